@@ -0,0 +1,228 @@
+"""
+Benchmark: end-to-end buy/sell latency and throughput of TradeExecutionService
+
+Drives concurrent buys, then sells of the resulting positions, through the real
+service stack (TradeExecutionService -> JupiterClient -> broadcast ->
+ConfirmationMultiplexer, UserWalletManager, DatabaseManager on a temporary
+SQLite file) against the local stand-in in src/ops/standin.py. No network.
+
+Latency and error distributions per endpoint are set with --profile
+(endpoint=median_ms:jitter_ms:error_rate, endpoints quote/swap/price/rpc/jito).
+
+Usage:
+    python scripts/benchmark_execution.py [--trades 50] [--concurrency 10]
+        [--mode standard|jito|single|race|bundle_race]
+        [--profile "quote=120:30,swap=150:40,rpc=40:10:0.01"] [--land-ms 400] [--drop-rate 0.0]
+        [--rebroadcast-ms 2000 | --rebroadcast-ms 0] [--compute-budget off|priority|savings]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cryptography.fernet import Fernet
+from solana.rpc.async_api import AsyncClient
+from solders.pubkey import Pubkey
+
+from src.ops import broadcast
+from src.ops.standin import StandinConfig, StandinServer, parse_profiles
+
+USER_SETTINGS = {
+    'max_trade_size_sol': 10.0,
+    'daily_loss_limit_sol': 1_000.0,
+    'slippage_percentage': 1.0,
+    'check_honeypots': False,
+    'min_liquidity_usd': 0.0,
+}
+
+
+def _percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(pct / 100 * len(ordered)))] if ordered else 0.0
+
+
+async def _timed(semaphore, latencies, call):
+    async with semaphore:
+        started = time.perf_counter()
+        try:
+            result = await call()
+        except Exception as e:
+            result = {'success': False, 'error': str(e)}
+        latencies.append((time.perf_counter() - started) * 1000)
+        return result
+
+
+async def _phase(name, calls, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    started = time.perf_counter()
+    results = await asyncio.gather(*(_timed(semaphore, latencies, call) for call in calls))
+    elapsed = time.perf_counter() - started
+    ok = sum(1 for result in results if result.get('success'))
+    return {
+        'phase': name,
+        'ok': ok,
+        'failed': len(results) - ok,
+        'p50': statistics.median(latencies) if latencies else 0.0,
+        'p99': _percentile(latencies, 99),
+        'max': max(latencies, default=0.0),
+        'tps': ok / elapsed if elapsed else 0.0,
+        'results': results,
+    }
+
+
+async def run(args):
+    standin = StandinServer(StandinConfig(
+        profiles=parse_profiles(args.profile),
+        land_ms=args.land_ms,
+        drop_rate=args.drop_rate,
+        bundle_land_rate=args.bundle_land_rate,
+        compute_units=args.compute_units,
+        seed=args.seed,
+    ))
+    await standin.start()
+    os.environ.update(standin.env())
+    os.environ.setdefault('WALLET_ENCRYPTION_KEY', Fernet.generate_key().decode())
+    os.environ['PYTH_PRICE_FEED_ENABLED'] = 'false'
+    os.environ['CONFIRMATION_POLL_MS'] = str(args.confirm_poll_ms)
+    os.environ['TX_CONFIRMATION_TIMEOUT'] = str(args.confirm_timeout)
+    os.environ['REBROADCAST_ENABLED'] = 'true' if args.rebroadcast_ms > 0 else 'false'
+    os.environ['REBROADCAST_INTERVAL_MS'] = str(args.rebroadcast_ms)
+
+    # Imported after the environment points at the stand-in
+    from src.modules.compute_budget import ComputeBudgetTuner
+    from src.modules.database import DatabaseManager
+    from src.modules.fee_estimator import FeeEstimator
+    from src.modules.http_pool import close_http_sessions
+    from src.modules.jupiter_client import JupiterClient
+    from src.modules.trade_execution import TradeExecutionService
+    from src.modules.wallet_manager import UserWalletManager
+
+    workdir = tempfile.TemporaryDirectory()
+    rebroadcast_stats = budget_stats = None
+    db = DatabaseManager(f"sqlite+aiosqlite:///{workdir.name}/bench.db")
+    client = AsyncClient(standin.rpc_url)
+    try:
+        await db.init_db()
+        wallets = UserWalletManager(db, client, default_user_settings=USER_SETTINGS)
+        users = list(range(1, args.trades + 1))
+        for user_id in users:
+            await wallets.get_or_create_user_wallet(user_id)
+            await db.ensure_user_settings(user_id, USER_SETTINGS)
+        mints = [str(Pubkey.new_unique()) for _ in range(args.tokens)]
+
+        async with JupiterClient(client) as jupiter:
+            if args.compute_budget != 'off':
+                jupiter.compute_budget = ComputeBudgetTuner(standin.rpc_url, mode=args.compute_budget)
+            # Unsampled estimator: each context's default priority fee and tip
+            service = TradeExecutionService(db, wallets, jupiter, fee_estimator=FeeEstimator(tip_floor_url=None))
+
+            buys = await _phase('buy', [
+                (lambda user_id=user_id: service.execute_buy(
+                    user_id, mints[user_id % len(mints)], args.amount_sol,
+                    context='benchmark', execution_mode=args.mode,
+                ))
+                for user_id in users
+            ], args.concurrency)
+
+            bought = [user_id for user_id, result in zip(users, buys['results']) if result.get('success')]
+            sells = await _phase('sell', [
+                (lambda user_id=user_id: service.execute_sell(
+                    user_id, mints[user_id % len(mints)],
+                    context='benchmark', execution_mode=args.mode,
+                ))
+                for user_id in bought
+            ], args.concurrency)
+            if jupiter.rebroadcaster:
+                rebroadcast_stats = jupiter.rebroadcaster.stats()
+            if jupiter.compute_budget:
+                budget_stats = jupiter.compute_budget.stats()
+    finally:
+        await client.close()
+        await close_http_sessions()
+        await db.engine.dispose()
+        await standin.stop()
+        workdir.cleanup()
+
+    return buys, sells, standin.stats(), rebroadcast_stats, budget_stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--trades', type=int, default=50, help='buys (one user each), then one sell per filled buy')
+    parser.add_argument('--concurrency', type=int, default=10)
+    parser.add_argument('--tokens', type=int, default=5)
+    parser.add_argument('--amount-sol', type=float, default=0.1)
+    parser.add_argument(
+        '--mode', choices=('standard', 'jito', 'single', 'race', 'bundle_race'), default='standard',
+        help='execution_mode passed to the service (a broadcast policy, or jito for tracked bundles)',
+    )
+    parser.add_argument('--profile', default='quote=120:30,swap=150:40,price=50:10,rpc=40:10,jito=60:15')
+    parser.add_argument('--land-ms', type=float, default=400.0)
+    parser.add_argument('--drop-rate', type=float, default=0.0)
+    parser.add_argument('--bundle-land-rate', type=float, default=1.0)
+    parser.add_argument('--confirm-poll-ms', type=int, default=400)
+    parser.add_argument('--confirm-timeout', type=float, default=60.0, help='seconds before a dropped send is retried')
+    parser.add_argument('--rebroadcast-ms', type=int, default=2000, help='resend interval until landed (0 = send once)')
+    parser.add_argument(
+        '--compute-budget', choices=('off', 'priority', 'savings'), default='off',
+        help='tighten swap compute unit limits from simulation (--compute-units per swap)',
+    )
+    parser.add_argument('--compute-units', type=int, default=120_000, help='units a swap consumes in simulation')
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    buys, sells, standin_stats, rebroadcast_stats, budget_stats = asyncio.run(run(args))
+
+    print("=" * 78)
+    print(
+        f"EXECUTION BENCHMARK - {args.trades} trades, concurrency {args.concurrency}, mode {args.mode}, "
+        f"land {args.land_ms:.0f}ms"
+    )
+    print(f"profile: {args.profile}")
+    print("=" * 78)
+    print(f"{'phase':<6} | {'ok':>4} | {'failed':>6} | {'p50 (ms)':>9} | {'p99 (ms)':>9} | {'max (ms)':>9} | {'trades/s':>8}")
+    print("-" * 78)
+    for phase in (buys, sells):
+        print(
+            f"{phase['phase']:<6} | {phase['ok']:>4} | {phase['failed']:>6} | {phase['p50']:>9.1f} | "
+            f"{phase['p99']:>9.1f} | {phase['max']:>9.1f} | {phase['tps']:>8.1f}"
+        )
+    print("-" * 78)
+    print(f"stand-in requests: {standin_stats['requests']}")
+    print(f"rpc methods: {standin_stats['rpc_methods']}")
+    print(f"sends {standin_stats['sends']}, dropped {standin_stats['dropped']}, expired {standin_stats['expired']}")
+    for policy, landing in broadcast.landing_stats().items():
+        print(
+            f"landing ({policy}): {landing['count']} txs, p50 {landing['p50'] * 1000:.0f}ms, "
+            f"p99 {landing['p99'] * 1000:.0f}ms, sends p50 {landing['sends_p50']} max {landing['sends_max']}"
+        )
+    if rebroadcast_stats:
+        print(
+            f"rebroadcast: outcomes {rebroadcast_stats['outcomes']}, total sends {rebroadcast_stats['total_sends']}"
+        )
+    if budget_stats:
+        print(
+            f"compute budget ({budget_stats['mode']}): {budget_stats['landed']} landed, "
+            f"{budget_stats['simulations']} simulations, {budget_stats['profile_hits']} profile hits"
+        )
+        print(
+            f"  per landed trade: CU limit {budget_stats['units_per_landed_before']:,.0f} -> "
+            f"{budget_stats['units_per_landed_after']:,.0f}, priority fee "
+            f"{budget_stats['priority_fee_per_landed_before']:,.0f} -> {budget_stats['priority_fee_per_landed_after']:,.0f} "
+            f"lamports, price {budget_stats['micro_lamports_per_cu_before']:,.0f} -> "
+            f"{budget_stats['micro_lamports_per_cu_after']:,.0f} micro-lamports/CU"
+        )
+
+
+if __name__ == "__main__":
+    main()
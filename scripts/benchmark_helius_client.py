@@ -0,0 +1,136 @@
+"""
+Benchmark: per-signature Helius lookups vs. pooled batch client
+
+Starts a local stand-in for the Helius enhanced-transactions API and resolves
+the same signatures two ways:
+
+  legacy  - new httpx.AsyncClient + GET /v0/transactions/{sig} per signature
+  pooled  - HeliusEnhancedClient, one keep-alive pool, POST /v0/transactions batches
+
+The stand-in charges --handshake-ms on every new connection (standing in for
+the TCP+TLS handshake to api.helius.xyz) and --latency-ms per request.
+
+Usage:
+    python scripts/benchmark_helius_client.py [--signatures 60] [--handshake-ms 60] [--latency-ms 40]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx
+from aiohttp import web
+
+from src.modules.helius_client import HeliusEnhancedClient
+
+TOKEN = "DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263"
+
+
+class HeliusStandIn:
+    def __init__(self, handshake: float, latency: float):
+        self.handshake = handshake
+        self.latency = latency
+        self.connections = set()
+        self.requests = 0
+
+    def _enhanced(self, signature):
+        return {
+            "signature": signature,
+            "type": "SWAP",
+            "source": "JUPITER",
+            "timestamp": int(time.time()),
+            "tokenTransfers": [{"mint": TOKEN, "tokenAmount": 1}],
+        }
+
+    async def _delay(self, request):
+        self.requests += 1
+        connection = id(request.transport)
+        if connection not in self.connections:
+            self.connections.add(connection)
+            await asyncio.sleep(self.handshake)
+        await asyncio.sleep(self.latency)
+
+    async def get_one(self, request):
+        await self._delay(request)
+        return web.json_response(self._enhanced(request.match_info["signature"]))
+
+    async def post_batch(self, request):
+        await self._delay(request)
+        body = await request.json()
+        return web.json_response([self._enhanced(sig) for sig in body["transactions"]])
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get("/v0/transactions/{signature}", self.get_one)
+        app.router.add_post("/v0/transactions", self.post_batch)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        return f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+
+async def legacy_lookup(base_url, signature):
+    # Mirrors the original per-signature code path in AutomatedTradingEngine
+    async with httpx.AsyncClient() as client:
+        response = await client.get(f"{base_url}/v0/transactions/{signature}", params={"api-key": "bench"}, timeout=5.0)
+        return response.json()
+
+
+async def run(mode, signatures, handshake, latency, scans):
+    server = HeliusStandIn(handshake, latency)
+    base_url = await server.start()
+    pooled = HeliusEnhancedClient("bench", base_url=base_url)
+
+    started = time.perf_counter()
+    for _ in range(scans):
+        if mode == "legacy":
+            await asyncio.gather(*(legacy_lookup(base_url, sig) for sig in signatures))
+        else:
+            await pooled.get_transactions(signatures)
+    elapsed = time.perf_counter() - started
+
+    await pooled.close()
+    await server.stop()
+    return elapsed, len(server.connections), server.requests
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--signatures", type=int, default=60)
+    parser.add_argument("--scans", type=int, default=5)
+    parser.add_argument("--handshake-ms", type=float, default=60.0)
+    parser.add_argument("--latency-ms", type=float, default=40.0)
+    args = parser.parse_args()
+
+    signatures = [f"sig{index:05d}" for index in range(args.signatures)]
+    lookups = args.signatures * args.scans
+
+    print("=" * 70)
+    print(f"HELIUS CLIENT BENCHMARK - {args.scans} scans x {args.signatures} signatures")
+    print(f"stand-in: {args.handshake_ms:.0f}ms per new connection, {args.latency_ms:.0f}ms per request")
+    print("=" * 70)
+    print(f"{'mode':>8} | {'total (s)':>9} | {'ms/signature':>12} | {'connections':>11} | {'requests':>8}")
+    print("-" * 70)
+
+    results = {}
+    for mode in ("legacy", "pooled"):
+        elapsed, connections, requests = await run(
+            mode, signatures, args.handshake_ms / 1000, args.latency_ms / 1000, args.scans
+        )
+        results[mode] = (elapsed, connections)
+        print(f"{mode:>8} | {elapsed:>9.2f} | {elapsed / lookups * 1000:>12.2f} | {connections:>11} | {requests:>8}")
+
+    print("-" * 70)
+    print(f"Handshakes saved: {results['legacy'][1] - results['pooled'][1]}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
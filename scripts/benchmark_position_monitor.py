@@ -0,0 +1,139 @@
+"""
+Benchmark: position exit checks vs. open position count
+
+Compares one pass over N open positions (spread over a set of tokens):
+
+  naive    - the previous _manage_positions loop: one price request per
+             position, then stop loss / take profit / trailing checks on
+             every position
+  monitor  - PositionMonitor.tick: one batched price request per 100 tokens,
+             then only positions whose trigger level was crossed
+
+Price requests sleep for a fixed simulated latency.
+
+Usage:
+    python scripts/benchmark_position_monitor.py [--latency-ms 50] [--positions 1000 10000]
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.modules.position_monitor import MonitoredPosition, PositionMonitor
+
+
+class SimulatedPriceApi:
+    """Stands in for JupiterClient.get_token_price."""
+
+    def __init__(self, latency: float, prices):
+        self.latency = latency
+        self.prices = prices
+        self.requests = 0
+
+    async def get_token_price(self, token_mints):
+        self.requests += 1
+        await asyncio.sleep(self.latency)
+        return {mint: self.prices[mint] for mint in token_mints}
+
+
+async def _noop(position, reason, price):
+    return None
+
+
+def _book(position_count: int, token_count: int, seed: int = 11):
+    rng = random.Random(seed)
+    return [
+        {
+            'mint': f"MINT{index % token_count}",
+            'entry_price': rng.uniform(0.8, 1.2),
+            'stop_loss_pct': 0.15,
+            'take_profit_pct': 0.5,
+        }
+        for index in range(position_count)
+    ]
+
+
+async def naive_pass(api: SimulatedPriceApi, positions, trailing_stop_pct: float = 0.10) -> int:
+    fired = 0
+    for position in positions:
+        price = (await api.get_token_price([position['mint']])).get(position['mint'], 0)
+        pnl_pct = (price - position['entry_price']) / position['entry_price']
+        if pnl_pct <= -position['stop_loss_pct'] or pnl_pct >= position['take_profit_pct']:
+            fired += 1
+        elif pnl_pct > 0:
+            highest = max(position.get('highest_price', price), price)
+            position['highest_price'] = highest
+            if (highest - price) / highest >= trailing_stop_pct:
+                fired += 1
+    return fired
+
+
+def _monitor(api: SimulatedPriceApi, positions) -> PositionMonitor:
+    monitor = PositionMonitor(api.get_token_price, price_batch_size=100)
+    for index, position in enumerate(positions):
+        monitor.add(MonitoredPosition(
+            key=(index % 50, index),  # (user, position) across 50 users
+            token_mint=position['mint'],
+            entry_price=position['entry_price'],
+            on_trigger=_noop,
+            stop_loss_pct=position['stop_loss_pct'],
+            take_profit_pct=position['take_profit_pct'],
+            trailing_stop_pct=0.10,
+        ))
+    return monitor
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--latency-ms', type=float, default=50.0)
+    parser.add_argument('--positions', type=int, nargs='+', default=[100, 1000, 10000])
+    parser.add_argument('--tokens', type=int, default=500)
+    parser.add_argument('--ticks', type=int, default=20)
+    args = parser.parse_args()
+
+    latency = args.latency_ms / 1000
+
+    print("=" * 70)
+    print(f"POSITION MONITOR BENCHMARK - {args.latency_ms:.0f}ms simulated price latency, {args.tokens} tokens")
+    print("=" * 70)
+    print(f"{'positions':>9} | {'naive pass (s)':>14} | {'naive reqs':>10} | {'tick (s)':>9} | {'tick reqs':>9} | {'touched/tick':>12}")
+    print("-" * 70)
+
+    for count in args.positions:
+        tokens = min(args.tokens, count)
+        prices = {f"MINT{index}": 1.0 for index in range(tokens)}
+
+        naive_api = SimulatedPriceApi(latency, prices)
+        # The naive loop is linear in positions; time a slice and extrapolate past 1000
+        sample = min(count, 1000)
+        started = time.perf_counter()
+        await naive_pass(naive_api, _book(sample, tokens))
+        naive = (time.perf_counter() - started) * count / sample
+
+        monitor_api = SimulatedPriceApi(latency, prices)
+        monitor = _monitor(monitor_api, _book(count, tokens))
+        rng = random.Random(3)
+        started = time.perf_counter()
+        for _ in range(args.ticks):
+            for mint in prices:
+                prices[mint] *= rng.uniform(0.97, 1.03)
+            await monitor.tick()
+        tick = (time.perf_counter() - started) / args.ticks
+
+        extrapolated = '*' if sample < count else ' '
+        print(
+            f"{count:>9} | {naive:>13.2f}{extrapolated} | {count:>10} | {tick:>9.3f} | "
+            f"{monitor_api.requests // args.ticks:>9} | {monitor.positions_touched // args.ticks:>12}"
+        )
+
+    print("-" * 70)
+    print("* extrapolated from the first 1000 positions")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,98 @@
+"""
+Benchmark: wallet scan duration vs. new-signature volume
+
+Runs WalletSignalCore._scan_for_opportunities against a simulated RPC
+client (fixed per-call latency) and compares serial transaction parsing
+(concurrency 1) with the bounded-concurrency parser.
+
+Usage:
+    python scripts/benchmark_scan_parsing.py [--latency-ms 80] [--concurrency 10]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from solders.keypair import Keypair
+from solders.rpc.responses import GetTransactionResp
+
+from src.modules.automated_trading import TradingConfig
+from src.modules.signal_core import WalletSignalCore
+from src.modules.wallet_intelligence import WalletMetrics
+
+SWAP_FIXTURE = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "swaps" / "jupiter_buy_bonk.json"
+SIGNATURES_PER_WALLET = 3
+
+
+class SimulatedRpcClient:
+    """Stands in for AsyncClient: every call sleeps for a fixed latency."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.calls = 0
+        self.swap_json = SWAP_FIXTURE.read_text()
+
+    async def get_signatures_for_address(self, pubkey, limit=3):
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        now = int(time.time())
+        return SimpleNamespace(value=[
+            SimpleNamespace(signature=f"{pubkey}-{index}", block_time=now, err=None)
+            for index in range(limit)
+        ])
+
+    async def get_transaction(self, signature, encoding=None, max_supported_transaction_version=None):
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        return GetTransactionResp.from_json(self.swap_json)
+
+
+async def run_scan(wallet_count: int, concurrency: int, latency: float) -> float:
+    os.environ['AUTO_TRADER_PARSE_CONCURRENCY'] = str(concurrency)
+    os.environ['AUTO_TRADER_RPC_BATCH_SIZE'] = '0'
+    os.environ.pop('HELIUS_API_KEY', None)
+
+    tracked = {
+        str(Keypair().pubkey()): WalletMetrics(address='', win_rate=0.8, profit_factor=2.0, total_trades=50)
+        for _ in range(wallet_count)
+    }
+    intelligence = SimpleNamespace(tracked_wallets=tracked, client=SimulatedRpcClient(latency))
+    core = WalletSignalCore(TradingConfig(), intelligence)
+
+    started = time.perf_counter()
+    await core._scan_for_opportunities()
+    return time.perf_counter() - started
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--latency-ms', type=float, default=80.0)
+    parser.add_argument('--concurrency', type=int, default=10)
+    parser.add_argument('--wallets', type=int, nargs='+', default=[2, 5, 10, 20, 40])
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    latency = args.latency_ms / 1000
+
+    print("=" * 70)
+    print(f"SCAN PARSING BENCHMARK - {args.latency_ms:.0f}ms simulated RPC latency")
+    print("=" * 70)
+    print(f"{'new sigs':>9} | {'serial (s)':>11} | {f'concurrent x{args.concurrency} (s)':>20} | {'speedup':>8}")
+    print("-" * 70)
+
+    for wallet_count in args.wallets:
+        serial = await run_scan(wallet_count, 1, latency)
+        concurrent = await run_scan(wallet_count, args.concurrency, latency)
+        new_signatures = wallet_count * SIGNATURES_PER_WALLET
+        print(f"{new_signatures:>9} | {serial:>11.2f} | {concurrent:>20.2f} | {serial / concurrent:>7.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,102 @@
+"""
+Microbenchmark: raw-JSON swap decoder vs. solders attribute walk
+
+Decodes every transaction in tests/fixtures/swaps with:
+
+  solders  - GetTransactionResp.from_json + the previous three-method parser
+             (pre/post balance dict with f"{account}_{mint}" keys, parsed
+             instruction scan, DEX program detection)
+  decoder  - src.modules.swap_decoder.decode_swap on the raw bytes
+
+Usage:
+    python scripts/benchmark_swap_decoder.py [--iterations 2000]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from solders.rpc.responses import GetTransactionResp
+
+from src.modules.swap_decoder import ORJSON_AVAILABLE, decode_swap
+
+FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "swaps"
+SOL_MINT = "So11111111111111111111111111111111111111112"
+DEX_PROGRAMS = {
+    "JUP6LkbZbjS1jKKwapdHNy74zcZ3tLUZoi5QNyVTaV4",
+    "JUP4Fb2cqiRUcaTHdrPC8h2gNsA2ETXiPDD33WcGuJB",
+    "675kPX9MHTjS2zt1qfr1NYHuzeLXfQM9H24wFSUt1Mp8",
+    "whirLbMiicVdio4qvUfM5KAg6Ct8VwpYzGff3uctyCc",
+}
+
+
+def solders_parse(raw: bytes):
+    """The pre-decoder parser, kept here only as the comparison baseline."""
+    tx = GetTransactionResp.from_json(raw.decode())
+    if not tx or not tx.value:
+        return None
+
+    meta = tx.value.transaction.meta
+    if meta:
+        pre_balance_dict = {}
+        for bal in meta.pre_token_balances or []:
+            amount = float(bal.ui_token_amount.ui_amount or 0)
+            pre_balance_dict[f"{bal.account_index}_{bal.mint}"] = amount
+        for bal in meta.post_token_balances or []:
+            post_amount = float(bal.ui_token_amount.ui_amount or 0)
+            if post_amount > pre_balance_dict.get(f"{bal.account_index}_{bal.mint}", 0) and bal.mint != SOL_MINT:
+                return str(bal.mint)
+
+    tokens_received = []
+    instructions = tx.value.transaction.transaction.message.instructions
+    for instruction in instructions:
+        parsed = getattr(instruction, 'parsed', None)
+        if isinstance(parsed, dict) and parsed.get('type') in ('transfer', 'transferChecked'):
+            mint = parsed.get('info', {}).get('mint')
+            if mint:
+                tokens_received.append(mint)
+    for instruction in instructions:
+        if str(getattr(instruction, 'program_id', '')) in DEX_PROGRAMS:
+            for token in tokens_received:
+                if token != SOL_MINT:
+                    return token
+    return None
+
+
+def bench(fn, corpus, iterations):
+    started = time.perf_counter()
+    for _ in range(iterations):
+        for raw in corpus:
+            fn(raw)
+    return (time.perf_counter() - started) / (iterations * len(corpus))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    corpus = [path.read_bytes() for path in sorted(FIXTURES.glob("*.json"))]
+
+    print("=" * 70)
+    print(f"SWAP DECODER MICROBENCHMARK - {len(corpus)} transactions x {args.iterations} iterations")
+    print(f"JSON backend: {'orjson' if ORJSON_AVAILABLE else 'json (stdlib)'}")
+    print("=" * 70)
+
+    for path, raw in zip(sorted(FIXTURES.glob("*.json")), corpus):
+        swap = decode_swap(raw)
+        print(f"  {path.stem:<28} solders={str(solders_parse(raw))[:8]:<8}  decoder={swap.mint[:8] if swap else None}")
+
+    baseline = bench(solders_parse, corpus, args.iterations)
+    decoder = bench(decode_swap, corpus, args.iterations)
+
+    print("-" * 70)
+    print(f"{'solders':>10}: {baseline * 1e6:8.1f} µs/tx")
+    print(f"{'decoder':>10}: {decoder * 1e6:8.1f} µs/tx  ({baseline / decoder:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
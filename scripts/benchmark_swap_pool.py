@@ -0,0 +1,133 @@
+"""
+Benchmark: trigger-to-broadcast latency with and without prebuilt swaps
+
+Runs JupiterClient.execute_swap against a simulated Jupiter API and RPC:
+
+  on-demand  - quote -> /swap -> sign -> send on the critical path
+  prebuilt   - PrebuiltSwapPool refreshed ahead of the trigger, so the
+               trigger only signs and sends
+
+Each round trip sleeps for its simulated latency; confirmation is not
+included (it is the same for both).
+
+Usage:
+    python scripts/benchmark_swap_pool.py [--quote-ms 120] [--swap-ms 150] [--send-ms 40] [--trades 20]
+"""
+
+import argparse
+import asyncio
+import base64
+import statistics
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from solders.hash import Hash
+from solders.keypair import Keypair
+from solders.message import MessageV0
+from solders.transaction import VersionedTransaction
+
+from src.modules.jupiter_client import JupiterClient
+from src.modules.swap_pool import SOL_MINT, PrebuiltSwapPool, SwapIntent
+
+TOKEN_PREFIX = "BENCH"
+
+
+class _Response:
+    status = 200
+
+    def __init__(self, latency, payload):
+        self.latency = latency
+        self.payload = payload
+
+    async def __aenter__(self):
+        await asyncio.sleep(self.latency)
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def json(self):
+        return self.payload
+
+
+class SimulatedJupiter:
+    """Stands in for the Jupiter quote and swap endpoints."""
+
+    def __init__(self, quote_latency, swap_latency, keypair):
+        self.quote_latency = quote_latency
+        self.swap_latency = swap_latency
+        message = MessageV0.try_compile(keypair.pubkey(), [], [], Hash.default())
+        self.transaction = base64.b64encode(bytes(VersionedTransaction(message, [keypair]))).decode()
+
+    def get(self, url, params=None):
+        return _Response(self.quote_latency, {"inAmount": params["amount"], "outAmount": "1000"})
+
+    def post(self, url, json=None):
+        return _Response(self.swap_latency, {"swapTransaction": self.transaction})
+
+
+def _client(args, keypair):
+    async def send_raw_transaction(tx_bytes, opts=None):
+        await asyncio.sleep(args.send_ms / 1000)
+        return SimpleNamespace(value="sig")
+
+    async def confirmed(signature, max_wait=None):
+        return True
+
+    client = JupiterClient(rpc_client=SimpleNamespace(send_raw_transaction=send_raw_transaction))
+    client.session = SimulatedJupiter(args.quote_ms / 1000, args.swap_ms / 1000, keypair)
+    client._confirm_transaction = confirmed
+    return client
+
+
+async def _trigger_to_broadcast(client, keypair, token, amount):
+    trace = {}
+    started = time.time()
+    await client.execute_swap(SOL_MINT, token, amount, keypair, slippage_bps=500, latency_trace=trace)
+    return (trace['broadcast'] - started) * 1000
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--quote-ms', type=float, default=120.0)
+    parser.add_argument('--swap-ms', type=float, default=150.0)
+    parser.add_argument('--send-ms', type=float, default=40.0)
+    parser.add_argument('--trades', type=int, default=20)
+    args = parser.parse_args()
+
+    keypair = Keypair()
+    amount = 100_000_000
+    tokens = [f"{TOKEN_PREFIX}{index}" for index in range(args.trades)]
+
+    on_demand_client = _client(args, keypair)
+    on_demand = [await _trigger_to_broadcast(on_demand_client, keypair, token, amount) for token in tokens]
+
+    pooled_client = _client(args, keypair)
+    pool = PrebuiltSwapPool(pooled_client, max_age=20)
+    pooled_client.swap_pool = pool
+    pool.add_source(lambda: [SwapIntent(str(keypair.pubkey()), SOL_MINT, token, amount, 500) for token in tokens])
+    refresh_started = time.perf_counter()
+    await pool.refresh()
+    refresh = (time.perf_counter() - refresh_started) * 1000
+    prebuilt = [await _trigger_to_broadcast(pooled_client, keypair, token, amount) for token in tokens]
+
+    print("=" * 70)
+    print(
+        f"SWAP POOL BENCHMARK - quote {args.quote_ms:.0f}ms, /swap {args.swap_ms:.0f}ms, "
+        f"send {args.send_ms:.0f}ms, {args.trades} trades"
+    )
+    print("=" * 70)
+    print(f"{'path':<12} | {'p50 trigger->broadcast (ms)':>28} | {'max (ms)':>9}")
+    print("-" * 70)
+    print(f"{'on-demand':<12} | {statistics.median(on_demand):>28.1f} | {max(on_demand):>9.1f}")
+    print(f"{'prebuilt':<12} | {statistics.median(prebuilt):>28.1f} | {max(prebuilt):>9.1f}")
+    print("-" * 70)
+    print(f"pool hit rate {pool.stats()['hit_rate']:.0%}; background refresh of {args.trades} swaps took {refresh:.0f}ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
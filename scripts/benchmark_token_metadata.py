@@ -0,0 +1,121 @@
+"""
+Benchmark: token metadata lookups, full-list scan vs. local index
+
+Uses a locally saved copy of the Jupiter token list (pass --list, or a
+synthetic list of --tokens entries is written to a temp file):
+
+  scan   - the previous get_token_info: parse the whole list, then scan it
+           linearly for the mint (network download time not included)
+  index  - TokenMetadataStore: build once, then cold-open the SQLite index
+           and serve single and batched lookups
+
+Save a real list with:
+    curl -o /tmp/jupiter_tokens.json https://token.jup.ag/all
+
+Usage:
+    python scripts/benchmark_token_metadata.py [--list /tmp/jupiter_tokens.json] [--lookups 1000]
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.modules.token_metadata import TokenMetadataStore, build_index
+
+
+def _synthetic_list(path: Path, count: int):
+    rng = random.Random(5)
+    tokens = [
+        {
+            'address': ''.join(rng.choice('123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz') for _ in range(44)),
+            'chainId': 101,
+            'decimals': rng.choice([6, 9]),
+            'name': f"Token {index}",
+            'symbol': f"TK{index}",
+            'logoURI': f"https://example.invalid/{index}.png",
+            'tags': ['community'] if index % 3 else ['verified'],
+        }
+        for index in range(count)
+    ]
+    path.write_text(json.dumps(tokens))
+
+
+def _percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--list', type=Path, help='saved token list JSON (default: synthetic)')
+    parser.add_argument('--tokens', type=int, default=300_000, help='synthetic list size')
+    parser.add_argument('--lookups', type=int, default=1000)
+    parser.add_argument('--batch', type=int, default=500)
+    parser.add_argument('--scan-samples', type=int, default=5)
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix='token_metadata_bench_'))
+    list_path = args.list
+    if list_path is None:
+        list_path = workdir / 'tokens.json'
+        _synthetic_list(list_path, args.tokens)
+
+    raw = list_path.read_bytes()
+    tokens = json.loads(raw)
+    mints = [token['address'] for token in tokens if token.get('address')]
+    rng = random.Random(9)
+    targets = [rng.choice(mints) for _ in range(args.lookups)]
+
+    print("=" * 70)
+    print(f"TOKEN METADATA BENCHMARK - {len(mints):,} tokens, {len(raw) / 1e6:.1f} MB list")
+    print("=" * 70)
+
+    # Previous behaviour: parse + linear scan per call
+    scan_times = []
+    for mint in targets[:args.scan_samples]:
+        started = time.perf_counter()
+        for token in json.loads(raw):
+            if token.get('address') == mint:
+                break
+        scan_times.append(time.perf_counter() - started)
+
+    index_path = workdir / 'tokens.sqlite'
+    started = time.perf_counter()
+    build_index(tokens, index_path)
+    build = time.perf_counter() - started
+
+    started = time.perf_counter()
+    store = TokenMetadataStore(index_path, cache_size=1)
+    store.open()
+    store.get(targets[0])
+    cold_open = time.perf_counter() - started
+
+    lookup_times = []
+    for mint in targets:
+        started = time.perf_counter()
+        store.get(mint)
+        lookup_times.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    found = store.get_many(targets[:args.batch])
+    batch = time.perf_counter() - started
+
+    print(f"{'scan per call (parse + linear search)':<44} {statistics.median(scan_times) * 1000:>12.1f} ms")
+    print(f"{'index build (one-off, background)':<44} {build * 1000:>12.1f} ms")
+    print(f"{'index cold open + first lookup':<44} {cold_open * 1000:>12.2f} ms")
+    print(f"{'index lookup p50':<44} {_percentile(lookup_times, 0.50) * 1e6:>12.1f} us")
+    print(f"{'index lookup p99':<44} {_percentile(lookup_times, 0.99) * 1e6:>12.1f} us")
+    print(f"{f'batch lookup of {args.batch} mints ({len(found)} found)':<44} {batch * 1000:>12.2f} ms")
+    print("-" * 70)
+    print(f"index file: {index_path.stat().st_size / 1e6:.1f} MB at {index_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -153,7 +153,8 @@ class BotRunner:
                     flash_loan_engine=self.bot.flash_loan_engine,
                     launch_predictor=self.bot.launch_predictor,
                     prediction_markets=self.bot.prediction_markets,
-                    trade_executor=self.bot.trade_executor  # Enable web dashboard trading
+                    trade_executor=self.bot.trade_executor,  # Enable web dashboard trading
+                    price_service=self.bot.price_service
                 )
                 logger.info("🌐 Web API modules injected (including trade executor)")
 
@@ -60,6 +60,8 @@ from src.modules.wallet_manager import UserWalletManager
 from src.modules.token_sniper import AutoSniper, SnipeSettings
 from src.modules.jupiter_client import JupiterClient, AntiMEVProtection
 from src.modules.monitoring import BotMonitor, PerformanceTracker
+from src.modules.ttl_cache import export_cache_metrics
+from src.modules.http_pool import close_http_sessions, export_http_metrics
 from src.modules.trade_execution import TradeExecutionService
 from src.config import Config, get_config
 from src.modules.web_api import WebAPIServer
@@ -69,6 +71,16 @@ from src.modules.web_auth import setup_auth_routes, DashboardAuth
 from src.modules.wallet_intelligence import WalletIntelligenceEngine, WalletMetrics
 from src.modules.elite_protection import EliteProtectionSystem, ProtectionConfig
 from src.modules.automated_trading import AutomatedTradingEngine, TradingConfig as AutoTradingConfig
+from src.modules.position_monitor import PositionMonitor
+from src.modules.signal_core import WalletSignalCore
+from src.modules.swap_pool import PrebuiltSwapPool
+from src.modules.blockhash_cache import BlockhashCache
+from src.modules.compute_budget import ComputeBudgetTuner
+from src.modules.wallet_stream import resolve_ws_url
+from src.modules.price_service import PriceService, parse_feed_map
+from src.modules.fee_estimator import FeeEstimator
+from src.modules.rpc_batch import JsonRpcBatchClient
+from src.ops import broadcast
 
 logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -170,6 +182,38 @@ class RevolutionaryTradingBot:
         # Trading execution (initialize first)
         self.jupiter = JupiterClient(self.client)
         self.anti_mev = AntiMEVProtection(self.client)
+
+        # 💹 One price service for every consumer: Pyth streams the major feeds,
+        # Jupiter is polled in batches for the long tail of watched mints
+        self.price_service = None
+        if os.getenv('PRICE_SERVICE_ENABLED', 'true').lower() == 'true':
+            pyth_feeds = {}
+            if self.jupiter.pyth_enabled:
+                pyth_feeds = {"So11111111111111111111111111111111111111112": self.jupiter.pyth_sol_feed}
+                pyth_feeds.update(parse_feed_map(os.getenv('PYTH_PRICE_FEEDS', '')))
+            self.price_service = PriceService(
+                self.jupiter.fetch_token_prices,
+                pyth_feeds=pyth_feeds,
+                hermes_url=os.getenv('PYTH_HERMES_URL', 'https://hermes.pyth.network'),
+                poll_interval=float(os.getenv('PRICE_SERVICE_POLL_SECONDS', '2')),
+                max_age=float(os.getenv('PRICE_SERVICE_MAX_AGE_SECONDS', '5')),
+                idle_seconds=float(os.getenv('PRICE_SERVICE_IDLE_SECONDS', '300')),
+                history_size=int(os.getenv('PRICE_SERVICE_HISTORY_SIZE', '120')),
+            )
+            self.jupiter.price_service = self.price_service
+
+        # Ready-to-sign swaps for pending snipes, open auto-trader positions and hot
+        # copy-trade targets (sources register themselves while they are active)
+        if os.getenv('SWAP_POOL_ENABLED', 'true').lower() == 'true':
+            self.jupiter.swap_pool = PrebuiltSwapPool(
+                self.jupiter,
+                price_fetcher=self.jupiter.get_token_price,
+                interval=float(os.getenv('SWAP_POOL_REFRESH_SECONDS', '2')),
+                max_age=float(os.getenv('SWAP_POOL_MAX_AGE_SECONDS', '20')),
+                price_tolerance_bps=float(os.getenv('SWAP_POOL_PRICE_TOLERANCE_BPS', '100')),
+                max_entries=int(os.getenv('SWAP_POOL_MAX_ENTRIES', '200')),
+                min_blocks_left=int(os.getenv('SWAP_POOL_MIN_BLOCKS_LEFT', '50')),
+            )
         
         # ⚡ FLASH LOAN ARBITRAGE ENGINE (Phase 2) - Initialized after Jupiter/Jito
         self.marginfi = MarginfiClient(self.client, config)
@@ -189,6 +233,52 @@ class RevolutionaryTradingBot:
         self.monitor = monitor or BotMonitor(None, admin_chat_id=self.config.admin_chat_id)
         self.performance = PerformanceTracker()
 
+        # ⛽ Adaptive priority fees / Jito tips per context, learned from landed trades
+        self.fee_estimator = None
+        if os.getenv('FEE_ESTIMATOR_ENABLED', 'true').lower() == 'true':
+            self.fee_estimator = FeeEstimator(
+                JsonRpcBatchClient(config.solana_rpc_url, on_request=self.monitor.record_request),
+                tip_floor_url=os.getenv('JITO_TIP_FLOOR_URL', 'https://bundles.jito.wtf/api/v1/bundles/tip_floor') or None,
+                accounts=[a.strip() for a in os.getenv('FEE_ESTIMATOR_ACCOUNTS', '').split(',') if a.strip()],
+                interval=float(os.getenv('FEE_ESTIMATOR_INTERVAL_SECONDS', '10')),
+                compute_units=int(os.getenv('PRIORITY_FEE_COMPUTE_UNITS', '300000')),
+                feedback_window=int(os.getenv('FEE_FEEDBACK_WINDOW', '20')),
+                min_feedback=int(os.getenv('FEE_FEEDBACK_MIN_SAMPLES', '10')),
+                monitor=self.monitor,
+            )
+            self.jupiter.fee_estimator = self.fee_estimator
+
+        # ⏱️ Latest blockhash / block height / slot kept in memory for the swap pool,
+        # the rebroadcast cutoff and local transaction assembly
+        self.blockhash_cache = None
+        if os.getenv('BLOCKHASH_CACHE_ENABLED', 'true').lower() == 'true':
+            self.blockhash_cache = BlockhashCache(
+                JsonRpcBatchClient(config.solana_rpc_url, on_request=self.monitor.record_request),
+                interval=int(os.getenv('BLOCKHASH_REFRESH_MS', '1000')) / 1000,
+                ws_url=(
+                    resolve_ws_url(config.solana_rpc_url)
+                    if os.getenv('BLOCKHASH_SLOT_SUBSCRIBE', 'false').lower() == 'true' else None
+                ),
+                monitor=self.monitor,
+            )
+            self.jupiter.blockhash_cache = self.blockhash_cache
+            if self.jupiter.rebroadcaster:
+                self.jupiter.rebroadcaster.blockhash_cache = self.blockhash_cache
+            if self.jupiter.swap_pool:
+                self.jupiter.swap_pool.blockhash_cache = self.blockhash_cache
+
+        # 🧮 Optional: simulate swaps and tighten their compute unit limit, so the
+        # priority fee is not spent on headroom (CU profile cached per route shape)
+        if os.getenv('COMPUTE_BUDGET_TUNING_ENABLED', 'false').lower() == 'true':
+            self.jupiter.compute_budget = ComputeBudgetTuner(
+                config.solana_rpc_url,
+                margin=float(os.getenv('COMPUTE_BUDGET_MARGIN', '0.15')),
+                mode=os.getenv('COMPUTE_BUDGET_MODE', 'priority').lower(),
+                min_samples=int(os.getenv('COMPUTE_BUDGET_PROFILE_MIN_SAMPLES', '3')),
+                resample_every=int(os.getenv('COMPUTE_BUDGET_RESAMPLE_EVERY', '20')),
+                monitor=self.monitor,
+            )
+
         # Centralized trade execution
         self.trade_executor = TradeExecutionService(
             self.db,
@@ -197,14 +287,29 @@ class RevolutionaryTradingBot:
             protection=self.elite_protection,
             monitor=self.monitor,
             social_marketplace=self.social_marketplace,
-            rewards=self.rewards
+            rewards=self.rewards,
+            fee_estimator=self.fee_estimator,
         )
 
         # Share executor with marketplace for copy trades
         self.social_marketplace.attach_trade_executor(self.trade_executor)
 
-        # Automated trading engine is created on demand
-        self.auto_trader = None
+        # Jito bundle outcomes settle the trades recorded at submission
+        self.trade_executor.attach_bundle_tracker(self.jupiter.bundle_tracker)
+
+        # Automated trading engines are created on demand, one per user. They
+        # share one wallet scan (signal core) and one exit monitor.
+        self.auto_traders: Dict[int, AutomatedTradingEngine] = {}
+        self.auto_signal_core = WalletSignalCore(
+            AutoTradingConfig(),
+            self.wallet_intelligence,
+            monitor=self.monitor,
+        )
+        self.auto_position_monitor = PositionMonitor(
+            self.jupiter.get_token_price,
+            interval=float(os.getenv('AUTO_TRADER_POSITION_CHECK_SECONDS', '5')),
+            monitor=self.monitor,
+        )
 
         # 🎯 Auto-Sniper with Elite Protection and centralized execution
         self.sniper = AutoSniper(
@@ -2034,22 +2139,26 @@ Use /rankings to see top wallets!
             await update.message.reply_text("❌ Could not access your wallet")
             return
         
-        # Initialize auto trader if not exists
-        if not self.auto_trader:
+        # Initialize this user's auto trader if not exists
+        auto_trader = self.auto_traders.get(user_id)
+        if not auto_trader:
             config = AutoTradingConfig()
-            self.auto_trader = AutomatedTradingEngine(
+            auto_trader = AutomatedTradingEngine(
                 config,
                 self.wallet_intelligence,
                 self.jupiter,
                 self.elite_protection,
                 trade_executor=self.trade_executor,
                 monitor=self.monitor,
+                position_monitor=self.auto_position_monitor,
+                signal_core=self.auto_signal_core,
             )
+            self.auto_traders[user_id] = auto_trader
         
         # Start automated trading (with database for loading tracked wallets)
         try:
             logger.info(f"🎯 Starting automated trading for user {user_id}...")
-            await self.auto_trader.start_automated_trading(
+            await auto_trader.start_automated_trading(
                 user_id,
                 user_keypair,
                 self.wallet_manager,
@@ -2058,7 +2167,7 @@ Use /rankings to see top wallets!
             logger.info(f"✅ Automated trading successfully started for user {user_id}")
             
             # 🎯 Register auto-trader with sniper for position tracking
-            self.sniper.register_auto_trader(self.auto_trader)
+            self.sniper.register_auto_trader(auto_trader)
             
         except Exception as e:
             logger.error(f"❌ ERROR starting automated trading: {e}", exc_info=True)
@@ -2102,8 +2211,9 @@ COMMANDS:
     
     async def autostop_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Stop automated trading"""
-        if self.auto_trader and self.auto_trader.is_running:
-            await self.auto_trader.stop_automated_trading()
+        auto_trader = self.auto_traders.get(update.effective_user.id)
+        if auto_trader and auto_trader.is_running:
+            await auto_trader.stop_automated_trading()
             await update.message.reply_text(
                 "🛑 AUTOMATED TRADING STOPPED\n\n"
                 "All open positions remain active.\n"
@@ -2118,11 +2228,12 @@ COMMANDS:
     
     async def autostatus_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Show automated trading status"""
-        if not self.auto_trader:
+        auto_trader = self.auto_traders.get(update.effective_user.id)
+        if not auto_trader:
             await update.message.reply_text("Automated trading not initialized. Use /autostart")
             return
 
-        status = self.auto_trader.get_status()
+        status = auto_trader.get_status()
         
         status_emoji = "✅ RUNNING" if status['is_running'] else "❌ STOPPED"
         
@@ -2166,6 +2277,8 @@ OPEN POSITIONS:
             await message.reply_text("Monitoring is currently disabled.")
             return
 
+        export_cache_metrics(self.monitor)
+        export_http_metrics(self.monitor)
         report = self.monitor.render_markdown_summary()
         await message.reply_text(
             report,
@@ -2180,6 +2293,8 @@ OPEN POSITIONS:
             return
         
         try:
+            export_cache_metrics(self.monitor)
+            export_http_metrics(self.monitor)
             stats = self.monitor.get_stats()
             health = self.monitor.get_health_status()
             
@@ -3837,6 +3952,17 @@ Use /settings command to modify these settings
         await self.sniper.start()
         logger.info("🎯 Auto-sniper monitoring started")
 
+        if self.blockhash_cache:
+            await self.blockhash_cache.start()
+        if self.price_service:
+            await self.price_service.start()
+        if self.fee_estimator:
+            await self.fee_estimator.start()
+        # Health pings keep the race broadcast endpoints scored
+        await broadcast.get_race_engine(self.client).start()
+        if self.jupiter.swap_pool:
+            await self.jupiter.swap_pool.start()
+
         # Load enabled snipers from database
         await self._load_sniper_settings()
 
@@ -3984,6 +4110,21 @@ Use /settings command to modify these settings
             try:
                 # Stop sniper first
                 await self.sniper.stop()
+                # Then the per-user trading engines and the scan/exit loops they share
+                for auto_trader in list(self.auto_traders.values()):
+                    if auto_trader.is_running:
+                        await auto_trader.stop_automated_trading()
+                await self.auto_signal_core.stop()
+                await self.auto_position_monitor.stop()
+                if self.jupiter.swap_pool:
+                    await self.jupiter.swap_pool.stop()
+                if self.price_service:
+                    await self.price_service.stop()
+                if self.fee_estimator:
+                    await self.fee_estimator.stop()
+                if self.blockhash_cache:
+                    await self.blockhash_cache.stop()
+                await broadcast.get_race_engine(self.client).stop()
 
                 # Note: Web API server is stopped by probe server in run_bot.py
 
@@ -3997,6 +4138,9 @@ Use /settings command to modify these settings
                 if self._owns_client and self.client:
                     logger.info("Closing Solana RPC client...")
                     await self.client.close()
+
+                # Every module shares one HTTP pool; close it last
+                await close_http_sessions()
                 
                 logger.info("Bot stopped successfully")
             except Exception as e:
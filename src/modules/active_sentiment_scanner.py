@@ -14,6 +14,8 @@ from typing import Dict, List, Optional, Set
 from datetime import datetime, timedelta
 from collections import Counter, defaultdict
 
+from src.modules.http_pool import get_http_session
+
 logger = logging.getLogger(__name__)
 
 
@@ -155,55 +157,55 @@ class ActiveSentimentScanner:
         found_tokens = {}
         
         try:
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    'Authorization': f'Bearer {self.twitter_bearer}',
-                    'User-Agent': 'Elite-Trading-Bot/1.0'
+            session = get_http_session()
+            headers = {
+                'Authorization': f'Bearer {self.twitter_bearer}',
+                'User-Agent': 'Elite-Trading-Bot/1.0'
+            }
+            
+            # Search recent tweets about Solana
+            for term in self.search_terms[:3]:  # Limit to avoid rate limits
+                url = 'https://api.twitter.com/2/tweets/search/recent'
+                params = {
+                    'query': f'{term} -is:retweet',
+                    'max_results': 10,
+                    'tweet.fields': 'created_at,public_metrics',
                 }
                 
-                # Search recent tweets about Solana
-                for term in self.search_terms[:3]:  # Limit to avoid rate limits
-                    url = 'https://api.twitter.com/2/tweets/search/recent'
-                    params = {
-                        'query': f'{term} -is:retweet',
-                        'max_results': 10,
-                        'tweet.fields': 'created_at,public_metrics',
-                    }
-                    
-                    async with session.get(url, headers=headers, params=params) as resp:
-                        if resp.status == 200:
-                            data = await resp.json()
-                            tweets = data.get('data', [])
+                async with session.get(url, headers=headers, params=params) as resp:
+                    if resp.status == 200:
+                        data = await resp.json()
+                        tweets = data.get('data', [])
+                        
+                        # Extract Solana addresses from tweets
+                        for tweet in tweets:
+                            text = tweet.get('text', '')
+                            addresses = self.solana_address_pattern.findall(text)
                             
-                            # Extract Solana addresses from tweets
-                            for tweet in tweets:
-                                text = tweet.get('text', '')
-                                addresses = self.solana_address_pattern.findall(text)
+                            for addr in addresses:
+                                if addr not in found_tokens:
+                                    found_tokens[addr] = {
+                                        'mentions': 0,
+                                        'sentiment': 50,
+                                        'source': 'twitter'
+                                    }
                                 
-                                for addr in addresses:
-                                    if addr not in found_tokens:
-                                        found_tokens[addr] = {
-                                            'mentions': 0,
-                                            'sentiment': 50,
-                                            'source': 'twitter'
-                                        }
-                                    
-                                    found_tokens[addr]['mentions'] += 1
-                                    
-                                    # Basic sentiment from engagement
-                                    metrics = tweet.get('public_metrics', {})
-                                    likes = metrics.get('like_count', 0)
-                                    retweets = metrics.get('retweet_count', 0)
-                                    engagement = likes + retweets * 2
-                                    
-                                    # Higher engagement = higher sentiment
-                                    if engagement > 50:
-                                        found_tokens[addr]['sentiment'] = 75
-                                    elif engagement > 10:
-                                        found_tokens[addr]['sentiment'] = 65
-                        else:
-                            logger.warning(f"Twitter API returned {resp.status}")
-                
+                                found_tokens[addr]['mentions'] += 1
+                                
+                                # Basic sentiment from engagement
+                                metrics = tweet.get('public_metrics', {})
+                                likes = metrics.get('like_count', 0)
+                                retweets = metrics.get('retweet_count', 0)
+                                engagement = likes + retweets * 2
+                                
+                                # Higher engagement = higher sentiment
+                                if engagement > 50:
+                                    found_tokens[addr]['sentiment'] = 75
+                                elif engagement > 10:
+                                    found_tokens[addr]['sentiment'] = 65
+                    else:
+                        logger.warning(f"Twitter API returned {resp.status}")
+            
         except Exception as e:
             logger.error(f"Twitter scan error: {e}")
         
@@ -223,66 +225,66 @@ class ActiveSentimentScanner:
         
         try:
             # Get Reddit access token
-            async with aiohttp.ClientSession() as session:
-                auth = aiohttp.BasicAuth(self.reddit_id, self.reddit_secret)
-                data = {
-                    'grant_type': 'client_credentials'
-                }
-                
-                async with session.post(
-                    'https://www.reddit.com/api/v1/access_token',
-                    auth=auth,
-                    data=data,
-                    headers={'User-Agent': 'EliteTradingBot/1.0'}
-                ) as resp:
-                    if resp.status == 200:
-                        token_data = await resp.json()
-                        access_token = token_data.get('access_token')
+            session = get_http_session()
+            auth = aiohttp.BasicAuth(self.reddit_id, self.reddit_secret)
+            data = {
+                'grant_type': 'client_credentials'
+            }
+            
+            async with session.post(
+                'https://www.reddit.com/api/v1/access_token',
+                auth=auth,
+                data=data,
+                headers={'User-Agent': 'EliteTradingBot/1.0'}
+            ) as resp:
+                if resp.status == 200:
+                    token_data = await resp.json()
+                    access_token = token_data.get('access_token')
+                    
+                    if access_token:
+                        # Search Solana-related subreddits
+                        headers = {
+                            'Authorization': f'Bearer {access_token}',
+                            'User-Agent': 'EliteTradingBot/1.0'
+                        }
                         
-                        if access_token:
-                            # Search Solana-related subreddits
-                            headers = {
-                                'Authorization': f'Bearer {access_token}',
-                                'User-Agent': 'EliteTradingBot/1.0'
-                            }
-                            
-                            subreddits = ['Solana', 'SolanaAlt', 'CryptoMoonShots']
+                        subreddits = ['Solana', 'SolanaAlt', 'CryptoMoonShots']
+                        
+                        for sub in subreddits:
+                            url = f'https://oauth.reddit.com/r/{sub}/hot'
+                            params = {'limit': 10}
                             
-                            for sub in subreddits:
-                                url = f'https://oauth.reddit.com/r/{sub}/hot'
-                                params = {'limit': 10}
-                                
-                                async with session.get(url, headers=headers, params=params) as r:
-                                    if r.status == 200:
-                                        data = await r.json()
-                                        posts = data.get('data', {}).get('children', [])
+                            async with session.get(url, headers=headers, params=params) as r:
+                                if r.status == 200:
+                                    data = await r.json()
+                                    posts = data.get('data', {}).get('children', [])
+                                    
+                                    for post in posts:
+                                        post_data = post.get('data', {})
+                                        title = post_data.get('title', '')
+                                        selftext = post_data.get('selftext', '')
+                                        text = f"{title} {selftext}"
                                         
-                                        for post in posts:
-                                            post_data = post.get('data', {})
-                                            title = post_data.get('title', '')
-                                            selftext = post_data.get('selftext', '')
-                                            text = f"{title} {selftext}"
+                                        # Extract addresses
+                                        addresses = self.solana_address_pattern.findall(text)
+                                        
+                                        for addr in addresses:
+                                            if addr not in found_tokens:
+                                                found_tokens[addr] = {
+                                                    'mentions': 0,
+                                                    'sentiment': 50,
+                                                    'source': 'reddit'
+                                                }
                                             
-                                            # Extract addresses
-                                            addresses = self.solana_address_pattern.findall(text)
+                                            found_tokens[addr]['mentions'] += 1
                                             
-                                            for addr in addresses:
-                                                if addr not in found_tokens:
-                                                    found_tokens[addr] = {
-                                                        'mentions': 0,
-                                                        'sentiment': 50,
-                                                        'source': 'reddit'
-                                                    }
-                                                
-                                                found_tokens[addr]['mentions'] += 1
-                                                
-                                                # Sentiment from upvotes
-                                                upvotes = post_data.get('ups', 0)
-                                                if upvotes > 50:
-                                                    found_tokens[addr]['sentiment'] = 70
-                                                elif upvotes > 10:
-                                                    found_tokens[addr]['sentiment'] = 60
-        
+                                            # Sentiment from upvotes
+                                            upvotes = post_data.get('ups', 0)
+                                            if upvotes > 50:
+                                                found_tokens[addr]['sentiment'] = 70
+                                            elif upvotes > 10:
+                                                found_tokens[addr]['sentiment'] = 60
+
         except Exception as e:
             logger.error(f"Reddit scan error: {e}")
         
@@ -13,21 +13,18 @@ FEATURES:
 - Daily loss limits
 """
 
-import asyncio
 import logging
 import os
 from datetime import datetime, timedelta
 from types import SimpleNamespace
-from typing import Dict, List, Optional, Tuple, Set
+from typing import Dict, Iterator, List, Optional, Tuple, Set
 
-from solders.pubkey import Pubkey
 from dataclasses import dataclass
 
-try:
-    import httpx
-    HTTPX_AVAILABLE = True
-except ImportError:
-    HTTPX_AVAILABLE = False
+from src.modules.bundle_tracker import LANDED, TrackedBundle
+from src.modules.position_monitor import MonitoredPosition, PositionMonitor
+from src.modules.signal_core import WalletSignalCore
+from src.modules.swap_pool import SOL_MINT, SwapIntent
 
 logger = logging.getLogger(__name__)
 
@@ -73,6 +70,8 @@ class AutomatedTradingEngine:
         protection_system,
         trade_executor=None,
         monitor=None,
+        position_monitor: Optional[PositionMonitor] = None,
+        signal_core: Optional[WalletSignalCore] = None,
     ):
         self.config = config
         self.wallet_intelligence = wallet_intelligence
@@ -89,18 +88,25 @@ class AutomatedTradingEngine:
         }
         self.is_running = False
 
-        # Cache the last processed signature per wallet so we do not
-        # re-process historical activity every scan.
-        self._wallet_last_signature: Dict[str, str] = {}
-
-        # Cache decoded transactions to avoid hammering the RPC endpoint.
-        self._transaction_cache: Dict[str, Dict[str, object]] = {}
-        self._transaction_cache_ttl = timedelta(minutes=10)
-
         # User risk configuration cache (refreshes periodically)
         self._user_settings: Optional[SimpleNamespace] = None
         self._settings_loaded_at: Optional[datetime] = None
 
+        # Wallet scanning, streaming and transaction parsing. Pass a shared core
+        # so several users' engines scan the tracked wallets only once.
+        self.signal_core = signal_core or WalletSignalCore(config, wallet_intelligence, monitor=monitor)
+
+        # Stop loss / take profit / trailing exits run on the position monitor's
+        # own cadence. Pass a shared monitor to watch every user's positions with
+        # one batched price request per tick.
+        self._owns_position_monitor = position_monitor is None
+        self.position_monitor = position_monitor or PositionMonitor(
+            self._fetch_position_prices,
+            interval=float(os.getenv('AUTO_TRADER_POSITION_CHECK_SECONDS', '5')),
+            monitor=monitor,
+        )
+        self._monitored_mints: Set[str] = set()
+
         logger.info("🤖 Automated Trading Engine initialized")
 
     async def start_automated_trading(self, user_id: int, user_keypair, wallet_manager, db_manager=None):
@@ -119,10 +125,25 @@ class AutomatedTradingEngine:
         # Load tracked wallets from database
         if self.db:
             await self._load_tracked_wallets_from_db()
-        
-        # Start trading loop in background
-        asyncio.create_task(self._automated_trading_loop())
-    
+
+        # Exits run on the position monitor's cadence, not the scan loop's
+        self.position_monitor.add_sync_hook(self._sync_monitored_positions)
+        await self.position_monitor.start()
+
+        # Opportunities arrive from the (possibly shared) signal core's scan loop
+        self.signal_core.subscribe(self)
+        await self.signal_core.start()
+
+        # Keep exits and likely copy-trade buys prebuilt
+        swap_pool = getattr(self.jupiter, 'swap_pool', None)
+        if swap_pool:
+            swap_pool.add_source(self._swap_intents)
+
+        # Jito buys are recorded at submission; drop them if the bundle never lands
+        bundle_tracker = getattr(self.jupiter, 'bundle_tracker', None)
+        if bundle_tracker is not None:
+            bundle_tracker.add_listener(self._on_bundle_resolved)
+
     async def _load_tracked_wallets_from_db(self):
         """Load tracked wallets from database into wallet intelligence"""
         try:
@@ -156,467 +177,99 @@ class AutomatedTradingEngine:
     async def stop_automated_trading(self):
         """Stop automated trading"""
         self.is_running = False
+        swap_pool = getattr(self.jupiter, 'swap_pool', None)
+        if swap_pool:
+            swap_pool.remove_source(self._swap_intents)
+        bundle_tracker = getattr(self.jupiter, 'bundle_tracker', None)
+        if bundle_tracker is not None:
+            bundle_tracker.remove_listener(self._on_bundle_resolved)
+        self.signal_core.unsubscribe(self)
+        if not self.signal_core.subscriber_count:
+            await self.signal_core.stop()
+
+        self.position_monitor.remove_sync_hook(self._sync_monitored_positions)
+        for token_mint in self._monitored_mints:
+            self.position_monitor.remove(self._position_key(token_mint))
+        self._monitored_mints.clear()
+        if self._owns_position_monitor:
+            await self.position_monitor.stop()
         logger.info("🛑 Automated trading STOPPED")
     
-    async def _automated_trading_loop(self):
-        """Main automated trading loop"""
-        logger.info("🔄 Automated trading loop started")
-        
-        while self.is_running:
-            try:
-                logger.debug(f"💫 Trading loop iteration - is_running={self.is_running}")
-                settings = await self._get_user_settings()
-
-                # Reset daily stats if needed
-                if datetime.now().date() != self.daily_stats['last_reset']:
-                    self.daily_stats = {
-                        'trades': 0,
-                        'profit_loss': 0.0,
-                        'last_reset': datetime.now().date()
-                    }
-                    logger.info("📊 Daily stats reset")
-                
-                # Check daily limits
-                if self.daily_stats['trades'] >= self.config.auto_trade_max_daily_trades:
-                    logger.info("Daily trade limit reached, waiting...")
-                    await asyncio.sleep(60)
-                    continue
-                
-                if self.db:
-                    daily_pnl = await self.db.get_daily_pnl(self.user_id)
-                    self.daily_stats['profit_loss'] = daily_pnl
-
-                    if settings.daily_loss_limit_sol > 0 and daily_pnl <= -settings.daily_loss_limit_sol:
-                        logger.warning(
-                            "Daily loss limit reached (%.4f <= -%.4f SOL) - pausing trading",
-                            daily_pnl,
-                            settings.daily_loss_limit_sol,
-                        )
-                        await asyncio.sleep(300)
-                        continue
-                elif (
-                    settings.daily_loss_limit_sol > 0
-                    and abs(self.daily_stats['profit_loss']) >= settings.daily_loss_limit_sol
-                ):
-                    logger.warning("Daily loss limit reached - pausing trading")
-                    await asyncio.sleep(300)
-                    continue
-                
-                # Find trading opportunities
-                opportunities = await self._scan_for_opportunities()
-                
-                # Execute high-confidence opportunities
-                for opp in opportunities:
-                    if opp['confidence'] >= self.config.auto_trade_min_confidence:
-                        await self._execute_automated_trade(opp, settings)
-
-                # Manage existing positions
-                await self._manage_positions(settings)
-                
-                # Wait before next scan (30 seconds to avoid rate limits)
-                await asyncio.sleep(30)
-                
-            except Exception as e:
-                logger.error(f"Error in automated trading loop: {e}")
-                await asyncio.sleep(30)
-    
-    async def _scan_for_opportunities(self) -> List[Dict]:
+    async def handle_opportunities(self, opportunities: List[Dict], once_per_window: bool = False) -> List[str]:
         """
-        🔍 SCAN FOR TRADING OPPORTUNITIES
-        
-        Uses:
-        - Top wallet following
-        - Technical signals
-        - AI predictions
-        - Pattern recognition
-        """
-        
-        opportunities = []
-        token_signals = {}  # Track how many wallets are buying each token
-        
-        try:
-            # Get all tracked wallets (not just top 5 - check all 558!)
-            all_tracked_wallets = list(self.wallet_intelligence.tracked_wallets.items())
-
-            if not all_tracked_wallets:
-                logger.debug("No tracked wallets to monitor")
-                return opportunities
-
-            wallet_count = len(all_tracked_wallets)
-            logger.info(f"🔍 Scanning {wallet_count} tracked wallets for opportunities...")
+        Signal core callback: apply this user's gates and trade.
 
-            scan_started = datetime.now()
-            rpc_requests = 0
-            wallets_with_activity: Set[str] = set()
-
-            batch_size = 20
-
-            for batch_start in range(0, wallet_count, batch_size):
-                batch = all_tracked_wallets[batch_start: batch_start + batch_size]
-
-                signature_tasks = [
-                    self._fetch_recent_signatures(address)
-                    for address, _ in batch
-                ]
-
-                batch_results = await asyncio.gather(*signature_tasks, return_exceptions=True)
-
-                for (address, metrics), result in zip(batch, batch_results):
-                    if isinstance(result, Exception):
-                        logger.debug(f"Error retrieving signatures for {address[:8]}: {result}")
-                        continue
-
-                    rpc_requests += result['rpc_calls']
-                    signatures = result['signatures']
-
-                    if not signatures:
-                        continue
-
-                    newest_signature: Optional[str] = None
-                    last_processed = self._wallet_last_signature.get(address)
-
-                    for sig_info in signatures:
-                        sig_value = getattr(sig_info, 'signature', None)
-                        sig_str = str(sig_value) if sig_value else None
-
-                        if not sig_str:
-                            continue
-
-                        if newest_signature is None:
-                            newest_signature = sig_str
-
-                        if sig_str == last_processed:
-                            break
-
-                        if hasattr(sig_info, 'block_time') and sig_info.block_time:
-                            tx_time = datetime.fromtimestamp(sig_info.block_time)
-                            if (datetime.now() - tx_time).total_seconds() > 300:
-                                continue
-
-                        token_mint, tx_rpc_calls = await self._parse_swap_transaction(sig_str)
-                        rpc_requests += tx_rpc_calls
-
-                        if token_mint:
-                            wallets_with_activity.add(address)
-
-                            if token_mint not in token_signals:
-                                token_signals[token_mint] = {
-                                    'count': 0,
-                                    'wallets': [],
-                                    'scores': [],
-                                    'first_seen': datetime.now()
-                                }
-
-                            token_signals[token_mint]['count'] += 1
-                            token_signals[token_mint]['wallets'].append(address)
-                            token_signals[token_mint]['scores'].append(metrics.calculate_score())
-
-                            logger.info(
-                                f"🎯 Detected buy from {address[:8]}... (score: {metrics.calculate_score():.0f}) - Token: {token_mint[:8]}..."
-                            )
-
-                    if newest_signature:
-                        self._wallet_last_signature[address] = newest_signature
+        Returns the token mints this user is done with: bought, attempted (a
+        failed swap is not retried) or rejected by the safety checks. Windowed
+        signals this engine declines (held position, daily limits, no executor
+        or trade size) are offered again on later scans.
+        """
+        if not self.is_running:
+            return []
+
+        if once_per_window:
+            opportunities = [opp for opp in opportunities if opp['token_mint'] not in self.active_positions]
+        if not opportunities:
+            return []
+
+        settings = await self._get_user_settings()
+        if await self._check_trading_limits(settings):
+            return []
+
+        taken = []
+        for opp in opportunities:
+            if opp['confidence'] >= self.config.auto_trade_min_confidence:
+                opp['amount'] = self.config.default_buy_amount
+                if await self._execute_automated_trade(opp, settings):
+                    taken.append(opp['token_mint'])
+
+        return taken
+
+    async def _check_trading_limits(self, settings: SimpleNamespace) -> Optional[int]:
+        """Apply daily trade/loss limits. Returns a back-off in seconds while limited, or None to trade."""
+
+        # Reset daily stats if needed
+        if datetime.now().date() != self.daily_stats['last_reset']:
+            self.daily_stats = {
+                'trades': 0,
+                'profit_loss': 0.0,
+                'last_reset': datetime.now().date()
+            }
+            logger.info("📊 Daily stats reset")
 
-                # Brief pause between batches to remain within rate limits
-                await asyncio.sleep(0.05)
+        # Check daily limits
+        if self.daily_stats['trades'] >= self.config.auto_trade_max_daily_trades:
+            logger.info("Daily trade limit reached, waiting...")
+            return 60
 
-            # Generate opportunities from strong signals
-            for token_mint, signal in token_signals.items():
-                # Calculate confidence based on:
-                # 1. Number of wallets buying
-                # 2. Quality of wallets (scores)
-                # 3. Recency
-                
-                wallet_count = signal['count']
-                avg_wallet_score = sum(signal['scores']) / len(signal['scores']) if signal['scores'] else 0
-                
-                # Confidence formula
-                confidence = 0.5  # Base confidence
-                
-                # Add confidence for multiple wallet signals
-                confidence += min(wallet_count * 0.1, 0.3)  # Up to +30% for 3+ wallets
-                
-                # Add confidence for high-quality wallets
-                if avg_wallet_score > 75:
-                    confidence += 0.2
-                elif avg_wallet_score > 60:
-                    confidence += 0.1
-                
-                # Only create opportunity if confidence meets minimum
-                if confidence >= self.config.auto_trade_min_confidence:
-                    opportunities.append({
-                        'token_mint': token_mint,
-                        'action': 'buy',
-                        'amount': self.config.default_buy_amount,
-                        'confidence': confidence,
-                        'signal_count': wallet_count,
-                        'wallet_scores': signal['scores'],
-                        'reason': f"{wallet_count} top wallets buying (avg score: {avg_wallet_score:.0f})"
-                    })
-                    
-                    logger.info(f"✨ OPPORTUNITY FOUND: {token_mint[:8]}... - Confidence: {confidence:.1%} ({wallet_count} wallets)")
-
-            if opportunities:
-                logger.info(f"🎯 Found {len(opportunities)} high-confidence opportunities!")
-            else:
-                logger.debug(f"No opportunities found (checked {len(all_tracked_wallets)} wallets)")
-
-            scan_duration = (datetime.now() - scan_started).total_seconds()
-            if self.monitor:
-                self.monitor.record_metric(
-                    'automated_trader.scan_duration_seconds',
-                    scan_duration,
-                    tags={'wallets_total': wallet_count}
-                )
-                self.monitor.record_metric(
-                    'automated_trader.rpc_requests',
-                    rpc_requests,
-                    tags={'wallets_with_activity': len(wallets_with_activity)}
-                )
-                self.monitor.record_metric(
-                    'automated_trader.opportunities_found',
-                    len(opportunities),
+        if self.db:
+            daily_pnl = await self.db.get_daily_pnl(self.user_id)
+            self.daily_stats['profit_loss'] = daily_pnl
+
+            if settings.daily_loss_limit_sol > 0 and daily_pnl <= -settings.daily_loss_limit_sol:
+                logger.warning(
+                    "Daily loss limit reached (%.4f <= -%.4f SOL) - pausing trading",
+                    daily_pnl,
+                    settings.daily_loss_limit_sol,
                 )
+                return 300
+        elif (
+            settings.daily_loss_limit_sol > 0
+            and abs(self.daily_stats['profit_loss']) >= settings.daily_loss_limit_sol
+        ):
+            logger.warning("Daily loss limit reached - pausing trading")
+            return 300
 
-        except Exception as e:
-            logger.error(f"Error scanning for opportunities: {e}")
-
-        return opportunities
-
-    async def _fetch_recent_signatures(self, address: str, limit: int = 3) -> Dict[str, object]:
-        """Fetch recent signatures for an address with monitoring instrumentation."""
-
-        rpc_calls = 0
-
-        try:
-            pubkey = Pubkey.from_string(address)
-        except Exception as exc:
-            logger.debug(f"Invalid wallet address {address[:8]}: {exc}")
-            return {'signatures': [], 'rpc_calls': rpc_calls}
-
-        try:
-            if self.monitor:
-                self.monitor.record_request()
-
-            signatures = await self.wallet_intelligence.client.get_signatures_for_address(
-                pubkey,
-                limit=limit
-            )
-            rpc_calls += 1
-
-            return {
-                'signatures': signatures.value if signatures and signatures.value else [],
-                'rpc_calls': rpc_calls
-            }
-
-        except Exception as exc:
-            logger.debug(f"Error fetching signatures for {address[:8]}: {exc}")
-            return {'signatures': [], 'rpc_calls': rpc_calls}
+        return None
 
-    async def _parse_swap_transaction(self, signature: str) -> Tuple[Optional[str], int]:
+    async def _execute_automated_trade(self, opportunity: Dict, settings: Optional[SimpleNamespace] = None) -> bool:
         """
-        Parse a transaction to detect token swaps and extract the token mint
+        Execute an automated trade.
 
-        Uses multiple methods (in priority order):
-        1. Helius Enhanced API (if available)
-        2. Pre/post token balance comparison
-        3. Parsed instruction analysis
-        4. DEX program detection
-        
-        Returns:
-            Tuple of (token mint address if this was a buy transaction, RPC call count)
+        Returns True once the opportunity is used up for this user (trade
+        attempted, whatever its outcome, or token rejected by the safety
+        checks), False when it was declined before any attempt.
         """
-        rpc_calls = 0
-
-        cached = self._transaction_cache.get(signature)
-        if cached:
-            cached_at = cached.get('timestamp')
-            if cached_at and (datetime.now() - cached_at) < self._transaction_cache_ttl:
-                return cached.get('mint'), rpc_calls
-            # Cache expired, remove so we refresh
-            self._transaction_cache.pop(signature, None)
-
-        try:
-            # METHOD 0: Try Helius Enhanced Transaction API first (if Helius RPC)
-            helius_api_key = os.getenv('HELIUS_API_KEY')
-
-            if helius_api_key and HTTPX_AVAILABLE:
-                try:
-                    # Use Helius enhanced transaction endpoint
-                    async with httpx.AsyncClient() as client:
-                        if self.monitor:
-                            self.monitor.record_request()
-                        rpc_calls += 1
-                        response = await client.get(
-                            f"https://api.helius.xyz/v0/transactions/{signature}",
-                            params={'api-key': helius_api_key},
-                            timeout=5.0
-                        )
-                        
-                        if response.status_code == 200:
-                            helius_data = response.json()
-                            
-                            # Helius provides parsed swap data
-                            if helius_data.get('type') in ['SWAP', 'SWAP_EXACT_IN', 'SWAP_EXACT_OUT']:
-                                # Extract token info from Helius parsed data
-                                token_transfers = helius_data.get('tokenTransfers', [])
-                                
-                                for transfer in token_transfers:
-                                    # Look for incoming transfers (tokens received)
-                                    if transfer.get('tokenAmount', 0) > 0:
-                                        mint = transfer.get('mint')
-                                        if mint and mint != "So11111111111111111111111111111111111111112":
-                                            logger.info(f"🎯 [Helius] Detected SWAP: {mint[:8]}... via {helius_data.get('source', 'DEX')}")
-                                            self._transaction_cache[signature] = {
-                                                'timestamp': datetime.now(),
-                                                'mint': mint
-                                            }
-                                            return mint, rpc_calls
-
-                except Exception as e:
-                    logger.debug(f"Helius enhanced API unavailable, falling back to standard parsing: {e}")
-
-            # METHOD 1: Standard RPC with balance comparison
-            if self.monitor:
-                self.monitor.record_request()
-            tx = await self.wallet_intelligence.client.get_transaction(
-                signature,
-                encoding="jsonParsed",
-                max_supported_transaction_version=0
-            )
-            rpc_calls += 1
-
-            if not tx or not tx.value:
-                self._transaction_cache[signature] = {
-                    'timestamp': datetime.now(),
-                    'mint': None
-                }
-                return None, rpc_calls
-            
-            # METHOD 1: Check token balance changes (most reliable)
-            # This shows what tokens were received in the transaction
-            if hasattr(tx.value, 'meta') and tx.value.meta:
-                meta = tx.value.meta
-                
-                # Check post token balances for new tokens received
-                if hasattr(meta, 'post_token_balances') and hasattr(meta, 'pre_token_balances'):
-                    post_balances = meta.post_token_balances
-                    pre_balances = meta.pre_token_balances
-                    
-                    # Build dict of pre-balances for comparison
-                    pre_balance_dict = {}
-                    if pre_balances:
-                        for bal in pre_balances:
-                            account = str(bal.account_index)
-                            mint = bal.mint
-                            amount = float(bal.ui_token_amount.ui_amount) if bal.ui_token_amount else 0
-                            pre_balance_dict[f"{account}_{mint}"] = amount
-                    
-                    # Check post balances for increases (tokens received)
-                    if post_balances:
-                        for bal in post_balances:
-                            account = str(bal.account_index)
-                            mint = bal.mint
-                            post_amount = float(bal.ui_token_amount.ui_amount) if bal.ui_token_amount else 0
-                            
-                            # Get pre amount (or 0 if didn't exist)
-                            pre_amount = pre_balance_dict.get(f"{account}_{mint}", 0)
-                            
-                            # If balance increased, this token was received (bought)
-                            if post_amount > pre_amount:
-                                # Skip SOL and wrapped SOL
-                                SOL_MINT = "So11111111111111111111111111111111111111112"
-                                WSOL_MINT = "So11111111111111111111111111111111111111112"
-                                
-                                if mint not in [SOL_MINT, WSOL_MINT]:
-                                    logger.info(f"🎯 Detected token BUY: {mint[:8]}... (+{post_amount - pre_amount:.4f} tokens)")
-                                    self._transaction_cache[signature] = {
-                                        'timestamp': datetime.now(),
-                                        'mint': mint
-                                    }
-                                    return mint, rpc_calls
-            
-            # METHOD 2: Parse instructions for token transfers
-            instructions = tx.value.transaction.transaction.message.instructions
-            
-            # Track all token transfers in this transaction
-            tokens_received = []
-            tokens_sent = []
-            
-            for instruction in instructions:
-                # Check parsed instructions
-                if hasattr(instruction, 'parsed') and isinstance(instruction.parsed, dict):
-                    parsed = instruction.parsed
-                    instruction_type = parsed.get('type')
-                    
-                    # Token transfer or transferChecked
-                    if instruction_type in ['transfer', 'transferChecked']:
-                        info = parsed.get('info', {})
-                        mint = info.get('mint')
-                        
-                        # Determine direction by checking destination
-                        if mint:
-                            # This is a simplification - would need to check if destination
-                            # belongs to the wallet we're monitoring
-                            tokens_received.append(mint)
-            
-            # METHOD 3: Detect known DEX program calls
-            for instruction in instructions:
-                if hasattr(instruction, 'program_id'):
-                    program_id = str(instruction.program_id)
-                    
-                    # Known DEX programs
-                    dex_programs = {
-                        "JUP6LkbZbjS1jKKwapdHNy74zcZ3tLUZoi5QNyVTaV4": "Jupiter V6",
-                        "JUP4Fb2cqiRUcaTHdrPC8h2gNsA2ETXiPDD33WcGuJB": "Jupiter V4",
-                        "675kPX9MHTjS2zt1qfr1NYHuzeLXfQM9H24wFSUt1Mp8": "Raydium AMM",
-                        "whirLbMiicVdio4qvUfM5KAg6Ct8VwpYzGff3uctyCc": "Orca Whirlpool",
-                    }
-                    
-                    if program_id in dex_programs:
-                        dex_name = dex_programs[program_id]
-                        logger.debug(f"Detected {dex_name} swap in transaction")
-
-                        # If we detected a DEX swap and found tokens received via Method 1 or 2,
-                        # return the first non-SOL token
-                        for token in tokens_received:
-                            SOL_MINT = "So11111111111111111111111111111111111111112"
-                            if token != SOL_MINT:
-                                logger.info(f"🎯 Detected {dex_name} token buy: {token[:8]}...")
-                                self._transaction_cache[signature] = {
-                                    'timestamp': datetime.now(),
-                                    'mint': token
-                                }
-                                return token, rpc_calls
-            
-            # If we found any tokens received but no DEX program, might still be a swap
-            # Return first non-SOL token found
-            for token in tokens_received:
-                SOL_MINT = "So11111111111111111111111111111111111111112"
-                if token != SOL_MINT:
-                    self._transaction_cache[signature] = {
-                        'timestamp': datetime.now(),
-                        'mint': token
-                    }
-                    return token, rpc_calls
-            
-            self._transaction_cache[signature] = {
-                'timestamp': datetime.now(),
-                'mint': None
-            }
-            return None, rpc_calls
-            
-        except Exception as e:
-            logger.debug(f"Error parsing transaction {str(signature)[:8]}: {e}")
-            self._transaction_cache[signature] = {
-                'timestamp': datetime.now(),
-                'mint': None
-            }
-            return None, rpc_calls
-    
-    async def _execute_automated_trade(self, opportunity: Dict, settings: Optional[SimpleNamespace] = None):
-        """Execute an automated trade"""
 
         try:
             token_mint = opportunity.get('token_mint')
@@ -635,22 +288,25 @@ class AutomatedTradingEngine:
 
                 if not protection_result['is_safe']:
                     logger.warning(f"⚠️ Token failed safety checks, skipping trade")
-                    return
+                    return True
 
             if not self.trade_executor:
                 logger.error("Trade executor is not configured for automated trading")
-                return
+                return False
 
             amount = min(amount, settings.max_trade_size_sol)
             if amount <= 0:
                 logger.debug("Configured max trade size prevents automated trade for user %s", self.user_id)
-                return
+                return False
 
             metadata = {
                 'opportunity': opportunity.get('source'),
                 'confidence': confidence,
                 'wallet_signal': opportunity.get('wallet_address'),
             }
+            if opportunity.get('latency') is not None:
+                # Shared with the opportunity, so execution stages land on both
+                metadata['latency'] = opportunity['latency']
 
             if action == 'buy':
                 result = await self.trade_executor.execute_buy(
@@ -673,6 +329,10 @@ class AutomatedTradingEngine:
                     metadata=metadata,
                 )
 
+            if result.get('success') and self._bundle_failed(result.get('bundle_id')):
+                logger.error(f"❌ Automated trade failed: Jito bundle {result.get('bundle_id')} did not land")
+                return True
+
             if result.get('success'):
                 stop_loss_pct = None
                 take_profit_pct = None
@@ -692,22 +352,28 @@ class AutomatedTradingEngine:
                     'token_symbol': opportunity.get('token_symbol'),
                     'stop_loss_pct': stop_loss_pct,
                     'take_profit_pct': take_profit_pct,
+                    'amount_raw': result.get('amount_raw'),
+                    'bundle_id': result.get('bundle_id'),
                 }
 
                 # Update stats
                 self.daily_stats['trades'] += 1
                 
                 logger.info(f"✅ Automated trade executed successfully")
-            else:
-                logger.error(f"❌ Automated trade failed: {result.get('error')}")
-        
+                return True
+
+            logger.error(f"❌ Automated trade failed: {result.get('error')}")
+            return True
+
         except Exception as e:
             logger.error(f"Error executing automated trade: {e}")
+            return True
     
     async def _manage_positions(self, settings: Optional[SimpleNamespace] = None):
         """
         📊 MANAGE OPEN POSITIONS
 
+        One position monitor tick, outside its regular cadence:
         - Check stop losses
         - Check take profits
         - Implement trailing stops
@@ -716,53 +382,131 @@ class AutomatedTradingEngine:
         if settings is None:
             settings = await self._get_user_settings()
 
+        self._sync_monitored_positions(settings)
+        await self.position_monitor.tick(wait=True)
+
+    def _bundle_failed(self, bundle_id: Optional[str]) -> bool:
+        """Whether a Jito bundle has already resolved without landing."""
+        bundle_tracker = getattr(self.jupiter, 'bundle_tracker', None)
+        bundle = bundle_tracker.get(bundle_id) if bundle_tracker is not None and bundle_id else None
+        return bundle is not None and bundle.done and bundle.status != LANDED
+
+    async def _on_bundle_resolved(self, bundle: TrackedBundle):
+        """Bundle tracker listener: forget positions whose buy bundle failed or expired."""
+        if bundle.status == LANDED:
+            return
+
         for token_mint, position in list(self.active_positions.items()):
-            try:
-                # Get current price
-                current_price = await self._get_token_price(token_mint)
-                
-                if current_price is None:
-                    continue
-                
-                entry_price = position['entry_price']
-                pnl_pct = (current_price - entry_price) / entry_price if entry_price > 0 else 0
+            if position.get('bundle_id') != bundle.bundle_id:
+                continue
+            del self.active_positions[token_mint]
+            self.position_monitor.remove(self._position_key(token_mint))
+            self._monitored_mints.discard(token_mint)
+            logger.warning(
+                f"⚠️ Dropped position {token_mint[:8]}...: Jito bundle {bundle.status.lower()} ({bundle.error or 'unknown'})"
+            )
 
-                # Check stop loss
-                stop_loss_pct = position.get('stop_loss_pct')
-                if stop_loss_pct is None and settings.use_stop_loss and settings.default_stop_loss_percentage:
-                    stop_loss_pct = max(settings.default_stop_loss_percentage, 0.0) / 100.0
+    def _position_key(self, token_mint: str) -> Tuple[Optional[int], str]:
+        return (getattr(self, 'user_id', None), token_mint)
 
-                if stop_loss_pct is not None and pnl_pct <= -stop_loss_pct:
-                    logger.info(f"🛑 Stop loss triggered for {token_mint[:8]}... (PnL: {pnl_pct:.1%})")
-                    await self._close_position(token_mint, "STOP_LOSS", pnl_pct)
-                    continue
+    def _sync_monitored_positions(self, settings: Optional[SimpleNamespace] = None):
+        """
+        Reconcile the position monitor with active_positions.
 
-                # Check take profit
-                take_profit_pct = position.get('take_profit_pct')
-                if take_profit_pct is None and settings.use_take_profit and settings.default_take_profit_percentage:
-                    take_profit_pct = max(settings.default_take_profit_percentage, 0.0) / 100.0
+        Positions are also recorded by other modules (the sniper writes into
+        active_positions directly), so this runs before every monitor tick.
+        """
+        for token_mint in list(self._monitored_mints):
+            if token_mint not in self.active_positions:
+                self.position_monitor.remove(self._position_key(token_mint))
+                self._monitored_mints.discard(token_mint)
+
+        if settings is None:
+            settings = self._user_settings or self._default_user_settings()
+
+        for token_mint, position in self.active_positions.items():
+            key = self._position_key(token_mint)
+            tracked = self.position_monitor.get(key)
+            if tracked is not None and tracked.data is position:
+                continue
+
+            stop_loss_pct = position.get('stop_loss_pct')
+            if stop_loss_pct is None and settings.use_stop_loss and settings.default_stop_loss_percentage:
+                stop_loss_pct = max(settings.default_stop_loss_percentage, 0.0) / 100.0
+
+            take_profit_pct = position.get('take_profit_pct')
+            if take_profit_pct is None and settings.use_take_profit and settings.default_take_profit_percentage:
+                take_profit_pct = max(settings.default_take_profit_percentage, 0.0) / 100.0
+
+            self.position_monitor.add(MonitoredPosition(
+                key=key,
+                token_mint=token_mint,
+                entry_price=position.get('entry_price') or 0,
+                on_trigger=self._on_position_trigger,
+                stop_loss_pct=stop_loss_pct,
+                take_profit_pct=take_profit_pct,
+                trailing_stop_pct=self.config.trailing_stop_percentage,
+                highest_price=position.get('highest_price'),
+                data=position,
+            ))
+            self._monitored_mints.add(token_mint)
+
+    async def _on_position_trigger(self, tracked: MonitoredPosition, reason: str, price: float):
+        """Position monitor callback: close the position that hit a trigger level."""
+        token_mint = tracked.token_mint
+        position = tracked.data
+        if self.active_positions.get(token_mint) is not position:
+            return  # closed or replaced since the tick started
+
+        self._monitored_mints.discard(token_mint)
+        if tracked.highest_price is not None:
+            position['highest_price'] = tracked.highest_price
+
+        pnl_pct = tracked.pnl_pct(price)
+        if reason == "STOP_LOSS":
+            logger.info(f"🛑 Stop loss triggered for {token_mint[:8]}... (PnL: {pnl_pct:.1%})")
+        elif reason == "TAKE_PROFIT":
+            logger.info(f"💰 Take profit triggered for {token_mint[:8]}... (PnL: {pnl_pct:.1%})")
+        else:
+            logger.info(f"📉 Trailing stop triggered for {token_mint[:8]}... (PnL: {pnl_pct:.1%})")
+
+        await self._close_position(token_mint, reason, pnl_pct)
+
+    def _swap_intents(self) -> Iterator[SwapIntent]:
+        """
+        Swap pool source: full exits for open positions and buys for hot signals,
+        with the same amounts, slippage and priority fees TradeExecutionService will use.
+        """
+        keypair = getattr(self, 'user_keypair', None)
+        if not self.is_running or keypair is None or not self.trade_executor:
+            return
+
+        settings = self._user_settings or self._default_user_settings()
+        slippage_bps = max(1, int(settings.slippage_percentage * 100))
+        user_pubkey = str(keypair.pubkey())
+
+        if self.active_positions:
+            exit_fee = self.trade_executor.expected_priority_fee('auto_trader', 'sell')
+            for token_mint, position in self.active_positions.items():
+                if position.get('amount_raw'):
+                    yield SwapIntent(
+                        user_pubkey, token_mint, SOL_MINT, int(position['amount_raw']), slippage_bps, exit_fee
+                    )
+
+        amount = min(self.config.default_buy_amount, settings.max_trade_size_sol)
+        if amount <= 0:
+            return
+        buy_fee = self.trade_executor.expected_priority_fee('auto_trader', 'buy', 'jito')
+        for token_mint in self.signal_core.hot_tokens(self):
+            if token_mint not in self.active_positions:
+                yield SwapIntent(user_pubkey, SOL_MINT, token_mint, int(amount * 1e9), slippage_bps, buy_fee)
+
+    async def _fetch_position_prices(self, token_mints: List[str]) -> Dict[str, float]:
+        """Price fetcher for the position monitor: one request per batch of mints."""
+        if not self.jupiter:
+            return {}
+        return await self.jupiter.get_token_price(token_mints)
 
-                if take_profit_pct is not None and pnl_pct >= take_profit_pct:
-                    logger.info(f"💰 Take profit triggered for {token_mint[:8]}... (PnL: {pnl_pct:.1%})")
-                    await self._close_position(token_mint, "TAKE_PROFIT", pnl_pct)
-                    continue
-
-                # Implement trailing stop
-                if pnl_pct > 0:
-                    if 'highest_price' not in position:
-                        position['highest_price'] = current_price
-                    else:
-                        position['highest_price'] = max(position['highest_price'], current_price)
-                        
-                        # Check if price fell from highest
-                        price_drop = (position['highest_price'] - current_price) / position['highest_price']
-                        if price_drop >= self.config.trailing_stop_percentage:
-                            logger.info(f"📉 Trailing stop triggered for {token_mint[:8]}... (PnL: {pnl_pct:.1%})")
-                            await self._close_position(token_mint, "TRAILING_STOP", pnl_pct)
-                
-            except Exception as e:
-                logger.error(f"Error managing position {token_mint}: {e}")
-    
     async def _get_token_price(self, token_mint: str) -> Optional[float]:
         """Get current token price"""
         try:
@@ -873,6 +617,11 @@ class AutomatedTradingEngine:
             'daily_trades': self.daily_stats['trades'],
             'daily_pnl': self.daily_stats['profit_loss'],
             'active_positions': len(self.active_positions),
-            'positions': list(self.active_positions.keys())
+            'positions': list(self.active_positions.keys()),
+            'streaming': self.signal_core.wallet_stream is not None and self.signal_core.wallet_stream.connected.is_set(),
+            'detection_latency': self.signal_core.get_detection_latency_stats(),
+            'scheduler': self.signal_core.scheduler.stats() if self.signal_core.scheduler else None,
+            'signal_subscribers': self.signal_core.subscriber_count,
+            'position_monitor': self.position_monitor.stats(),
         }
 
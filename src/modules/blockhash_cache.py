@@ -0,0 +1,225 @@
+"""
+⏱️ BLOCKHASH CACHE
+Latest blockhash, last valid block height and current slot kept warm in memory
+
+FEATURES:
+- getLatestBlockhash, getBlockHeight and getSlot refreshed together in one
+  JSON-RPC batch request on a short cadence
+- Optional slotSubscribe stream moves the slot forward between refreshes
+- Recently seen blockhashes remember their lastValidBlockHeight, so the expiry
+  of a transaction built on one of them is known without asking the node
+- Readers never wait: values come from memory, or None once they are too old
+  to trust (callers then fall back to their own RPC call)
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import websockets
+from solders.transaction import VersionedTransaction
+
+logger = logging.getLogger(__name__)
+
+
+def transaction_blockhash(tx_bytes: bytes) -> str:
+    """Recent blockhash a serialized (signed or unsigned) versioned transaction was built on."""
+    return str(VersionedTransaction.from_bytes(tx_bytes).message.recent_blockhash)
+
+
+@dataclass(frozen=True)
+class BlockhashInfo:
+    blockhash: str
+    last_valid_block_height: int
+    slot: int                 # context slot of the getLatestBlockhash response
+    fetched_at: float         # time.monotonic()
+
+
+class BlockhashCache:
+    """
+    Background-refreshed chain clock.
+
+    `rpc` is anything with `async call_many(calls)` (JsonRpcBatchClient).
+    Block height is only ever taken from the node, never extrapolated, so an
+    expiry decision based on it can be late by one refresh but never early.
+    """
+
+    def __init__(
+        self,
+        rpc,
+        *,
+        interval: float = 1.0,
+        commitment: str = 'confirmed',
+        max_age: float = 10.0,
+        ws_url: Optional[str] = None,
+        reconnect_delay: float = 5.0,
+        history: int = 300,
+        monitor=None,
+    ):
+        self.rpc = rpc
+        self.interval = interval
+        self.commitment = commitment
+        self.max_age = max_age
+        self.ws_url = ws_url
+        self.reconnect_delay = reconnect_delay
+        self.history = history
+        self.monitor = monitor
+
+        self._latest: Optional[BlockhashInfo] = None
+        self._block_height: Optional[int] = None
+        self._slot: Optional[int] = None
+        self._updated_at = 0.0
+        self._last_valid: "OrderedDict[str, int]" = OrderedDict()   # blockhash -> last valid block height
+
+        self._tasks = []
+        self.running = False
+        self.refreshes = 0
+        self.refresh_failures = 0
+        self.slot_notifications = 0
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self):
+        if self.running:
+            return
+        self.running = True
+        self._tasks = [asyncio.create_task(self._run())]
+        if self.ws_url:
+            self._tasks.append(asyncio.create_task(self._stream_slots()))
+        logger.info(
+            f"⏱️ Blockhash cache started ({self.interval * 1000:.0f}ms refresh"
+            f"{', slotSubscribe' if self.ws_url else ''})"
+        )
+
+    async def stop(self):
+        self.running = False
+        for task in self._tasks:
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._tasks = []
+
+    async def _run(self):
+        while self.running:
+            try:
+                await self.refresh()
+            except Exception as e:
+                self.refresh_failures += 1
+                logger.debug(f"Blockhash refresh failed: {e}")
+            await asyncio.sleep(self.interval)
+
+    async def refresh(self):
+        """Fetch blockhash, block height and slot in one batch request."""
+        config = {'commitment': self.commitment}
+        latest, height, slot = await self.rpc.call_many([
+            ('getLatestBlockhash', [config]),
+            ('getBlockHeight', [config]),
+            ('getSlot', [config]),
+        ])
+        for result in (latest, height, slot):
+            if isinstance(result, Exception):
+                raise result
+
+        value = latest['value']
+        self._latest = BlockhashInfo(
+            value['blockhash'], int(value['lastValidBlockHeight']), int(latest['context']['slot']), time.monotonic(),
+        )
+        self.add_blockhash(self._latest.blockhash, self._latest.last_valid_block_height)
+        self._block_height = int(height)
+        self._observe_slot(int(slot))
+        self._updated_at = time.monotonic()
+        self.refreshes += 1
+        if self.monitor:
+            self.monitor.record_metric('blockhash.block_height', self._block_height)
+
+    def add_blockhash(self, blockhash: str, last_valid_block_height: int):
+        """Remember a blockhash's lastValidBlockHeight (e.g. from a Jupiter /swap response)."""
+        self._last_valid[blockhash] = last_valid_block_height
+        self._last_valid.move_to_end(blockhash)
+        while len(self._last_valid) > self.history:
+            self._last_valid.popitem(last=False)
+
+    def _observe_slot(self, slot: int):
+        if self._slot is None or slot > self._slot:
+            self._slot = slot
+
+    # ------------------------------------------------------------------
+    # slotSubscribe
+    # ------------------------------------------------------------------
+
+    async def _stream_slots(self):
+        while self.running:
+            try:
+                async with websockets.connect(self.ws_url, ping_interval=30) as websocket:
+                    await websocket.send(json.dumps({'jsonrpc': '2.0', 'id': 1, 'method': 'slotSubscribe'}))
+                    async for message in websocket:
+                        self._handle_slot_message(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.debug(f"Slot stream disconnected: {e}")
+            if self.running:
+                await asyncio.sleep(self.reconnect_delay)
+
+    def _handle_slot_message(self, message):
+        try:
+            data = json.loads(message)
+        except json.JSONDecodeError:
+            return
+        if data.get('method') != 'slotNotification':
+            return
+        slot = ((data.get('params') or {}).get('result') or {}).get('slot')
+        if isinstance(slot, int):
+            self.slot_notifications += 1
+            self._observe_slot(slot)
+
+    # ------------------------------------------------------------------
+    # Readers
+    # ------------------------------------------------------------------
+
+    def _fresh(self) -> bool:
+        return self._updated_at > 0 and time.monotonic() - self._updated_at < self.max_age
+
+    def latest(self) -> Optional[BlockhashInfo]:
+        """Latest blockhash for local transaction assembly, None if refreshes have stalled."""
+        return self._latest if self._fresh() else None
+
+    @property
+    def block_height(self) -> Optional[int]:
+        return self._block_height if self._fresh() else None
+
+    @property
+    def slot(self) -> Optional[int]:
+        return self._slot if self._fresh() else None
+
+    def last_valid_for(self, blockhash: str) -> Optional[int]:
+        """lastValidBlockHeight of a recently seen blockhash."""
+        return self._last_valid.get(str(blockhash))
+
+    def blocks_left(self, last_valid_block_height: Optional[int]) -> Optional[int]:
+        """Blocks until a transaction with this lastValidBlockHeight expires (negative once expired)."""
+        height = self.block_height
+        if height is None or last_valid_block_height is None:
+            return None
+        return last_valid_block_height - height
+
+    def stats(self) -> Dict:
+        return {
+            'blockhash': self._latest.blockhash if self._latest else None,
+            'last_valid_block_height': self._latest.last_valid_block_height if self._latest else None,
+            'block_height': self._block_height,
+            'slot': self._slot,
+            'age_seconds': time.monotonic() - self._updated_at if self._updated_at else None,
+            'refreshes': self.refreshes,
+            'refresh_failures': self.refresh_failures,
+            'slot_notifications': self.slot_notifications,
+            'known_blockhashes': len(self._last_valid),
+        }
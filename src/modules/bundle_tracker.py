@@ -0,0 +1,337 @@
+"""
+📦 JITO BUNDLE TRACKER
+Follows every submitted bundle until it lands, fails or expires
+
+FEATURES:
+- One background loop polls getInflightBundleStatuses for all in-flight
+  bundles (up to 5 bundle ids per call, calls issued concurrently)
+- Falls back to a regular RPC send of the same signed transaction when a
+  bundle has not landed by its deadline (or was dropped by the auction)
+- After a fallback the signature is confirmed through the shared
+  ConfirmationMultiplexer; whichever path lands first wins
+- Listeners receive the final outcome to update Trade/Position/SnipeRun records
+- Loop runs only while something is pending
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from src.modules.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Jito accepts at most 5 bundle ids per status request
+MAX_BUNDLES_PER_CALL = 5
+
+PENDING = 'PENDING'
+LANDED = 'LANDED'
+FAILED = 'FAILED'
+EXPIRED = 'EXPIRED'
+
+# bundle ids -> {bundle_id: {'status': 'Landed' | 'Pending' | 'Failed' | 'Invalid', 'landed_slot': int}}
+StatusFetcher = Callable[[List[str]], Awaitable[Dict[str, Dict]]]
+# Sends the bundle's signed transaction through regular RPC, returns its signature
+FallbackSender = Callable[[], Awaitable[str]]
+
+
+@dataclass
+class TrackedBundle:
+    bundle_id: str
+    signature: Optional[str]
+    deadline: float                              # time.monotonic()
+    fallback_at: Optional[float] = None          # time.monotonic(); None = no fallback
+    fallback: Optional[FallbackSender] = None
+    status: str = PENDING
+    landed_via: Optional[str] = None             # 'bundle' or 'rpc'
+    landed_slot: Optional[int] = None
+    error: Optional[str] = None
+    fallback_sent: bool = False
+    submitted_at: float = field(default_factory=time.monotonic)
+    future: Optional[asyncio.Future] = None
+
+    @property
+    def done(self) -> bool:
+        return self.status != PENDING
+
+
+BundleListener = Callable[[TrackedBundle], Awaitable[None]]
+
+
+class BundleTracker:
+    """
+    Lifecycle tracking for submitted Jito bundles.
+
+    `track()` registers a bundle and returns immediately; `wait()` awaits its
+    outcome. A bundle with a `fallback` sender is re-sent through RPC once
+    `fallback_after` seconds pass without it landing, or as soon as Jito
+    reports it failed.
+    """
+
+    def __init__(
+        self,
+        fetch_statuses: StatusFetcher,
+        *,
+        confirmations=None,
+        poll_interval: float = 1.0,
+        fallback_after: float = 8.0,
+        timeout: float = 30.0,
+        batch_size: int = MAX_BUNDLES_PER_CALL,
+        monitor=None,
+    ):
+        self.fetch_statuses = fetch_statuses
+        self.confirmations = confirmations
+        self.poll_interval = poll_interval
+        self.fallback_after = fallback_after
+        self.timeout = timeout
+        self.batch_size = max(1, min(batch_size, MAX_BUNDLES_PER_CALL))
+        self.monitor = monitor
+
+        self._pending: Dict[str, TrackedBundle] = {}
+        self._finished = TTLCache('jito.bundles', max_size=2000, ttl_seconds=600)
+        self._listeners: List[BundleListener] = []
+        self._fallback_tasks: Dict[str, asyncio.Task] = {}
+        self._task: Optional[asyncio.Task] = None
+
+        self.status_calls = 0
+        self.tracked = 0
+        self.landed = 0
+        self.landed_via_rpc = 0
+        self.failed = 0
+        self.expired = 0
+        self.fallbacks = 0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    # ------------------------------------------------------------------
+    # Registration
+    # ------------------------------------------------------------------
+
+    def add_listener(self, listener: BundleListener):
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: BundleListener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def track(
+        self,
+        bundle_id: str,
+        signature: Optional[str] = None,
+        *,
+        fallback: Optional[FallbackSender] = None,
+        timeout: Optional[float] = None,
+        fallback_after: Optional[float] = None,
+    ) -> TrackedBundle:
+        existing = self.get(bundle_id)
+        if existing is not None:
+            return existing
+
+        now = time.monotonic()
+        fallback_after = self.fallback_after if fallback_after is None else fallback_after
+        bundle = TrackedBundle(
+            bundle_id=bundle_id,
+            signature=signature,
+            deadline=now + (self.timeout if timeout is None else timeout),
+            fallback_at=now + fallback_after if fallback else None,
+            fallback=fallback,
+            future=asyncio.get_running_loop().create_future(),
+        )
+        self._pending[bundle_id] = bundle
+        self.tracked += 1
+        self._ensure_running()
+        return bundle
+
+    async def wait(self, bundle_id: str) -> str:
+        """Final status of a tracked bundle (LANDED, FAILED or EXPIRED)."""
+        bundle = self._pending.get(bundle_id) or self._finished.get(bundle_id)
+        if bundle is None:
+            raise KeyError(bundle_id)
+        if bundle.done:
+            return bundle.status
+        return await asyncio.shield(bundle.future)
+
+    def get(self, bundle_id: str) -> Optional[TrackedBundle]:
+        """Pending or recently finished bundle"""
+        return self._pending.get(bundle_id) or self._finished.get(bundle_id)
+
+    def _ensure_running(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self):
+        tasks = [self._task, *self._fallback_tasks.values()]
+        for task in tasks:
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+        self._task = None
+        self._fallback_tasks.clear()
+        for bundle in self._pending.values():
+            if bundle.future and not bundle.future.done():
+                bundle.future.cancel()
+        self._pending.clear()
+
+    # ------------------------------------------------------------------
+    # Polling
+    # ------------------------------------------------------------------
+
+    async def _run(self):
+        while self._pending:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                await self.poll()
+            except Exception as e:
+                logger.error(f"Error checking bundle statuses: {e}")
+
+    async def poll(self):
+        """One pass: batched status calls, then fallbacks and expiry."""
+        bundle_ids = [bundle_id for bundle_id, bundle in self._pending.items() if not bundle.done]
+        if not bundle_ids:
+            return
+
+        chunks = [bundle_ids[i:i + self.batch_size] for i in range(0, len(bundle_ids), self.batch_size)]
+        results = await asyncio.gather(*(self._fetch_chunk(chunk) for chunk in chunks), return_exceptions=True)
+
+        for chunk, statuses in zip(chunks, results):
+            if isinstance(statuses, Exception):
+                logger.warning(f"⚠️ Bundle status check failed for {len(chunk)} bundles: {statuses}")
+                continue
+            for bundle_id in chunk:
+                status = statuses.get(bundle_id)
+                if status:
+                    await self._apply_status(bundle_id, status)
+
+        now = time.monotonic()
+        for bundle in list(self._pending.values()):
+            if bundle.done:
+                continue
+            if bundle.fallback and not bundle.fallback_sent and now >= bundle.fallback_at:
+                self._start_fallback(bundle, reason='deadline')
+            elif now >= bundle.deadline and bundle.bundle_id not in self._fallback_tasks:
+                self.expired += 1
+                await self._resolve(bundle, EXPIRED, error='bundle did not land before the deadline')
+
+        if self.monitor:
+            self.monitor.record_metric('bundles.pending', len(self._pending))
+
+    async def _fetch_chunk(self, bundle_ids: List[str]) -> Dict[str, Dict]:
+        self.status_calls += 1
+        if self.monitor:
+            self.monitor.record_request()
+        return await self.fetch_statuses(bundle_ids) or {}
+
+    async def _apply_status(self, bundle_id: str, status: Dict):
+        bundle = self._pending.get(bundle_id)
+        if bundle is None or bundle.done:
+            return
+
+        state = str(status.get('status', '')).lower()
+        if state == 'landed':
+            self.landed += 1
+            await self._resolve(bundle, LANDED, landed_via='bundle', landed_slot=status.get('landed_slot'))
+        elif state == 'failed':
+            if bundle.fallback and not bundle.fallback_sent:
+                # Lost the auction or failed simulation; the transaction itself may still land
+                self._start_fallback(bundle, reason='bundle failed')
+            elif not bundle.fallback_sent:
+                self.failed += 1
+                await self._resolve(bundle, FAILED, error='bundle failed')
+        # 'pending' and 'invalid' (not seen yet / already aged out) wait for the deadline
+
+    # ------------------------------------------------------------------
+    # RPC fallback
+    # ------------------------------------------------------------------
+
+    def _start_fallback(self, bundle: TrackedBundle, reason: str):
+        bundle.fallback_sent = True
+        self.fallbacks += 1
+        logger.warning(f"⚠️ Bundle {bundle.bundle_id[:12]}... {reason}, sending through RPC")
+        self._fallback_tasks[bundle.bundle_id] = asyncio.create_task(self._run_fallback(bundle))
+
+    async def _run_fallback(self, bundle: TrackedBundle):
+        try:
+            signature = await bundle.fallback()
+            bundle.signature = bundle.signature or signature
+            remaining = max(0.0, bundle.deadline - time.monotonic())
+            confirmed = False
+            if self.confirmations and bundle.signature:
+                confirmed = await self.confirmations.wait(bundle.signature, timeout=remaining)
+        except Exception as e:
+            logger.error(f"Bundle fallback send failed: {e}")
+            confirmed = False
+        finally:
+            self._fallback_tasks.pop(bundle.bundle_id, None)
+
+        if bundle.done:
+            return  # the bundle itself landed meanwhile
+        if confirmed:
+            self.landed += 1
+            self.landed_via_rpc += 1
+            await self._resolve(bundle, LANDED, landed_via='rpc')
+        elif time.monotonic() >= bundle.deadline:
+            self.expired += 1
+            await self._resolve(bundle, EXPIRED, error='not confirmed before the deadline')
+        else:
+            self.failed += 1
+            await self._resolve(bundle, FAILED, error='fallback transaction failed')
+
+    # ------------------------------------------------------------------
+    # Resolution
+    # ------------------------------------------------------------------
+
+    async def _resolve(
+        self,
+        bundle: TrackedBundle,
+        status: str,
+        *,
+        landed_via: Optional[str] = None,
+        landed_slot: Optional[int] = None,
+        error: Optional[str] = None,
+    ):
+        if bundle.done:
+            return
+        bundle.status = status
+        bundle.landed_via = landed_via
+        bundle.landed_slot = landed_slot
+        bundle.error = error
+        self._pending.pop(bundle.bundle_id, None)
+        self._finished[bundle.bundle_id] = bundle
+
+        task = self._fallback_tasks.pop(bundle.bundle_id, None)
+        if task and task is not asyncio.current_task():
+            task.cancel()
+
+        if bundle.future and not bundle.future.done():
+            bundle.future.set_result(status)
+
+        if self.monitor:
+            self.monitor.record_metric('bundles.seconds_to_outcome', time.monotonic() - bundle.submitted_at, tags={'status': status})
+
+        icon = '✅' if status == LANDED else '❌'
+        logger.info(f"{icon} Bundle {bundle.bundle_id[:12]}... {status.lower()}" + (f" via {landed_via}" if landed_via else ''))
+
+        for listener in list(self._listeners):
+            try:
+                await listener(bundle)
+            except Exception as e:
+                logger.error(f"Error in bundle listener: {e}")
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'pending': len(self._pending),
+            'tracked': self.tracked,
+            'status_calls': self.status_calls,
+            'landed': self.landed,
+            'landed_via_rpc': self.landed_via_rpc,
+            'failed': self.failed,
+            'expired': self.expired,
+            'fallbacks': self.fallbacks,
+        }
@@ -0,0 +1,296 @@
+"""
+🧮 COMPUTE BUDGET TUNER
+Right-size swap compute budgets from simulation so priority fees are not spent on headroom
+
+FEATURES:
+- Simulates Jupiter's swap transaction (fast_execution simulation) to measure
+  the compute units it actually consumes
+- Patches the SetComputeUnitLimit instruction to that figure plus a margin
+- `priority` mode keeps the total priority fee and raises the compute unit
+  price to match (same fee, more priority); `savings` keeps the price and
+  pays for fewer units
+- CU profile cached per route shape (AMM labels, splits, input and output
+  mints), so repeat shapes skip the simulation round trip and are only
+  re-measured now and then
+- Priority fee and compute unit price per landed trade, as Jupiter built the
+  transaction vs as it was sent, exposed through stats()
+"""
+
+import base64
+import logging
+import math
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional, Tuple
+
+from solders.compute_budget import ID as COMPUTE_BUDGET_PROGRAM
+from solders.instruction import CompiledInstruction
+from solders.message import MessageV0
+from solders.signature import Signature
+from solders.transaction import VersionedTransaction
+
+from src.modules.fast_execution import simulate_compute_units
+from src.modules.http_pool import get_http_session
+
+logger = logging.getLogger(__name__)
+
+# ComputeBudgetInstruction discriminators
+SET_COMPUTE_UNIT_LIMIT = 2
+SET_COMPUTE_UNIT_PRICE = 3
+
+MAX_COMPUTE_UNITS = 1_400_000
+MICRO_LAMPORTS = 1_000_000
+
+PRIORITY = 'priority'
+SAVINGS = 'savings'
+
+RouteShape = Tuple
+
+
+@dataclass(frozen=True)
+class ComputeBudget:
+    units: Optional[int]               # SetComputeUnitLimit (None = runtime default)
+    micro_lamports: int                # SetComputeUnitPrice, per compute unit
+
+    @property
+    def priority_fee_lamports(self) -> int:
+        return math.ceil((self.units or 0) * self.micro_lamports / MICRO_LAMPORTS)
+
+
+@dataclass(frozen=True)
+class BudgetTuning:
+    shape: RouteShape
+    before: ComputeBudget
+    after: ComputeBudget               # == before when the budget could not be tightened
+    measured_units: Optional[int]
+    simulated: bool                    # False = taken from the cached CU profile
+
+    @property
+    def changed(self) -> bool:
+        return self.after != self.before
+
+    def as_metadata(self) -> Dict:
+        return {
+            'measured_units': self.measured_units,
+            'simulated': self.simulated,
+            'units_before': self.before.units,
+            'units_after': self.after.units,
+            'micro_lamports_before': self.before.micro_lamports,
+            'micro_lamports_after': self.after.micro_lamports,
+            'priority_fee_before': self.before.priority_fee_lamports,
+            'priority_fee_after': self.after.priority_fee_lamports,
+        }
+
+
+def route_shape(quote: Dict) -> RouteShape:
+    """
+    What decides a swap's compute cost: the AMMs it hops through, how it splits, and the mints.
+
+    The mints are part of the shape because the token itself changes the cost on
+    the same route: SOL is wrapped/unwrapped, and Token-2022 mints with transfer
+    fees or hooks need far more compute than plain SPL tokens.
+    """
+    steps = tuple(
+        ((step.get('swapInfo') or {}).get('label', '?'), step.get('percent', 100))
+        for step in quote.get('routePlan') or []
+    )
+    return steps, quote.get('inputMint'), quote.get('outputMint')
+
+
+def _compute_budget_instructions(message: MessageV0) -> Dict[int, int]:
+    """discriminator -> instruction index of the message's compute budget instructions."""
+    found = {}
+    keys = message.account_keys
+    for index, instruction in enumerate(message.instructions):
+        if keys[instruction.program_id_index] == COMPUTE_BUDGET_PROGRAM and instruction.data:
+            found.setdefault(instruction.data[0], index)
+    return found
+
+
+def read_compute_budget(message: MessageV0) -> ComputeBudget:
+    found = _compute_budget_instructions(message)
+    units = price = None
+    if SET_COMPUTE_UNIT_LIMIT in found:
+        units = int.from_bytes(bytes(message.instructions[found[SET_COMPUTE_UNIT_LIMIT]].data)[1:5], 'little')
+    if SET_COMPUTE_UNIT_PRICE in found:
+        price = int.from_bytes(bytes(message.instructions[found[SET_COMPUTE_UNIT_PRICE]].data)[1:9], 'little')
+    return ComputeBudget(units, price or 0)
+
+
+def patch_compute_budget(transaction: VersionedTransaction, budget: ComputeBudget) -> VersionedTransaction:
+    """
+    Rewrite the limit and price of existing compute budget instructions.
+
+    Returns an unsigned copy (signatures must be added afterwards). Messages
+    without a SetComputeUnitLimit instruction are left as they are, since adding
+    one could mean adding the program to the account keys.
+    """
+    message = transaction.message
+    found = _compute_budget_instructions(message)
+    if SET_COMPUTE_UNIT_LIMIT not in found:
+        return transaction
+
+    instructions: List[CompiledInstruction] = list(message.instructions)
+    patches = {SET_COMPUTE_UNIT_LIMIT: bytes([SET_COMPUTE_UNIT_LIMIT]) + int(budget.units).to_bytes(4, 'little')}
+    if SET_COMPUTE_UNIT_PRICE in found:
+        patches[SET_COMPUTE_UNIT_PRICE] = bytes([SET_COMPUTE_UNIT_PRICE]) + int(budget.micro_lamports).to_bytes(8, 'little')
+    for discriminator, data in patches.items():
+        original = instructions[found[discriminator]]
+        instructions[found[discriminator]] = CompiledInstruction(original.program_id_index, data, bytes(original.accounts))
+
+    patched = MessageV0(
+        message.header,
+        message.account_keys,
+        message.recent_blockhash,
+        instructions,
+        message.address_table_lookups,
+    )
+    return VersionedTransaction.populate(patched, [Signature.default()] * len(transaction.signatures))
+
+
+class ComputeBudgetTuner:
+    """
+    Tighten a swap transaction's compute unit limit before it is signed.
+
+    `simulate_url` is the RPC endpoint used for simulateTransaction. A route
+    shape's profile is trusted once it holds `min_samples` measurements; from
+    then on one swap in `resample_every` is simulated again to keep it current.
+    """
+
+    def __init__(
+        self,
+        simulate_url: str,
+        *,
+        margin: float = 0.15,
+        min_units: int = 50_000,
+        mode: str = PRIORITY,
+        max_micro_lamports: Optional[int] = None,
+        min_samples: int = 3,
+        resample_every: int = 20,
+        profile_size: int = 50,
+        timeout_ms: int = 800,
+        monitor=None,
+    ):
+        if mode not in (PRIORITY, SAVINGS):
+            raise ValueError(f"Unknown compute budget mode: {mode}")
+        self.simulate_url = simulate_url
+        self.margin = margin
+        self.min_units = min_units
+        self.mode = mode
+        self.max_micro_lamports = max_micro_lamports
+        self.min_samples = min_samples
+        self.resample_every = max(1, resample_every)
+        self.profile_size = profile_size
+        self.timeout_ms = timeout_ms
+        self.monitor = monitor
+
+        self._profiles: Dict[RouteShape, Deque[int]] = {}
+        self._uses: Dict[RouteShape, int] = {}
+        # Landed trades: budget as Jupiter built it, budget actually sent
+        self._landed: Deque[Tuple[ComputeBudget, ComputeBudget]] = deque(maxlen=1000)
+
+        self.simulations = 0
+        self.simulation_failures = 0
+        self.profile_hits = 0
+        self.tuned = 0
+
+    async def tune(self, swap_tx_base64: str, quote: Dict) -> Tuple[str, Optional[BudgetTuning]]:
+        """
+        Return the swap transaction with a tightened compute budget and what was done.
+
+        The transaction comes back unchanged when it carries no compute unit limit
+        (tuning None), or when it could not be measured or tightened (tuning.changed False).
+        """
+        try:
+            transaction = VersionedTransaction.from_bytes(base64.b64decode(swap_tx_base64))
+        except Exception as e:
+            logger.debug(f"Compute budget: undecodable swap transaction: {e}")
+            return swap_tx_base64, None
+        before = read_compute_budget(transaction.message)
+        if before.units is None:
+            return swap_tx_base64, None
+
+        shape = route_shape(quote)
+        units, simulated = self._profiled_units(shape), False
+        if units is None:
+            units = await self._measure(swap_tx_base64, shape)
+            simulated = True
+        if units is None:
+            return swap_tx_base64, BudgetTuning(shape, before, before, None, simulated)
+
+        limit = min(MAX_COMPUTE_UNITS, max(self.min_units, math.ceil(round(units * (1 + self.margin), 6))))
+        if limit >= before.units:
+            return swap_tx_base64, BudgetTuning(shape, before, before, units, simulated)
+
+        price = before.micro_lamports
+        if self.mode == PRIORITY and price:
+            # Same total priority fee spread over fewer units
+            price = before.units * price // limit
+            if self.max_micro_lamports:
+                price = min(price, max(before.micro_lamports, self.max_micro_lamports))
+        after = ComputeBudget(limit, price)
+
+        patched = patch_compute_budget(transaction, after)
+        self.tuned += 1
+        tuning = BudgetTuning(shape, before, after, units, simulated)
+        if self.monitor:
+            self.monitor.record_metric('compute_budget.units_saved', before.units - limit)
+        return base64.b64encode(bytes(patched)).decode(), tuning
+
+    def _profiled_units(self, shape: RouteShape) -> Optional[int]:
+        samples = self._profiles.get(shape)
+        if not samples or len(samples) < self.min_samples:
+            return None
+        uses = self._uses[shape] = self._uses.get(shape, 0) + 1
+        if uses % self.resample_every == 0:
+            return None
+        self.profile_hits += 1
+        return max(samples)
+
+    async def _measure(self, swap_tx_base64: str, shape: RouteShape) -> Optional[int]:
+        self.simulations += 1
+        units = await simulate_compute_units(
+            get_http_session(), self.simulate_url, swap_tx_base64, timeout_ms=self.timeout_ms
+        )
+        if units is None:
+            self.simulation_failures += 1
+            return None
+        samples = self._profiles.get(shape)
+        if samples is None:
+            samples = self._profiles[shape] = deque(maxlen=self.profile_size)
+        samples.append(units)
+        return units
+
+    def record_landed(self, tuning: BudgetTuning):
+        self._landed.append((tuning.before, tuning.after))
+
+    def profiles(self) -> Dict[str, Dict[str, int]]:
+        return {
+            f"{'+'.join(label for label, _ in steps) or '?'} {str(input_mint)[:6]}->{str(output_mint)[:6]}": {
+                'samples': len(samples),
+                'max_units': max(samples),
+            }
+            for (steps, input_mint, output_mint), samples in self._profiles.items()
+        }
+
+    def stats(self) -> Dict:
+        landed = len(self._landed)
+
+        def mean(values) -> float:
+            return sum(values) / landed if landed else 0.0
+
+        return {
+            'mode': self.mode,
+            'tuned': self.tuned,
+            'simulations': self.simulations,
+            'simulation_failures': self.simulation_failures,
+            'profile_hits': self.profile_hits,
+            'route_shapes': len(self._profiles),
+            'landed': landed,
+            'priority_fee_per_landed_before': mean(before.priority_fee_lamports for before, _ in self._landed),
+            'priority_fee_per_landed_after': mean(after.priority_fee_lamports for _, after in self._landed),
+            'micro_lamports_per_cu_before': mean(before.micro_lamports for before, _ in self._landed),
+            'micro_lamports_per_cu_after': mean(after.micro_lamports for _, after in self._landed),
+            'units_per_landed_before': mean(before.units for before, _ in self._landed),
+            'units_per_landed_after': mean(after.units for _, after in self._landed),
+        }
@@ -0,0 +1,202 @@
+"""
+✅ CONFIRMATION MULTIPLEXER
+One background loop confirms every in-flight transaction
+
+FEATURES:
+- All pending signatures checked together with batched getSignatureStatuses
+  (up to 256 per call) instead of one polling loop per trade
+- Callers await a per-signature future; duplicate waiters share it
+- Polls once per slot-ish interval, so confirmation is seen sooner
+- Loop runs only while something is pending
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from solders.signature import Signature
+
+logger = logging.getLogger(__name__)
+
+# getSignatureStatuses accepts at most 256 signatures per call
+MAX_SIGNATURES_PER_CALL = 256
+
+_COMMITMENT_RANK = {'processed': 0, 'confirmed': 1, 'finalized': 2}
+
+
+@dataclass
+class _Pending:
+    future: asyncio.Future
+    signature: Signature
+    commitment: str
+    deadline: float
+    waiters: int = 1
+    submitted_at: float = field(default_factory=time.monotonic)
+
+
+class ConfirmationMultiplexer:
+    """
+    Resolve signature confirmations for many concurrent trades in shared RPC calls.
+
+    `wait(signature)` returns True once the transaction reaches the requested
+    commitment, False if it landed with an error or was not seen before the
+    timeout.
+    """
+
+    def __init__(
+        self,
+        rpc_client,
+        *,
+        poll_interval: float = 0.4,
+        timeout: float = 60.0,
+        commitment: str = 'confirmed',
+        batch_size: int = MAX_SIGNATURES_PER_CALL,
+        monitor=None,
+    ):
+        self.rpc_client = rpc_client
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.commitment = commitment
+        self.batch_size = max(1, min(batch_size, MAX_SIGNATURES_PER_CALL))
+        self.monitor = monitor
+
+        self._pending: Dict[str, _Pending] = {}
+        self._task: Optional[asyncio.Task] = None
+
+        self.rpc_calls = 0
+        self.confirmed = 0
+        self.failed = 0
+        self.timeouts = 0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    async def wait(
+        self,
+        signature: str,
+        *,
+        timeout: Optional[float] = None,
+        commitment: Optional[str] = None,
+    ) -> bool:
+        """Await confirmation of `signature` (shared with any other waiter for it)."""
+        signature = str(signature)
+        commitment = commitment or self.commitment
+        pending = self._pending.get(signature)
+        if pending is None:
+            loop = asyncio.get_running_loop()
+            pending = _Pending(
+                future=loop.create_future(),
+                signature=Signature.from_string(signature),  # ValueError for a malformed signature
+                commitment=commitment,
+                deadline=time.monotonic() + (timeout if timeout is not None else self.timeout),
+            )
+            self._pending[signature] = pending
+        else:
+            pending.waiters += 1
+            if _COMMITMENT_RANK.get(commitment, 1) > _COMMITMENT_RANK.get(pending.commitment, 1):
+                pending.commitment = commitment
+
+        self._ensure_running()
+        try:
+            return await asyncio.shield(pending.future)
+        finally:
+            pending.waiters -= 1
+            if pending.waiters <= 0 and not pending.future.done():
+                # Last waiter was cancelled: stop polling for it
+                pending.future.cancel()
+                self._pending.pop(signature, None)
+
+    def _ensure_running(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._task = None
+        for pending in self._pending.values():
+            if not pending.future.done():
+                pending.future.set_result(False)
+        self._pending.clear()
+
+    async def _run(self):
+        while self._pending:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                await self.poll()
+            except Exception as e:
+                logger.error(f"Error checking transaction statuses: {e}")
+
+    async def poll(self):
+        """One pass: query every pending signature, resolve the settled ones, expire the rest."""
+        signatures = [(signature, pending.signature) for signature, pending in self._pending.items()]
+        if not signatures:
+            return
+
+        chunks = [
+            signatures[start:start + self.batch_size]
+            for start in range(0, len(signatures), self.batch_size)
+        ]
+        results = await asyncio.gather(*(self._fetch_statuses(chunk) for chunk in chunks), return_exceptions=True)
+
+        for chunk, statuses in zip(chunks, results):
+            if isinstance(statuses, Exception):
+                logger.warning(f"⚠️ getSignatureStatuses failed for {len(chunk)} signatures: {statuses}")
+                continue
+            for (signature, _), status in zip(chunk, statuses):
+                if status is not None:
+                    self._apply_status(signature, status)
+
+        now = time.monotonic()
+        for signature, pending in list(self._pending.items()):
+            if now >= pending.deadline:
+                self.timeouts += 1
+                self._resolve(signature, False)
+
+        if self.monitor:
+            self.monitor.record_metric('confirmation.pending', len(self._pending))
+
+    async def _fetch_statuses(self, chunk: List[Tuple[str, Signature]]) -> List[Any]:
+        self.rpc_calls += 1
+        if self.monitor:
+            self.monitor.record_request()
+        response = await self.rpc_client.get_signature_statuses([signature for _, signature in chunk])
+        return list(response.value or [])
+
+    def _apply_status(self, signature: str, status: Any):
+        pending = self._pending.get(signature)
+        if pending is None:
+            return
+
+        if getattr(status, 'err', None) is not None:
+            logger.warning(f"❌ Transaction {signature[:16]}... failed: {status.err}")
+            self.failed += 1
+            self._resolve(signature, False)
+            return
+
+        reached = str(getattr(status, 'confirmation_status', '') or '').split('.')[-1].lower()
+        if _COMMITMENT_RANK.get(reached, -1) >= _COMMITMENT_RANK.get(pending.commitment, 1):
+            self.confirmed += 1
+            if self.monitor:
+                self.monitor.record_metric('confirmation.seconds', time.monotonic() - pending.submitted_at)
+            self._resolve(signature, True)
+
+    def _resolve(self, signature: str, result: bool):
+        pending = self._pending.pop(signature, None)
+        if pending is not None and not pending.future.done():
+            pending.future.set_result(result)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'pending': len(self._pending),
+            'rpc_calls': self.rpc_calls,
+            'confirmed': self.confirmed,
+            'failed': self.failed,
+            'timeouts': self.timeouts,
+        }
@@ -298,6 +298,32 @@ class DatabaseManager:
             await session.refresh(trade)
             return trade
     
+    async def get_trade_by_signature(self, signature: str) -> Optional[Trade]:
+        """Fetch a trade by its transaction signature"""
+        async with self.async_session() as session:
+            result = await session.execute(select(Trade).where(Trade.signature == signature))
+            return result.scalar_one_or_none()
+
+    async def update_trade(self, signature: str, updates: Dict) -> Optional[Trade]:
+        """Apply updates to a trade once its on-chain outcome is known"""
+        if not updates:
+            return None
+
+        async with self.async_session() as session:
+            result = await session.execute(select(Trade).where(Trade.signature == signature))
+            trade = result.scalar_one_or_none()
+
+            if not trade:
+                return None
+
+            for key, value in updates.items():
+                if hasattr(trade, key):
+                    setattr(trade, key, value)
+
+            await session.commit()
+            await session.refresh(trade)
+            return trade
+
     async def get_user_trades(
         self,
         user_id: int,
@@ -22,6 +22,9 @@ from dataclasses import dataclass
 from solana.rpc.async_api import AsyncClient
 from solders.pubkey import Pubkey
 
+from src.modules.http_pool import get_http_session
+from src.modules.ttl_cache import TTLCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -52,7 +55,8 @@ class EliteProtectionSystem:
     def __init__(self, client: AsyncClient, config: ProtectionConfig = None):
         self.client = client
         self.config = config or ProtectionConfig()
-        self.honeypot_cache: Dict[str, bool] = {}
+        # Honeypot verdicts can change (liquidity pulled, authority revoked), so expire them
+        self.honeypot_cache = TTLCache('protection.honeypot', max_size=5000, ttl_seconds=3600)
         self.twitter_handle_history: Dict[str, Set[str]] = defaultdict(set)
         
         # API Keys from environment - Core Security
@@ -88,7 +92,7 @@ class EliteProtectionSystem:
     async def _ensure_session(self):
         """Ensure HTTP session exists"""
         if not self.session:
-            self.session = aiohttp.ClientSession()
+            self.session = get_http_session()
     
     async def comprehensive_token_check(self, token_mint: str) -> Dict:
         """
@@ -190,8 +194,9 @@ class EliteProtectionSystem:
         """
         
         # Check cache first
-        if token_mint in self.honeypot_cache:
-            return self.honeypot_cache[token_mint], "Cached result"
+        cached = self.honeypot_cache.get(token_mint)
+        if cached is not None:
+            return cached, "Cached result"
         
         try:
             # Method 1: Try to simulate a sell (most reliable)
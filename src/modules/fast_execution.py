@@ -7,17 +7,24 @@ FEATURES:
 - Parallel submission to Jito + multiple RPCs
 - Fast simulation before submit
 - Sub-second execution
-- Automatic fastest-RPC selection
+- Endpoint selection by live health score: EWMA of each endpoint's own
+  response time, weighted by its recent error rate
+- Per-endpoint circuit breaker (open after consecutive failures, half-open
+  probe after a cooldown that backs off while the endpoint keeps failing)
+- Background health pings keep idle endpoints scored and probe open ones
 """
 
 import aiohttp
 import asyncio
 import base64
+import json
 import time
 import logging
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional, Set
 from dataclasses import dataclass
 
+from src.modules.http_pool import get_http_session
+
 logger = logging.getLogger(__name__)
 
 
@@ -44,59 +51,114 @@ async def _rpc_send_signed_tx(
         "jsonrpc": "2.0",
         "id": 1,
         "method": "sendTransaction",
-        "params": [signed_tx_b64, {"skipPreflight": True, "preflightCommitment": "confirmed"}]
+        "params": [signed_tx_b64, {"encoding": "base64", "skipPreflight": True, "preflightCommitment": "confirmed"}]
     }
     
+    start = time.perf_counter()
     try:
         timeout = aiohttp.ClientTimeout(total=timeout_ms/1000)
         async with session.post(rpc_url, json=payload, timeout=timeout) as resp:
             txt = await resp.text()
-            return {"rpc": rpc_url, "status": resp.status, "body": txt, "success": resp.status == 200}
+        latency_ms = (time.perf_counter() - start) * 1000
+        # HTTP 200 with a JSON-RPC error (bad blockhash, node behind...) is still a failure
+        try:
+            body = json.loads(txt)
+        except ValueError:
+            body = {}
+        success = resp.status == 200 and isinstance(body, dict) and "result" in body
+        result = {"rpc": rpc_url, "status": resp.status, "body": txt, "success": success, "latency_ms": latency_ms}
+        if success:
+            result["signature"] = body["result"]
+        return result
     except Exception as e:
-        return {"rpc": rpc_url, "error": str(e), "success": False}
+        return {"rpc": rpc_url, "error": str(e) or type(e).__name__, "success": False,
+                "latency_ms": (time.perf_counter() - start) * 1000}
 
 
-async def _simulate_transaction(
+async def _simulate(
     session: aiohttp.ClientSession,
     rpc_url: str,
     signed_tx_b64: str,
     timeout_ms: int = 350
-) -> bool:
+) -> Optional[Dict]:
     """
-    Fast simulation - returns True if simulation looks OK (no obvious revert)
+    simulateTransaction (signatures not verified, blockhash replaced); returns the
+    simulation result value (err, logs, unitsConsumed) or None if the call failed
     """
     payload = {
         "jsonrpc": "2.0",
         "id": 1,
         "method": "simulateTransaction",
-        "params": [signed_tx_b64, {"sigVerify": False, "replaceRecentBlockhash": True}]
+        "params": [signed_tx_b64, {"encoding": "base64", "sigVerify": False, "replaceRecentBlockhash": True}]
     }
-    
+
+    timeout = aiohttp.ClientTimeout(total=timeout_ms/1000)
+    async with session.post(rpc_url, json=payload, timeout=timeout) as resp:
+        if resp.status != 200:
+            return None
+        j = await resp.json()
+    result = j.get('result')
+    if not isinstance(result, dict):
+        return None  # JSON-RPC error
+    return result.get('value', result)
+
+
+async def _simulate_transaction(
+    session: aiohttp.ClientSession,
+    rpc_url: str,
+    signed_tx_b64: str,
+    timeout_ms: int = 350
+) -> bool:
+    """
+    Fast simulation - returns True if simulation looks OK (no obvious revert)
+    """
     try:
-        timeout = aiohttp.ClientTimeout(total=timeout_ms/1000)
-        async with session.post(rpc_url, json=payload, timeout=timeout) as resp:
-            if resp.status != 200:
-                return False
-            
-            j = await resp.json()
-            # Quick heuristic: if 'err' in result → bad
-            if j.get('result', {}).get('err'):
-                logger.warning(f"❌ Simulation failed: {j.get('result', {}).get('err')}")
-                return False
-            
-            return True
-            
+        value = await _simulate(session, rpc_url, signed_tx_b64, timeout_ms)
+        if value is None:
+            return False
+        # Quick heuristic: if 'err' in result → bad
+        if value.get('err'):
+            logger.warning(f"❌ Simulation failed: {value.get('err')}")
+            return False
+
+        return True
+
     except Exception as e:
         logger.debug(f"Simulation error: {e}")
         return False
 
 
+async def simulate_compute_units(
+    session: aiohttp.ClientSession,
+    rpc_url: str,
+    tx_b64: str,
+    timeout_ms: int = 800
+) -> Optional[int]:
+    """
+    Compute units the transaction consumes in simulation; None if it failed or
+    the node did not report them
+    """
+    try:
+        value = await _simulate(session, rpc_url, tx_b64, timeout_ms)
+    except Exception as e:
+        logger.debug(f"Simulation error: {e}")
+        return None
+    if not value or value.get('err') or value.get('unitsConsumed') is None:
+        return None
+    return int(value['unitsConsumed'])
+
+
+# Sends that lost the race but are still in flight (reported through on_result)
+_detached_sends: Set[asyncio.Task] = set()
+
+
 async def submit_signed_tx_fast(
     signed_tx_bytes: bytes,
     rpc_endpoints: List[str],
     jito_submit_fn=None,  # Callable that submits to Jito
     simulate_rpc: Optional[str] = None,
-    timeout_ms_on_all: int = 1200
+    timeout_ms_on_all: int = 1200,
+    on_result: Optional[Callable[[Dict], None]] = None,
 ) -> ExecutionResult:
     """
     Submit signed transaction as fast as possible:
@@ -110,6 +172,9 @@ async def submit_signed_tx_fast(
         jito_submit_fn: Function to submit Jito bundle
         simulate_rpc: RPC to use for fast simulation
         timeout_ms_on_all: Overall timeout in milliseconds
+        on_result: Called with every RPC endpoint's own result (including its
+            latency_ms). Sends still in flight when the race is decided are left
+            to finish so they can be measured too.
     
     Returns:
         ExecutionResult with success status and details
@@ -117,152 +182,358 @@ async def submit_signed_tx_fast(
     signed_b64 = base64.b64encode(signed_tx_bytes).decode()
     start = time.time()
     
-    async with aiohttp.ClientSession() as session:
-        # Step 1: Quick simulation (fast-fail honeypots/bad tx)
-        if simulate_rpc:
-            logger.info(f"🔍 Fast simulation on {simulate_rpc[:30]}...")
-            ok = await _simulate_transaction(session, simulate_rpc, signed_b64, timeout_ms=300)
-            
-            if not ok:
-                latency = int((time.time() - start) * 1000)
-                logger.warning(f"❌ Simulation failed in {latency}ms - ABORTING")
-                return ExecutionResult(
-                    success=False,
-                    latency_ms=latency,
-                    reason="simulation_failed"
-                )
-            
-            logger.info(f"✅ Simulation passed")
+    session = get_http_session()
+    # Step 1: Quick simulation (fast-fail honeypots/bad tx)
+    if simulate_rpc:
+        logger.info(f"🔍 Fast simulation on {simulate_rpc[:30]}...")
+        ok = await _simulate_transaction(session, simulate_rpc, signed_b64, timeout_ms=300)
         
-        # Step 2: Build parallel submission tasks
-        tasks = []
-        
-        # Jito submission
-        if jito_submit_fn:
-            logger.info(f"🚀 Submitting to Jito bundle...")
-            tasks.append(asyncio.create_task(jito_submit_fn(signed_tx_bytes)))
-        
-        # Submit to multiple RPC endpoints
-        for rpc in rpc_endpoints:
-            logger.info(f"📡 Submitting to RPC: {rpc[:40]}...")
-            tasks.append(
-                asyncio.create_task(
-                    _rpc_send_signed_tx(session, rpc, signed_b64, timeout_ms=timeout_ms_on_all//2)
-                )
+        if not ok:
+            latency = int((time.time() - start) * 1000)
+            logger.warning(f"❌ Simulation failed in {latency}ms - ABORTING")
+            return ExecutionResult(
+                success=False,
+                latency_ms=latency,
+                reason="simulation_failed"
             )
         
-        logger.info(f"⚡ Parallel submission to {len(tasks)} destinations...")
-        
-        # Step 3: Race for first success
-        done, pending = await asyncio.wait(
-            tasks,
-            timeout=(timeout_ms_on_all/1000),
-            return_when=asyncio.FIRST_COMPLETED
-        )
+        logger.info(f"✅ Simulation passed")
+    
+    # Step 2: Build parallel submission tasks
+    tasks = []
+    
+    # Jito submission
+    if jito_submit_fn:
+        logger.info(f"🚀 Submitting to Jito bundle...")
+        tasks.append(asyncio.create_task(jito_submit_fn(signed_tx_bytes)))
+    
+    async def send(rpc: str) -> Dict:
+        res = await _rpc_send_signed_tx(session, rpc, signed_b64, timeout_ms=timeout_ms_on_all//2)
+        if on_result:
+            on_result(res)
+        return res
+
+    # Submit to multiple RPC endpoints
+    rpc_tasks = []
+    for rpc in rpc_endpoints:
+        logger.info(f"📡 Submitting to RPC: {rpc[:40]}...")
+        rpc_tasks.append(asyncio.create_task(send(rpc)))
+    tasks.extend(rpc_tasks)
+
+    def settle(pending):
+        """Cancel the losers; with on_result, RPC sends are left to finish and report."""
+        for p in pending:
+            if on_result and p in rpc_tasks:
+                _detached_sends.add(p)
+                p.add_done_callback(_detached_sends.discard)
+            else:
+                p.cancel()
+    
+    logger.info(f"⚡ Parallel submission to {len(tasks)} destinations...")
+    
+    # Step 3: Race for first success
+    done, pending = await asyncio.wait(
+        tasks,
+        timeout=(timeout_ms_on_all/1000),
+        return_when=asyncio.FIRST_COMPLETED
+    )
+    
+    # Process results
+    results = []
+    for task in list(done):
+        try:
+            res = task.result()
+            results.append(res)
+            
+            # Check for success
+            if isinstance(res, dict):
+                if res.get("success") or res.get("bundle_id"):
+                    # SUCCESS! Cancel remaining tasks
+                    settle(pending)
+                    
+                    latency = int((time.time() - start) * 1000)
+                    logger.info(f"✅ TX CONFIRMED in {latency}ms via {res.get('rpc', 'Jito')[:30]}")
+                    
+                    return ExecutionResult(
+                        success=True,
+                        latency_ms=latency,
+                        winner=res,
+                        all_results=results
+                    )
+        except Exception as e:
+            logger.debug(f"Task error: {e}")
+            continue
+    
+    # Wait a bit more for remaining tasks
+    if pending:
+        done2, still_pending = await asyncio.wait(pending, timeout=1.0)
         
-        # Process results
-        results = []
-        for task in list(done):
+        for t in done2:
             try:
-                res = task.result()
-                results.append(res)
-                
-                # Check for success
-                if isinstance(res, dict):
-                    if res.get("status") == 200 or res.get("success") or res.get("bundle_id"):
-                        # SUCCESS! Cancel remaining tasks
-                        for p in pending:
-                            p.cancel()
-                        
-                        latency = int((time.time() - start) * 1000)
-                        logger.info(f"✅ TX CONFIRMED in {latency}ms via {res.get('rpc', 'Jito')[:30]}")
-                        
-                        return ExecutionResult(
-                            success=True,
-                            latency_ms=latency,
-                            winner=res,
-                            all_results=results
-                        )
-            except Exception as e:
-                logger.debug(f"Task error: {e}")
-                continue
+                results.append(t.result())
+            except Exception:
+                pass
         
-        # Wait a bit more for remaining tasks
-        if pending:
-            done2, still_pending = await asyncio.wait(pending, timeout=1.0)
-            
-            for t in done2:
-                try:
-                    results.append(t.result())
-                except Exception:
-                    pass
+        # Cancel any still running
+        settle(still_pending)
+    
+    # Final check for any success
+    for r in results:
+        if isinstance(r, dict) and (r.get("bundle_id") or r.get("success")):
+            latency = int((time.time() - start) * 1000)
+            logger.info(f"✅ TX CONFIRMED in {latency}ms (delayed)")
             
-            # Cancel any still running
-            for p in still_pending:
-                p.cancel()
-        
-        # Final check for any success
-        for r in results:
-            if isinstance(r, dict) and (r.get("status") == 200 or r.get("bundle_id") or r.get("success")):
-                latency = int((time.time() - start) * 1000)
-                logger.info(f"✅ TX CONFIRMED in {latency}ms (delayed)")
-                
-                return ExecutionResult(
-                    success=True,
-                    latency_ms=latency,
-                    winner=r,
-                    all_results=results
-                )
-        
-        # No success
-        latency = int((time.time() - start) * 1000)
-        logger.error(f"❌ TX FAILED after {latency}ms - no successful submission")
-        
-        return ExecutionResult(
-            success=False,
-            latency_ms=latency,
-            all_results=results,
-            reason="no_success"
-        )
+            return ExecutionResult(
+                success=True,
+                latency_ms=latency,
+                winner=r,
+                all_results=results
+            )
+    
+    # No success
+    latency = int((time.time() - start) * 1000)
+    logger.error(f"❌ TX FAILED after {latency}ms - no successful submission")
+    
+    return ExecutionResult(
+        success=False,
+        latency_ms=latency,
+        all_results=results,
+        reason="no_success"
+    )
+
+
+CLOSED = 'CLOSED'
+OPEN = 'OPEN'
+HALF_OPEN = 'HALF_OPEN'
+
+
+@dataclass
+class EndpointHealth:
+    """Live score and circuit-breaker state of one RPC endpoint"""
+    url: str
+    ewma_latency_ms: Optional[float] = None
+    error_rate: float = 0.0
+    samples: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    state: str = CLOSED
+    opened_at: float = 0.0
+    cooldown: float = 0.0
+    probing: bool = False
+    probe_started: float = 0.0
+    last_used: float = 0.0
+
+    def score(self, prior_latency_ms: float, error_penalty: float) -> float:
+        """Lower is better: expected latency inflated by the recent error rate"""
+        latency = prior_latency_ms if self.ewma_latency_ms is None else self.ewma_latency_ms
+        return latency * (1 + error_penalty * self.error_rate)
+
+    def as_dict(self) -> Dict:
+        return {
+            'state': self.state,
+            'ewma_latency_ms': round(self.ewma_latency_ms, 1) if self.ewma_latency_ms is not None else None,
+            'error_rate': round(self.error_rate, 3),
+            'samples': self.samples,
+            'failures': self.failures,
+            'consecutive_failures': self.consecutive_failures,
+        }
 
 
 class FastExecutionEngine:
     """
     Ultra-fast transaction execution engine
+
+    Every endpoint is scored from its own send latency (EWMA) and error rate.
+    `failure_threshold` consecutive failures open its circuit: it gets no
+    traffic for `cooldown` seconds, after which a single probe (a health ping
+    or one live send) decides whether it closes again or stays open with the
+    cooldown doubled, up to `max_cooldown`.
     """
     
-    def __init__(self, primary_rpc: str, fallback_rpcs: List[str]):
+    def __init__(
+        self,
+        primary_rpc: str,
+        fallback_rpcs: List[str],
+        *,
+        alpha: float = 0.2,
+        error_penalty: float = 4.0,
+        prior_latency_ms: float = 250.0,
+        failure_threshold: int = 3,
+        cooldown: float = 10.0,
+        max_cooldown: float = 120.0,
+        ping_interval: float = 5.0,
+        ping_timeout_ms: int = 1000,
+        monitor=None,
+    ):
         self.primary_rpc = primary_rpc
         self.fallback_rpcs = fallback_rpcs
         self.all_rpcs = [primary_rpc] + fallback_rpcs
+
+        self.alpha = alpha
+        self.error_penalty = error_penalty
+        self.prior_latency_ms = prior_latency_ms
+        self.failure_threshold = failure_threshold
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.ping_interval = ping_interval
+        self.ping_timeout_ms = ping_timeout_ms
+        self.probe_timeout = max(2.0, ping_timeout_ms / 1000)
+        self.monitor = monitor
         
         # RPC performance tracking
-        self.rpc_latencies: Dict[str, List[float]] = {rpc: [] for rpc in self.all_rpcs}
+        self.health: Dict[str, EndpointHealth] = {rpc: EndpointHealth(rpc) for rpc in self.all_rpcs}
+        self._ping_task: Optional[asyncio.Task] = None
         
         logger.info(f"⚡ Fast Execution Engine initialized with {len(self.all_rpcs)} RPCs")
     
+    # ------------------------------------------------------------------
+    # Scoring
+    # ------------------------------------------------------------------
+
+    def record_result(self, rpc_url: str, latency_ms: float, success: bool):
+        """One response (or failure) measured for this endpoint alone"""
+        health = self.health.get(rpc_url)
+        if health is None:
+            return
+
+        health.samples += 1
+        health.last_used = time.monotonic()
+        health.error_rate += self.alpha * ((0.0 if success else 1.0) - health.error_rate)
+        if success:
+            if health.ewma_latency_ms is None:
+                health.ewma_latency_ms = latency_ms
+            else:
+                health.ewma_latency_ms += self.alpha * (latency_ms - health.ewma_latency_ms)
+        elif health.ewma_latency_ms is not None:
+            # A failure costs at least as much time as it took
+            health.ewma_latency_ms += self.alpha * max(0.0, latency_ms - health.ewma_latency_ms)
+
+        if success:
+            health.consecutive_failures = 0
+            if health.state != CLOSED:
+                logger.info(f"✅ RPC {rpc_url[:40]} recovered, circuit closed")
+            health.state = CLOSED
+            health.cooldown = 0.0
+            health.probing = False
+        else:
+            health.failures += 1
+            health.consecutive_failures += 1
+            if health.state == HALF_OPEN or (
+                health.state == CLOSED and health.consecutive_failures >= self.failure_threshold
+            ):
+                self._open(health)
+
+        if self.monitor:
+            tags = {'endpoint': rpc_url.split('?')[0]}
+            self.monitor.record_metric('rpc.endpoint_latency_ms', latency_ms, tags={**tags, 'success': str(success).lower()})
+            self.monitor.record_metric('rpc.endpoint_error_rate', health.error_rate, tags=tags)
+
     def record_latency(self, rpc_url: str, latency_ms: float):
-        """Record RPC latency for performance tracking"""
-        if rpc_url in self.rpc_latencies:
-            self.rpc_latencies[rpc_url].append(latency_ms)
-            # Keep only last 100 measurements
-            if len(self.rpc_latencies[rpc_url]) > 100:
-                self.rpc_latencies[rpc_url] = self.rpc_latencies[rpc_url][-100:]
-    
+        """Record a successful response time for performance tracking"""
+        self.record_result(rpc_url, latency_ms, True)
+
+    def _open(self, health: EndpointHealth):
+        # Back off while the endpoint keeps failing its probes
+        health.cooldown = min(self.max_cooldown, health.cooldown * 2 if health.cooldown else self.base_cooldown)
+        health.state = OPEN
+        health.opened_at = time.monotonic()
+        health.probing = False
+        logger.warning(
+            f"🔌 RPC {health.url[:40]} circuit open for {health.cooldown:.0f}s "
+            f"({health.consecutive_failures} consecutive failures)"
+        )
+
+    def _acquire(self, health: EndpointHealth) -> bool:
+        """May this endpoint take a request now? Moves an expired OPEN circuit to HALF_OPEN."""
+        if health.state == CLOSED:
+            return True
+        if health.state == OPEN and time.monotonic() - health.opened_at >= health.cooldown:
+            health.state = HALF_OPEN
+        if health.probing and time.monotonic() - health.probe_started > self.probe_timeout:
+            health.probing = False  # the probe was selected but never reported back
+        if health.state == HALF_OPEN and not health.probing:
+            health.probing = True  # exactly one probe at a time
+            health.probe_started = time.monotonic()
+            return True
+        return False
+
+    def _ranked(self) -> List[EndpointHealth]:
+        order = {rpc: index for index, rpc in enumerate(self.all_rpcs)}
+        return sorted(
+            self.health.values(),
+            key=lambda h: (h.score(self.prior_latency_ms, self.error_penalty), order[h.url]),
+        )
+
     def get_fastest_rpcs(self, n: int = 3) -> List[str]:
-        """Get N fastest RPCs based on recent latency"""
-        rpc_avgs = []
-        
-        for rpc, latencies in self.rpc_latencies.items():
-            if latencies:
-                avg_latency = sum(latencies) / len(latencies)
-                rpc_avgs.append((rpc, avg_latency))
-        
-        # Sort by latency
-        rpc_avgs.sort(key=lambda x: x[1])
-        
-        # Return top N RPCs
-        return [rpc for rpc, _ in rpc_avgs[:n]]
+        """Best-scoring N endpoints whose circuit lets traffic through"""
+        selected = [health.url for health in self._ranked() if health.state == CLOSED][:n]
+        for health in self._ranked():
+            if len(selected) >= n:
+                break
+            if health.url not in selected and self._acquire(health):
+                selected.append(health.url)
+        if not selected:
+            # Every circuit is open: sending somewhere beats not sending at all
+            selected = [health.url for health in self._ranked()[:n]]
+        return selected
+
+    def stats(self) -> Dict[str, Dict]:
+        return {health.url: health.as_dict() for health in self._ranked()}
+
+    # ------------------------------------------------------------------
+    # Health pings
+    # ------------------------------------------------------------------
+
+    async def start(self):
+        if self._ping_task is None or self._ping_task.done():
+            self._ping_task = asyncio.create_task(self._ping_loop())
+
+    async def stop(self):
+        if self._ping_task:
+            self._ping_task.cancel()
+            try:
+                await self._ping_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._ping_task = None
+
+    async def _ping_loop(self):
+        while True:
+            await asyncio.sleep(self.ping_interval)
+            try:
+                await self.ping_all()
+            except Exception as e:
+                logger.error(f"Error pinging RPC endpoints: {e}")
+
+    async def ping_all(self):
+        """getHealth on idle closed endpoints and on open ones due for their probe"""
+        now = time.monotonic()
+        due = [
+            health for health in self.health.values()
+            if (health.state == CLOSED and now - health.last_used >= self.ping_interval)
+            or (health.state != CLOSED and self._acquire(health))
+        ]
+        await asyncio.gather(*(self._ping(health.url) for health in due))
+
+    async def _ping(self, rpc_url: str):
+        payload = {"jsonrpc": "2.0", "id": 1, "method": "getHealth"}
+        start = time.perf_counter()
+        try:
+            timeout = aiohttp.ClientTimeout(total=self.ping_timeout_ms / 1000)
+            async with get_http_session().post(rpc_url, json=payload, timeout=timeout) as resp:
+                body = await resp.json(content_type=None)
+            healthy = resp.status == 200 and isinstance(body, dict) and body.get("result") == "ok"
+        except Exception:
+            healthy = False
+        self.record_result(rpc_url, (time.perf_counter() - start) * 1000, healthy)
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    def on_send_result(self, res: Dict):
+        if 'rpc' in res and 'latency_ms' in res:
+            self.record_result(res['rpc'], res['latency_ms'], bool(res.get('success')))
     
     async def execute_fast(
         self,
@@ -285,30 +556,20 @@ class FastExecutionEngine:
         # Get fastest RPCs
         fastest_rpcs = self.get_fastest_rpcs(n=3)
         
-        if not fastest_rpcs:
-            fastest_rpcs = self.all_rpcs[:3]
-        
         # Use fastest RPC for simulation
         simulate_rpc = fastest_rpcs[0] if use_simulation else None
         
         logger.info(f"⚡ Fast execution using {len(fastest_rpcs)} RPCs + Jito")
         
-        # Execute with parallel submission
-        result = await submit_signed_tx_fast(
+        # Execute with parallel submission; every endpoint reports its own latency
+        return await submit_signed_tx_fast(
             signed_tx_bytes=signed_tx_bytes,
             rpc_endpoints=fastest_rpcs,
             jito_submit_fn=jito_submit_fn,
             simulate_rpc=simulate_rpc,
-            timeout_ms_on_all=1200
+            timeout_ms_on_all=1200,
+            on_result=self.on_send_result,
         )
-        
-        # Record latencies
-        if result.all_results:
-            for res in result.all_results:
-                if isinstance(res, dict) and 'rpc' in res:
-                    self.record_latency(res['rpc'], result.latency_ms)
-        
-        return result
 
 
 # Example usage
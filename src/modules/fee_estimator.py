@@ -0,0 +1,294 @@
+"""
+⛽ FEE ESTIMATOR
+Adaptive priority fees and Jito tips from live network data
+
+FEATURES:
+- Samples getRecentPrioritizationFees and Jito's landed-tip floor in the background
+- Rolling percentiles over the sampled window
+- Fee policy per context (sniper, copy trade, exit, manual)
+- Trade outcomes feed back in: each context climbs the percentile ladder
+  while its landing rate is below target and steps down once it overpays
+- Landing rate per context and fee level exposed through stats()
+"""
+
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional, Tuple
+
+from src.modules.http_pool import get_http_session
+
+logger = logging.getLogger(__name__)
+
+# One fee level = one rung on both ladders. Jito publishes landed-tip
+# percentiles 25/50/75/95/99, so the tip ladder uses those.
+PRIORITY_LADDER = (50, 75, 90, 95, 99)
+TIP_LADDER = (25, 50, 75, 95, 99)
+
+MICRO_LAMPORTS = 1_000_000
+LAMPORTS_PER_SOL = 1_000_000_000
+
+
+@dataclass(frozen=True)
+class FeePolicy:
+    base_level: int                 # starting rung on the ladders
+    max_level: int
+    target_landing_rate: float
+    min_priority_lamports: int
+    max_priority_lamports: int
+    min_tip_lamports: int
+    max_tip_lamports: int
+    default_priority_lamports: int  # used until the first sample arrives
+    default_tip_lamports: int
+
+
+CONTEXT_POLICIES: Dict[str, FeePolicy] = {
+    # Snipes race everyone else for the same pool: start high, escalate fast
+    'sniper': FeePolicy(2, 4, 0.90, 10_000, 5_000_000, 10_000, 2_000_000, 2_000_000, 100_000),
+    'copy_trade': FeePolicy(1, 4, 0.85, 5_000, 3_000_000, 10_000, 1_000_000, 1_000_000, 100_000),
+    # Exits must land, even if that costs more
+    'exit': FeePolicy(1, 4, 0.95, 5_000, 5_000_000, 10_000, 2_000_000, 1_000_000, 100_000),
+    'manual': FeePolicy(0, 3, 0.80, 5_000, 2_000_000, 10_000, 500_000, 1_000_000, 100_000),
+}
+
+
+# Execution contexts that copy a tracked wallet's buy (the wallet-copy engine trades as auto_trader)
+COPY_TRADE_CONTEXTS = ('copy_trade', 'auto_trader')
+
+
+def fee_context(context: str, trade_type: str = 'buy') -> str:
+    """Map a trade's execution context to its fee policy name."""
+    if trade_type == 'sell':
+        return 'exit'
+    if context.startswith('sniper'):
+        return 'sniper'
+    if context in COPY_TRADE_CONTEXTS:
+        return 'copy_trade'
+    return 'manual'
+
+
+@dataclass(frozen=True)
+class FeeQuote:
+    context: str
+    level: int
+    priority_fee_lamports: int       # total priority fee for the transaction
+    tip_lamports: int
+    micro_lamports_per_cu: int
+
+    def as_metadata(self) -> Dict:
+        return {
+            'fee_context': self.context,
+            'fee_level': self.level,
+            'priority_fee_lamports': self.priority_fee_lamports,
+            'tip_lamports': self.tip_lamports,
+        }
+
+
+def _percentile(values, pct: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(pct / 100 * len(ordered)))]
+
+
+class FeeEstimator:
+    """
+    Rolling fee/tip percentiles plus per-context landing feedback.
+
+    `rpc` is anything with `async call(method, params)` (JsonRpcBatchClient).
+    Priority fees are sampled in micro-lamports per compute unit and turned into
+    a total with `compute_units`, which is what Jupiter's /swap expects.
+    """
+
+    def __init__(
+        self,
+        rpc=None,
+        *,
+        tip_floor_url: Optional[str] = 'https://bundles.jito.wtf/api/v1/bundles/tip_floor',
+        accounts: Optional[List[str]] = None,
+        interval: float = 10.0,
+        window_slots: int = 600,
+        tip_window: int = 30,
+        compute_units: int = 300_000,
+        feedback_window: int = 20,
+        min_feedback: int = 10,
+        policies: Optional[Dict[str, FeePolicy]] = None,
+        monitor=None,
+    ):
+        self.rpc = rpc
+        self.tip_floor_url = tip_floor_url
+        self.accounts = list(accounts or [])
+        self.interval = interval
+        self.compute_units = compute_units
+        self.feedback_window = feedback_window
+        self.min_feedback = min_feedback
+        self.policies = dict(policies or CONTEXT_POLICIES)
+        self.monitor = monitor
+
+        self._fee_slots: Dict[int, int] = {}                       # slot -> micro-lamports per CU
+        self._slot_order: Deque[int] = deque(maxlen=window_slots)
+        self._tip_floors: Deque[Dict[int, float]] = deque(maxlen=tip_window)  # percentile -> SOL
+        self._levels: Dict[str, int] = {name: policy.base_level for name, policy in self.policies.items()}
+        self._outcomes: Dict[Tuple[str, int], Deque[bool]] = {}
+        self._totals: Dict[Tuple[str, int], List[int]] = {}         # (context, level) -> [sent, landed]
+
+        self._task: Optional[asyncio.Task] = None
+        self.running = False
+        self.samples = 0
+
+    # ------------------------------------------------------------------
+    # Sampling
+    # ------------------------------------------------------------------
+
+    async def start(self):
+        if self.running:
+            return
+        self.running = True
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"⛽ Fee estimator started ({self.interval:.0f}s sampling)")
+
+    async def stop(self):
+        self.running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._task = None
+
+    async def _run(self):
+        while self.running:
+            await self.sample()
+            await asyncio.sleep(self.interval)
+
+    async def sample(self):
+        results = await asyncio.gather(self._sample_priority_fees(), self._sample_tip_floor(), return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.debug(f"Fee sample failed: {result}")
+        self.samples += 1
+        if self.monitor:
+            for name in self.policies:
+                quote = self.quote(name)
+                self.monitor.record_metric('fees.priority_lamports', quote.priority_fee_lamports, tags={'context': name})
+                self.monitor.record_metric('fees.tip_lamports', quote.tip_lamports, tags={'context': name})
+
+    async def _sample_priority_fees(self):
+        if not self.rpc:
+            return
+        params = [self.accounts] if self.accounts else []
+        entries = await self.rpc.call('getRecentPrioritizationFees', params)
+        self.add_priority_samples(
+            (int(entry['slot']), int(entry.get('prioritizationFee', 0))) for entry in entries or []
+        )
+
+    async def _sample_tip_floor(self):
+        if not self.tip_floor_url:
+            return
+        async with get_http_session().get(self.tip_floor_url) as response:
+            if response.status != 200:
+                raise RuntimeError(f"tip floor returned {response.status}")
+            data = await response.json()
+        floor = data[0] if isinstance(data, list) and data else data
+        self.add_tip_floor(floor or {})
+
+    def add_priority_samples(self, samples):
+        """(slot, micro-lamports per CU) pairs; each slot is counted once."""
+        for slot, fee in samples:
+            if slot in self._fee_slots:
+                continue
+            if len(self._slot_order) == self._slot_order.maxlen:
+                self._fee_slots.pop(self._slot_order[0], None)
+            self._slot_order.append(slot)
+            self._fee_slots[slot] = fee
+
+    def add_tip_floor(self, floor: Dict):
+        """One Jito tip_floor snapshot (landed_tips_<p>th_percentile in SOL)."""
+        snapshot = {
+            pct: float(floor[f'landed_tips_{pct}th_percentile'])
+            for pct in TIP_LADDER
+            if floor.get(f'landed_tips_{pct}th_percentile') is not None
+        }
+        if snapshot:
+            self._tip_floors.append(snapshot)
+
+    # ------------------------------------------------------------------
+    # Policy
+    # ------------------------------------------------------------------
+
+    def quote(self, context: str) -> FeeQuote:
+        policy = self.policies.get(context) or self.policies['manual']
+        level = self._levels.get(context, policy.base_level)
+
+        micro = _percentile(list(self._fee_slots.values()), PRIORITY_LADDER[level])
+        if micro is None:
+            micro = policy.default_priority_lamports * MICRO_LAMPORTS // self.compute_units
+            priority = policy.default_priority_lamports
+        else:
+            priority = int(micro * self.compute_units / MICRO_LAMPORTS)
+        priority = max(policy.min_priority_lamports, min(policy.max_priority_lamports, priority))
+
+        tip_pct = TIP_LADDER[level]
+        tip_sol = [floor[tip_pct] for floor in self._tip_floors if tip_pct in floor]
+        tip = int(sum(tip_sol) / len(tip_sol) * LAMPORTS_PER_SOL) if tip_sol else policy.default_tip_lamports
+        tip = max(policy.min_tip_lamports, min(policy.max_tip_lamports, tip))
+
+        return FeeQuote(context, level, priority, tip, int(micro))
+
+    def record_outcome(self, context: str, level: int, landed: bool):
+        """Feed back whether a transaction sent at `level` landed; adapts the context's level."""
+        policy = self.policies.get(context)
+        if policy is None:
+            return
+        key = (context, level)
+        outcomes = self._outcomes.get(key)
+        if outcomes is None:
+            outcomes = self._outcomes[key] = deque(maxlen=self.feedback_window)
+        outcomes.append(landed)
+        totals = self._totals.setdefault(key, [0, 0])
+        totals[0] += 1
+        totals[1] += int(landed)
+
+        current = self._levels.get(context, policy.base_level)
+        if level != current or len(outcomes) < self.min_feedback:
+            return
+
+        rate = sum(outcomes) / len(outcomes)
+        if rate < policy.target_landing_rate and current < policy.max_level:
+            self._set_level(context, current + 1, rate)
+        elif current > policy.base_level and rate >= 1.0:
+            # Everything lands: try one rung cheaper, unless that rung is known to underdeliver
+            below = self._outcomes.get((context, current - 1))
+            if not below or len(below) < self.min_feedback or sum(below) / len(below) >= policy.target_landing_rate:
+                self._set_level(context, current - 1, rate)
+
+    def _set_level(self, context: str, level: int, rate: float):
+        previous = self._levels.get(context)
+        self._levels[context] = level
+        # Start the new rung with fresh evidence
+        self._outcomes.pop((context, level), None)
+        logger.info(
+            f"⛽ {context} fees: level {previous} -> {level} "
+            f"(p{PRIORITY_LADDER[level]} priority / p{TIP_LADDER[level]} tip, landing rate {rate:.0%})"
+        )
+
+    def landing_rates(self) -> Dict[str, Dict[int, Dict[str, float]]]:
+        rates: Dict[str, Dict[int, Dict[str, float]]] = {}
+        for (context, level), (sent, landed) in sorted(self._totals.items()):
+            rates.setdefault(context, {})[level] = {
+                'sent': sent,
+                'landed': landed,
+                'landing_rate': landed / sent if sent else 0.0,
+            }
+        return rates
+
+    def stats(self) -> Dict:
+        return {
+            'samples': self.samples,
+            'fee_slots': len(self._fee_slots),
+            'tip_snapshots': len(self._tip_floors),
+            'levels': dict(self._levels),
+            'landing': self.landing_rates(),
+        }
@@ -17,6 +17,8 @@ from datetime import datetime, timedelta
 from solana.rpc.async_api import AsyncClient
 from solders.pubkey import Pubkey
 
+from src.modules.http_pool import get_http_session
+
 logger = logging.getLogger(__name__)
 
 
@@ -141,7 +143,7 @@ class FlashLoanArbitrageEngine:
     async def _ensure_session(self):
         """Ensure HTTP session exists"""
         if not self.session:
-            self.session = aiohttp.ClientSession()
+            self.session = get_http_session()
     
     async def scan_for_opportunities(self) -> List[ArbitrageOpportunity]:
         """
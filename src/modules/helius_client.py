@@ -0,0 +1,133 @@
+"""
+⚡ HELIUS ENHANCED TRANSACTIONS CLIENT
+Long-lived, pooled client for the Helius parsed-transaction API
+
+FEATURES:
+- One keep-alive connection pool for the life of the process (no per-lookup TLS handshake)
+- Batch endpoint: up to 100 signatures resolved per POST /v0/transactions
+- Unresolved signatures reported back so callers can fall back to standard RPC
+- Logical lookup vs physical HTTP request counters
+"""
+
+import asyncio
+import logging
+import os
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Helius rejects larger batches on /v0/transactions
+MAX_BATCH_SIZE = 100
+
+
+class HeliusEnhancedClient:
+    """Resolve signatures to Helius enhanced transactions over a shared connection pool."""
+
+    def __init__(
+        self,
+        api_key: str,
+        *,
+        base_url: Optional[str] = None,
+        batch_size: int = MAX_BATCH_SIZE,
+        timeout: float = 5.0,
+        max_connections: int = 10,
+        on_request: Optional[Callable[[], None]] = None,
+    ):
+        if not HTTPX_AVAILABLE:
+            raise RuntimeError("httpx is required for the Helius enhanced client")
+
+        self.api_key = api_key
+        self.base_url = (base_url or os.getenv('HELIUS_API_URL', 'https://api.helius.xyz')).rstrip('/')
+        self.batch_size = max(1, min(batch_size, MAX_BATCH_SIZE))
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.on_request = on_request
+        self._client: Optional["httpx.AsyncClient"] = None
+
+        # Counters: signatures looked up vs physical HTTP requests sent
+        self.logical_calls = 0
+        self.http_requests = 0
+
+    def _get_client(self) -> "httpx.AsyncClient":
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+            )
+        return self._client
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def get_counters(self) -> Dict[str, int]:
+        return {
+            'logical_calls': self.logical_calls,
+            'http_requests': self.http_requests,
+        }
+
+    async def get_transactions(self, signatures: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch enhanced transactions for `signatures`.
+
+        Returns only the signatures Helius resolved; anything missing (unknown,
+        not yet indexed, or a failed request) should go through standard RPC.
+        """
+        unique = list(dict.fromkeys(signatures))
+        if not unique:
+            return {}
+
+        chunks = [unique[start: start + self.batch_size] for start in range(0, len(unique), self.batch_size)]
+        results: Dict[str, Dict[str, Any]] = {}
+
+        for chunk_result in await asyncio.gather(*(self._post_chunk(chunk) for chunk in chunks)):
+            results.update(chunk_result)
+
+        return results
+
+    async def get_transaction(self, signature: str) -> Optional[Dict[str, Any]]:
+        return (await self.get_transactions([signature])).get(signature)
+
+    async def _post_chunk(self, signatures: List[str]) -> Dict[str, Dict[str, Any]]:
+        self.logical_calls += len(signatures)
+        self.http_requests += 1
+        if self.on_request:
+            self.on_request()
+
+        try:
+            response = await self._get_client().post(
+                '/v0/transactions',
+                params={'api-key': self.api_key},
+                json={'transactions': signatures},
+            )
+        except Exception as e:
+            logger.debug(f"Helius enhanced batch request failed: {e}")
+            return {}
+
+        if response.status_code != 200:
+            logger.debug(f"Helius enhanced API returned HTTP {response.status_code}: {response.text[:200]}")
+            return {}
+
+        try:
+            data = response.json()
+        except ValueError as e:
+            logger.debug(f"Helius enhanced API returned invalid JSON: {e}")
+            return {}
+
+        wanted = set(signatures)
+        return {
+            item['signature']: item
+            for item in data or []
+            if isinstance(item, dict) and item.get('signature') in wanted
+        }
@@ -0,0 +1,212 @@
+"""
+🌐 SHARED HTTP POOL
+One process-wide aiohttp session for every outbound HTTP client
+
+FEATURES:
+- Tuned TCPConnector: global and per-host connection limits, DNS cache, keep-alive
+- Warm connections reused across modules instead of a TLS handshake per call
+- Per-host metrics: requests, errors, in-flight, pool waits, latency percentiles
+- Metrics exported through BotMonitor.record_metric
+- One clean shutdown for every pooled connection
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+class HostStats:
+    """Counters for one remote host."""
+
+    def __init__(self, window: int = 512):
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.pool_waits = 0
+        self.pool_wait_seconds = 0.0
+        self.connections_created = 0
+        self.connections_reused = 0
+        self.latencies: Deque[float] = deque(maxlen=window)
+
+    def percentile(self, pct: float) -> float:
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(pct / 100 * len(ordered)))]
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'in_flight': self.in_flight,
+            'pool_waits': self.pool_waits,
+            'pool_wait_seconds': round(self.pool_wait_seconds, 6),
+            'connections_created': self.connections_created,
+            'connections_reused': self.connections_reused,
+            'latency_p50': round(self.percentile(50), 6),
+            'latency_p95': round(self.percentile(95), 6),
+        }
+
+
+class HttpClientRegistry:
+    """
+    Lazily creates the shared session on first use in a running loop.
+
+    Callers must not close the session they get; `close()` does that once at
+    shutdown. A session from a loop that is no longer running (tests, scripts
+    with several `asyncio.run` calls) is replaced transparently.
+    """
+
+    def __init__(
+        self,
+        *,
+        limit: int = 200,
+        limit_per_host: int = 32,
+        dns_cache_ttl: int = 300,
+        keepalive_timeout: float = 30.0,
+        connect_timeout: float = 5.0,
+        total_timeout: float = 30.0,
+    ):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.connect_timeout = connect_timeout
+        self.total_timeout = total_timeout
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.hosts: Dict[str, HostStats] = {}
+
+    @classmethod
+    def from_env(cls) -> "HttpClientRegistry":
+        return cls(
+            limit=int(os.getenv('HTTP_POOL_LIMIT', '200')),
+            limit_per_host=int(os.getenv('HTTP_POOL_LIMIT_PER_HOST', '32')),
+            dns_cache_ttl=int(os.getenv('HTTP_POOL_DNS_CACHE_SECONDS', '300')),
+            keepalive_timeout=float(os.getenv('HTTP_POOL_KEEPALIVE_SECONDS', '30')),
+            connect_timeout=float(os.getenv('HTTP_POOL_CONNECT_TIMEOUT', '5')),
+            total_timeout=float(os.getenv('HTTP_POOL_TOTAL_TIMEOUT', '30')),
+        )
+
+    def session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            self._session = self._create_session()
+            self._loop = loop
+        return self._session
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=self.dns_cache_ttl,
+            use_dns_cache=True,
+            keepalive_timeout=self.keepalive_timeout,
+            enable_cleanup_closed=True,
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.total_timeout, connect=self.connect_timeout),
+            trace_configs=[self._trace_config()],
+        )
+
+    # ------------------------------------------------------------------
+    # Metrics (aiohttp request tracing)
+    # ------------------------------------------------------------------
+
+    def _host(self, url) -> HostStats:
+        host = url.host or 'unknown'
+        stats = self.hosts.get(host)
+        if stats is None:
+            stats = self.hosts[host] = HostStats()
+        return stats
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        trace = aiohttp.TraceConfig()
+
+        async def on_request_start(session, ctx, params):
+            ctx.stats = self._host(params.url)
+            ctx.started = time.perf_counter()
+            ctx.stats.requests += 1
+            ctx.stats.in_flight += 1
+
+        async def on_request_end(session, ctx, params):
+            ctx.stats.in_flight -= 1
+            ctx.stats.latencies.append(time.perf_counter() - ctx.started)
+
+        async def on_request_exception(session, ctx, params):
+            ctx.stats.in_flight -= 1
+            ctx.stats.errors += 1
+
+        async def on_connection_queued_start(session, ctx, params):
+            ctx.queued_at = time.perf_counter()
+
+        async def on_connection_queued_end(session, ctx, params):
+            ctx.stats.pool_waits += 1
+            ctx.stats.pool_wait_seconds += time.perf_counter() - ctx.queued_at
+
+        async def on_connection_create_end(session, ctx, params):
+            ctx.stats.connections_created += 1
+
+        async def on_connection_reuseconn(session, ctx, params):
+            ctx.stats.connections_reused += 1
+
+        trace.on_request_start.append(on_request_start)
+        trace.on_request_end.append(on_request_end)
+        trace.on_request_exception.append(on_request_exception)
+        trace.on_connection_queued_start.append(on_connection_queued_start)
+        trace.on_connection_queued_end.append(on_connection_queued_end)
+        trace.on_connection_create_end.append(on_connection_create_end)
+        trace.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace
+
+    def host_stats(self) -> Dict[str, Dict[str, float]]:
+        return {host: stats.as_dict() for host, stats in sorted(self.hosts.items())}
+
+    def export_metrics(self, monitor) -> None:
+        if not monitor:
+            return
+        for host, stats in self.host_stats().items():
+            for name in ('in_flight', 'pool_waits', 'pool_wait_seconds', 'errors', 'latency_p50', 'latency_p95'):
+                monitor.record_metric(f'http_pool.{name}', stats[name], tags={'host': host})
+
+    async def close(self):
+        session, self._session, self._loop = self._session, None, None
+        if session and not session.closed:
+            try:
+                await session.close()
+            except Exception as e:
+                logger.debug(f"Error closing shared HTTP session: {e}")
+
+
+_registry: Optional[HttpClientRegistry] = None
+
+
+def get_http_registry() -> HttpClientRegistry:
+    global _registry
+    if _registry is None:
+        _registry = HttpClientRegistry.from_env()
+    return _registry
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """The shared session (call from inside the event loop; never close it)."""
+    return get_http_registry().session()
+
+
+async def close_http_sessions() -> None:
+    if _registry is not None:
+        await _registry.close()
+
+
+def export_http_metrics(monitor) -> None:
+    if _registry is not None:
+        _registry.export_metrics(monitor)
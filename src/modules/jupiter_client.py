@@ -8,6 +8,7 @@ ELITE FEATURES:
 - Price impact analysis
 - Route optimization
 - Advanced slippage protection
+- Sub-second quote cache with amount bucketing and in-flight coalescing
 """
 
 import aiohttp
@@ -16,14 +17,29 @@ import logging
 import base64
 import random
 import os
-from typing import Dict, Optional, List, Tuple
+import math
+import time
+from typing import Dict, Optional, List, Sequence, Tuple
 from decimal import Decimal
 from dataclasses import dataclass
 from solders.pubkey import Pubkey
 from solders.keypair import Keypair
+from solders.message import MessageV0
+from solders.system_program import TransferParams, transfer
 from solders.transaction import VersionedTransaction
 from solana.rpc.async_api import AsyncClient
 
+from src.modules.blockhash_cache import transaction_blockhash
+from src.modules.bundle_tracker import MAX_BUNDLES_PER_CALL, BundleTracker
+from src.modules.confirmation_service import ConfirmationMultiplexer
+from src.modules.http_pool import get_http_session
+from src.modules.latency_trace import mark
+from src.modules.rebroadcaster import Rebroadcaster
+from src.modules.swap_pool import PrebuiltSwap, SwapIntent
+from src.modules.token_metadata import TokenMetadataStore
+from src.modules.ttl_cache import TTLCache
+from src.ops import broadcast
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,6 +59,28 @@ class SwapQuote:
     time_taken: float
 
 
+@dataclass(frozen=True)
+class RouteStrategy:
+    """One way of asking Jupiter for a route"""
+    name: str
+    only_direct_routes: bool = False
+    max_accounts: Optional[int] = None
+    exclude_dexes: Tuple[str, ...] = ()
+
+
+@dataclass
+class RouteChoice:
+    """A quote returned by one routing strategy, scored for selection"""
+    strategy: RouteStrategy
+    quote: Dict
+    latency_ms: float
+    score: float
+
+    @property
+    def out_amount(self) -> int:
+        return int(self.quote.get('outAmount', 0))
+
+
 @dataclass
 class JitoBundle:
     """Jito bundle for MEV protection"""
@@ -64,9 +102,29 @@ class JupiterClient:
     - Route caching
     """
     
-    def __init__(self, rpc_client: AsyncClient):
+    def __init__(self, rpc_client: AsyncClient, confirmations: Optional[ConfirmationMultiplexer] = None):
         self.rpc_client = rpc_client
         self.session: Optional[aiohttp.ClientSession] = None
+
+        # Every swap this client (or anyone sharing the multiplexer) sends is confirmed
+        # by one background loop with batched getSignatureStatuses
+        self.confirmations = confirmations or ConfirmationMultiplexer(
+            rpc_client,
+            poll_interval=int(os.getenv('CONFIRMATION_POLL_MS', '400')) / 1000,
+            timeout=float(os.getenv('TX_CONFIRMATION_TIMEOUT', '60')),
+            commitment=os.getenv('CONFIRMATION_STRATEGY', 'confirmed').lower(),
+        )
+
+        # Sent swaps are re-sent every REBROADCAST_INTERVAL_MS until they confirm or
+        # their blockhash expires (leaders drop transactions under congestion)
+        self.rebroadcaster = None
+        if os.getenv('REBROADCAST_ENABLED', 'true').lower() == 'true':
+            self.rebroadcaster = Rebroadcaster(
+                lambda signature, timeout: self._confirm_transaction(signature, max_wait=timeout),
+                rpc_client,
+                interval=int(os.getenv('REBROADCAST_INTERVAL_MS', '2000')) / 1000,
+                max_duration=float(os.getenv('REBROADCAST_MAX_SECONDS', '90')),
+            )
         
         # READ JUPITER CONFIGURATION FROM ENVIRONMENT
         self.JUPITER_API_V6 = os.getenv('JUPITER_API_URL', 'https://quote-api.jup.ag/v6')
@@ -75,10 +133,69 @@ class JupiterClient:
         self.use_versioned_txs = os.getenv('USE_VERSIONED_TRANSACTIONS', 'true').lower() == 'true'
         self.only_direct_routes = os.getenv('JUPITER_ONLY_DIRECT_ROUTES', 'false').lower() == 'true'
         self.max_accounts = int(os.getenv('JUPITER_MAX_ACCOUNTS', '64'))
+        self.exclude_dexes = tuple(
+            dex.strip() for dex in os.getenv('JUPITER_EXCLUDE_DEXES', '').split(',') if dex.strip()
+        )
+
+        # Route comparison: strategies are quoted concurrently; with a hedge budget the
+        # comparison stops waiting once it has something, and slow quotes lose points
+        self.route_strategies: List[RouteStrategy] = [
+            RouteStrategy('best'),
+            RouteStrategy('direct', only_direct_routes=True),
+            RouteStrategy('compact', max_accounts=min(self.max_accounts, 32)),
+        ]
+        if self.exclude_dexes:
+            self.route_strategies.append(RouteStrategy('filtered', exclude_dexes=self.exclude_dexes))
+        self.route_hedge_ms = float(os.getenv('JUPITER_ROUTE_HEDGE_MS', '0'))
+        self.route_latency_penalty_bps = float(os.getenv('JUPITER_ROUTE_LATENCY_PENALTY_BPS', '5'))
         
         # Elite features
-        self.route_cache: Dict[Tuple[str, str], List[Dict]] = {}
+        self.route_cache = TTLCache('jupiter.routes', max_size=1000, ttl_seconds=30)
+
+        # Quote layer: identical quotes are requested back to back (execute_buy then
+        # execute_swap, one per copy-trade follower), so serve them from a short-lived
+        # cache and collapse concurrent identical requests into one HTTP call
+        self.quote_ttl_seconds = int(os.getenv('JUPITER_QUOTE_CACHE_TTL_MS', '500')) / 1000
+        self.quote_bucket_bps = int(os.getenv('JUPITER_QUOTE_BUCKET_BPS', '100'))
+        self.quote_cache = TTLCache('jupiter.quotes', max_size=2000, ttl_seconds=self.quote_ttl_seconds)
+        self._quote_inflight: Dict[Tuple, asyncio.Future] = {}
+        self.quote_http_requests = 0
+        self.quote_coalesced = 0
+
+        # Optional PrebuiltSwapPool; when it holds a fresh swap for exactly this trade,
+        # execution skips the quote and /swap round trips
+        self.swap_pool = None
+
+        # Optional PriceService; get_token_price reads its tick store instead of
+        # issuing a price request per call
+        self.price_service = None
+
+        # Optional FeeEstimator; supplies priority fees and Jito tips per context
+        self.fee_estimator = None
+
+        # Optional ComputeBudgetTuner; tightens Jupiter's compute unit limit to the
+        # simulated need before signing
+        self.compute_budget = None
+
+        # Optional BlockhashCache; learns each /swap blockhash's lastValidBlockHeight
+        # so the rebroadcast cutoff needs no extra round trip
+        self.blockhash_cache = None
+
+        # Token list lives in a local index, refreshed in the background
+        self.token_list_url = os.getenv('JUPITER_TOKEN_LIST_URL', 'https://token.jup.ag/all')
+        self.token_metadata = TokenMetadataStore()
         self.jito_enabled = os.getenv('ENABLE_JITO_BUNDLES', 'true').lower() == 'true'
+        self.jito_bundles_url = os.getenv('JITO_BUNDLES_URL', 'https://mainnet.block-engine.jito.wtf/api/v1/bundles')
+
+        # Submitted bundles are followed up in one background loop; a bundle that has
+        # not landed after JITO_BUNDLE_FALLBACK_SECONDS is re-sent through regular RPC
+        self.bundle_tracker = BundleTracker(
+            self.fetch_bundle_statuses,
+            confirmations=self.confirmations,
+            poll_interval=int(os.getenv('JITO_BUNDLE_POLL_MS', '1000')) / 1000,
+            fallback_after=float(os.getenv('JITO_BUNDLE_FALLBACK_SECONDS', '8')),
+            timeout=float(os.getenv('JITO_BUNDLE_TIMEOUT', '30')),
+        )
         
         # API ENHANCEMENTS - Multi-source price feeds
         self.pyth_enabled = os.getenv('PYTH_PRICE_FEED_ENABLED', 'true').lower() == 'true'
@@ -96,12 +213,14 @@ class JupiterClient:
             logger.info("  ✅ Pyth Network price feeds enabled (real-time oracle)")
     
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        self.session = get_http_session()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        await self.bundle_tracker.close()
+        await self.confirmations.close()
+        # The session belongs to the shared HTTP pool, closed once at shutdown
+        self.session = None
     
     async def get_quote(
         self,
@@ -109,7 +228,10 @@ class JupiterClient:
         output_mint: str,
         amount: int,  # In smallest units (lamports for SOL)
         slippage_bps: int = 50,  # 0.5%
-        only_direct_routes: bool = False
+        only_direct_routes: bool = False,
+        allow_bucketed: bool = False,
+        max_accounts: Optional[int] = None,
+        exclude_dexes: Optional[Sequence[str]] = None,
     ) -> Optional[Dict]:
         """
         Get best swap quote from Jupiter
@@ -120,10 +242,53 @@ class JupiterClient:
             amount: Amount in smallest token units
             slippage_bps: Slippage tolerance in basis points (50 = 0.5%)
             only_direct_routes: Only use direct routes (faster but may miss better prices)
+            allow_bucketed: Quote a nearby bucketed amount instead (price discovery only;
+                never execute a bucketed quote, its inAmount differs from `amount`)
+            max_accounts: Cap on accounts the route may touch (Jupiter `maxAccounts`)
+            exclude_dexes: DEX labels the route must avoid (Jupiter `excludeDexes`)
         
         Returns:
-            Quote data including price, route, and price impact
+            Quote data including price, route, and price impact. Quotes are shared
+            between callers for up to JUPITER_QUOTE_CACHE_TTL_MS; treat them as read-only.
         """
+        if allow_bucketed:
+            amount = self._bucket_amount(amount)
+
+        excluded = tuple(sorted(exclude_dexes)) if exclude_dexes else ()
+        key = (input_mint, output_mint, int(amount), int(slippage_bps), bool(only_direct_routes), max_accounts, excluded)
+        cached = self.quote_cache.get(key)
+        if cached is not None:
+            return cached
+
+        inflight = self._quote_inflight.get(key)
+        if inflight is not None:
+            self.quote_coalesced += 1
+            return await asyncio.shield(inflight)
+
+        inflight = asyncio.ensure_future(self._fetch_and_cache_quote(
+            key, input_mint, output_mint, amount, slippage_bps, only_direct_routes, max_accounts, excluded
+        ))
+        self._quote_inflight[key] = inflight
+        inflight.add_done_callback(lambda _: self._quote_inflight.pop(key, None))
+        return await asyncio.shield(inflight)
+
+    async def _fetch_and_cache_quote(self, key: Tuple, *args) -> Optional[Dict]:
+        # Cached from the shared task, so it lands even if every waiter was cancelled
+        quote = await self._fetch_quote(*args)
+        if quote is not None:
+            self.quote_cache.set(key, quote)
+        return quote
+
+    async def _fetch_quote(
+        self,
+        input_mint: str,
+        output_mint: str,
+        amount: int,
+        slippage_bps: int,
+        only_direct_routes: bool,
+        max_accounts: Optional[int] = None,
+        exclude_dexes: Sequence[str] = (),
+    ) -> Optional[Dict]:
         try:
             params = {
                 "inputMint": input_mint,
@@ -132,10 +297,15 @@ class JupiterClient:
                 "slippageBps": slippage_bps,
                 "onlyDirectRoutes": str(only_direct_routes).lower()
             }
+            if max_accounts:
+                params["maxAccounts"] = max_accounts
+            if exclude_dexes:
+                params["excludeDexes"] = ",".join(exclude_dexes)
             
             if not self.session:
-                self.session = aiohttp.ClientSession()
+                self.session = get_http_session()
             
+            self.quote_http_requests += 1
             async with self.session.get(
                 f"{self.JUPITER_API_V6}/quote",
                 params=params
@@ -152,13 +322,35 @@ class JupiterClient:
         except Exception as e:
             logger.error(f"Error getting Jupiter quote: {e}")
             return None
+
+    def _bucket_amount(self, amount: int) -> int:
+        """Round to a power-of-ten step no larger than JUPITER_QUOTE_BUCKET_BPS of the amount."""
+        if self.quote_bucket_bps <= 0 or amount <= 0:
+            return int(amount)
+        tolerance = amount * self.quote_bucket_bps / 10_000
+        if tolerance < 1:
+            return int(amount)
+        step = 10 ** int(math.floor(math.log10(tolerance)))
+        return max(step, int(round(amount / step)) * step)
+
+    def get_quote_cache_stats(self) -> Dict:
+        """Quote cache hits/misses plus coalesced waiters and real HTTP calls."""
+        stats = self.quote_cache.stats()
+        stats.update({
+            'ttl_ms': int(self.quote_ttl_seconds * 1000),
+            'coalesced': self.quote_coalesced,
+            'http_requests': self.quote_http_requests,
+            'inflight': len(self._quote_inflight),
+        })
+        return stats
     
     async def get_swap_transaction(
         self,
         quote: Dict,
         user_public_key: str,
         wrap_unwrap_sol: bool = True,
-        fee_account: Optional[str] = None
+        fee_account: Optional[str] = None,
+        prioritization_fee_lamports: Optional[int] = None,
     ) -> Optional[str]:
         """
         Get serialized transaction for the swap
@@ -168,6 +360,7 @@ class JupiterClient:
             user_public_key: User's wallet public key
             wrap_unwrap_sol: Automatically wrap/unwrap SOL
             fee_account: Optional fee account for referral fees
+            prioritization_fee_lamports: Total priority fee (Jupiter sets the compute unit price)
         
         Returns:
             Base64 encoded serialized transaction
@@ -181,9 +374,12 @@ class JupiterClient:
             
             if fee_account:
                 payload["feeAccount"] = fee_account
+
+            if prioritization_fee_lamports is not None:
+                payload["prioritizationFeeLamports"] = int(prioritization_fee_lamports)
             
             if not self.session:
-                self.session = aiohttp.ClientSession()
+                self.session = get_http_session()
             
             async with self.session.post(
                 f"{self.JUPITER_API_V6}/swap",
@@ -191,7 +387,13 @@ class JupiterClient:
             ) as response:
                 if response.status == 200:
                     data = await response.json()
-                    return data.get("swapTransaction")
+                    swap_transaction = data.get("swapTransaction")
+                    if self.blockhash_cache and swap_transaction and data.get("lastValidBlockHeight"):
+                        self.blockhash_cache.add_blockhash(
+                            transaction_blockhash(base64.b64decode(swap_transaction)),
+                            int(data["lastValidBlockHeight"]),
+                        )
+                    return swap_transaction
                 else:
                     error_text = await response.text()
                     logger.error(f"Jupiter swap transaction error: {response.status} - {error_text}")
@@ -201,6 +403,26 @@ class JupiterClient:
             logger.error(f"Error getting swap transaction: {e}")
             return None
     
+    def _take_prebuilt(
+        self,
+        user_pubkey: str,
+        input_mint: str,
+        output_mint: str,
+        amount: int,
+        slippage_bps: int,
+        priority_fee_lamports: Optional[int] = None,
+    ) -> Optional[PrebuiltSwap]:
+        if not self.swap_pool:
+            return None
+        # The fee is part of the match: an entry built with another fee would silently change it
+        prebuilt = self.swap_pool.take(SwapIntent(
+            user_pubkey, input_mint, output_mint, int(amount), int(slippage_bps),
+            None if priority_fee_lamports is None else int(priority_fee_lamports),
+        ))
+        if prebuilt:
+            logger.info(f"🧰 Using prebuilt swap for {prebuilt.intent.token_mint[:8]}... ({prebuilt.age():.1f}s old)")
+        return prebuilt
+    
     async def execute_swap(
         self,
         input_mint: str,
@@ -210,6 +432,11 @@ class JupiterClient:
         slippage_bps: int = 50,
         max_retries: int = 3,
         confirm_token: Optional[str] = None,
+        latency_trace: Optional[Dict] = None,
+        quote: Optional[Dict] = None,
+        priority_fee_lamports: Optional[int] = None,
+        broadcast_policy: str = "single",
+        tip_lamports: Optional[int] = None,
     ) -> Optional[Dict]:
         """
         Execute a complete swap operation
@@ -221,21 +448,36 @@ class JupiterClient:
             keypair: User's keypair for signing
             slippage_bps: Slippage tolerance
             max_retries: Maximum retry attempts
+            latency_trace: Optional stage trace (quote/broadcast/confirmation are marked)
+            quote: Quote already fetched by the caller for these exact parameters
+            priority_fee_lamports: Total priority fee for the swap transaction
+            broadcast_policy: single, race or bundle_race (see src.ops.broadcast)
+            tip_lamports: Jito tip for the bundle leg of bundle_race
         
         Returns:
             Transaction result with signature
         """
         try:
-            # Get quote
-            quote = await self.get_quote(
-                input_mint,
-                output_mint,
-                amount,
-                slippage_bps
+            # Prebuilt swap: quote and transaction are ready, only sign and send remain
+            user_pubkey = str(keypair.pubkey())
+            prebuilt = None if quote is not None else self._take_prebuilt(
+                user_pubkey, input_mint, output_mint, amount, slippage_bps, priority_fee_lamports
             )
+            if prebuilt:
+                quote = prebuilt.quote
+
+            # Get quote (skip the round trip when the caller already has one)
+            if quote is None:
+                quote = await self.get_quote(
+                    input_mint,
+                    output_mint,
+                    amount,
+                    slippage_bps
+                )
             
             if not quote:
                 return {"success": False, "error": "Failed to get quote"}
+            mark(latency_trace, 'quote_received')
             
             # Calculate price impact
             price_impact = float(quote.get("priceImpactPct", 0))
@@ -243,44 +485,92 @@ class JupiterClient:
                 logger.warning(f"High price impact: {price_impact}%")
             
             # Get swap transaction
-            user_pubkey = str(keypair.pubkey())
-            swap_tx_base64 = await self.get_swap_transaction(
+            swap_tx_base64 = prebuilt.swap_transaction if prebuilt else await self.get_swap_transaction(
                 quote,
-                user_pubkey
+                user_pubkey,
+                prioritization_fee_lamports=priority_fee_lamports,
             )
             
             if not swap_tx_base64:
                 return {"success": False, "error": "Failed to get swap transaction"}
+            # Reported with the outcome so fee feedback credits what the transaction actually paid
+            built_fee = prebuilt.intent.priority_fee_lamports if prebuilt else priority_fee_lamports
+
+            budget = None
+            if self.compute_budget:
+                swap_tx_base64, budget = await self.compute_budget.tune(swap_tx_base64, quote)
             
             # Deserialize and sign transaction
-            import base64
-            tx_bytes = base64.b64decode(swap_tx_base64)
-            transaction = VersionedTransaction.from_bytes(tx_bytes)
-            
-            # Sign transaction
-            # Note: VersionedTransaction requires different signing approach
-            signature_bytes = keypair.sign_message(bytes(transaction.message))
+            tx_bytes = self._sign_swap_transaction(swap_tx_base64, keypair)
+
+            jito_submit_fn = None
+            if broadcast_policy == broadcast.BUNDLE_RACE and self.jito_enabled:
+                tip = tip_lamports if tip_lamports is not None else 100_000
+
+                async def jito_submit_fn(signed: bytes) -> Dict:
+                    return await self._submit_jito_bundle(base64.b64encode(signed).decode(), keypair, tip) or {}
             
             # Send transaction with retries
+            sent = False
             for attempt in range(max_retries):
                 try:
+                    sent_at = time.monotonic()
                     signature = await broadcast.send(
                         self.rpc_client,
                         tx_bytes,
                         context={"component": "jupiter_swap", "attempt": attempt + 1},
                         confirm_token=confirm_token,
+                        policy=broadcast_policy,
+                        jito_submit_fn=jito_submit_fn,
                     )
+                    mark(latency_trace, 'broadcast')
+                    sent = True
 
-                    confirmed = await self._confirm_transaction(signature)
+                    if self.rebroadcaster:
+                        outcome = await self.rebroadcaster.run(
+                            signature,
+                            lambda: broadcast.rebroadcast(
+                                self.rpc_client,
+                                tx_bytes,
+                                confirm_token=confirm_token,
+                                policy=broadcast_policy,
+                            ),
+                            last_valid_block_height=self._last_valid_block_height(tx_bytes),
+                            started=sent_at,
+                        )
+                        confirmed, sends = outcome.landed, outcome.sends
+                        rebroadcast = outcome.as_metadata()
+                    else:
+                        confirmed, sends, rebroadcast = await self._confirm_transaction(signature), 1, None
 
                     if confirmed:
+                        mark(latency_trace, 'confirmed')
+                        broadcast.record_landing(broadcast_policy, time.monotonic() - sent_at, sends)
+                        if budget:
+                            self.compute_budget.record_landed(budget)
                         return {
                             "success": True,
                             "signature": signature,
                             "input_amount": amount,
                             "output_amount": int(quote.get("outAmount", 0)),
                             "price_impact": price_impact,
-                            "route": quote.get("routePlan", [])
+                            "route": quote.get("routePlan", []),
+                            "quote": quote,
+                            "prebuilt": prebuilt is not None,
+                            "priority_fee_lamports": built_fee,
+                            "broadcast_policy": broadcast_policy,
+                            "rebroadcast": rebroadcast,
+                            "compute_budget": budget.as_metadata() if budget else None,
+                        }
+                    if rebroadcast:
+                        # Expired, failed on chain or given up on: resending these bytes again is pointless
+                        return {
+                            "success": False,
+                            "error": f"Transaction {rebroadcast['status']} after {sends} sends",
+                            "sent": True,
+                            "rebroadcast": rebroadcast,
+                            "prebuilt": prebuilt is not None,
+                            "priority_fee_lamports": built_fee,
                         }
 
                 except Exception as e:
@@ -289,34 +579,44 @@ class JupiterClient:
                         await asyncio.sleep(1)
                         continue
             
-            return {"success": False, "error": "Failed to send transaction after retries"}
+            # sent=True: the transaction reached the network but did not land
+            return {
+                "success": False,
+                "error": "Failed to send transaction after retries",
+                "sent": sent,
+                "prebuilt": prebuilt is not None,
+                "priority_fee_lamports": built_fee,
+            }
             
         except Exception as e:
             logger.error(f"Swap execution error: {e}")
             return {"success": False, "error": str(e)}
     
-    async def _confirm_transaction(self, signature: str, max_wait: int = 60) -> bool:
-        """Wait for transaction confirmation"""
-        import asyncio
-        
-        for _ in range(max_wait):
-            try:
-                status = await self.rpc_client.get_signature_statuses([signature])
-                if status.value and status.value[0]:
-                    if status.value[0].confirmation_status in ["confirmed", "finalized"]:
-                        return True
-                await asyncio.sleep(1)
-            except Exception as e:
-                logger.error(f"Error checking transaction status: {e}")
-                await asyncio.sleep(1)
-        
-        return False
+    @staticmethod
+    def _sign_swap_transaction(swap_tx_base64: str, keypair: Keypair) -> bytes:
+        """Sign Jupiter's unsigned /swap transaction (the user is its only signer)"""
+        transaction = VersionedTransaction.from_bytes(base64.b64decode(swap_tx_base64))
+        return bytes(VersionedTransaction(transaction.message, [keypair]))
+
+    def _last_valid_block_height(self, tx_bytes: bytes) -> Optional[int]:
+        if not self.blockhash_cache:
+            return None
+        return self.blockhash_cache.last_valid_for(transaction_blockhash(tx_bytes))
+
+    async def _confirm_transaction(self, signature: str, max_wait: Optional[float] = None) -> bool:
+        """Wait for transaction confirmation (shared batched status polling)"""
+        try:
+            return await self.confirmations.wait(signature, timeout=max_wait)
+        except Exception as e:
+            logger.error(f"Error checking transaction status: {e}")
+            return False
     
     async def get_token_price(self, token_mints: List[str]) -> Dict[str, float]:
         """
-        Get current prices for tokens with multi-source validation
+        Get current prices for tokens
         
-        Uses Jupiter Price API as primary, Pyth Network as fallback
+        Served from the shared PriceService tick store when one is attached
+        (only missing or stale mints hit the network); otherwise fetched directly.
         
         Args:
             token_mints: List of token mint addresses
@@ -324,9 +624,19 @@ class JupiterClient:
         Returns:
             Dict mapping mint addresses to USD prices
         """
+        if self.price_service:
+            return await self.price_service.get_prices(token_mints)
+        return await self.fetch_token_prices(token_mints)
+
+    async def fetch_token_prices(self, token_mints: List[str]) -> Dict[str, float]:
+        """
+        Fetch prices over HTTP with multi-source validation
+        
+        Uses Jupiter Price API as primary, Pyth Network as fallback
+        """
         try:
             if not self.session:
-                self.session = aiohttp.ClientSession()
+                self.session = get_http_session()
             
             # Try Jupiter price API first (primary source)
             ids = ",".join(token_mints)
@@ -343,7 +653,7 @@ class JupiterClient:
                         price_data = data.get("data", {}).get(mint, {})
                         prices[mint] = float(price_data.get("price", 0))
                     
-                    logger.info(f"✅ Jupiter price API: Got prices for {len(prices)} tokens")
+                    logger.debug(f"✅ Jupiter price API: Got prices for {len(prices)} tokens")
                     return prices
                 else:
                     logger.warning(f"⚠️ Jupiter price API returned status {response.status}, trying Pyth fallback...")
@@ -390,62 +700,122 @@ class JupiterClient:
     async def get_token_info(self, token_mint: str) -> Optional[Dict]:
         """Get detailed token information"""
         try:
-            if not self.session:
-                self.session = aiohttp.ClientSession()
-            
-            # Use Jupiter's token list
-            async with self.session.get(
-                "https://token.jup.ag/all"
-            ) as response:
-                if response.status == 200:
-                    tokens = await response.json()
-                    for token in tokens:
-                        if token.get("address") == token_mint:
-                            return token
-                    return None
-                else:
-                    return None
-                    
+            if not await self.token_metadata.ensure_fresh(self._download_token_list):
+                return None
+            return self.token_metadata.get(token_mint)
         except Exception as e:
             logger.error(f"Error getting token info: {e}")
             return None
+
+    async def get_token_infos(self, token_mints: List[str]) -> Dict[str, Dict]:
+        """Token information for many mints at once (unknown mints are omitted)"""
+        try:
+            if not await self.token_metadata.ensure_fresh(self._download_token_list):
+                return {}
+            return self.token_metadata.get_many(token_mints)
+        except Exception as e:
+            logger.error(f"Error getting token info batch: {e}")
+            return {}
+
+    async def _download_token_list(self) -> Optional[bytes]:
+        if not self.session:
+            self.session = get_http_session()
+
+        # Use Jupiter's token list
+        async with self.session.get(self.token_list_url) as response:
+            if response.status != 200:
+                logger.error(f"Jupiter token list error: {response.status}")
+                return None
+            return await response.read()
     
     async def compare_multiple_routes(
         self,
         input_mint: str,
         output_mint: str,
         amount: int,
-        slippage_bps: int = 50
+        slippage_bps: int = 50,
+        strategies: Optional[Sequence[RouteStrategy]] = None,
+        hedge_ms: Optional[float] = None,
     ) -> List[Dict]:
         """
         🚀 ELITE FEATURE: Compare multiple routing strategies
         
-        Returns list of quotes sorted by output amount (best first)
+        Returns list of quotes sorted best first (see select_routes)
         """
-        quotes = []
-        
-        # Strategy 1: Best overall route
-        quote1 = await self.get_quote(
+        choices = await self.select_routes(
             input_mint, output_mint, amount, slippage_bps,
-            only_direct_routes=False
+            strategies=strategies, hedge_ms=hedge_ms,
         )
-        if quote1:
-            quotes.append(quote1)
         
-        # Strategy 2: Direct routes only (faster)
-        quote2 = await self.get_quote(
-            input_mint, output_mint, amount, slippage_bps,
-            only_direct_routes=True
-        )
-        if quote2:
-            quotes.append(quote2)
-        
-        # Sort by output amount (best first)
-        quotes.sort(key=lambda q: int(q.get('outAmount', 0)), reverse=True)
-        
-        logger.info(f"Compared {len(quotes)} routes, best gives {quotes[0].get('outAmount') if quotes else 0} output")
+        logger.info(f"Compared {len(choices)} routes, best gives {choices[0].out_amount if choices else 0} output")
         
-        return quotes
+        return [choice.quote for choice in choices]
+
+    async def select_routes(
+        self,
+        input_mint: str,
+        output_mint: str,
+        amount: int,
+        slippage_bps: int = 50,
+        strategies: Optional[Sequence[RouteStrategy]] = None,
+        hedge_ms: Optional[float] = None,
+    ) -> List[RouteChoice]:
+        """
+        Quote every strategy concurrently and rank the results.
+
+        With a hedge budget (`hedge_ms`, default JUPITER_ROUTE_HEDGE_MS; 0 waits for
+        all), strategies still outstanding once the budget is spent and at least one
+        quote has arrived are dropped. Ranking is outAmount discounted by
+        JUPITER_ROUTE_LATENCY_PENALTY_BPS per 100ms of quote latency, since a slow
+        quote is a staler price and a slower route to the same answer.
+        """
+        strategies = list(strategies or self.route_strategies)
+        hedge_ms = self.route_hedge_ms if hedge_ms is None else hedge_ms
+        started = time.perf_counter()
+
+        async def quote_with(strategy: RouteStrategy):
+            quote = await self.get_quote(
+                input_mint, output_mint, amount, slippage_bps,
+                only_direct_routes=strategy.only_direct_routes,
+                max_accounts=strategy.max_accounts,
+                exclude_dexes=strategy.exclude_dexes,
+            )
+            return strategy, quote, (time.perf_counter() - started) * 1000
+
+        pending = {asyncio.ensure_future(quote_with(strategy)) for strategy in strategies}
+        budget = hedge_ms / 1000 if hedge_ms and hedge_ms > 0 else None
+        arrived = []
+
+        def collect(done):
+            arrived.extend(task.result() for task in done if task.result()[1])
+
+        try:
+            if budget is not None:
+                done, pending = await asyncio.wait(pending, timeout=budget)
+                collect(done)
+            # No budget: wait for everything. Budget spent with nothing usable: take the next quote.
+            while pending and (budget is None or not arrived):
+                done, pending = await asyncio.wait(
+                    pending,
+                    return_when=asyncio.ALL_COMPLETED if budget is None else asyncio.FIRST_COMPLETED,
+                )
+                collect(done)
+        finally:
+            for task in pending:
+                task.cancel()
+        if pending:
+            logger.debug(f"Route hedge: proceeding without {len(pending)} slow strategies after {hedge_ms:.0f}ms")
+
+        choices = [
+            RouteChoice(strategy, quote, latency_ms, self._route_score(quote, latency_ms))
+            for strategy, quote, latency_ms in arrived
+        ]
+        choices.sort(key=lambda choice: choice.score, reverse=True)
+        return choices
+
+    def _route_score(self, quote: Dict, latency_ms: float) -> float:
+        penalty = self.route_latency_penalty_bps / 10_000 * latency_ms / 100
+        return int(quote.get('outAmount', 0)) * max(0.0, 1.0 - penalty)
     
     async def estimate_price_impact(
         self,
@@ -457,7 +827,7 @@ class JupiterClient:
         🚀 ELITE FEATURE: Estimate price impact for a trade
         Returns percentage (e.g., 0.05 = 5%)
         """
-        quote = await self.get_quote(input_mint, output_mint, amount)
+        quote = await self.get_quote(input_mint, output_mint, amount, allow_bucketed=True)
         if quote:
             return float(quote.get('priceImpactPct', 0))
         return None
@@ -472,6 +842,7 @@ class JupiterClient:
         tip_amount_lamports: int = 100000,  # 0.0001 SOL tip
         priority_fee_lamports: int = 1000000,
         confirm_token: Optional[str] = None,
+        latency_trace: Optional[Dict] = None,
     ) -> Optional[Dict]:
         """
         🚀 ELITE FEATURE: Execute swap with Jito MEV protection
@@ -486,8 +857,13 @@ class JupiterClient:
             Result dict with bundle_id and status
         """
         try:
+            user_pubkey = str(keypair.pubkey())
+            prebuilt = self._take_prebuilt(
+                user_pubkey, input_mint, output_mint, amount, slippage_bps, priority_fee_lamports
+            )
+
             # Get best quote
-            quote = await self.get_quote(
+            quote = prebuilt.quote if prebuilt else await self.get_quote(
                 input_mint,
                 output_mint,
                 amount,
@@ -496,33 +872,56 @@ class JupiterClient:
             
             if not quote:
                 return {"success": False, "error": "Failed to get quote"}
+            mark(latency_trace, 'quote_received')
             
             # Get swap transaction with higher priority fee
-            user_pubkey = str(keypair.pubkey())
-            swap_tx_base64 = await self.get_swap_transaction(
+            swap_tx_base64 = prebuilt.swap_transaction if prebuilt else await self.get_swap_transaction(
                 quote,
                 user_pubkey,
-                wrap_unwrap_sol=True
+                wrap_unwrap_sol=True,
+                prioritization_fee_lamports=priority_fee_lamports,
             )
             
             if not swap_tx_base64:
                 return {"success": False, "error": "Failed to get swap transaction"}
+            built_fee = prebuilt.intent.priority_fee_lamports if prebuilt else priority_fee_lamports
+            
+            # Sign once: the same bytes go into the bundle and, if it does not
+            # land in time, out through regular RPC
+            tx_bytes = self._sign_swap_transaction(swap_tx_base64, keypair)
+            signature = str(VersionedTransaction.from_bytes(tx_bytes).signatures[0])
             
             # Create Jito bundle
             logger.info("⚡ Creating Jito bundle for MEV protection...")
             bundle_result = await self._submit_jito_bundle(
-                swap_tx_base64,
+                base64.b64encode(tx_bytes).decode(),
                 keypair,
                 tip_amount_lamports
             )
             
             if bundle_result:
+                mark(latency_trace, 'broadcast')
+                bundle_id = bundle_result.get("bundle_id")
+
+                async def send_through_rpc() -> str:
+                    return await broadcast.send(
+                        self.rpc_client,
+                        tx_bytes,
+                        context={"component": "jito_fallback", "bundle_id": bundle_id},
+                        confirm_token=confirm_token,
+                    )
+
+                # Outcome (landed / failed / expired) is resolved in the background
+                self.bundle_tracker.track(bundle_id, signature, fallback=send_through_rpc)
                 return {
                     "success": True,
-                    "bundle_id": bundle_result.get("bundle_id"),
+                    "bundle_id": bundle_id,
+                    "signature": signature,
                     "status": "SUBMITTED",
                     "quote": quote,
-                    "protection": "JITO_BUNDLE"
+                    "protection": "JITO_BUNDLE",
+                    "prebuilt": prebuilt is not None,
+                    "priority_fee_lamports": built_fee,
                 }
             else:
                 # Fallback to regular execution
@@ -534,6 +933,8 @@ class JupiterClient:
                     keypair,
                     slippage_bps,
                     confirm_token=confirm_token,
+                    latency_trace=latency_trace,
+                    priority_fee_lamports=priority_fee_lamports,
                 )
                 
         except Exception as e:
@@ -546,27 +947,23 @@ class JupiterClient:
         keypair: Keypair,
         tip_amount: int
     ) -> Optional[Dict]:
-        """Submit transaction bundle to Jito"""
+        """Submit the swap plus a tip transfer to Jito as one bundle"""
         try:
-            # Jito block engine endpoint
-            jito_url = "https://mainnet.block-engine.jito.wtf/api/v1/bundles"
-            
-            # Deserialize and sign transaction
-            tx_bytes = base64.b64decode(swap_tx_base64)
-            
+            tip_tx = self._build_tip_transaction(swap_tx_base64, keypair, tip_amount)
+
             # Create bundle payload
             payload = {
                 "jsonrpc": "2.0",
                 "id": 1,
                 "method": "sendBundle",
-                "params": [[swap_tx_base64]]  # Bundle with single transaction
+                "params": [[swap_tx_base64, tip_tx]]
             }
             
             if not self.session:
-                self.session = aiohttp.ClientSession()
+                self.session = get_http_session()
             
             async with self.session.post(
-                jito_url,
+                self.jito_bundles_url,
                 json=payload,
                 headers={"Content-Type": "application/json"}
             ) as response:
@@ -584,6 +981,40 @@ class JupiterClient:
             logger.error(f"Error submitting Jito bundle: {e}")
             return None
 
+    @staticmethod
+    def _build_tip_transaction(swap_tx_base64: str, keypair: Keypair, tip_lamports: int) -> str:
+        """Tip transfer to a random Jito tip account, sharing the swap's blockhash"""
+        swap_tx = VersionedTransaction.from_bytes(base64.b64decode(swap_tx_base64))
+        tip_ix = transfer(TransferParams(
+            from_pubkey=keypair.pubkey(),
+            to_pubkey=Pubkey.from_string(random.choice(AntiMEVProtection.JITO_TIP_ACCOUNTS)),
+            lamports=int(tip_lamports),
+        ))
+        message = MessageV0.try_compile(keypair.pubkey(), [tip_ix], [], swap_tx.message.recent_blockhash)
+        return base64.b64encode(bytes(VersionedTransaction(message, [keypair]))).decode()
+
+    async def fetch_bundle_statuses(self, bundle_ids: List[str]) -> Dict[str, Dict]:
+        """In-flight status for up to 5 bundles in one getInflightBundleStatuses call"""
+        if not self.session:
+            self.session = get_http_session()
+
+        payload = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "getInflightBundleStatuses",
+            "params": [list(bundle_ids)]
+        }
+        async with self.session.post(self.jito_bundles_url, json=payload) as response:
+            if response.status != 200:
+                raise RuntimeError(f"Jito status request returned {response.status}")
+            data = await response.json()
+
+        statuses = {}
+        for entry in (data.get("result") or {}).get("value") or []:
+            if entry and entry.get("bundle_id"):
+                statuses[entry["bundle_id"]] = entry
+        return statuses
+
 
 class AntiMEVProtection:
     """
@@ -653,7 +1084,7 @@ class AntiMEVProtection:
         """
         try:
             if not self.session:
-                self.session = aiohttp.ClientSession()
+                self.session = get_http_session()
             
             # Add tip transaction
             # Tip goes to random Jito tip account
@@ -696,7 +1127,7 @@ class AntiMEVProtection:
         """Check bundle status"""
         try:
             if not self.session:
-                self.session = aiohttp.ClientSession()
+                self.session = get_http_session()
             
             payload = {
                 "jsonrpc": "2.0",
@@ -718,3 +1149,35 @@ class AntiMEVProtection:
         except Exception as e:
             logger.error(f"Error getting bundle status: {e}")
             return None
+
+    async def get_bundle_statuses(self, bundle_ids: List[str]) -> Dict[str, Dict]:
+        """Landed status for many bundles: 5 ids per getBundleStatuses call, calls in parallel"""
+        if not self.session:
+            self.session = get_http_session()
+
+        async def fetch(chunk: List[str]) -> List[Dict]:
+            payload = {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "getBundleStatuses",
+                "params": [chunk]
+            }
+            async with self.session.post(
+                f"{self.JITO_BLOCK_ENGINE}/api/v1/bundles",
+                json=payload
+            ) as response:
+                if response.status != 200:
+                    return []
+                data = await response.json()
+                return (data.get("result") or {}).get("value") or []
+
+        chunks = [bundle_ids[i:i + MAX_BUNDLES_PER_CALL] for i in range(0, len(bundle_ids), MAX_BUNDLES_PER_CALL)]
+        statuses = {}
+        for result in await asyncio.gather(*(fetch(chunk) for chunk in chunks), return_exceptions=True):
+            if isinstance(result, Exception):
+                logger.error(f"Error getting bundle statuses: {result}")
+                continue
+            for entry in result:
+                if entry and entry.get("bundle_id"):
+                    statuses[entry["bundle_id"]] = entry
+        return statuses
@@ -0,0 +1,146 @@
+"""
+⏱️ STAGE LATENCY TRACE
+Where the time goes between a tracked wallet's buy and our own order
+
+FEATURES:
+- Per-trade trace dict of stage -> epoch seconds, travels with the
+  opportunity into Trade.metadata_json
+- Stage-to-stage durations (block time -> discovery -> parse -> score ->
+  execute_buy -> quote -> broadcast -> confirmation)
+- Rolling per-stage histograms with p50/p95/p99, exported via the monitor
+"""
+
+import logging
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+STAGES = (
+    'block_time',
+    'discovered',
+    'parsed',
+    'scored',
+    'execute_buy',
+    'quote_received',
+    'broadcast',
+    'confirmed',
+)
+
+TOTAL = 'total'
+
+# Histogram bucket upper bounds in seconds (last bucket is open-ended)
+BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def mark(trace: Optional[Dict[str, float]], stage: str, timestamp: Optional[float] = None) -> Optional[Dict[str, float]]:
+    """Record `stage` on a trace (no-op for None or an unknown stage)."""
+    if trace is None or stage not in STAGES:
+        return trace
+    trace[stage] = time.time() if timestamp is None else float(timestamp)
+    return trace
+
+
+def new_trace(**stages: Optional[float]) -> Dict[str, float]:
+    """Start a trace, e.g. new_trace(block_time=..., discovered=...). None values are skipped."""
+    trace: Dict[str, float] = {}
+    for stage, timestamp in stages.items():
+        if timestamp is not None:
+            mark(trace, stage, timestamp)
+    return trace
+
+
+def stage_durations(trace: Dict[str, float]) -> Dict[str, float]:
+    """Seconds spent reaching each stage from the previous recorded one, plus the end-to-end total."""
+    durations: Dict[str, float] = {}
+    previous = None
+    for stage in STAGES:
+        timestamp = trace.get(stage)
+        if timestamp is None:
+            continue
+        if previous is not None:
+            durations[stage] = max(timestamp - previous, 0.0)
+        previous = timestamp
+
+    recorded = [trace[stage] for stage in STAGES if stage in trace]
+    if len(recorded) > 1:
+        durations[TOTAL] = max(recorded[-1] - recorded[0], 0.0)
+    return durations
+
+
+class StageLatencyTracker:
+    """Rolling per-stage latency histograms."""
+
+    def __init__(self, window: int = 2000):
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = {
+            stage: deque(maxlen=window) for stage in STAGES[1:] + (TOTAL,)
+        }
+        self._buckets: Dict[str, list] = {
+            stage: [0] * (len(BUCKETS) + 1) for stage in self._samples
+        }
+        self.traces = 0
+
+    def observe(self, trace: Optional[Dict[str, float]], monitor=None, tags: Optional[Dict] = None) -> Dict[str, float]:
+        """Add one finished trace; exports each stage duration through the monitor."""
+        if not trace:
+            return {}
+
+        durations = stage_durations(trace)
+        if not durations:
+            return durations
+
+        self.traces += 1
+        record_metric = getattr(monitor, 'record_metric', None)
+        for stage, seconds in durations.items():
+            self._samples[stage].append(seconds)
+            self._buckets[stage][self._bucket(seconds)] += 1
+            if record_metric:
+                record_metric(f'latency.{stage}_seconds', seconds, tags=tags or {})
+        return durations
+
+    @staticmethod
+    def _bucket(seconds: float) -> int:
+        for index, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                return index
+        return len(BUCKETS)
+
+    @staticmethod
+    def _percentile(ordered, fraction: float) -> Optional[float]:
+        if not ordered:
+            return None
+        index = min(int(round(fraction * (len(ordered) - 1))), len(ordered) - 1)
+        return ordered[index]
+
+    def breakdown(self) -> Dict[str, Dict]:
+        """p50/p95/p99 per stage over the rolling window, plus lifetime bucket counts."""
+        result = {}
+        for stage, samples in self._samples.items():
+            ordered = sorted(samples)
+            result[stage] = {
+                'count': len(ordered),
+                'p50': self._percentile(ordered, 0.50),
+                'p95': self._percentile(ordered, 0.95),
+                'p99': self._percentile(ordered, 0.99),
+                'buckets': {
+                    (f'le_{bound}' if index < len(BUCKETS) else 'inf'): count
+                    for index, (bound, count) in enumerate(zip(BUCKETS + (None,), self._buckets[stage]))
+                },
+            }
+        return result
+
+    def reset(self):
+        for stage in self._samples:
+            self._samples[stage].clear()
+            self._buckets[stage] = [0] * (len(BUCKETS) + 1)
+        self.traces = 0
+
+
+_tracker = StageLatencyTracker()
+
+
+def get_latency_tracker() -> StageLatencyTracker:
+    """Process-wide tracker shared by the signal path, trade execution and the web API."""
+    return _tracker
@@ -0,0 +1,349 @@
+"""
+📊 POSITION MONITOR
+Event-driven stop loss / take profit / trailing stop engine
+
+FEATURES:
+- One batched price request per tick for every open position (all users)
+- Trigger levels kept in sorted books per token (bisect)
+- A price tick only touches positions whose trigger level was crossed
+- Runs on its own cadence, independent of the wallet scan loop
+"""
+
+import asyncio
+import itertools
+import logging
+import time
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+PriceFetcher = Callable[[List[str]], Awaitable[Dict[str, float]]]
+TriggerCallback = Callable[['MonitoredPosition', str, float], Awaitable[None]]
+
+_INF = float('inf')
+
+
+@dataclass
+class MonitoredPosition:
+    """A position registered for automatic exits"""
+    key: Hashable
+    token_mint: str
+    entry_price: float
+    on_trigger: TriggerCallback
+    stop_loss_pct: Optional[float] = None
+    take_profit_pct: Optional[float] = None
+    trailing_stop_pct: Optional[float] = None
+    highest_price: Optional[float] = None
+    data: Dict[str, Any] = field(default_factory=dict)
+
+    # Levels currently indexed in the token book (None = not indexed)
+    _seq: int = 0
+    _stop: Optional[float] = None
+    _take: Optional[float] = None
+    _arm: Optional[float] = None
+    _high: Optional[float] = None
+    _trail: Optional[float] = None
+
+    def pnl_pct(self, price: float) -> float:
+        return (price - self.entry_price) / self.entry_price if self.entry_price > 0 else 0
+
+    def evaluate(self, price: float) -> Optional[str]:
+        """
+        Same rules, same order as the original per-position loop:
+        stop loss, take profit, then trailing stop once the position is in profit.
+        """
+        pnl_pct = self.pnl_pct(price)
+
+        if self.stop_loss_pct is not None and pnl_pct <= -self.stop_loss_pct:
+            return 'STOP_LOSS'
+
+        if self.take_profit_pct is not None and pnl_pct >= self.take_profit_pct:
+            return 'TAKE_PROFIT'
+
+        if pnl_pct > 0 and self.trailing_stop_pct is not None:
+            if self.highest_price is None:
+                self.highest_price = price
+            else:
+                self.highest_price = max(self.highest_price, price)
+                price_drop = (self.highest_price - price) / self.highest_price
+                if price_drop >= self.trailing_stop_pct:
+                    return 'TRAILING_STOP'
+
+        return None
+
+
+Level = Tuple[float, int, Hashable]
+
+
+class _TokenBook:
+    """Sorted trigger levels for every position in one token."""
+
+    def __init__(self):
+        self.positions: Dict[Hashable, MonitoredPosition] = {}
+        self.stops: List[Level] = []    # fire when price <= level
+        self.takes: List[Level] = []    # fire when price >= level
+        self.arms: List[Level] = []     # not yet in profit: entry price, wakes when price > level
+        self.highs: List[Level] = []    # in profit: highest price, wakes on a new high
+        self.trails: List[Level] = []   # trailing stop price, fire when price <= level
+
+    @staticmethod
+    def _remove(levels: List[Level], level: Optional[float], position: MonitoredPosition):
+        if level is None:
+            return
+        entry = (level, position._seq, position.key)
+        index = bisect_left(levels, entry)
+        if index < len(levels) and levels[index] == entry:
+            del levels[index]
+
+    def index(self, position: MonitoredPosition):
+        """(Re)insert a position's levels after registration or evaluation."""
+        self.unindex(position)
+        self.positions[position.key] = position
+        seq, key, entry = position._seq, position.key, position.entry_price
+
+        if entry <= 0:
+            return
+
+        if position.stop_loss_pct is not None:
+            position._stop = entry * (1 - position.stop_loss_pct)
+            insort(self.stops, (position._stop, seq, key))
+
+        if position.take_profit_pct is not None:
+            position._take = entry * (1 + position.take_profit_pct)
+            insort(self.takes, (position._take, seq, key))
+
+        if position.trailing_stop_pct is None:
+            return
+
+        if position.highest_price is None:
+            position._arm = entry
+            insort(self.arms, (entry, seq, key))
+            return
+
+        position._high = position.highest_price
+        insort(self.highs, (position._high, seq, key))
+
+        trail = position.highest_price * (1 - position.trailing_stop_pct)
+        # Trailing only fires while in profit, so a level at/below entry can never fire
+        if trail > entry:
+            position._trail = trail
+            insort(self.trails, (trail, seq, key))
+
+    def unindex(self, position: MonitoredPosition):
+        self._remove(self.stops, position._stop, position)
+        self._remove(self.takes, position._take, position)
+        self._remove(self.arms, position._arm, position)
+        self._remove(self.highs, position._high, position)
+        self._remove(self.trails, position._trail, position)
+        position._stop = position._take = position._arm = position._high = position._trail = None
+
+    def crossed(self, price: float) -> Set[Hashable]:
+        """Keys of positions with a level crossed by `price`."""
+        keys: Set[Hashable] = set()
+        keys.update(key for _, _, key in self.stops[bisect_left(self.stops, (price, -1)):])
+        keys.update(key for _, _, key in self.takes[:bisect_right(self.takes, (price, _INF))])
+        keys.update(key for _, _, key in self.arms[:bisect_left(self.arms, (price, -1))])
+        keys.update(key for _, _, key in self.highs[:bisect_left(self.highs, (price, -1))])
+        keys.update(key for _, _, key in self.trails[bisect_left(self.trails, (price, -1)):])
+        return keys
+
+
+class PositionMonitor:
+    """
+    Watches open positions for every engine/user and fires exit callbacks.
+
+    Positions are keyed by an owner-chosen hashable (e.g. (user_id, mint)).
+    """
+
+    def __init__(
+        self,
+        price_fetcher: PriceFetcher,
+        *,
+        interval: float = 5.0,
+        price_batch_size: int = 100,
+        monitor=None,
+    ):
+        self.price_fetcher = price_fetcher
+        self.interval = interval
+        self.price_batch_size = max(1, price_batch_size)
+        self.monitor = monitor
+
+        self._books: Dict[str, _TokenBook] = {}
+        self._keys: Dict[Hashable, str] = {}
+        self._sequence = itertools.count()
+        self._firing: Set[asyncio.Task] = set()
+        self._sync_hooks: List[Callable[[], None]] = []
+        self._task: Optional[asyncio.Task] = None
+        self.running = False
+
+        self.ticks = 0
+        self.positions_touched = 0
+        self.price_requests = 0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._keys
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            'positions': len(self._keys),
+            'tokens': len(self._books),
+            'ticks': self.ticks,
+            'positions_touched': self.positions_touched,
+            'price_requests': self.price_requests,
+            'interval_seconds': self.interval,
+        }
+
+    # ------------------------------------------------------------------
+    # Registration
+    # ------------------------------------------------------------------
+
+    def add(self, position: MonitoredPosition):
+        self.remove(position.key)
+        position._seq = next(self._sequence)
+        book = self._books.setdefault(position.token_mint, _TokenBook())
+        book.index(position)
+        self._keys[position.key] = position.token_mint
+
+    def remove(self, key: Hashable) -> Optional[MonitoredPosition]:
+        token_mint = self._keys.pop(key, None)
+        if token_mint is None:
+            return None
+
+        book = self._books[token_mint]
+        position = book.positions.pop(key)
+        book.unindex(position)
+        if not book.positions:
+            del self._books[token_mint]
+        return position
+
+    def get(self, key: Hashable) -> Optional[MonitoredPosition]:
+        token_mint = self._keys.get(key)
+        return self._books[token_mint].positions.get(key) if token_mint else None
+
+    def add_sync_hook(self, hook: Callable[[], None]):
+        """Run `hook` before every tick (owners reconcile their positions here)."""
+        if hook not in self._sync_hooks:
+            self._sync_hooks.append(hook)
+
+    def remove_sync_hook(self, hook: Callable[[], None]):
+        if hook in self._sync_hooks:
+            self._sync_hooks.remove(hook)
+
+    # ------------------------------------------------------------------
+    # Ticks
+    # ------------------------------------------------------------------
+
+    async def _fetch_prices(self, mints: List[str]) -> Dict[str, float]:
+        chunks = [mints[start: start + self.price_batch_size] for start in range(0, len(mints), self.price_batch_size)]
+        self.price_requests += len(chunks)
+        results = await asyncio.gather(*(self.price_fetcher(chunk) for chunk in chunks), return_exceptions=True)
+
+        prices: Dict[str, float] = {}
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error fetching position prices: {result}")
+                continue
+            prices.update(result or {})
+        return prices
+
+    async def tick(self, wait: bool = False) -> List[Tuple[MonitoredPosition, str, float]]:
+        """
+        Fetch prices for every monitored token once and fire crossed triggers.
+
+        Callbacks run as tasks so a slow exit does not delay the next tick;
+        `wait=True` awaits them before returning.
+        """
+        for hook in list(self._sync_hooks):
+            try:
+                hook()
+            except Exception as e:
+                logger.error(f"Error syncing monitored positions: {e}")
+
+        if not self._books:
+            return []
+
+        started = time.perf_counter()
+        prices = await self._fetch_prices(list(self._books))
+        fired = self.apply_prices(prices)
+
+        tasks = []
+        for position, reason, price in fired:
+            task = asyncio.create_task(self._fire(position, reason, price))
+            self._firing.add(task)
+            task.add_done_callback(self._firing.discard)
+            tasks.append(task)
+
+        if self.monitor:
+            self.monitor.record_metric(
+                'position_monitor.tick_seconds',
+                time.perf_counter() - started,
+                tags={'positions': len(self._keys), 'tokens': len(self._books), 'fired': len(fired)},
+            )
+
+        if wait and tasks:
+            await asyncio.gather(*tasks)
+        return fired
+
+    def apply_prices(self, prices: Dict[str, float]) -> List[Tuple[MonitoredPosition, str, float]]:
+        """Evaluate only positions whose levels the new prices crossed. Returns fired triggers."""
+        self.ticks += 1
+        fired: List[Tuple[MonitoredPosition, str, float]] = []
+
+        for token_mint, price in prices.items():
+            book = self._books.get(token_mint)
+            # A missing/zero quote is not a -100% move
+            if book is None or not price or price <= 0:
+                continue
+
+            for key in book.crossed(price):
+                position = book.positions[key]
+                self.positions_touched += 1
+
+                reason = position.evaluate(price)
+                if reason:
+                    self.remove(key)
+                    fired.append((position, reason, price))
+                else:
+                    book.index(position)
+
+        return fired
+
+    async def _fire(self, position: MonitoredPosition, reason: str, price: float):
+        try:
+            await position.on_trigger(position, reason, price)
+        except Exception as e:
+            logger.error(f"Error handling {reason} for {position.token_mint[:8]}...: {e}")
+
+    # ------------------------------------------------------------------
+    # Background loop
+    # ------------------------------------------------------------------
+
+    async def start(self):
+        if self.running:
+            return
+        self.running = True
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"📊 Position monitor started ({self.interval:.0f}s cadence)")
+
+    async def stop(self):
+        self.running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._task = None
+
+    async def _run(self):
+        while self.running:
+            try:
+                await self.tick()
+            except Exception as e:
+                logger.error(f"Error in position monitor: {e}")
+            await asyncio.sleep(self.interval)
@@ -531,36 +531,50 @@ class OracleResolver:
         self.jupiter = jupiter_client
         logger.info("🔮 Oracle Resolver initialized")
     
-    async def get_current_price(self, token_address: str) -> Decimal:
-        """Get current token price from oracle"""
-        
-        # TODO: Get actual price from Jupiter quote
-        # For now, return placeholder
-        return Decimal('0.00045')
+    async def get_current_price(self, token_address: str) -> Optional[Decimal]:
+        """Get current token price from oracle (None when no source has one)"""
+        prices = await self.get_current_prices([token_address])
+        return prices.get(token_address)
+
+    async def get_current_prices(self, token_addresses: List[str]) -> Dict[str, Decimal]:
+        """Current prices for many tokens in one request (through the shared price service)"""
+        try:
+            prices = await self.jupiter.get_token_price(list(token_addresses))
+        except Exception as e:
+            logger.error(f"Error getting oracle prices: {e}")
+            return {}
+        return {mint: Decimal(str(price)) for mint, price in prices.items() if price and price > 0}
     
     async def resolve_markets_batch(self, markets: List[PredictionMarket]) -> List[Dict]:
         """Resolve multiple markets in batch"""
         
         results = []
-        
-        for market in markets:
-            if market.resolves_at <= datetime.utcnow() and market.status == MarketStatus.OPEN:
-                # Get current price
-                current_price = await self.get_current_price(market.token_address)
-                
-                # Determine outcome
-                if current_price >= market.target_price_up:
-                    outcome = PredictionSide.UP
-                elif current_price <= market.target_price_down:
-                    outcome = PredictionSide.DOWN
-                else:
-                    outcome = PredictionSide.NEUTRAL
-                
-                results.append({
-                    'market_id': market.market_id,
-                    'outcome': outcome.value,
-                    'price': float(current_price)
-                })
+        due = [
+            market for market in markets
+            if market.resolves_at <= datetime.utcnow() and market.status == MarketStatus.OPEN
+        ]
+        prices = await self.get_current_prices({market.token_address for market in due}) if due else {}
+        
+        for market in due:
+            current_price = prices.get(market.token_address)
+            if current_price is None:
+                # No price yet - leave the market open and retry on the next pass
+                logger.warning(f"⚠️ No oracle price for {market.token_address[:8]}..., market {market.market_id} not resolved")
+                continue
+            
+            # Determine outcome
+            if current_price >= market.target_price_up:
+                outcome = PredictionSide.UP
+            elif current_price <= market.target_price_down:
+                outcome = PredictionSide.DOWN
+            else:
+                outcome = PredictionSide.NEUTRAL
+            
+            results.append({
+                'market_id': market.market_id,
+                'outcome': outcome.value,
+                'price': float(current_price)
+            })
         
         return results
 
@@ -0,0 +1,340 @@
+"""
+💹 PRICE SERVICE
+One shared source of token prices for every subsystem
+
+FEATURES:
+- Pyth Hermes streaming (SSE) for major feeds, pushed as they publish
+- Batched Jupiter polling for the long tail of watched mints
+- In-memory tick store: last price plus a short history ring buffer per mint
+- Concurrent requests for the same mint share one fetch
+- Subscribers notified on every new tick
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+import aiohttp
+
+from src.modules.http_pool import get_http_session
+
+logger = logging.getLogger(__name__)
+
+PriceFetcher = Callable[[List[str]], Awaitable[Dict[str, float]]]
+
+
+@dataclass(frozen=True)
+class PriceTick:
+    mint: str
+    price: float
+    source: str        # 'pyth' or 'jupiter'
+    timestamp: float   # epoch seconds when received
+
+
+TickCallback = Callable[[PriceTick], None]
+
+
+def parse_feed_map(raw: str) -> Dict[str, str]:
+    """Parse "mint:feed_id,mint:feed_id" into {mint: feed_id}."""
+    feeds = {}
+    for item in raw.split(','):
+        if ':' in item:
+            mint, feed_id = item.split(':', 1)
+            if mint.strip() and feed_id.strip():
+                feeds[mint.strip()] = feed_id.strip()
+    return feeds
+
+
+def _normalize_feed_id(feed_id: str) -> str:
+    return feed_id.lower().removeprefix('0x')
+
+
+class PriceService:
+    """
+    Tick store fed by Pyth streaming and Jupiter polling.
+
+    Readers call `get_prices` (fresh store hits are free; misses and stale
+    entries trigger one batched fetch) or `get_price` (store only, never
+    does I/O). Any mint that is read is watched and kept fresh by the poll
+    loop until nobody has asked for it for `idle_seconds`.
+    """
+
+    def __init__(
+        self,
+        fetch_prices: PriceFetcher,
+        *,
+        pyth_feeds: Optional[Dict[str, str]] = None,
+        hermes_url: str = 'https://hermes.pyth.network',
+        poll_interval: float = 2.0,
+        max_age: float = 5.0,
+        idle_seconds: float = 300.0,
+        batch_size: int = 100,
+        history_size: int = 120,
+        monitor=None,
+    ):
+        self.fetch_prices = fetch_prices
+        self.pyth_feeds = dict(pyth_feeds or {})
+        self.hermes_url = hermes_url.rstrip('/')
+        self.poll_interval = poll_interval
+        self.max_age = max_age
+        self.idle_seconds = idle_seconds
+        self.batch_size = max(1, batch_size)
+        self.history_size = history_size
+        self.monitor = monitor
+
+        self._feed_to_mint = {_normalize_feed_id(feed): mint for mint, feed in self.pyth_feeds.items()}
+        self._last: Dict[str, PriceTick] = {}
+        self._history: Dict[str, Deque[Tuple[float, float]]] = {}
+        self._watched: Dict[str, float] = {}  # mint -> last time someone asked for it
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._subscribers: List[TickCallback] = []
+
+        self._poll_task: Optional[asyncio.Task] = None
+        self._stream_task: Optional[asyncio.Task] = None
+        self.running = False
+
+        self.fetches = 0
+        self.fetched_mints = 0
+        self.store_hits = 0
+        self.stream_ticks = 0
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get_price(self, mint: str, max_age: Optional[float] = None) -> Optional[float]:
+        """Last known price if fresh enough (no I/O). Also marks the mint as watched."""
+        self._watched[mint] = time.time()
+        tick = self._last.get(mint)
+        if tick is None or not self._fresh(tick, max_age):
+            return None
+        return tick.price
+
+    def get_tick(self, mint: str) -> Optional[PriceTick]:
+        return self._last.get(mint)
+
+    def history(self, mint: str, seconds: Optional[float] = None) -> List[Tuple[float, float]]:
+        """(timestamp, price) samples, oldest first."""
+        samples = list(self._history.get(mint, ()))
+        if seconds is not None:
+            cutoff = time.time() - seconds
+            samples = [sample for sample in samples if sample[0] >= cutoff]
+        return samples
+
+    async def get_prices(self, mints: Iterable[str], max_age: Optional[float] = None) -> Dict[str, float]:
+        """
+        Prices for `mints`: fresh ticks come from the store, the rest from one
+        batched fetch (shared with any in-flight fetch for the same mints).
+        Mints without a price are omitted.
+        """
+        now = time.time()
+        mints = list(dict.fromkeys(mints))
+        prices: Dict[str, float] = {}
+        missing: List[str] = []
+        for mint in mints:
+            self._watched[mint] = now
+            tick = self._last.get(mint)
+            if tick is not None and self._fresh(tick, max_age, now):
+                prices[mint] = tick.price
+                self.store_hits += 1
+            else:
+                missing.append(mint)
+
+        if missing:
+            await self._fetch(missing)
+            for mint in missing:
+                tick = self._last.get(mint)
+                if tick is not None and tick.price > 0:
+                    prices[mint] = tick.price
+        return prices
+
+    def _fresh(self, tick: PriceTick, max_age: Optional[float] = None, now: Optional[float] = None) -> bool:
+        max_age = self.max_age if max_age is None else max_age
+        return (now or time.time()) - tick.timestamp <= max_age
+
+    # ------------------------------------------------------------------
+    # Subscriptions
+    # ------------------------------------------------------------------
+
+    def subscribe(self, callback: TickCallback):
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: TickCallback):
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def watch(self, mints: Iterable[str]):
+        now = time.time()
+        for mint in mints:
+            self._watched[mint] = now
+
+    # ------------------------------------------------------------------
+    # Ingest
+    # ------------------------------------------------------------------
+
+    def record(self, mint: str, price: float, source: str, timestamp: Optional[float] = None) -> Optional[PriceTick]:
+        if not price or price <= 0:
+            return None
+        tick = PriceTick(mint, float(price), source, timestamp or time.time())
+        self._last[mint] = tick
+        history = self._history.get(mint)
+        if history is None:
+            history = self._history[mint] = deque(maxlen=self.history_size)
+        history.append((tick.timestamp, tick.price))
+
+        for callback in list(self._subscribers):
+            try:
+                callback(tick)
+            except Exception as e:
+                logger.error(f"Error in price subscriber: {e}")
+        return tick
+
+    async def _fetch(self, mints: List[str]):
+        """Fetch `mints` from Jupiter in batches, joining fetches already in flight."""
+        waiting = [self._inflight[mint] for mint in mints if mint in self._inflight]
+        to_fetch = [mint for mint in mints if mint not in self._inflight]
+
+        if to_fetch:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            for mint in to_fetch:
+                self._inflight[mint] = future
+            try:
+                chunks = [to_fetch[i:i + self.batch_size] for i in range(0, len(to_fetch), self.batch_size)]
+                results = await asyncio.gather(*(self._fetch_chunk(chunk) for chunk in chunks), return_exceptions=True)
+                for result in results:
+                    if isinstance(result, Exception):
+                        logger.debug(f"Price fetch failed: {result}")
+                        continue
+                    for mint, price in result.items():
+                        self.record(mint, price, 'jupiter')
+            finally:
+                for mint in to_fetch:
+                    self._inflight.pop(mint, None)
+                future.set_result(None)
+
+        if waiting:
+            await asyncio.gather(*(asyncio.shield(future) for future in set(waiting)))
+
+    async def _fetch_chunk(self, mints: List[str]) -> Dict[str, float]:
+        self.fetches += 1
+        self.fetched_mints += len(mints)
+        if self.monitor:
+            self.monitor.record_request()
+        return await self.fetch_prices(mints) or {}
+
+    # ------------------------------------------------------------------
+    # Background loops
+    # ------------------------------------------------------------------
+
+    async def start(self):
+        if self.running:
+            return
+        self.running = True
+        self._poll_task = asyncio.create_task(self._poll_loop())
+        if self.pyth_feeds:
+            self._stream_task = asyncio.create_task(self._stream_loop())
+        logger.info(
+            f"💹 Price service started ({len(self.pyth_feeds)} Pyth feeds streaming, "
+            f"{self.poll_interval:.0f}s Jupiter poll)"
+        )
+
+    async def stop(self):
+        self.running = False
+        for task in (self._poll_task, self._stream_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+        self._poll_task = self._stream_task = None
+
+    async def poll(self):
+        """Refresh every watched mint the stream does not keep fresh; forget idle mints."""
+        now = time.time()
+        for mint, last_asked in list(self._watched.items()):
+            if now - last_asked > self.idle_seconds:
+                del self._watched[mint]
+
+        due = [
+            mint for mint in self._watched
+            if mint not in self._last or now - self._last[mint].timestamp >= self.poll_interval
+        ]
+        if due:
+            await self._fetch(due)
+        if self.monitor:
+            self.monitor.record_metric('price_service.watched', len(self._watched))
+
+    async def _poll_loop(self):
+        while self.running:
+            try:
+                await self.poll()
+            except Exception as e:
+                logger.error(f"Error polling prices: {e}")
+            await asyncio.sleep(self.poll_interval)
+
+    async def _stream_loop(self):
+        """Hermes server-sent events; reconnects with backoff."""
+        backoff = 1.0
+        params = [('ids[]', feed) for feed in self.pyth_feeds.values()] + [('parsed', 'true')]
+        while self.running:
+            try:
+                async with get_http_session().get(
+                    f"{self.hermes_url}/v2/updates/price/stream",
+                    params=params,
+                    timeout=aiohttp.ClientTimeout(total=None, sock_read=60),
+                ) as response:
+                    if response.status != 200:
+                        raise RuntimeError(f"Hermes stream status {response.status}")
+                    backoff = 1.0
+                    async for line in response.content:
+                        self.handle_stream_line(line)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"⚠️ Pyth stream disconnected: {e} (retrying in {backoff:.0f}s)")
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 30.0)
+
+    def handle_stream_line(self, line) -> int:
+        """Ingest one SSE line from Hermes. Returns the number of ticks recorded."""
+        if isinstance(line, bytes):
+            line = line.decode(errors='ignore')
+        line = line.strip()
+        if not line.startswith('data:'):
+            return 0
+
+        try:
+            payload = json.loads(line[5:])
+        except ValueError:
+            return 0
+
+        recorded = 0
+        for update in payload.get('parsed') or []:
+            mint = self._feed_to_mint.get(_normalize_feed_id(update.get('id', '')))
+            price_data = update.get('price') or {}
+            if not mint or 'price' not in price_data:
+                continue
+            price = int(price_data['price']) * 10 ** int(price_data.get('expo', 0))
+            if self.record(mint, price, 'pyth'):
+                recorded += 1
+        self.stream_ticks += recorded
+        return recorded
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            'watched': len(self._watched),
+            'priced': len(self._last),
+            'pyth_feeds': len(self.pyth_feeds),
+            'fetches': self.fetches,
+            'fetched_mints': self.fetched_mints,
+            'store_hits': self.store_hits,
+            'stream_ticks': self.stream_ticks,
+            'subscribers': len(self._subscribers),
+        }
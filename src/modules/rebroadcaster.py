@@ -0,0 +1,194 @@
+"""
+🔁 REBROADCASTER
+Resend a signed transaction until it lands or its blockhash expires
+
+FEATURES:
+- The same signed bytes are re-sent at a fixed interval while confirmation
+  is pending (leaders drop transactions under congestion; resending the
+  identical transaction cannot double-execute it)
+- Stops as soon as the transaction is confirmed, fails on chain, or its
+  blockhash passes lastValidBlockHeight
+- Sends per trade and time-to-land recorded and summarised in stats()
+"""
+
+import asyncio
+import logging
+import time
+from collections import Counter, deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+from solana.rpc.commitment import Processed
+
+logger = logging.getLogger(__name__)
+
+# A blockhash stays valid for 150 blocks after the block it was taken from
+BLOCKHASH_VALID_BLOCKS = 150
+
+CONFIRMED = 'confirmed'
+FAILED = 'failed'        # landed with an error (resending cannot help)
+EXPIRED = 'expired'      # blockhash expired before the transaction was seen
+TIMEOUT = 'timeout'      # max_duration reached without an expiry verdict
+
+Resend = Callable[[], Awaitable[Any]]
+Confirm = Callable[[str, float], Awaitable[bool]]    # (signature, timeout) -> landed
+
+
+@dataclass(frozen=True)
+class RebroadcastOutcome:
+    signature: str
+    status: str
+    sends: int               # send rounds, the initial broadcast included
+    seconds: float           # first send -> confirmed (or -> gave up)
+
+    @property
+    def landed(self) -> bool:
+        return self.status == CONFIRMED
+
+    def as_metadata(self) -> Dict:
+        return {
+            'status': self.status,
+            'sends': self.sends,
+            'seconds': round(self.seconds, 3),
+        }
+
+
+def _confirmed(waiter: asyncio.Future) -> bool:
+    return waiter.exception() is None and bool(waiter.result())
+
+
+def _percentile(values, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(pct / 100 * len(ordered)))] if ordered else 0.0
+
+
+class Rebroadcaster:
+    """
+    Drive one transaction from first send to a final verdict.
+
+    `confirm(signature, timeout)` resolves True once the transaction is
+    confirmed, False if it failed (e.g. ConfirmationMultiplexer.wait).
+    Expiry is judged from the attached BlockhashCache's block height; only
+    while that is missing or stale does `rpc_client` (AsyncClient) get asked
+    with getBlockHeight. When the caller does not know the transaction's
+    lastValidBlockHeight it is taken as the block height seen right after the
+    first send plus 150, which can only overshoot by the age of the blockhash
+    at send time.
+    """
+
+    def __init__(
+        self,
+        confirm: Confirm,
+        rpc_client=None,
+        *,
+        interval: float = 2.0,
+        max_duration: float = 90.0,
+        grace: float = 2.0,
+        history: int = 1000,
+        blockhash_cache=None,
+        monitor=None,
+    ):
+        self.confirm = confirm
+        self.rpc_client = rpc_client
+        self.interval = interval
+        self.max_duration = max_duration
+        self.grace = grace            # how long a send made just before expiry may still confirm
+        self.blockhash_cache = blockhash_cache
+        self.monitor = monitor
+
+        self.outcomes: Counter = Counter()
+        self.total_sends = 0
+        self.resend_errors = 0
+        self._landed: Deque[Tuple[int, float]] = deque(maxlen=history)   # (sends, seconds)
+
+    async def run(
+        self,
+        signature: str,
+        resend: Resend,
+        *,
+        last_valid_block_height: Optional[int] = None,
+        started: Optional[float] = None,
+    ) -> RebroadcastOutcome:
+        """
+        Rebroadcast an already sent transaction until it has a verdict.
+
+        `resend` re-submits the same signed bytes; its errors are logged and the
+        loop carries on. `started` is the monotonic time of the first send.
+        """
+        started = started if started is not None else time.monotonic()
+        sends = 1
+        status = TIMEOUT
+        waiter = asyncio.ensure_future(self.confirm(signature, self.max_duration + self.grace))
+        try:
+            while True:
+                done, _ = await asyncio.wait({waiter}, timeout=self.interval)
+                if done:
+                    status = CONFIRMED if _confirmed(waiter) else FAILED
+                    break
+                if time.monotonic() - started >= self.max_duration:
+                    break
+                expired, last_valid_block_height = await self._expired(last_valid_block_height)
+                if expired:
+                    status = EXPIRED
+                    break
+                try:
+                    await resend()
+                except Exception as e:
+                    self.resend_errors += 1
+                    logger.debug(f"Rebroadcast of {signature[:16]}... failed: {e}")
+                sends += 1
+
+            if status in (EXPIRED, TIMEOUT):
+                # The last send may still be landing
+                done, _ = await asyncio.wait({waiter}, timeout=self.grace)
+                if done and _confirmed(waiter):
+                    status = CONFIRMED
+        finally:
+            if not waiter.done():
+                waiter.cancel()
+
+        outcome = RebroadcastOutcome(signature, status, sends, time.monotonic() - started)
+        self._record(outcome)
+        return outcome
+
+    async def _expired(self, last_valid_block_height: Optional[int]) -> Tuple[bool, Optional[int]]:
+        height = self.blockhash_cache.block_height if self.blockhash_cache else None
+        if height is None:
+            if self.rpc_client is None:
+                return False, last_valid_block_height
+            try:
+                height = (await self.rpc_client.get_block_height(Processed)).value
+            except Exception as e:
+                logger.debug(f"Block height check failed: {e}")
+                return False, last_valid_block_height
+        if last_valid_block_height is None:
+            last_valid_block_height = height + BLOCKHASH_VALID_BLOCKS
+        return height > last_valid_block_height, last_valid_block_height
+
+    def _record(self, outcome: RebroadcastOutcome):
+        self.outcomes[outcome.status] += 1
+        self.total_sends += outcome.sends
+        if outcome.landed:
+            self._landed.append((outcome.sends, outcome.seconds))
+        else:
+            logger.warning(
+                f"🔁 {outcome.signature[:16]}... {outcome.status} after {outcome.sends} sends "
+                f"({outcome.seconds:.1f}s)"
+            )
+        if self.monitor:
+            tags = {'status': outcome.status}
+            self.monitor.record_metric('rebroadcast.sends', outcome.sends, tags=tags)
+            self.monitor.record_metric('rebroadcast.seconds', outcome.seconds, tags=tags)
+
+    def stats(self) -> Dict:
+        sends = [entry[0] for entry in self._landed]
+        seconds = [entry[1] for entry in self._landed]
+        return {
+            'outcomes': dict(self.outcomes),
+            'total_sends': self.total_sends,
+            'resend_errors': self.resend_errors,
+            'landed_sends_p50': _percentile(sends, 50),
+            'landed_sends_max': max(sends, default=0),
+            'time_to_land_p50': _percentile(seconds, 50),
+            'time_to_land_p99': _percentile(seconds, 99),
+        }
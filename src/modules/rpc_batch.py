@@ -0,0 +1,141 @@
+"""
+📦 JSON-RPC BATCH TRANSPORT
+Pack many Solana RPC calls into a handful of HTTP requests
+
+FEATURES:
+- Configurable batch size (calls per HTTP request)
+- Responses demultiplexed by request id, whatever order the node returns them
+- Per-call errors isolated from the rest of the batch
+- Logical call vs physical HTTP request counters
+"""
+
+import asyncio
+import logging
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import aiohttp
+
+from src.modules.http_pool import get_http_session
+
+logger = logging.getLogger(__name__)
+
+
+class RpcBatchError(Exception):
+    """Raised (and returned in place of a result) when a batched call fails."""
+
+
+RpcCall = Tuple[str, Sequence[Any]]
+
+
+class JsonRpcBatchClient:
+    """Send JSON-RPC calls to one endpoint as batch requests."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        *,
+        batch_size: int = 100,
+        timeout: float = 15.0,
+        max_concurrent_requests: int = 4,
+        session: Optional[aiohttp.ClientSession] = None,
+        on_request: Optional[Callable[[], None]] = None,
+    ):
+        self.endpoint = endpoint
+        self.batch_size = max(1, batch_size)
+        self.timeout = timeout
+        # Defaults to the shared HTTP pool, which is never closed from here
+        self.session = session
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrent_requests))
+        # Invoked once per physical HTTP request (e.g. BotMonitor.record_request)
+        self.on_request = on_request
+
+        # Counters: logical calls requested vs physical HTTP requests sent
+        self.logical_calls = 0
+        self.http_requests = 0
+
+    async def close(self):
+        self.session = None
+
+    def get_counters(self) -> Dict[str, int]:
+        return {
+            'logical_calls': self.logical_calls,
+            'http_requests': self.http_requests,
+        }
+
+    async def call(self, method: str, params: Sequence[Any]) -> Any:
+        """Single call through the batch transport. Raises RpcBatchError on failure."""
+        result = (await self.call_many([(method, params)]))[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    async def call_many(self, calls: Sequence[RpcCall]) -> List[Any]:
+        """
+        Execute calls in batches and return results in the same order as `calls`.
+
+        Failed calls are returned as RpcBatchError instances rather than raised,
+        so one bad wallet does not sink the whole scan.
+        """
+        if not calls:
+            return []
+
+        chunks = [
+            list(enumerate(calls))[start: start + self.batch_size]
+            for start in range(0, len(calls), self.batch_size)
+        ]
+        results: List[Any] = [None] * len(calls)
+
+        chunk_results = await asyncio.gather(*(self._send_chunk(chunk) for chunk in chunks))
+        for chunk_result in chunk_results:
+            for index, value in chunk_result.items():
+                results[index] = value
+
+        return results
+
+    async def _send_chunk(self, chunk: List[Tuple[int, RpcCall]]) -> Dict[int, Any]:
+        payload = [
+            {'jsonrpc': '2.0', 'id': index, 'method': method, 'params': list(params)}
+            for index, (method, params) in chunk
+        ]
+        self.logical_calls += len(payload)
+
+        if not self.session:
+            self.session = get_http_session()
+
+        try:
+            async with self._semaphore:
+                self.http_requests += 1
+                if self.on_request:
+                    self.on_request()
+                async with self.session.post(
+                    self.endpoint,
+                    json=payload,
+                    timeout=aiohttp.ClientTimeout(total=self.timeout),
+                ) as response:
+                    if response.status != 200:
+                        error_text = await response.text()
+                        raise RpcBatchError(f"HTTP {response.status}: {error_text[:200]}")
+                    data = await response.json(content_type=None)
+        except RpcBatchError as e:
+            return {index: e for index, _ in chunk}
+        except Exception as e:
+            logger.debug(f"RPC batch request failed: {e}")
+            return {index: RpcBatchError(str(e)) for index, _ in chunk}
+
+        # Some providers answer a one-element batch with a bare object
+        if isinstance(data, dict):
+            data = [data]
+
+        by_id: Dict[int, Any] = {}
+        for item in data or []:
+            if not isinstance(item, dict) or 'id' not in item:
+                continue
+            if item.get('error'):
+                by_id[item['id']] = RpcBatchError(str(item['error']))
+            else:
+                by_id[item['id']] = item.get('result')
+
+        return {
+            index: by_id.get(index, RpcBatchError('missing response'))
+            for index, _ in chunk
+        }
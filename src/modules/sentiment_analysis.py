@@ -19,6 +19,9 @@ from datetime import datetime, timedelta
 from collections import Counter
 import logging
 
+from src.modules.http_pool import get_http_session
+from src.modules.ttl_cache import TTLCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -120,7 +123,7 @@ class TwitterMonitor:
         }
         
         # Cache for recent mentions
-        self.mention_cache: Dict[str, List[Dict]] = {}
+        self.mention_cache = TTLCache('sentiment.mentions', max_size=1000, ttl_seconds=3600)
     
     async def monitor_token(
         self,
@@ -307,7 +310,7 @@ class TwitterMonitor:
             }
             
             if not self.session:
-                self.session = aiohttp.ClientSession()
+                self.session = get_http_session()
             
             async with self.session.get(url, headers=headers, params=params) as response:
                 if response.status == 200:
@@ -682,7 +685,7 @@ class SocialMediaAggregator:
     async def _ensure_session(self):
         """Ensure HTTP session exists"""
         if not self.session:
-            self.session = aiohttp.ClientSession()
+            self.session = get_http_session()
     
     async def analyze_token_sentiment(
         self,
@@ -0,0 +1,997 @@
+"""
+📡 WALLET SIGNAL CORE
+Shared copy-trading signal generation for every automated trading user
+
+FEATURES:
+- Scans tracked wallets once, whatever the number of users
+- Websocket stream + adaptive poll scan of tracked wallet activity
+- Batched RPC / Helius transaction parsing with a shared decode cache
+- Opportunities fan out to subscribed per-user engines
+- Each engine applies its own settings, limits and daily PnL gates
+"""
+
+import asyncio
+import logging
+import os
+import statistics
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Deque, Dict, List, Optional, Set, Tuple
+
+from solana.rpc.commitment import Confirmed
+from solders.pubkey import Pubkey
+
+from src.modules.helius_client import HTTPX_AVAILABLE, HeliusEnhancedClient
+from src.modules.latency_trace import mark, new_trace
+from src.modules.rpc_batch import JsonRpcBatchClient
+from src.modules.swap_decoder import decode_swap, load_result
+from src.modules.ttl_cache import TTLCache
+from src.modules.wallet_scheduler import AdaptiveWalletScheduler
+from src.modules.wallet_stream import WalletActivityStream, resolve_ws_url
+
+logger = logging.getLogger(__name__)
+
+
+class WalletSignalCore:
+    """
+    Turns tracked wallet activity into trading opportunities, once for all users.
+
+    Subscribers implement `handle_opportunities(opportunities, once_per_window)`
+    and return the token mints they acted on. Windowed signals (stream, and the
+    adaptive poll scan) are offered to each subscriber until it acts on them.
+    """
+
+    def __init__(self, config, wallet_intelligence, monitor=None):
+        self.config = config
+        self.wallet_intelligence = wallet_intelligence
+        self.monitor = monitor
+
+        self.running = False
+        self._subscribers: List[object] = []
+        self._loop_task: Optional[asyncio.Task] = None
+
+        # Cache the last processed signature per wallet so we do not
+        # re-process historical activity every scan.
+        self._wallet_last_signature: Dict[str, str] = {}
+
+        # Cache decoded transactions to avoid hammering the RPC endpoint.
+        self._transaction_cache = TTLCache(
+            'automated_trader.transactions',
+            max_size=int(os.getenv('AUTO_TRADER_TX_CACHE_SIZE', '20000')),
+            ttl_seconds=600,
+            monitor=monitor,
+        )
+
+        # Push-based wallet activity (websocket). The 30s poll loop keeps
+        # running as a reconciliation pass for anything the stream misses.
+        self.streaming_enabled = os.getenv('AUTO_TRADER_STREAMING_ENABLED', 'true').lower() == 'true'
+        self.wallet_stream: Optional[WalletActivityStream] = None
+        self._streamed_signatures: Dict[str, datetime] = {}
+        self._stream_signals: Dict[str, Dict] = {}
+        self._stream_lock = asyncio.Lock()
+
+        # JSON-RPC batch transport for the wallet scan (0 disables batching)
+        self.rpc_batch_size = int(os.getenv('AUTO_TRADER_RPC_BATCH_SIZE', '100'))
+        self.rpc_batch: Optional[JsonRpcBatchClient] = None
+
+        # Pooled Helius enhanced-transactions client (created when HELIUS_API_KEY is set)
+        self.helius_client: Optional[HeliusEnhancedClient] = None
+
+        # Max transactions parsed in parallel per scan batch
+        self.parse_concurrency = max(1, int(os.getenv('AUTO_TRADER_PARSE_CONCURRENCY', '10')))
+        self._parse_semaphore = asyncio.Semaphore(self.parse_concurrency)
+
+        # Per-wallet poll cadence under a global RPC budget. Disabled = every
+        # tracked wallet is polled on every 30s pass.
+        self.scheduler: Optional[AdaptiveWalletScheduler] = None
+        if os.getenv('AUTO_TRADER_ADAPTIVE_SCHEDULING', 'true').lower() == 'true':
+            self.scheduler = AdaptiveWalletScheduler(
+                min_interval=float(os.getenv('AUTO_TRADER_MIN_POLL_SECONDS', '5')),
+                max_interval=float(os.getenv('AUTO_TRADER_MAX_POLL_SECONDS', '600')),
+                budget_per_minute=float(os.getenv('AUTO_TRADER_RPC_BUDGET_PER_MINUTE', '1200')),
+            )
+        # Partial scans only see some wallets, so poll signals aggregate over the 5 minute window
+        self._poll_signals: Dict[str, Dict] = {}
+
+        # Block time -> detection latency samples per discovery mode
+        self._detection_latencies: Dict[str, Deque[float]] = {
+            'stream': deque(maxlen=500),
+            'poll': deque(maxlen=500),
+        }
+
+        logger.info("📡 Wallet signal core initialized")
+
+    # ------------------------------------------------------------------
+    # Subscribers and lifecycle
+    # ------------------------------------------------------------------
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self, consumer):
+        if consumer not in self._subscribers:
+            self._subscribers.append(consumer)
+            logger.info(f"📡 Signal core subscriber added ({len(self._subscribers)} total)")
+
+    def unsubscribe(self, consumer):
+        if consumer in self._subscribers:
+            self._subscribers.remove(consumer)
+            logger.info(f"📡 Signal core subscriber removed ({len(self._subscribers)} left)")
+
+    def hot_tokens(self, consumer, limit: int = 10) -> List[str]:
+        """
+        Tokens tracked wallets are buying right now that `consumer` has not traded yet,
+        strongest signal first (candidates for prebuilt swaps).
+        """
+        taker = id(consumer)
+        signals: Dict[str, Dict] = {}
+        for token_signals in (self._poll_signals, self._stream_signals):
+            for token_mint, signal in token_signals.items():
+                if taker in signal.get('taken_by', ()):
+                    continue
+                if token_mint not in signals or signal['count'] > signals[token_mint]['count']:
+                    signals[token_mint] = signal
+
+        ranked = sorted(signals, key=lambda mint: (signals[mint]['count'], signals[mint]['first_seen']), reverse=True)
+        return ranked[:limit]
+
+    async def start(self):
+        """Start the stream and the scan loop (no-op when already running)."""
+        if self.running:
+            return
+        self.running = True
+        await self._start_wallet_stream()
+        self._loop_task = asyncio.create_task(self._signal_loop())
+        logger.info("📡 Wallet signal core STARTED")
+
+    async def stop(self):
+        self.running = False
+        if self._loop_task:
+            self._loop_task.cancel()
+            try:
+                await self._loop_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._loop_task = None
+        if self.wallet_stream:
+            await self.wallet_stream.stop()
+            self.wallet_stream = None
+        if self.rpc_batch:
+            await self.rpc_batch.close()
+            self.rpc_batch = None
+        if self.helius_client:
+            await self.helius_client.close()
+            self.helius_client = None
+        logger.info("📡 Wallet signal core STOPPED")
+
+    async def _signal_loop(self):
+        """Scan loop shared by every subscribed engine"""
+        logger.info("🔄 Signal scan loop started")
+
+        while self.running:
+            try:
+                if self.wallet_stream:
+                    await self.wallet_stream.update_addresses(
+                        self.wallet_intelligence.tracked_wallets.keys()
+                    )
+
+                opportunities = await self._scan_for_opportunities()
+                if opportunities:
+                    await self._publish(opportunities, self._poll_signals if self.scheduler else None)
+
+                # Wait before next scan (30 seconds, or until the next wallet is due)
+                await asyncio.sleep(self._next_scan_delay())
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in signal scan loop: {e}")
+                await asyncio.sleep(30)
+
+    async def _publish(self, opportunities: List[Dict], signals: Optional[Dict[str, Dict]] = None):
+        """
+        Fan opportunities out to every subscriber concurrently.
+
+        With `signals` (a windowed aggregate), each subscriber is offered a
+        signal until it acts on it, so every user trades it at most once. A
+        signal being handled is not offered to the same subscriber again by a
+        concurrent publish (e.g. a second streamed buy of the same token).
+        """
+        consumers = []
+        offers = []
+        for consumer in list(self._subscribers):
+            offer = [
+                opp for opp in opportunities
+                if signals is None or not self._offered(signals.get(opp['token_mint']), consumer)
+            ]
+            if offer:
+                consumers.append(consumer)
+                offers.append(offer)
+
+        if not consumers:
+            return
+
+        reserved = []
+        if signals is not None:
+            for consumer, offer in zip(consumers, offers):
+                for opp in offer:
+                    signal = signals.get(opp['token_mint'])
+                    if signal is not None:
+                        signal.setdefault('pending_by', set()).add(id(consumer))
+                        reserved.append((signal, id(consumer)))
+
+        try:
+            results = await asyncio.gather(
+                *(
+                    consumer.handle_opportunities([dict(opp) for opp in offer], once_per_window=signals is not None)
+                    for consumer, offer in zip(consumers, offers)
+                ),
+                return_exceptions=True,
+            )
+        finally:
+            for signal, taker in reserved:
+                signal['pending_by'].discard(taker)
+
+        for consumer, result in zip(consumers, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error delivering opportunities: {result}")
+                continue
+            if signals is None:
+                continue
+            for token_mint in result or []:
+                signal = signals.get(token_mint)
+                if signal is not None:
+                    signal['taken_by'].add(id(consumer))
+
+        if self.monitor:
+            self.monitor.record_metric(
+                'automated_trader.opportunities_delivered',
+                sum(len(offer) for offer in offers),
+                tags={'subscribers': len(consumers)},
+            )
+
+    @staticmethod
+    def _offered(signal: Optional[Dict], consumer) -> bool:
+        """Whether `consumer` already took this windowed signal or is handling it now."""
+        if signal is None:
+            return False
+        taker = id(consumer)
+        return taker in signal.get('taken_by', ()) or taker in signal.get('pending_by', ())
+
+    # ------------------------------------------------------------------
+    # Wallet activity
+    # ------------------------------------------------------------------
+
+    async def _start_wallet_stream(self):
+        """Subscribe to tracked wallet activity over the RPC websocket."""
+        if not self.streaming_enabled or self.wallet_stream is not None:
+            return
+
+        client = getattr(self.wallet_intelligence, 'client', None)
+        provider = getattr(client, '_provider', None)
+        ws_url = resolve_ws_url(getattr(provider, 'endpoint_uri', None))
+        if not ws_url:
+            logger.info("Wallet streaming disabled: no websocket endpoint configured")
+            return
+
+        self.wallet_stream = WalletActivityStream(ws_url, self._handle_streamed_signature)
+        await self.wallet_stream.start(self.wallet_intelligence.tracked_wallets.keys())
+
+    async def _handle_streamed_signature(self, address: str, signature: str, slot: Optional[int] = None):
+        """Run swap detection on a signature pushed by the wallet stream."""
+
+        if not self.running or signature in self._streamed_signatures:
+            return
+
+        metrics = self.wallet_intelligence.tracked_wallets.get(address)
+        if metrics is None:
+            return
+
+        self._streamed_signatures[signature] = datetime.now()
+        discovered_at = time.time()
+
+        token_mint, _ = await self._parse_swap_transaction(signature, owner=address)
+        if not token_mint:
+            if self._get_cached_transaction(signature, address) is None:
+                # Not visible to the node yet (or the lookup failed): let a later
+                # notification or the poll scan pick it up again
+                self._streamed_signatures.pop(signature, None)
+            return
+
+        block_time = self._cached_block_time(signature)
+        trace = new_trace(block_time=block_time, discovered=discovered_at, parsed=time.time())
+        self._record_detection_latency('stream', block_time)
+        if self.scheduler:
+            self.scheduler.mark_hot(address)
+
+        # The lock only covers the window state; subscribers trade after it is released
+        async with self._stream_lock:
+            self._prune_stream_state()
+            self._record_token_signal(self._stream_signals, token_mint, address, metrics, trace)
+            stream_signals = self._stream_signals
+
+            opportunities = self._build_opportunities({token_mint: stream_signals[token_mint]})
+            if not opportunities:
+                return
+
+            for opp in opportunities:
+                opp['source'] = 'wallet_stream'
+
+        await self._publish(opportunities, stream_signals)
+
+    def _next_scan_delay(self) -> float:
+        if not self.scheduler:
+            return 30
+
+        delay = self.scheduler.seconds_until_next_due()
+        delay = 30 if delay is None else delay
+
+        # Out of RPC budget: wait until the bucket refills one request
+        budget = self.scheduler.budget_remaining
+        if budget < 1:
+            delay = max(delay, (1 - budget) * 60 / self.scheduler.budget_per_minute)
+
+        return min(max(delay, 1), 30)
+
+    def _prune_stream_state(self):
+        """Drop streamed signatures and signals older than the 5 minute signal window."""
+        cutoff = datetime.now() - timedelta(seconds=300)
+        self._streamed_signatures = {
+            sig: seen_at for sig, seen_at in self._streamed_signatures.items() if seen_at >= cutoff
+        }
+        self._stream_signals = {
+            mint: signal for mint, signal in self._stream_signals.items() if signal['first_seen'] >= cutoff
+        }
+        self._poll_signals = {
+            mint: signal for mint, signal in self._poll_signals.items() if signal['first_seen'] >= cutoff
+        }
+
+    def _cached_block_time(self, signature: str) -> Optional[int]:
+        cached = self._transaction_cache.get(signature)
+        return cached.get('block_time') if cached else None
+
+    def _record_detection_latency(self, mode: str, block_time: Optional[int]):
+        """Record seconds between the wallet's on-chain block time and our detection."""
+        if not block_time:
+            return
+
+        latency = max(datetime.now().timestamp() - block_time, 0.0)
+        self._detection_latencies[mode].append(latency)
+
+        if self.monitor:
+            self.monitor.record_metric(
+                'automated_trader.detection_latency_seconds',
+                latency,
+                tags={'mode': mode},
+            )
+
+    def get_detection_latency_stats(self) -> Dict[str, Dict[str, float]]:
+        """Median detection latency per discovery mode (stream vs poll)."""
+        stats = {}
+        for mode, samples in self._detection_latencies.items():
+            stats[mode] = {
+                'samples': len(samples),
+                'median_seconds': statistics.median(samples) if samples else None,
+            }
+        return stats
+
+    # ------------------------------------------------------------------
+    # Poll scan
+    # ------------------------------------------------------------------
+
+    async def _scan_for_opportunities(self) -> List[Dict]:
+        """
+        🔍 SCAN FOR TRADING OPPORTUNITIES
+        
+        Uses:
+        - Top wallet following
+        - Technical signals
+        - AI predictions
+        - Pattern recognition
+        """
+        
+        opportunities = []
+        token_signals = {}  # Track how many wallets are buying each token
+        
+        try:
+            tracked_wallets = self.wallet_intelligence.tracked_wallets
+
+            if not tracked_wallets:
+                logger.debug("No tracked wallets to monitor")
+                return opportunities
+
+            if self.scheduler:
+                # Only wallets whose next-poll time has come, within the RPC budget
+                self.scheduler.sync(tracked_wallets)
+                all_tracked_wallets = [
+                    (address, tracked_wallets[address]) for address in self.scheduler.take_due()
+                ]
+                if not all_tracked_wallets:
+                    logger.debug("No tracked wallets due for polling")
+                    return opportunities
+            else:
+                all_tracked_wallets = list(tracked_wallets.items())
+
+            wallet_count = len(all_tracked_wallets)
+            logger.info(f"🔍 Scanning {wallet_count}/{len(tracked_wallets)} tracked wallets for opportunities...")
+
+            scan_started = datetime.now()
+            rpc_requests = 0
+            http_requests = 0
+            wallets_with_activity: Set[str] = set()
+
+            rpc_batch = self._get_rpc_batch()
+            transports = [t for t in (rpc_batch, self._get_helius_client()) if t]
+            counters_before = [t.get_counters() for t in transports]
+
+            # With the batch transport a whole scan is one demultiplexed round;
+            # otherwise fall back to 20 concurrent single calls at a time.
+            batch_size = wallet_count if rpc_batch else 20
+
+            # (address, metrics, sig_info, discovered_at) for every signature that needs parsing
+            new_activity: List[Tuple[str, object, object, float]] = []
+
+            for batch_start in range(0, wallet_count, batch_size):
+                batch = all_tracked_wallets[batch_start: batch_start + batch_size]
+
+                if rpc_batch:
+                    batch_results = await self._fetch_recent_signatures_batched(
+                        rpc_batch,
+                        [address for address, _ in batch],
+                    )
+                else:
+                    signature_tasks = [
+                        self._fetch_recent_signatures(address)
+                        for address, _ in batch
+                    ]
+                    batch_results = await asyncio.gather(*signature_tasks, return_exceptions=True)
+                discovered_at = time.time()
+
+                for (address, metrics), result in zip(batch, batch_results):
+                    if isinstance(result, Exception):
+                        logger.debug(f"Error retrieving signatures for {address[:8]}: {result}")
+                        continue
+
+                    rpc_requests += result['rpc_calls']
+                    signatures = result['signatures']
+
+                    if not signatures:
+                        continue
+
+                    newest_signature: Optional[str] = None
+                    last_processed = self._wallet_last_signature.get(address)
+
+                    for sig_info in signatures:
+                        sig_value = getattr(sig_info, 'signature', None)
+                        sig_str = str(sig_value) if sig_value else None
+
+                        if not sig_str:
+                            continue
+
+                        if newest_signature is None:
+                            newest_signature = sig_str
+
+                        if sig_str == last_processed:
+                            break
+
+                        # Already handled by the websocket stream
+                        if sig_str in self._streamed_signatures:
+                            continue
+
+                        if hasattr(sig_info, 'block_time') and sig_info.block_time:
+                            tx_time = datetime.fromtimestamp(sig_info.block_time)
+                            if (datetime.now() - tx_time).total_seconds() > 300:
+                                continue
+
+                        new_activity.append((address, metrics, sig_info, discovered_at))
+
+                    if newest_signature:
+                        self._wallet_last_signature[address] = newest_signature
+
+                # Brief pause between batches to remain within rate limits
+                await asyncio.sleep(0.05)
+
+            # Parse every new signature of the scan in one stage so Helius
+            # resolves them in a single batch POST. A signature is decoded for the
+            # tracked wallet it was listed under (the first one, if several).
+            owners: Dict[str, str] = {}
+            for address, _, sig_info, _ in new_activity:
+                owners.setdefault(str(sig_info.signature), address)
+            parsed_mints, tx_rpc_calls = await self._parse_swap_transactions(list(owners), owners)
+            parsed_at = time.time()
+            rpc_requests += tx_rpc_calls
+
+            if self.scheduler:
+                self._prune_stream_state()
+                token_signals = self._poll_signals
+
+            new_signature_counts: Dict[str, int] = {}
+            swap_counts: Dict[str, int] = {}
+
+            for address, metrics, sig_info, discovered_at in new_activity:
+                new_signature_counts[address] = new_signature_counts.get(address, 0) + 1
+                signature = str(sig_info.signature)
+                token_mint = parsed_mints.get(signature) if owners[signature] == address else None
+                if token_mint:
+                    swap_counts[address] = swap_counts.get(address, 0) + 1
+                    wallets_with_activity.add(address)
+                    block_time = getattr(sig_info, 'block_time', None)
+                    self._record_detection_latency('poll', block_time)
+                    trace = new_trace(block_time=block_time, discovered=discovered_at, parsed=parsed_at)
+                    self._record_token_signal(token_signals, token_mint, address, metrics, trace)
+
+            if self.scheduler:
+                for address, _ in all_tracked_wallets:
+                    self.scheduler.record_poll(
+                        address,
+                        new_signatures=new_signature_counts.get(address, 0),
+                        swaps=swap_counts.get(address, 0),
+                    )
+                # One request per wallet was reserved by take_due()
+                self.scheduler.charge(max(rpc_requests - wallet_count, 0))
+
+            # Physical HTTP requests: batched calls share requests, everything
+            # else (single RPC calls) costs one request each.
+            http_requests = rpc_requests
+            for transport, before in zip(transports, counters_before):
+                counters = transport.get_counters()
+                http_requests -= counters['logical_calls'] - before['logical_calls']
+                http_requests += counters['http_requests'] - before['http_requests']
+
+            # Generate opportunities from strong signals (each windowed
+            # signal is delivered once per subscriber by _publish)
+            opportunities = self._build_opportunities(token_signals)
+
+            if opportunities:
+                logger.info(f"🎯 Found {len(opportunities)} high-confidence opportunities!")
+            else:
+                logger.debug(f"No opportunities found (checked {len(all_tracked_wallets)} wallets)")
+
+            scan_duration = (datetime.now() - scan_started).total_seconds()
+            if self.monitor:
+                self.monitor.record_metric(
+                    'automated_trader.scan_duration_seconds',
+                    scan_duration,
+                    tags={'wallets_total': len(tracked_wallets), 'wallets_polled': wallet_count}
+                )
+                self.monitor.record_metric(
+                    'automated_trader.rpc_requests',
+                    rpc_requests,
+                    tags={
+                        'wallets_with_activity': len(wallets_with_activity),
+                        'logical_calls': rpc_requests,
+                        'http_requests': http_requests,
+                    }
+                )
+                self.monitor.record_metric(
+                    'automated_trader.opportunities_found',
+                    len(opportunities),
+                )
+                self._transaction_cache.export_metrics(self.monitor)
+
+        except Exception as e:
+            logger.error(f"Error scanning for opportunities: {e}")
+
+        return opportunities
+
+    def _record_token_signal(
+        self,
+        token_signals: Dict[str, Dict],
+        token_mint: str,
+        address: str,
+        metrics,
+        trace: Optional[Dict[str, float]] = None,
+    ):
+        """Add one wallet buy to the per-token signal aggregate (trace = stage timestamps of this buy)."""
+
+        if token_mint not in token_signals:
+            token_signals[token_mint] = {
+                'count': 0,
+                'wallets': [],
+                'scores': [],
+                'first_seen': datetime.now(),
+                'taken_by': set(),
+                'pending_by': set(),
+            }
+
+        signal = token_signals[token_mint]
+        score = metrics.calculate_score()
+        signal['count'] += 1
+        signal['wallets'].append(address)
+        signal['scores'].append(score)
+        if trace:
+            # Latency is measured from the buy that completes the signal
+            signal['trace'] = trace
+
+        logger.info(
+            f"🎯 Detected buy from {address[:8]}... (score: {score:.0f}) - Token: {token_mint[:8]}..."
+        )
+
+    def _build_opportunities(self, token_signals: Dict[str, Dict]) -> List[Dict]:
+        """Turn aggregated wallet signals into scored opportunities."""
+
+        opportunities = []
+
+        for token_mint, signal in token_signals.items():
+            # Calculate confidence based on:
+            # 1. Number of wallets buying
+            # 2. Quality of wallets (scores)
+            # 3. Recency
+            
+            wallet_count = signal['count']
+            avg_wallet_score = sum(signal['scores']) / len(signal['scores']) if signal['scores'] else 0
+            
+            # Confidence formula
+            confidence = 0.5  # Base confidence
+            
+            # Add confidence for multiple wallet signals
+            confidence += min(wallet_count * 0.1, 0.3)  # Up to +30% for 3+ wallets
+            
+            # Add confidence for high-quality wallets
+            if avg_wallet_score > 75:
+                confidence += 0.2
+            elif avg_wallet_score > 60:
+                confidence += 0.1
+            
+            # Only create opportunity if confidence meets minimum
+            if confidence >= self.config.auto_trade_min_confidence:
+                opportunities.append({
+                    'token_mint': token_mint,
+                    'action': 'buy',
+                    'amount': self.config.default_buy_amount,
+                    'confidence': confidence,
+                    'signal_count': wallet_count,
+                    'wallet_scores': signal['scores'],
+                    'wallets': list(signal['wallets']),
+                    'reason': f"{wallet_count} top wallets buying (avg score: {avg_wallet_score:.0f})",
+                    'latency': mark(dict(signal.get('trace') or {}), 'scored'),
+                })
+                
+                logger.info(f"✨ OPPORTUNITY FOUND: {token_mint[:8]}... - Confidence: {confidence:.1%} ({wallet_count} wallets)")
+
+        return opportunities
+
+    async def _fetch_recent_signatures(self, address: str, limit: int = 3) -> Dict[str, object]:
+        """Fetch recent signatures for an address with monitoring instrumentation."""
+
+        rpc_calls = 0
+
+        try:
+            pubkey = Pubkey.from_string(address)
+        except Exception as exc:
+            logger.debug(f"Invalid wallet address {address[:8]}: {exc}")
+            return {'signatures': [], 'rpc_calls': rpc_calls}
+
+        try:
+            if self.monitor:
+                self.monitor.record_request()
+
+            signatures = await self.wallet_intelligence.client.get_signatures_for_address(
+                pubkey,
+                limit=limit
+            )
+            rpc_calls += 1
+
+            return {
+                'signatures': signatures.value if signatures and signatures.value else [],
+                'rpc_calls': rpc_calls
+            }
+
+        except Exception as exc:
+            logger.debug(f"Error fetching signatures for {address[:8]}: {exc}")
+            return {'signatures': [], 'rpc_calls': rpc_calls}
+
+    def _get_rpc_batch(self) -> Optional[JsonRpcBatchClient]:
+        """Lazily create the batch transport against the wallet intelligence RPC endpoint."""
+        if self.rpc_batch is not None or self.rpc_batch_size <= 0:
+            return self.rpc_batch
+
+        client = getattr(self.wallet_intelligence, 'client', None)
+        provider = getattr(client, '_provider', None)
+        endpoint = getattr(provider, 'endpoint_uri', None)
+        if not endpoint:
+            return None
+
+        self.rpc_batch = JsonRpcBatchClient(
+            endpoint,
+            batch_size=self.rpc_batch_size,
+            on_request=self.monitor.record_request if self.monitor else None,
+        )
+        logger.info(f"📦 JSON-RPC batching enabled ({self.rpc_batch_size} calls per request)")
+        return self.rpc_batch
+
+    async def _fetch_recent_signatures_batched(
+        self,
+        rpc_batch: JsonRpcBatchClient,
+        addresses: List[str],
+        limit: int = 3,
+    ) -> List[Dict[str, object]]:
+        """Fetch recent signatures for many wallets through the JSON-RPC batch transport."""
+
+        results: List[Dict[str, object]] = [{'signatures': [], 'rpc_calls': 0} for _ in addresses]
+        calls = []
+        call_indexes = []
+
+        for index, address in enumerate(addresses):
+            try:
+                Pubkey.from_string(address)
+            except Exception as exc:
+                logger.debug(f"Invalid wallet address {address[:8]}: {exc}")
+                continue
+            calls.append(('getSignaturesForAddress', [address, {'limit': limit}]))
+            call_indexes.append(index)
+
+        responses = await rpc_batch.call_many(calls)
+
+        for index, response in zip(call_indexes, responses):
+            results[index]['rpc_calls'] = 1
+            if isinstance(response, Exception):
+                logger.debug(f"Error fetching signatures for {addresses[index][:8]}: {response}")
+                continue
+            results[index]['signatures'] = [
+                SimpleNamespace(
+                    signature=item.get('signature'),
+                    block_time=item.get('blockTime'),
+                    err=item.get('err'),
+                )
+                for item in response or []
+            ]
+
+        return results
+
+    # ------------------------------------------------------------------
+    # Transaction parsing
+    # ------------------------------------------------------------------
+
+    async def _parse_swap_transaction(self, signature: str, owner: Optional[str] = None) -> Tuple[Optional[str], int]:
+        """
+        Parse a transaction to detect token swaps and extract the token mint
+
+        Uses (in priority order):
+        1. Helius Enhanced API (if available)
+        2. Net pre/post token balance delta of `owner` (the tracked wallet;
+           default the fee payer) from the raw RPC JSON
+        
+        Returns:
+            Tuple of (token mint address if this was a buy transaction, RPC call count)
+        """
+        cached = self._get_cached_transaction(signature, owner)
+        if cached is not None:
+            return cached.get('mint'), 0
+
+        helius_mints, rpc_calls = await self._resolve_helius_transactions([signature])
+        if signature in helius_mints:
+            return helius_mints[signature], rpc_calls
+
+        mint, calls = await self._parse_rpc_transaction(signature, owner)
+        return mint, rpc_calls + calls
+
+    async def _parse_swap_transactions(
+        self,
+        signatures: List[str],
+        owners: Optional[Dict[str, str]] = None,
+    ) -> Tuple[Dict[str, Optional[str]], int]:
+        """
+        Resolve the bought token mint for many signatures at once.
+
+        All uncached signatures go to Helius in one batch POST; whatever Helius
+        cannot resolve falls back to getTransaction, either through the JSON-RPC
+        batch transport or as single calls, at most parse_concurrency at a time.
+        `owners` maps a signature to the tracked wallet whose buy it may be.
+
+        Returns:
+            Tuple of (mint or None keyed by signature, RPC call count)
+        """
+        owners = owners or {}
+        mints: Dict[str, Optional[str]] = {}
+        pending: List[str] = []
+
+        for signature in dict.fromkeys(signatures):
+            cached = self._get_cached_transaction(signature, owners.get(signature))
+            if cached is not None:
+                mints[signature] = cached.get('mint')
+            else:
+                pending.append(signature)
+
+        helius_mints, rpc_calls = await self._resolve_helius_transactions(pending)
+        mints.update(helius_mints)
+        unresolved = [signature for signature in pending if signature not in helius_mints]
+
+        if not unresolved:
+            return mints, rpc_calls
+
+        rpc_batch = self._get_rpc_batch()
+        if not rpc_batch:
+            # Signatures are independent, so parse them concurrently (bounded so a
+            # burst of activity cannot flood the RPC provider).
+            results = await asyncio.gather(
+                *(
+                    self._parse_bounded(self._parse_rpc_transaction, signature, owners.get(signature))
+                    for signature in unresolved
+                ),
+                return_exceptions=True,
+            )
+
+            for signature, result in zip(unresolved, results):
+                if isinstance(result, Exception):
+                    logger.debug(f"Error parsing transaction {signature[:8]}: {result}")
+                    mints[signature] = None
+                    continue
+
+                mints[signature], calls = result
+                rpc_calls += calls
+
+            return mints, rpc_calls
+
+        responses = await rpc_batch.call_many([
+            (
+                'getTransaction',
+                [signature, {'encoding': 'jsonParsed', 'maxSupportedTransactionVersion': 0, 'commitment': 'confirmed'}],
+            )
+            for signature in unresolved
+        ])
+        rpc_calls += len(unresolved)
+
+        for signature, response in zip(unresolved, responses):
+            if isinstance(response, Exception):
+                # Transport failures are not cached so the next scan retries
+                logger.debug(f"Error fetching transaction {signature[:8]}: {response}")
+                mints[signature] = None
+                continue
+
+            mints[signature] = self._decode_transaction(signature, response, owners.get(signature))
+
+        return mints, rpc_calls
+
+    async def _parse_bounded(self, parser, signature: str, owner: Optional[str] = None) -> Tuple[Optional[str], int]:
+        async with self._parse_semaphore:
+            return await parser(signature, owner)
+
+    def _get_helius_client(self) -> Optional[HeliusEnhancedClient]:
+        """Lazily create the pooled Helius client when HELIUS_API_KEY is configured."""
+        if self.helius_client is not None:
+            return self.helius_client
+
+        helius_api_key = os.getenv('HELIUS_API_KEY')
+        if not helius_api_key or not HTTPX_AVAILABLE:
+            return None
+
+        self.helius_client = HeliusEnhancedClient(
+            helius_api_key,
+            on_request=self.monitor.record_request if self.monitor else None,
+        )
+        return self.helius_client
+
+    async def _resolve_helius_transactions(self, signatures: List[str]) -> Tuple[Dict[str, Optional[str]], int]:
+        """
+        METHOD 0: Helius Enhanced Transaction API, one batch POST per scan.
+
+        Returns:
+            Tuple of (mint or None keyed by every signature Helius answered, lookup count)
+        """
+        helius = self._get_helius_client()
+        if not helius or not signatures:
+            return {}, 0
+
+        try:
+            enhanced = await helius.get_transactions(signatures)
+        except Exception as e:
+            logger.debug(f"Helius enhanced API unavailable, falling back to standard parsing: {e}")
+            return {}, len(signatures)
+
+        mints: Dict[str, Optional[str]] = {}
+        for signature, helius_data in enhanced.items():
+            mint = self._extract_helius_mint(signature, helius_data)
+            if not mint:
+                # Helius parsed it and it is not a buy: no getTransaction fallback
+                self._cache_transaction(signature, None, helius_data.get('timestamp'))
+            mints[signature] = mint
+
+        return mints, len(signatures)
+
+    def _extract_helius_mint(self, signature: str, helius_data: Dict) -> Optional[str]:
+        # Helius provides parsed swap data
+        if helius_data.get('type') not in ['SWAP', 'SWAP_EXACT_IN', 'SWAP_EXACT_OUT']:
+            return None
+
+        # Extract token info from Helius parsed data
+        for transfer in helius_data.get('tokenTransfers', []):
+            # Look for incoming transfers (tokens received)
+            if transfer.get('tokenAmount', 0) > 0:
+                mint = transfer.get('mint')
+                if mint and mint != "So11111111111111111111111111111111111111112":
+                    logger.info(f"🎯 [Helius] Detected SWAP: {mint[:8]}... via {helius_data.get('source', 'DEX')}")
+                    self._cache_transaction(signature, mint, helius_data.get('timestamp'))
+                    return mint
+
+        return None
+
+    async def _parse_rpc_transaction(self, signature: str, owner: Optional[str] = None) -> Tuple[Optional[str], int]:
+        """
+        Standard RPC fallback: one getTransaction call. Returns (mint, RPC call count).
+
+        Read at 'confirmed' like the wallet stream. Lookup errors and transactions
+        the node does not have yet are not cached, so they are retried.
+        """
+        try:
+            if self.monitor:
+                self.monitor.record_request()
+            tx = await self.wallet_intelligence.client.get_transaction(
+                signature,
+                encoding="jsonParsed",
+                max_supported_transaction_version=0,
+                commitment=Confirmed,
+            )
+        except Exception as e:
+            logger.debug(f"Error parsing transaction {str(signature)[:8]}: {e}")
+            return None, 1
+
+        if not tx or not getattr(tx, 'value', None):
+            return None, 1
+
+        return self._decode_transaction(signature, tx.to_json(), owner), 1
+
+    def _decode_transaction(self, signature: str, raw, owner: Optional[str] = None) -> Optional[str]:
+        """
+        Find the token bought by `owner` in a raw getTransaction result.
+
+        `owner` is the tracked wallet. A wallet that is only mentioned by someone
+        else's transaction has no balance change of its own, so nothing is found.
+        Without an owner the fee payer is assumed.
+        """
+        try:
+            result = load_result(raw)
+            swap = decode_swap(result, owner=owner) if result else None
+        except Exception as e:
+            logger.debug(f"Error decoding transaction {str(signature)[:8]}: {e}")
+            self._cache_transaction(signature, None, owner=owner)
+            return None
+
+        if result is None:
+            # Not found (yet): leave it uncached so it is looked up again
+            return None
+
+        block_time = result.get('blockTime')
+        if not swap:
+            self._cache_transaction(signature, None, block_time, owner)
+            return None
+
+        logger.info(
+            f"🎯 Detected token BUY: {swap.mint[:8]}... (+{swap.ui_amount:.4f} tokens, "
+            f"{-swap.sol_change_lamports / 1e9:.4f} SOL)"
+        )
+        self._cache_transaction(signature, swap.mint, block_time, owner)
+        return swap.mint
+
+    def _get_cached_transaction(self, signature: str, owner: Optional[str] = None) -> Optional[Dict[str, object]]:
+        """Cached decode of a signature; one decoded for another wallet counts as a miss."""
+        cached = self._transaction_cache.get(signature)
+        if cached is not None and owner and cached.get('owner') not in (None, owner):
+            return None
+        return cached
+
+    def _cache_transaction(
+        self,
+        signature: str,
+        mint: Optional[str],
+        block_time: Optional[int] = None,
+        owner: Optional[str] = None,
+    ):
+        self._transaction_cache[signature] = {
+            'mint': mint,
+            'block_time': block_time,
+            'owner': owner,
+        }
+
+    def get_status(self) -> Dict:
+        return {
+            'running': self.running,
+            'subscribers': len(self._subscribers),
+            'tracked_wallets': len(self.wallet_intelligence.tracked_wallets),
+            'streaming': self.wallet_stream is not None and self.wallet_stream.connected.is_set(),
+            'detection_latency': self.get_detection_latency_stats(),
+            'scheduler': self.scheduler.stats() if self.scheduler else None,
+        }
@@ -0,0 +1,140 @@
+"""
+🔬 FAST SWAP DECODER
+Detect token buys straight from raw getTransaction JSON
+
+FEATURES:
+- Works on raw response bytes/str or the already-decoded result dict
+- No solders objects: one pass over pre/post token balances
+- Net token delta per (owner, mint) using integer base units
+- Returns the bought mint, token amount and SOL spent by the wallet
+"""
+
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+WSOL_MINT = "So11111111111111111111111111111111111111112"
+
+RawTransaction = Union[bytes, bytearray, str, Dict[str, Any]]
+
+
+@dataclass
+class DecodedSwap:
+    """A token buy detected in a transaction."""
+    mint: str
+    owner: str
+    amount: int                # token base units received
+    decimals: int
+    sol_change_lamports: int   # native + wSOL change for the owner, excluding the fee (negative = spent)
+    block_time: Optional[int] = None
+    slot: Optional[int] = None
+
+    @property
+    def ui_amount(self) -> float:
+        return self.amount / (10 ** self.decimals)
+
+
+def _loads(raw: RawTransaction) -> Any:
+    if isinstance(raw, dict):
+        return raw
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def load_result(raw: RawTransaction) -> Optional[Dict[str, Any]]:
+    """Accept a full JSON-RPC response or just its `result` object."""
+    data = _loads(raw)
+    if isinstance(data, dict) and 'meta' not in data and 'result' in data:
+        data = data['result']
+    return data if isinstance(data, dict) else None
+
+
+def _fee_payer(message: Dict[str, Any]) -> Optional[str]:
+    keys = message.get('accountKeys') or []
+    if not keys:
+        return None
+    first = keys[0]
+    # jsonParsed encoding returns objects, json encoding returns plain strings
+    return first.get('pubkey') if isinstance(first, dict) else first
+
+
+def token_deltas(meta: Dict[str, Any]) -> Dict[Tuple[str, str], Tuple[int, int]]:
+    """Net change per (owner, mint) in base units -> (delta, decimals)."""
+    deltas: Dict[Tuple[str, str], Tuple[int, int]] = {}
+
+    for balances, sign in ((meta.get('preTokenBalances') or (), -1), (meta.get('postTokenBalances') or (), 1)):
+        for balance in balances:
+            amount_info = balance.get('uiTokenAmount') or {}
+            key = (balance.get('owner'), balance.get('mint'))
+            delta, _ = deltas.get(key, (0, 0))
+            deltas[key] = (
+                delta + sign * int(amount_info.get('amount') or 0),
+                amount_info.get('decimals') or 0,
+            )
+
+    return deltas
+
+
+def decode_swap(raw: RawTransaction, owner: Optional[str] = None) -> Optional[DecodedSwap]:
+    """
+    Return the token bought by `owner` (default: the fee payer), or None.
+
+    Failed transactions, sells and transfers with no positive non-SOL delta
+    for the owner all return None.
+    """
+    result = load_result(raw)
+    if not result:
+        return None
+
+    meta = result.get('meta') or {}
+    if meta.get('err') is not None:
+        return None
+
+    message = (result.get('transaction') or {}).get('message') or {}
+    fee_payer = _fee_payer(message)
+    owner = owner or fee_payer
+    if not owner:
+        return None
+
+    deltas = token_deltas(meta)
+
+    best: Optional[Tuple[str, int, int]] = None
+    wsol_change = 0
+    for (balance_owner, mint), (delta, decimals) in deltas.items():
+        if balance_owner != owner:
+            continue
+        if mint == WSOL_MINT:
+            wsol_change += delta
+            continue
+        if delta <= 0:
+            continue
+        # Several tokens received: keep the largest in UI terms
+        if best is None or delta / (10 ** decimals) > best[1] / (10 ** best[2]):
+            best = (mint, delta, decimals)
+
+    if best is None:
+        return None
+
+    native_change = 0
+    if owner == fee_payer:
+        pre, post = meta.get('preBalances') or [0], meta.get('postBalances') or [0]
+        native_change = post[0] - pre[0] + (meta.get('fee') or 0)
+
+    mint, amount, decimals = best
+    return DecodedSwap(
+        mint=mint,
+        owner=owner,
+        amount=amount,
+        decimals=decimals,
+        sol_change_lamports=native_change + wsol_change,
+        block_time=result.get('blockTime'),
+        slot=result.get('slot'),
+    )
+
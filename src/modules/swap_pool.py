@@ -0,0 +1,291 @@
+"""
+🧰 PREBUILT SWAP POOL
+Keeps ready-to-sign Jupiter swap transactions for trades we expect to make
+
+FEATURES:
+- Sources (sniper, auto-traders) declare the swaps they may need soon
+- Quote + /swap done ahead of time, so execution is sign-and-send
+- Rebuilt before the blockhash ages out or when the price moves past a tolerance
+- With a BlockhashCache, blockhash age is measured in blocks left before
+  lastValidBlockHeight instead of wall-clock time
+- One batched price request per refresh for every watched token
+- Entries are single-use; an executed swap is rebuilt if still wanted
+- Built with the priority fee the executor will pay; a different fee is a miss
+"""
+
+import asyncio
+import base64
+import logging
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional
+
+from src.modules.blockhash_cache import transaction_blockhash
+
+logger = logging.getLogger(__name__)
+
+SOL_MINT = "So11111111111111111111111111111111111111112"
+
+PriceFetcher = Callable[[List[str]], Awaitable[Dict[str, float]]]
+
+
+@dataclass(frozen=True)
+class SwapIntent:
+    """A swap some user may execute soon. Matches execution by exact parameters."""
+    user_pubkey: str
+    input_mint: str
+    output_mint: str
+    amount: int
+    slippage_bps: int
+    priority_fee_lamports: Optional[int] = None     # total priority fee; None lets Jupiter decide
+
+    @property
+    def token_mint(self) -> str:
+        """The non-SOL side, whose price decides whether the quote is still good."""
+        return self.output_mint if self.input_mint == SOL_MINT else self.input_mint
+
+
+@dataclass
+class PrebuiltSwap:
+    intent: SwapIntent
+    quote: Dict
+    swap_transaction: str       # base64 unsigned transaction from Jupiter /swap
+    built_at: float             # time.monotonic()
+    reference_price: Optional[float] = None
+    last_valid_block_height: Optional[int] = None
+
+    def age(self, now: Optional[float] = None) -> float:
+        return (now if now is not None else time.monotonic()) - self.built_at
+
+
+SwapSource = Callable[[], Iterable[SwapIntent]]
+
+
+class PrebuiltSwapPool:
+    """
+    Prebuilt swap transactions for watched intents.
+
+    `max_age` bounds how old a transaction's blockhash may get before it is
+    rebuilt (blockhashes expire after ~60-90s, so the default leaves margin for
+    confirmation); `price_tolerance_bps` rebuilds a quote once the token price
+    moved that far from the price it was built at. When `blockhash_cache` knows
+    an entry's lastValidBlockHeight, entries with fewer than `min_blocks_left`
+    blocks of validity are not handed out either.
+    """
+
+    def __init__(
+        self,
+        jupiter,
+        *,
+        price_fetcher: Optional[PriceFetcher] = None,
+        interval: float = 2.0,
+        max_age: float = 20.0,
+        price_tolerance_bps: float = 100.0,
+        max_entries: int = 200,
+        build_concurrency: int = 4,
+        blockhash_cache=None,
+        min_blocks_left: int = 50,
+        monitor=None,
+    ):
+        self.jupiter = jupiter
+        self.price_fetcher = price_fetcher
+        self.interval = interval
+        self.max_age = max_age
+        self.price_tolerance_bps = price_tolerance_bps
+        self.max_entries = max_entries
+        self.blockhash_cache = blockhash_cache
+        self.min_blocks_left = min_blocks_left
+        self.monitor = monitor
+
+        self._sources: List[SwapSource] = []
+        self._entries: Dict[SwapIntent, PrebuiltSwap] = {}
+        self._build_semaphore = asyncio.Semaphore(max(1, build_concurrency))
+        self._task: Optional[asyncio.Task] = None
+        self.running = False
+
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.builds = 0
+        self.build_failures = 0
+
+    # ------------------------------------------------------------------
+    # Sources
+    # ------------------------------------------------------------------
+
+    def add_source(self, source: SwapSource):
+        if source not in self._sources:
+            self._sources.append(source)
+
+    def remove_source(self, source: SwapSource):
+        if source in self._sources:
+            self._sources.remove(source)
+
+    def _wanted(self) -> List[SwapIntent]:
+        wanted: Dict[SwapIntent, None] = {}
+        for source in list(self._sources):
+            try:
+                for intent in source():
+                    wanted[intent] = None
+                    if len(wanted) >= self.max_entries:
+                        return list(wanted)
+            except Exception as e:
+                logger.error(f"Error in swap pool source: {e}")
+        return list(wanted)
+
+    # ------------------------------------------------------------------
+    # Execution side
+    # ------------------------------------------------------------------
+
+    def take(self, intent: SwapIntent) -> Optional[PrebuiltSwap]:
+        """Hand out the prebuilt swap for `intent` if it is still fresh (single use)."""
+        entry = self._entries.pop(intent, None)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry.age() >= self.max_age or self._short_lived(entry, self.min_blocks_left):
+            self.stale += 1
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, intent: SwapIntent) -> bool:
+        return intent in self._entries
+
+    # ------------------------------------------------------------------
+    # Refresh
+    # ------------------------------------------------------------------
+
+    async def refresh(self) -> int:
+        """Reconcile with the sources and (re)build what is missing, old or mispriced."""
+        started = time.perf_counter()
+        wanted = self._wanted()
+        wanted_set = set(wanted)
+        for intent in list(self._entries):
+            if intent not in wanted_set:
+                del self._entries[intent]
+
+        prices = await self._fetch_prices({intent.token_mint for intent in wanted})
+
+        now = time.monotonic()
+        to_build = [
+            intent for intent in wanted
+            if self._needs_build(self._entries.get(intent), prices.get(intent.token_mint), now)
+        ]
+        if to_build:
+            await asyncio.gather(*(self._build(intent, prices.get(intent.token_mint)) for intent in to_build))
+
+        if self.monitor:
+            self.monitor.record_metric('swap_pool.refresh_seconds', time.perf_counter() - started)
+            self.monitor.record_metric('swap_pool.entries', len(self._entries))
+        return len(to_build)
+
+    def _needs_build(self, entry: Optional[PrebuiltSwap], price: Optional[float], now: float) -> bool:
+        if entry is None:
+            return True
+        # Rebuild at half life so an entry never expires between refreshes
+        if entry.age(now) >= self.max_age / 2 or self._short_lived(entry, 2 * self.min_blocks_left):
+            return True
+        if price and entry.reference_price:
+            moved_bps = abs(price / entry.reference_price - 1) * 10_000
+            return moved_bps > self.price_tolerance_bps
+        return False
+
+    def _short_lived(self, entry: PrebuiltSwap, min_blocks: int) -> bool:
+        if not self.blockhash_cache:
+            return False
+        blocks_left = self.blockhash_cache.blocks_left(entry.last_valid_block_height)
+        return blocks_left is not None and blocks_left < min_blocks
+
+    def _last_valid_block_height(self, swap_transaction: str) -> Optional[int]:
+        if not self.blockhash_cache:
+            return None
+        try:
+            return self.blockhash_cache.last_valid_for(transaction_blockhash(base64.b64decode(swap_transaction)))
+        except Exception:
+            return None
+
+    async def _fetch_prices(self, token_mints) -> Dict[str, float]:
+        if not self.price_fetcher or not token_mints:
+            return {}
+        try:
+            return await self.price_fetcher(sorted(token_mints)) or {}
+        except Exception as e:
+            logger.debug(f"Swap pool price fetch failed: {e}")
+            return {}
+
+    async def _build(self, intent: SwapIntent, price: Optional[float]):
+        async with self._build_semaphore:
+            try:
+                quote = await self.jupiter.get_quote(
+                    intent.input_mint, intent.output_mint, intent.amount, intent.slippage_bps
+                )
+                if not quote:
+                    raise RuntimeError("no quote")
+                swap_transaction = await self.jupiter.get_swap_transaction(
+                    quote, intent.user_pubkey, prioritization_fee_lamports=intent.priority_fee_lamports
+                )
+                if not swap_transaction:
+                    raise RuntimeError("no swap transaction")
+            except Exception as e:
+                self.build_failures += 1
+                self._entries.pop(intent, None)
+                logger.debug(f"Swap pool build failed for {intent.token_mint[:8]}...: {e}")
+                return
+
+            self.builds += 1
+            self._entries[intent] = PrebuiltSwap(
+                intent=intent,
+                quote=quote,
+                swap_transaction=swap_transaction,
+                built_at=time.monotonic(),
+                reference_price=price,
+                last_valid_block_height=self._last_valid_block_height(swap_transaction),
+            )
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self):
+        if self.running:
+            return
+        self.running = True
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"🧰 Prebuilt swap pool started ({self.interval:.0f}s refresh, {self.max_age:.0f}s max age)")
+
+    async def stop(self):
+        self.running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._task = None
+        self._entries.clear()
+
+    async def _run(self):
+        while self.running:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"Error refreshing swap pool: {e}")
+            await asyncio.sleep(self.interval)
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'sources': len(self._sources),
+            'hits': self.hits,
+            'misses': self.misses,
+            'stale': self.stale,
+            'builds': self.builds,
+            'build_failures': self.build_failures,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
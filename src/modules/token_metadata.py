@@ -0,0 +1,266 @@
+"""
+🗂️ TOKEN METADATA STORE
+Local SQLite index of the Jupiter token list
+
+FEATURES:
+- One primary-key lookup per mint instead of downloading and scanning the
+  full token list on every call
+- Batch lookups for many mints in a handful of queries
+- Persisted on disk, so a restart opens the index without re-downloading
+- Rebuilt off the event loop and swapped in atomically when it goes stale
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Union
+
+from src.modules.ttl_cache import TTLCache
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# SQLite's default host parameter limit is 999
+_BATCH_SIZE = 900
+
+# Minimum gap between refresh attempts, so a failing download is not retried on every lookup
+_RETRY_SECONDS = 60.0
+
+_SCHEMA = (
+    "CREATE TABLE tokens (address TEXT PRIMARY KEY, payload TEXT NOT NULL) WITHOUT ROWID",
+    "CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL) WITHOUT ROWID",
+)
+
+
+def _loads(raw: Union[bytes, str]) -> Any:
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(value: Any) -> str:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value).decode()
+    return json.dumps(value, separators=(',', ':'))
+
+
+def build_index(tokens: Iterable[Dict], path: Union[str, Path]) -> int:
+    """Write `tokens` to a fresh index at `path` (replaced atomically). Returns the token count."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    if tmp_path.exists():
+        tmp_path.unlink()
+
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.execute("PRAGMA journal_mode=OFF")
+        conn.execute("PRAGMA synchronous=OFF")
+        for statement in _SCHEMA:
+            conn.execute(statement)
+        rows = (
+            (token['address'], _dumps(token))
+            for token in tokens
+            if isinstance(token, dict) and token.get('address')
+        )
+        conn.executemany("INSERT OR REPLACE INTO tokens VALUES (?, ?)", rows)
+        count = conn.execute("SELECT COUNT(*) FROM tokens").fetchone()[0]
+        conn.execute("INSERT INTO meta VALUES ('updated_at', ?)", (str(time.time()),))
+        conn.commit()
+    finally:
+        conn.close()
+
+    os.replace(tmp_path, path)
+    return count
+
+
+class TokenMetadataStore:
+    """
+    Token list indexed by mint address.
+
+    Lookups are synchronous primary-key reads (microseconds) fronted by a small
+    LRU; `ensure_fresh` downloads and rebuilds the index when it is missing or
+    older than `refresh_seconds`, in the background once an index exists.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        *,
+        refresh_seconds: Optional[float] = None,
+        cache_size: int = 10_000,
+    ):
+        self.path = Path(path or os.getenv('TOKEN_METADATA_DB', 'data/token_metadata.sqlite'))
+        self.refresh_seconds = (
+            refresh_seconds if refresh_seconds is not None
+            else float(os.getenv('TOKEN_METADATA_REFRESH_SECONDS', '21600'))
+        )
+        self._conn: Optional[sqlite3.Connection] = None
+        self._updated_at: Optional[float] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._next_attempt = 0.0
+        self._cache = TTLCache('token_metadata', max_size=cache_size, ttl_seconds=None)
+
+        self.lookups = 0
+        self.refreshes = 0
+
+    # ------------------------------------------------------------------
+    # Index lifecycle
+    # ------------------------------------------------------------------
+
+    def open(self) -> bool:
+        """Open the on-disk index if present. Returns True when lookups can be served."""
+        if self._conn is not None:
+            return True
+        if not self.path.exists():
+            return False
+
+        try:
+            conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+            row = conn.execute("SELECT value FROM meta WHERE key = 'updated_at'").fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ Token metadata index at {self.path} unreadable: {e}")
+            return False
+
+        self._conn = conn
+        self._updated_at = float(row[0]) if row else 0.0
+        return True
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._conn is not None
+
+    def is_stale(self) -> bool:
+        if self._updated_at is None:
+            return True
+        return time.time() - self._updated_at >= self.refresh_seconds
+
+    def load_tokens(self, tokens: Iterable[Dict]) -> int:
+        """Rebuild the index from an already-parsed token list and switch to it."""
+        count = build_index(tokens, self.path)
+        self._reopen()
+        return count
+
+    def load_raw(self, raw: Union[bytes, str]) -> int:
+        """Rebuild from the raw token list JSON (as downloaded or saved to disk)."""
+        return self.load_tokens(self._parse(raw))
+
+    def _reopen(self):
+        self.close()
+        self._cache.clear()
+        self.open()
+        self.refreshes += 1
+
+    @staticmethod
+    def _parse(raw: Union[bytes, str]) -> List[Dict]:
+        tokens = _loads(raw)
+        if not isinstance(tokens, list):
+            raise ValueError("Token list must be a JSON array")
+        return tokens
+
+    async def refresh(self, fetch_raw: Callable[[], Awaitable[Optional[bytes]]]) -> int:
+        """Download via `fetch_raw`, rebuild the file in a worker thread, then switch to it."""
+        raw = await fetch_raw()
+        if not raw:
+            return 0
+        count = await asyncio.to_thread(lambda: build_index(self._parse(raw), self.path))
+        # Swap connections on the event loop so no lookup ever sees a closed handle
+        self._reopen()
+        logger.info(f"🗂️ Token metadata index rebuilt: {count:,} tokens")
+        return count
+
+    async def ensure_fresh(self, fetch_raw: Callable[[], Awaitable[Optional[bytes]]]) -> bool:
+        """
+        Make sure lookups can be served. Blocks only when no index exists yet;
+        a stale index keeps serving while it is rebuilt in the background.
+        """
+        self.open()
+        if not self.is_stale():
+            return True
+
+        now = time.monotonic()
+        if (self._refresh_task is None or self._refresh_task.done()) and now >= self._next_attempt:
+            self._next_attempt = now + _RETRY_SECONDS
+            self._refresh_task = asyncio.create_task(self._refresh_safely(fetch_raw))
+
+        if not self.loaded and self._refresh_task is not None:
+            await asyncio.shield(self._refresh_task)
+        return self.loaded
+
+    async def _refresh_safely(self, fetch_raw):
+        try:
+            await self.refresh(fetch_raw)
+        except Exception as e:
+            logger.error(f"❌ Token metadata refresh failed: {e}")
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def get(self, token_mint: str) -> Optional[Dict]:
+        self.lookups += 1
+        token = self._cache.get(token_mint)
+        if token is not None or self._conn is None:
+            return token
+
+        row = self._conn.execute(
+            "SELECT payload FROM tokens WHERE address = ?", (token_mint,)
+        ).fetchone()
+        if row is None:
+            return None
+        token = _loads(row[0])
+        self._cache.set(token_mint, token)
+        return token
+
+    def get_many(self, token_mints: Iterable[str]) -> Dict[str, Dict]:
+        """Known tokens among `token_mints`, keyed by mint. Unknown mints are omitted."""
+        found: Dict[str, Dict] = {}
+        missing: List[str] = []
+        for mint in dict.fromkeys(token_mints):
+            self.lookups += 1
+            token = self._cache.get(mint)
+            if token is not None:
+                found[mint] = token
+            else:
+                missing.append(mint)
+
+        if not missing or self._conn is None:
+            return found
+
+        for start in range(0, len(missing), _BATCH_SIZE):
+            chunk = missing[start:start + _BATCH_SIZE]
+            placeholders = ','.join('?' * len(chunk))
+            rows = self._conn.execute(
+                f"SELECT address, payload FROM tokens WHERE address IN ({placeholders})", chunk
+            ).fetchall()
+            for address, payload in rows:
+                token = _loads(payload)
+                self._cache.set(address, token)
+                found[address] = token
+        return found
+
+    def stats(self) -> Dict[str, Any]:
+        size = 0
+        if self._conn is not None:
+            size = self._conn.execute("SELECT COUNT(*) FROM tokens").fetchone()[0]
+        return {
+            'tokens': size,
+            'updated_at': self._updated_at,
+            'lookups': self.lookups,
+            'refreshes': self.refreshes,
+            'cache_hit_rate': self._cache.stats()['hit_rate'],
+        }
@@ -17,10 +17,13 @@ import logging
 import hashlib
 import json
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Set
-import aiohttp
+from typing import Dict, List, Optional, Set, Tuple
 import websockets
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+
+from src.modules.fee_estimator import CONTEXT_POLICIES
+from src.modules.http_pool import get_http_session
+from src.modules.swap_pool import SOL_MINT, SwapIntent
 
 logger = logging.getLogger(__name__)
 
@@ -64,7 +67,7 @@ class PumpFunMonitor:
             return
         
         self.running = True
-        self.session = aiohttp.ClientSession()
+        self.session = get_http_session()
         logger.info("🎯 Pump.fun monitor started")
         
         # Start API monitoring loop
@@ -78,8 +81,8 @@ class PumpFunMonitor:
         self.running = False
         if self.ws:
             await self.ws.close()
-        if self.session:
-            await self.session.close()
+        # Shared HTTP pool session; closed once at shutdown
+        self.session = None
         logger.info("🎯 Pump.fun monitor stopped")
     
     def on_new_token(self, callback):
@@ -655,7 +658,7 @@ class AutoSniper:
         self.jupiter = jupiter_client
         self.protection = protection_system  # Elite protection system
         self.monitor = PumpFunMonitor()
-        self.auto_trader = None  # Will be set when auto-trading starts
+        self.auto_traders: Dict[int, object] = {}  # user_id -> engine, set when auto-trading starts
         self.trade_executor = trade_executor
         self.sentiment_aggregator = sentiment_aggregator
         self.community_intel = community_intel
@@ -674,12 +677,17 @@ class AutoSniper:
         # Rate limiting
         self.last_snipe = {}  # user_id -> timestamp
         self.min_snipe_interval = 60  # seconds between snipes per user
+
+        # Pending manual snipes keep a ready-to-sign buy in the swap pool
+        swap_pool = getattr(self.jupiter, 'swap_pool', None)
+        if swap_pool:
+            swap_pool.add_source(self._swap_intents)
         
         logger.info("🎯 Elite Auto-Sniper initialized")
     
     def register_auto_trader(self, auto_trader):
-        """Register automated trading engine for position management"""
-        self.auto_trader = auto_trader
+        """Register a user's automated trading engine for position management"""
+        self.auto_traders[auto_trader.user_id] = auto_trader
         logger.info("🎯 Auto-trader registered with sniper for position tracking")
 
     def _generate_snipe_id(self, user_id: int, token_mint: str) -> str:
@@ -1361,19 +1369,18 @@ class AutoSniper:
                     reason='auto_sniper',
                     context='sniper_auto',
                     execution_mode='jito',
-                    priority_fee_lamports=2_000_000,
-                    tip_lamports=100_000,
                     metadata=execution_metadata,
                 )
             else:
+                tip_lamports, priority_fee_lamports = self._sniper_fees()
                 result = await self.jupiter.execute_swap_with_jito(
                     input_mint=SOL_MINT,
                     output_mint=token_info['address'],
                     amount=amount_lamports,
                     keypair=user_keypair,
                     slippage_bps=100,
-                    tip_amount_lamports=100000,
-                    priority_fee_lamports=2000000,
+                    tip_amount_lamports=tip_lamports,
+                    priority_fee_lamports=priority_fee_lamports,
                 )
 
             if result and result.get('success'):
@@ -1413,15 +1420,17 @@ class AutoSniper:
                 )
 
                 # 🎯 Register position with auto-trader for stop loss/take profit tracking
-                if self.auto_trader and self.auto_trader.is_running:
+                auto_trader = self.auto_traders.get(user_id)
+                if auto_trader and auto_trader.is_running:
                     entry_price = price or 0
-                    self.auto_trader.active_positions[token_info['address']] = {
+                    auto_trader.active_positions[token_info['address']] = {
                         'token_mint': token_info['address'],
                         'token_symbol': token_info['symbol'],
                         'entry_price': entry_price,
                         'amount': settings.max_buy_amount,
                         'entry_time': datetime.now(),
-                        'source': 'AUTO_SNIPE'
+                        'source': 'AUTO_SNIPE',
+                        'bundle_id': result.get('bundle_id'),
                     }
                     logger.info(f"📊 Position registered for auto-management (Stop Loss: 15%, Take Profit: 50%)")
                 
@@ -1521,10 +1530,57 @@ class AutoSniper:
             'message': 'Monitoring for liquidity addition...'
         }
     
+    def _sniper_fees(self) -> Tuple[int, int]:
+        """(tip, priority fee) of the sniper policy: adaptive when an estimator is attached, policy defaults otherwise."""
+        if self.jupiter.fee_estimator:
+            fees = self.jupiter.fee_estimator.quote('sniper')
+            return fees.tip_lamports, fees.priority_fee_lamports
+        policy = CONTEXT_POLICIES['sniper']
+        return policy.default_tip_lamports, policy.default_priority_lamports
+
+    def _swap_intents(self):
+        """Swap pool source: the buy of every manual snipe still waiting for liquidity."""
+        snipes = [
+            snipe for snipe in list(self.active_snipes.values())
+            if snipe.get('swap_intent') and snipe.get('status') == 'MONITORING'
+        ]
+        if not snipes:
+            return
+        # Built with the fee the Jito buy would pay now, so the execution can use it as is
+        if self.trade_executor:
+            priority_fee_lamports = self.trade_executor.expected_priority_fee('sniper_manual', 'buy', 'jito')
+        else:
+            priority_fee_lamports = self._sniper_fees()[1]
+        for snipe in snipes:
+            yield replace(snipe['swap_intent'], priority_fee_lamports=priority_fee_lamports)
+
+    async def _prepare_manual_snipe_swap(self, snipe: Dict):
+        """Resolve the wallet and slippage a manual snipe will buy with, for the swap pool."""
+        try:
+            keypair = await self.wallet_manager.get_user_keypair(snipe['user_id'])
+            if not keypair:
+                return
+
+            slippage_percentage = None
+            if self.db:
+                user_settings = await self.db.get_user_settings(snipe['user_id'])
+                slippage_percentage = getattr(user_settings, 'slippage_percentage', None)
+            # Same conversion TradeExecutionService applies
+            slippage_bps = 50 if slippage_percentage is None else max(1, int(slippage_percentage * 100))
+
+            snipe['swap_intent'] = SwapIntent(
+                str(keypair.pubkey()), SOL_MINT, snipe['token_mint'], int(snipe['amount_sol'] * 1e9), slippage_bps
+            )
+        except Exception as e:
+            logger.debug(f"Could not prepare prebuilt swap for manual snipe: {e}")
+
     async def _monitor_manual_snipe(self, snipe_id: str):
         """Monitor for liquidity and execute manual snipe"""
         snipe = self.active_snipes[snipe_id]
         token_mint = snipe['token_mint']
+
+        if getattr(self.jupiter, 'swap_pool', None):
+            await self._prepare_manual_snipe_swap(snipe)
         
         max_attempts = 600  # 10 minutes
         check_interval = 1.0  # 1 second
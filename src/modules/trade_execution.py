@@ -9,16 +9,20 @@ from datetime import datetime
 from types import SimpleNamespace
 from typing import Any, Dict, Optional
 
+from src.modules.bundle_tracker import LANDED, BundleTracker, TrackedBundle
 from src.modules.database import DatabaseManager
 from src.modules.wallet_manager import UserWalletManager
 from src.modules.jupiter_client import JupiterClient
+from src.modules.latency_trace import get_latency_tracker, mark
 from src.modules.elite_protection import EliteProtectionSystem
+from src.modules.fee_estimator import CONTEXT_POLICIES, FeeEstimator, FeeQuote, fee_context
 from src.modules.monitoring import BotMonitor
 from src.modules.social_trading import (
     SocialTradingMarketplace,
     RewardSystem,
     REWARD_POINTS,
 )
+from src.ops import broadcast
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +49,7 @@ class TradeExecutionService:
         monitor: Optional[BotMonitor] = None,
         social_marketplace: Optional[SocialTradingMarketplace] = None,
         rewards: Optional[RewardSystem] = None,
+        fee_estimator: Optional[FeeEstimator] = None,
     ) -> None:
         self.db = db
         self.wallet_manager = wallet_manager
@@ -53,6 +58,11 @@ class TradeExecutionService:
         self.monitor = monitor
         self.social_marketplace = social_marketplace
         self.rewards = rewards
+        self.fee_estimator = fee_estimator
+
+    def attach_bundle_tracker(self, tracker: BundleTracker) -> None:
+        """Resolve Jito bundle outcomes back into trade, position and snipe records."""
+        tracker.add_listener(self._on_bundle_resolved)
 
     async def execute_buy(
         self,
@@ -77,6 +87,12 @@ class TradeExecutionService:
         metadata = dict(metadata) if metadata else {}
         confirm_token = metadata.get("confirm_token")
 
+        # Stage timestamps (signal path stages arrive with copy-trade opportunities)
+        latency_trace = metadata.get("latency")
+        if not isinstance(latency_trace, dict):
+            latency_trace = metadata["latency"] = {}
+        mark(latency_trace, "execute_buy")
+
         if amount_sol <= 0:
             return {"success": False, "error": "Trade amount must be positive"}
 
@@ -130,28 +146,28 @@ class TradeExecutionService:
         slippage_bps = self._slippage_to_bps(settings.slippage_percentage)
         amount_lamports = int(amount_sol * 1e9)
 
-        # Capture quote metadata to derive token decimals when available
-        quote = None
-        if execution_mode != "jito":
-            quote = await self.jupiter.get_quote(
-                self.SOL_MINT,
-                token_mint,
-                amount_lamports,
-                slippage_bps=slippage_bps,
-            )
+        # Explicit fees win; otherwise the context's adaptive fee policy applies
+        fee_quote = self._quote_fees(context, "buy", metadata, explicit=priority_fee_lamports is not None)
+        if priority_fee_lamports is None and fee_quote:
+            priority_fee_lamports = fee_quote.priority_fee_lamports
+        if tip_lamports is None and fee_quote:
+            tip_lamports = fee_quote.tip_lamports
 
         if execution_mode == "jito":
+            policy = CONTEXT_POLICIES[fee_context(context, "buy")]
             result = await self.jupiter.execute_swap_with_jito(
                 input_mint=self.SOL_MINT,
                 output_mint=token_mint,
                 amount=amount_lamports,
                 keypair=keypair,
                 slippage_bps=slippage_bps,
-                tip_amount_lamports=tip_lamports or 100_000,
-                priority_fee_lamports=priority_fee_lamports or 1_000_000,
+                tip_amount_lamports=tip_lamports or policy.default_tip_lamports,
+                priority_fee_lamports=priority_fee_lamports or policy.default_priority_lamports,
                 confirm_token=confirm_token,
+                latency_trace=latency_trace,
             )
         else:
+            policy = self._broadcast_policy(execution_mode, context, "buy", metadata)
             result = await self.jupiter.execute_swap(
                 self.SOL_MINT,
                 token_mint,
@@ -159,8 +175,17 @@ class TradeExecutionService:
                 keypair,
                 slippage_bps=slippage_bps,
                 confirm_token=confirm_token,
+                latency_trace=latency_trace,
+                priority_fee_lamports=priority_fee_lamports,
+                broadcast_policy=policy,
+                tip_lamports=tip_lamports,
             )
 
+        # Bundle outcomes are only known once the tracker resolves them
+        self._record_execution_details(metadata, result)
+        if not result.get("bundle_id"):
+            self._record_fee_outcome(metadata, result)
+
         if not result.get("success"):
             await self._record_failed_trade(result.get("error", "Unknown error"))
             await self._persist_trade_record(
@@ -177,8 +202,9 @@ class TradeExecutionService:
             )
             return {"success": False, "error": result.get("error", "Swap failed")}
 
+        # Both swap paths return the quote they executed (token decimals live there)
         quote_payload = result.get("quote") if isinstance(result, dict) else None
-        token_decimals = self._extract_decimals(quote_payload or quote)
+        token_decimals = self._extract_decimals(quote_payload)
         output_raw = int(
             result.get("output_amount")
             or (quote_payload or {}).get("outAmount", 0)
@@ -240,6 +266,11 @@ class TradeExecutionService:
 
         if self.monitor:
             self.monitor.record_trade_success()
+        get_latency_tracker().observe(
+            latency_trace,
+            self.monitor,
+            tags={"context": context, "policy": metadata.get("broadcast_policy", execution_mode)},
+        )
 
         if self.social_marketplace and context != "copy_trade":
             try:
@@ -276,6 +307,7 @@ class TradeExecutionService:
             "signature": signature,
             "amount_sol": amount_sol,
             "amount_tokens": tokens_received,
+            "amount_raw": output_raw,
             "token_decimals": token_decimals,
             "price": execution_price,
             "position_id": position_id,
@@ -292,6 +324,7 @@ class TradeExecutionService:
         token_symbol: Optional[str] = None,
         reason: str = "manual",
         context: str = "manual",
+        execution_mode: str = "standard",
         metadata: Optional[Dict[str, Any]] = None,
     ) -> Dict:
         """Execute a token -> SOL swap for an open position."""
@@ -350,6 +383,8 @@ class TradeExecutionService:
         if not keypair:
             return {"success": False, "error": "Wallet unavailable for trading"}
 
+        fee_quote = self._quote_fees(context, "sell", metadata)
+
         result = await self.jupiter.execute_swap(
             token_mint,
             self.SOL_MINT,
@@ -357,7 +392,12 @@ class TradeExecutionService:
             keypair,
             slippage_bps=slippage_bps,
             confirm_token=confirm_token,
+            priority_fee_lamports=fee_quote.priority_fee_lamports if fee_quote else None,
+            broadcast_policy=self._broadcast_policy(execution_mode, context, "sell", metadata),
+            tip_lamports=fee_quote.tip_lamports if fee_quote else None,
         )
+        self._record_execution_details(metadata, result)
+        self._record_fee_outcome(metadata, result)
 
         if not result.get("success"):
             await self._record_failed_trade(result.get("error", "Unknown error"))
@@ -559,6 +599,126 @@ class TradeExecutionService:
 
         await self.db.add_trade(trade_data)
 
+    async def _on_bundle_resolved(self, bundle: TrackedBundle) -> None:
+        """A bundle trade was recorded optimistically at submission; settle it now."""
+        if not bundle.signature:
+            return
+
+        trade = await self.db.get_trade_by_signature(bundle.signature)
+        if not trade:
+            return
+
+        try:
+            metadata = json.loads(trade.metadata_json) if trade.metadata_json else {}
+        except ValueError:
+            metadata = {}
+        metadata.update(
+            bundle_status=bundle.status,
+            landed_via=bundle.landed_via,
+            landed_slot=bundle.landed_slot,
+        )
+        # The tip bought the bundle's landing; an RPC-fallback landing does not count for it
+        self._record_fee_outcome(metadata, {"success": bundle.landed_via == "bundle", "sent": True})
+        updates: Dict[str, Any] = {"metadata_json": self._serialize_metadata(metadata)}
+
+        if bundle.status == LANDED:
+            await self.db.update_trade(bundle.signature, updates)
+            return
+
+        error = f"Jito bundle {bundle.status.lower()}: {bundle.error or 'unknown'}"
+        updates.update(success=False, error_message=error, is_position_open=False)
+        await self.db.update_trade(bundle.signature, updates)
+        await self._record_failed_trade(error)
+
+        # The buy never happened: the position it opened holds nothing
+        if trade.position_id:
+            await self.db.update_position_partial(
+                trade.position_id,
+                {
+                    "is_open": False,
+                    "remaining_amount_sol": 0.0,
+                    "remaining_amount_tokens": 0.0,
+                    "remaining_amount_raw": 0,
+                },
+            )
+
+        snipe_id = metadata.get("snipe_id")
+        if snipe_id:
+            await self.db.update_snipe_run(snipe_id, {"status": "FAILED", "completed_at": datetime.utcnow()})
+
+        logger.warning(
+            "Bundle trade not landed | user=%s token=%s signature=%s status=%s",
+            trade.user_id,
+            trade.token_mint,
+            bundle.signature,
+            bundle.status,
+        )
+
+    def _quote_fees(
+        self,
+        context: str,
+        trade_type: str,
+        metadata: Dict[str, Any],
+        *,
+        explicit: bool = False,
+    ) -> Optional[FeeQuote]:
+        """Fee policy for this trade; stored in the trade metadata so its outcome can be fed back."""
+        if not self.fee_estimator or explicit:
+            return None
+        fee_quote = self.fee_estimator.quote(fee_context(context, trade_type))
+        metadata["fees"] = fee_quote.as_metadata()
+        return fee_quote
+
+    def expected_priority_fee(
+        self,
+        context: str,
+        trade_type: str = "buy",
+        execution_mode: str = "standard",
+    ) -> Optional[int]:
+        """Total priority fee execute_buy / execute_sell would pay right now (swap pool sources build with it)."""
+        fees_context = fee_context(context, trade_type)
+        fee = self.fee_estimator.quote(fees_context).priority_fee_lamports if self.fee_estimator else None
+        if execution_mode == "jito" and trade_type == "buy":
+            fee = fee or CONTEXT_POLICIES[fees_context].default_priority_lamports
+        return fee
+
+    def _broadcast_policy(
+        self,
+        execution_mode: str,
+        context: str,
+        trade_type: str,
+        metadata: Dict[str, Any],
+    ) -> str:
+        """An explicit policy as execution_mode wins; "standard" uses the context's policy."""
+        if execution_mode in broadcast.POLICIES:
+            policy = execution_mode
+        else:
+            policy = broadcast.policy_for(fee_context(context, trade_type))
+        metadata["broadcast_policy"] = policy
+        return policy
+
+    def _record_fee_outcome(self, metadata: Dict[str, Any], result: Dict) -> None:
+        """Landed or not at the quoted fee level (swaps that never reached the network are ignored)."""
+        fees = metadata.get("fees")
+        if not self.fee_estimator or not fees:
+            return
+        if not result.get("success") and not result.get("sent"):
+            return
+        if metadata.get("prebuilt") and metadata.get("prebuilt_priority_fee_lamports") != fees["priority_fee_lamports"]:
+            # Built ahead of time with another fee, so the quoted level is not what the transaction paid
+            return
+        self.fee_estimator.record_outcome(fees["fee_context"], fees["fee_level"], bool(result.get("success")))
+
+    @staticmethod
+    def _record_execution_details(metadata: Dict[str, Any], result: Dict) -> None:
+        """Send rounds / time-to-land, compute budget tuning and prebuilt fee of the swap, kept with the trade."""
+        for key in ("rebroadcast", "compute_budget"):
+            if result.get(key):
+                metadata[key] = result[key]
+        if result.get("prebuilt"):
+            metadata["prebuilt"] = True
+            metadata["prebuilt_priority_fee_lamports"] = result.get("priority_fee_lamports")
+
     async def _reward_user(
         self,
         user_id: int,
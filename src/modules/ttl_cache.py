@@ -0,0 +1,160 @@
+"""
+🗄️ BOUNDED TTL CACHE
+LRU + time-to-live cache for long-running in-process lookups
+
+FEATURES:
+- Maximum entry count with O(1) least-recently-used eviction
+- Per-cache TTL (entries expire lazily on access)
+- Hit / miss / eviction / expiration counters
+- Counters exported through BotMonitor.record_metric
+"""
+
+import logging
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+# Every live cache, so counters can be exported without wiring each owner to the monitor
+_registry: "weakref.WeakSet[TTLCache]" = weakref.WeakSet()
+
+
+class TTLCache:
+    """
+    Dict-like cache bounded by entry count and age.
+
+    Reads refresh an entry's LRU position but not its age, so a hot entry still
+    expires after `ttl_seconds`. Set `ttl_seconds=None` for a pure LRU cache.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        max_size: int = 10_000,
+        ttl_seconds: Optional[float] = 600.0,
+        monitor=None,
+    ):
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+
+        self.name = name
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.monitor = monitor
+
+        # key -> (stored_at, value), ordered least -> most recently used
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+        _registry.add(self)
+
+    def _expired(self, stored_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - stored_at >= self.ttl_seconds
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+
+        stored_at, value = entry
+        if self._expired(stored_at, time.monotonic()):
+            del self._data[key]
+            self.expirations += 1
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if key in self._data:
+            self._data.move_to_end(key)
+        self._data[key] = (time.monotonic(), value)
+
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def purge_expired(self) -> int:
+        """Drop every expired entry now. O(n); lookups already expire lazily."""
+        if self.ttl_seconds is None:
+            return 0
+
+        now = time.monotonic()
+        expired = [key for key, (stored_at, _) in self._data.items() if self._expired(stored_at, now)]
+        for key in expired:
+            del self._data[key]
+        self.expirations += len(expired)
+        return len(expired)
+
+    def __getitem__(self, key: Hashable) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self.set(key, value)
+
+    def __delitem__(self, key: Hashable) -> None:
+        del self._data[key]
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._data.get(key)
+        return entry is not None and not self._expired(entry[0], time.monotonic())
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(list(self._data))
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._data),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+    def export_metrics(self, monitor=None) -> None:
+        """Record cache counters as `cache.<name>.<counter>` samples."""
+        monitor = monitor or self.monitor
+        if not monitor:
+            return
+
+        for key, value in self.stats().items():
+            if key == 'max_size':
+                continue
+            monitor.record_metric(f'cache.{self.name}.{key}', value, tags={'cache': self.name})
+
+
+def export_cache_metrics(monitor) -> None:
+    """Export counters for every live TTLCache in the process."""
+    for cache in list(_registry):
+        try:
+            cache.export_metrics(monitor)
+        except Exception as e:
+            logger.debug(f"Failed to export metrics for cache {cache.name}: {e}")
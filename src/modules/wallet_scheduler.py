@@ -0,0 +1,219 @@
+"""
+⏱️ ADAPTIVE WALLET SCHEDULER
+Per-wallet poll cadence for the automated trader's wallet scan
+
+FEATURES:
+- Each wallet gets its own next-poll time (min-heap, lazy invalidation)
+- Wallets that just swapped drop to the minimum interval
+- Dormant wallets back off exponentially up to the maximum interval
+- High-score wallets (WalletMetrics.calculate_score) get a tighter ceiling
+- Global RPC budget (token bucket, requests per minute) caps every scan
+"""
+
+import heapq
+import itertools
+import logging
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WalletSchedule:
+    """Poll state for one wallet"""
+    next_due: float
+    interval: float
+    score: float = 0.0
+    polls: int = 0
+    last_swap_at: Optional[float] = None
+
+
+class AdaptiveWalletScheduler:
+    """
+    Decide which tracked wallets a scan should poll.
+
+    The scan calls `take_due()` (one budget token reserved per wallet), polls
+    those wallets, reports each result with `record_poll()` and charges any
+    extra RPC calls (transaction lookups) with `charge()`.
+    """
+
+    def __init__(
+        self,
+        *,
+        min_interval: float = 5.0,
+        max_interval: float = 600.0,
+        initial_interval: float = 30.0,
+        backoff: float = 2.0,
+        budget_per_minute: float = 1200.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.min_interval = min_interval
+        self.max_interval = max(max_interval, min_interval)
+        self.initial_interval = min(max(initial_interval, min_interval), self.max_interval)
+        self.backoff = backoff
+        self.budget_per_minute = budget_per_minute
+        self._clock = clock
+
+        self._wallets: Dict[str, WalletSchedule] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._sequence = itertools.count()
+
+        # Token bucket: refills budget_per_minute per minute, bursts up to one minute
+        self._tokens = budget_per_minute
+        self._tokens_updated = clock()
+
+    def __len__(self) -> int:
+        return len(self._wallets)
+
+    def __contains__(self, address: str) -> bool:
+        return address in self._wallets
+
+    # ------------------------------------------------------------------
+    # Wallet set
+    # ------------------------------------------------------------------
+
+    def sync(self, tracked_wallets: Dict[str, object]):
+        """Add newly tracked wallets (due immediately), drop removed ones, refresh scores."""
+        now = self._clock()
+
+        for address in list(self._wallets):
+            if address not in tracked_wallets:
+                # Heap entry is discarded lazily when it surfaces
+                del self._wallets[address]
+
+        for address, metrics in tracked_wallets.items():
+            score = self._score(metrics)
+            schedule = self._wallets.get(address)
+            if schedule is None:
+                self._wallets[address] = WalletSchedule(next_due=now, interval=self.initial_interval, score=score)
+                self._push(address, now)
+            else:
+                schedule.score = score
+
+    @staticmethod
+    def _score(metrics) -> float:
+        try:
+            return float(metrics.calculate_score())
+        except Exception:
+            return 0.0
+
+    def _push(self, address: str, due: float):
+        heapq.heappush(self._heap, (due, next(self._sequence), address))
+
+    # ------------------------------------------------------------------
+    # Budget
+    # ------------------------------------------------------------------
+
+    def _refill(self, now: float):
+        elapsed = max(now - self._tokens_updated, 0.0)
+        self._tokens = min(self.budget_per_minute, self._tokens + elapsed * self.budget_per_minute / 60.0)
+        self._tokens_updated = now
+
+    def charge(self, calls: int):
+        """Spend budget for RPC calls beyond the one reserved per polled wallet (may go into debt)."""
+        self._refill(self._clock())
+        self._tokens -= calls
+
+    @property
+    def budget_remaining(self) -> float:
+        self._refill(self._clock())
+        return self._tokens
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+
+    def take_due(self, limit: Optional[int] = None) -> List[str]:
+        """Pop due wallets, earliest first, reserving one budget token for each."""
+        now = self._clock()
+        self._refill(now)
+
+        due: List[str] = []
+        while self._heap and self._heap[0][0] <= now:
+            if limit is not None and len(due) >= limit:
+                break
+            if self._tokens < 1:
+                break
+
+            next_due, _, address = self._heap[0]
+            schedule = self._wallets.get(address)
+            if schedule is None or schedule.next_due != next_due:
+                heapq.heappop(self._heap)  # stale entry
+                continue
+
+            heapq.heappop(self._heap)
+            self._tokens -= 1
+            due.append(address)
+
+            # Provisional slot so a wallet whose poll never reports back is not lost
+            schedule.next_due = now + schedule.interval
+            self._push(address, schedule.next_due)
+
+        return due
+
+    def record_poll(self, address: str, new_signatures: int = 0, swaps: int = 0):
+        """Reschedule a wallet after it was polled."""
+        schedule = self._wallets.get(address)
+        if schedule is None:
+            return
+
+        now = self._clock()
+        schedule.polls += 1
+
+        if swaps:
+            schedule.last_swap_at = now
+            interval = self.min_interval
+        elif new_signatures:
+            # Active but no buy: poll a little faster than last time
+            interval = schedule.interval / self.backoff
+        else:
+            interval = schedule.interval * self.backoff
+
+        schedule.interval = min(max(interval, self.min_interval), self._ceiling(schedule.score))
+        schedule.next_due = now + schedule.interval
+        self._push(address, schedule.next_due)
+
+    def mark_hot(self, address: str):
+        """Wallet swapped (seen outside the poll, e.g. on the websocket): poll it soon."""
+        schedule = self._wallets.get(address)
+        if schedule is None:
+            return
+
+        now = self._clock()
+        schedule.last_swap_at = now
+        schedule.interval = self.min_interval
+        next_due = now + self.min_interval
+        if next_due < schedule.next_due:
+            schedule.next_due = next_due
+            self._push(address, next_due)
+
+    def _ceiling(self, score: float) -> float:
+        """Score 0 backs off to max_interval; score 100 tops out at a quarter of it."""
+        fraction = 1.0 - 0.75 * min(max(score, 0.0), 100.0) / 100.0
+        return max(self.min_interval, self.max_interval * fraction)
+
+    def seconds_until_next_due(self) -> Optional[float]:
+        now = self._clock()
+        while self._heap:
+            next_due, _, address = self._heap[0]
+            schedule = self._wallets.get(address)
+            if schedule is None or schedule.next_due != next_due:
+                heapq.heappop(self._heap)
+                continue
+            return max(next_due - now, 0.0)
+        return None
+
+    def stats(self) -> Dict[str, float]:
+        now = self._clock()
+        intervals = [schedule.interval for schedule in self._wallets.values()]
+        return {
+            'wallets': len(self._wallets),
+            'due': sum(1 for schedule in self._wallets.values() if schedule.next_due <= now),
+            'hot': sum(1 for interval in intervals if interval <= self.min_interval),
+            'avg_interval_seconds': sum(intervals) / len(intervals) if intervals else 0.0,
+            'budget_remaining': self.budget_remaining,
+            # Expected steady-state poll rate at current intervals
+            'polls_per_minute': sum(60.0 / interval for interval in intervals) if intervals else 0.0,
+        }
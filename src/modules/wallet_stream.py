@@ -0,0 +1,232 @@
+"""
+📡 WALLET ACTIVITY STREAM
+Push-based feed of tracked wallet signatures over the Solana RPC websocket
+
+FEATURES:
+- One logsSubscribe subscription per tracked wallet
+- Signatures delivered to a callback as soon as the RPC node sees them
+- Failed transactions filtered before they reach swap detection
+- Automatic reconnect and re-subscribe on disconnect
+"""
+
+import asyncio
+import json
+import logging
+import os
+from typing import Awaitable, Callable, Dict, Iterable, Optional, Set
+
+import websockets
+
+logger = logging.getLogger(__name__)
+
+
+SignatureCallback = Callable[[str, str, Optional[int]], Awaitable[None]]
+
+
+def resolve_ws_url(rpc_url: Optional[str] = None) -> Optional[str]:
+    """Return the websocket endpoint from SOLANA_WS_URL or derive it from the RPC URL."""
+    ws_url = os.getenv('SOLANA_WS_URL', '').strip()
+    if ws_url:
+        return ws_url
+
+    if not rpc_url:
+        return None
+    if rpc_url.startswith('https://'):
+        return 'wss://' + rpc_url[len('https://'):]
+    if rpc_url.startswith('http://'):
+        return 'ws://' + rpc_url[len('http://'):]
+    return None
+
+
+class WalletActivityStream:
+    """
+    Subscribe to log notifications for tracked wallets and forward new signatures.
+
+    The stream only discovers signatures; swap detection and signal scoring stay in
+    AutomatedTradingEngine so streamed and polled activity share the same logic.
+    """
+
+    def __init__(
+        self,
+        ws_url: str,
+        on_signature: SignatureCallback,
+        *,
+        commitment: str = 'confirmed',
+        reconnect_delay: float = 5.0,
+        ping_interval: Optional[float] = 30,
+    ):
+        self.ws_url = ws_url
+        self.on_signature = on_signature
+        self.commitment = commitment
+        self.reconnect_delay = reconnect_delay
+        self.ping_interval = ping_interval
+
+        self.addresses: Set[str] = set()
+        self.running = False
+        self.connected = asyncio.Event()
+
+        self._websocket = None
+        self._task: Optional[asyncio.Task] = None
+        self._next_request_id = 1
+        self._pending_requests: Dict[int, str] = {}
+        self._subscriptions: Dict[int, str] = {}
+        self._address_subscriptions: Dict[str, int] = {}
+        self._callback_tasks: Set[asyncio.Task] = set()
+
+        self.notifications_received = 0
+
+    async def start(self, addresses: Iterable[str]):
+        """Start streaming activity for the given wallet addresses."""
+        self.addresses = set(addresses)
+        if self.running:
+            return
+
+        self.running = True
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"📡 Wallet activity stream started for {len(self.addresses)} wallets")
+
+    async def stop(self):
+        """Stop streaming and close the websocket."""
+        self.running = False
+        self.connected.clear()
+
+        if self._websocket is not None:
+            try:
+                await self._websocket.close()
+            except Exception:
+                pass
+
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._task = None
+
+        logger.info("📡 Wallet activity stream stopped")
+
+    async def update_addresses(self, addresses: Iterable[str]):
+        """Subscribe newly tracked wallets and unsubscribe removed ones."""
+        wanted = set(addresses)
+        added = wanted - self.addresses
+        removed = self.addresses - wanted
+        self.addresses = wanted
+
+        if self._websocket is None or not self.connected.is_set():
+            return
+
+        for address in added:
+            await self._subscribe(address)
+
+        for address in removed:
+            subscription_id = self._address_subscriptions.pop(address, None)
+            if subscription_id is None:
+                continue
+            self._subscriptions.pop(subscription_id, None)
+            await self._send('logsUnsubscribe', [subscription_id])
+
+    @property
+    def subscription_count(self) -> int:
+        return len(self._subscriptions)
+
+    async def _run(self):
+        while self.running:
+            try:
+                async with websockets.connect(self.ws_url, ping_interval=self.ping_interval) as websocket:
+                    self._websocket = websocket
+                    self._reset_subscriptions()
+
+                    for address in list(self.addresses):
+                        await self._subscribe(address)
+
+                    self.connected.set()
+                    logger.info(f"✅ Wallet stream connected ({len(self.addresses)} subscriptions requested)")
+
+                    async for message in websocket:
+                        await self._handle_message(message)
+
+            except asyncio.CancelledError:
+                raise
+            except websockets.exceptions.WebSocketException as e:
+                logger.warning(f"⚠️ Wallet stream disconnected: {e}")
+            except Exception as e:
+                logger.error(f"Wallet stream error: {e}")
+            finally:
+                self._websocket = None
+                self.connected.clear()
+
+            if self.running:
+                await asyncio.sleep(self.reconnect_delay)
+
+    def _reset_subscriptions(self):
+        self._pending_requests.clear()
+        self._subscriptions.clear()
+        self._address_subscriptions.clear()
+
+    async def _subscribe(self, address: str):
+        request_id = await self._send(
+            'logsSubscribe',
+            [{'mentions': [address]}, {'commitment': self.commitment}],
+        )
+        self._pending_requests[request_id] = address
+
+    async def _send(self, method: str, params) -> int:
+        request_id = self._next_request_id
+        self._next_request_id += 1
+        await self._websocket.send(json.dumps({
+            'jsonrpc': '2.0',
+            'id': request_id,
+            'method': method,
+            'params': params,
+        }))
+        return request_id
+
+    async def _handle_message(self, message):
+        try:
+            data = json.loads(message)
+        except json.JSONDecodeError:
+            logger.debug(f"Non-JSON wallet stream message: {message}")
+            return
+
+        # Subscription confirmation: {"id": n, "result": subscription_id}
+        if 'id' in data and data.get('id') in self._pending_requests:
+            address = self._pending_requests.pop(data['id'])
+            subscription_id = data.get('result')
+            if isinstance(subscription_id, int):
+                self._subscriptions[subscription_id] = address
+                self._address_subscriptions[address] = subscription_id
+            else:
+                logger.debug(f"Subscription failed for {address[:8]}: {data.get('error')}")
+            return
+
+        if data.get('method') != 'logsNotification':
+            return
+
+        params = data.get('params') or {}
+        address = self._subscriptions.get(params.get('subscription'))
+        if not address:
+            return
+
+        result = params.get('result') or {}
+        value = result.get('value') or {}
+        signature = value.get('signature')
+
+        # Failed transactions can never be copy signals
+        if not signature or value.get('err') is not None:
+            return
+
+        self.notifications_received += 1
+        slot = (result.get('context') or {}).get('slot')
+
+        # Dispatch without blocking the read loop so a slow transaction parse
+        # never delays the next notification.
+        task = asyncio.create_task(self._dispatch(address, signature, slot))
+        self._callback_tasks.add(task)
+        task.add_done_callback(self._callback_tasks.discard)
+
+    async def _dispatch(self, address: str, signature: str, slot: Optional[int]):
+        try:
+            await self.on_signature(address, signature, slot)
+        except Exception as e:
+            logger.error(f"Wallet stream callback error: {e}")
@@ -18,6 +18,9 @@ from .database import (
     DatabaseManager, Trade, Position, TrackedWallet, 
     UserWallet, UserSettings, SnipeRun
 )
+from .http_pool import get_http_registry
+from .latency_trace import STAGES, TOTAL, get_latency_tracker
+from ..ops import broadcast
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +60,7 @@ class WebAPIServer:
         self.launch_predictor = None
         self.prediction_markets = None
         self.trade_executor = None  # For executing trades from web dashboard
+        self.price_service = None  # Shared tick store for live position prices
         
         self._setup_routes()
         self._setup_cors()
@@ -68,7 +72,8 @@ class WebAPIServer:
         flash_loan_engine=None,
         launch_predictor=None,
         prediction_markets=None,
-        trade_executor=None
+        trade_executor=None,
+        price_service=None
     ):
         """Inject module instances for API to use"""
         self.monitoring = monitoring
@@ -77,6 +82,7 @@ class WebAPIServer:
         self.launch_predictor = launch_predictor
         self.prediction_markets = prediction_markets
         self.trade_executor = trade_executor
+        self.price_service = price_service
     
     def _setup_routes(self):
         """Setup all API routes"""
@@ -127,6 +133,9 @@ class WebAPIServer:
         self.app.router.add_put('/api/v1/admin/config', self.update_config)
         self.app.router.add_get('/api/v1/admin/logs', self.get_logs)
         self.app.router.add_get('/api/v1/admin/logs/export', self.export_logs)
+        self.app.router.add_get('/api/v1/admin/latency', self.get_latency_breakdown)
+        self.app.router.add_get('/api/v1/admin/http', self.get_http_pool_stats)
+        self.app.router.add_get('/api/v1/admin/broadcast', self.get_broadcast_stats)
         
         # Prediction phase
         self.app.router.add_get('/api/v1/predictions/stats', self.get_prediction_stats)
@@ -1041,6 +1050,39 @@ class WebAPIServer:
         ]
         return web.json_response(logs)
     
+    async def get_latency_breakdown(self, request: web.Request) -> web.Response:
+        """Copy-trade signal path latency: p50/p95/p99 seconds per stage (admin only)"""
+        tracker = get_latency_tracker()
+        breakdown = tracker.breakdown()
+
+        # Stage order follows the trade: discovery first, end-to-end total last
+        stages = [
+            {'stage': stage, **breakdown[stage]}
+            for stage in STAGES[1:] + (TOTAL,)
+        ]
+        return web.json_response({
+            'traces': tracker.traces,
+            'window': tracker.window,
+            'stages': stages,
+        })
+
+    async def get_http_pool_stats(self, request: web.Request) -> web.Response:
+        """Shared outbound HTTP pool: limits plus per-host counters and latency (admin only)"""
+        registry = get_http_registry()
+        return web.json_response({
+            'limit': registry.limit,
+            'limit_per_host': registry.limit_per_host,
+            'hosts': registry.host_stats(),
+        })
+
+    async def get_broadcast_stats(self, request: web.Request) -> web.Response:
+        """Landing latency per broadcast policy plus race endpoint health (admin only)"""
+        return web.json_response({
+            'policies': {context: broadcast.policy_for(context) for context in broadcast.DEFAULT_CONTEXT_POLICIES},
+            'landing_seconds': broadcast.landing_stats(),
+            'race_endpoints': broadcast.get_race_engine().stats(),
+        })
+
     async def export_logs(self, request: web.Request) -> web.Response:
         """Export logs as file"""
         # TODO: Implement log export
@@ -1412,6 +1454,11 @@ class WebAPIServer:
             
             positions = await self.database.get_open_positions(user_id)
             
+            # One batched lookup for every open position (store hits are free)
+            prices = {}
+            if self.price_service and positions:
+                prices = await self.price_service.get_prices({pos.token_mint for pos in positions})
+            
             positions_data = []
             for pos in positions:
                 positions_data.append({
@@ -1427,7 +1474,8 @@ class WebAPIServer:
                     'remaining_amount_tokens': round(pos.remaining_amount_tokens, 4),
                     'realized_pnl_sol': round(pos.realized_pnl_sol, 4),
                     'is_open': pos.is_open,
-                    'source': pos.source
+                    'source': pos.source,
+                    'current_price_usd': prices.get(pos.token_mint)
                 })
             
             return web.json_response(positions_data)
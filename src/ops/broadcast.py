@@ -1,15 +1,94 @@
-"""Centralized Solana broadcast guardrails."""
+"""Centralized Solana broadcast guardrails and execution policies.
+
+Policies:
+- ``single``: one ``sendTransaction`` through the caller's RPC client, preflight on
+- ``race``: the signed transaction is raced across the best-scoring RPC endpoints
+  of a shared FastExecutionEngine (preflight off)
+- ``bundle_race``: ``race`` plus a Jito bundle submitted in parallel
+
+Every policy goes through the same production guardrails first, and so does
+``rebroadcast``, which re-sends an already broadcast transaction (preflight off)
+to the endpoints of its policy until the Rebroadcaster sees it land or expire.
+"""
 
 import logging
 import os
-from typing import Any, Dict, Optional
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple
 
 from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Confirmed
+from solana.rpc.types import TxOpts
+from solders.transaction import VersionedTransaction
 
 from src.config import IS_PROD
+from src.modules.fast_execution import FastExecutionEngine, submit_signed_tx_fast
 
 logger = logging.getLogger(__name__)
 
+SINGLE = "single"
+RACE = "race"
+BUNDLE_RACE = "bundle_race"
+POLICIES = (SINGLE, RACE, BUNDLE_RACE)
+
+# Fee/trade context -> policy (see fee_estimator.fee_context), overridable per context
+DEFAULT_CONTEXT_POLICIES = {
+    "sniper": BUNDLE_RACE,
+    "copy_trade": RACE,
+    "exit": RACE,
+    "manual": SINGLE,
+}
+
+JitoSubmitter = Callable[[bytes], Awaitable[Optional[Dict[str, Any]]]]
+
+_race_engine: Optional[FastExecutionEngine] = None
+# policy -> (broadcast -> confirmed seconds, send rounds) of landed transactions
+_landing: Dict[str, Deque[Tuple[float, int]]] = {policy: deque(maxlen=1000) for policy in POLICIES}
+
+
+def policy_for(context: str) -> str:
+    """Execution policy for a fee context, from BROADCAST_POLICY_<CONTEXT> or the defaults."""
+    default = DEFAULT_CONTEXT_POLICIES.get(context, SINGLE)
+    policy = os.getenv(f"BROADCAST_POLICY_{context.upper()}", default).strip().lower()
+    if policy not in POLICIES:
+        logger.warning("Unknown broadcast policy %r for %s, using %s", policy, context, default)
+        return default
+    return policy
+
+
+def get_race_engine(rpc_client: Optional[AsyncClient] = None) -> FastExecutionEngine:
+    """The shared engine racing SOLANA_RPC_URL plus BROADCAST_RACE_RPC_URLS."""
+    global _race_engine
+    if _race_engine is None:
+        primary = os.getenv("SOLANA_RPC_URL", "")
+        if not primary and rpc_client is not None:
+            primary = rpc_client._provider.endpoint_uri
+        fallbacks = [url.strip() for url in os.getenv("BROADCAST_RACE_RPC_URLS", "").split(",") if url.strip()]
+        _race_engine = FastExecutionEngine(
+            primary,
+            [url for url in fallbacks if url != primary],
+            failure_threshold=int(os.getenv("BROADCAST_RACE_FAILURE_THRESHOLD", "3")),
+            cooldown=float(os.getenv("BROADCAST_RACE_COOLDOWN_SECONDS", "10")),
+            ping_interval=float(os.getenv("BROADCAST_RACE_PING_SECONDS", "5")),
+        )
+    return _race_engine
+
+
+def set_race_engine(engine: Optional[FastExecutionEngine]) -> None:
+    global _race_engine
+    _race_engine = engine
+
+
+def _check_guardrails(confirm_token: Optional[str]) -> None:
+    allow_broadcast = os.getenv("ALLOW_BROADCAST", "false").strip().lower() in {"1", "true", "yes", "on"}
+    expected_token = os.getenv("CONFIRM_TOKEN")
+
+    if IS_PROD:
+        if not allow_broadcast:
+            raise RuntimeError("Broadcast denied: ALLOW_BROADCAST is not enabled in production.")
+        if not (confirm_token and expected_token and confirm_token == expected_token):
+            raise RuntimeError("Broadcast denied: missing or invalid confirm_token.")
+
 
 async def send(
     rpc_client: AsyncClient,
@@ -17,34 +96,106 @@ async def send(
     *,
     context: Optional[Dict[str, Any]] = None,
     confirm_token: Optional[str] = None,
+    policy: str = SINGLE,
+    jito_submit_fn: Optional[JitoSubmitter] = None,
 ) -> str:
-    """Broadcast a transaction with production guardrails."""
+    """Broadcast a transaction with production guardrails, using the given execution policy."""
     context = context or {}
-    allow_broadcast = os.getenv("ALLOW_BROADCAST", "false").strip().lower() in {"1", "true", "yes", "on"}
-    expected_token = os.getenv("CONFIRM_TOKEN")
+    _check_guardrails(confirm_token)
 
-    if IS_PROD:
-        if not allow_broadcast:
-            raise RuntimeError("Broadcast denied: ALLOW_BROADCAST is not enabled in production.")
-        if not (confirm_token and expected_token and confirm_token == expected_token):
-            raise RuntimeError("Broadcast denied: missing or invalid confirm_token.")
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown broadcast policy: {policy}")
+    if policy == BUNDLE_RACE and jito_submit_fn is None:
+        logger.warning("bundle_race without a Jito submitter, racing RPCs only")
+        policy = RACE
 
     logger.info(
         "Submitting transaction",
         extra={
             "details": {
                 "context": context,
+                "policy": policy,
                 "tx_size": len(tx_bytes),
             }
         },
     )
-    result = await rpc_client.send_raw_transaction(
-        tx_bytes,
-        opts={"skip_preflight": False, "preflight_commitment": "confirmed"},
-    )
-    signature = str(result.value)
+
+    if policy == SINGLE:
+        result = await rpc_client.send_raw_transaction(
+            tx_bytes,
+            opts=TxOpts(skip_preflight=False, preflight_commitment=Confirmed),
+        )
+        signature = str(result.value)
+    else:
+        engine = get_race_engine(rpc_client)
+        outcome = await submit_signed_tx_fast(
+            tx_bytes,
+            engine.get_fastest_rpcs(n=3),
+            jito_submit_fn=jito_submit_fn if policy == BUNDLE_RACE else None,
+            timeout_ms_on_all=int(os.getenv("BROADCAST_RACE_TIMEOUT_MS", "1200")),
+            on_result=engine.on_send_result,
+        )
+        if not outcome.success:
+            raise RuntimeError(f"Broadcast failed ({policy}): {outcome.reason or 'no endpoint accepted'}")
+        # Every path carries the same signed transaction, so its signature is known up front
+        signature = str(VersionedTransaction.from_bytes(tx_bytes).signatures[0])
+        context = {**context, "winner": (outcome.winner or {}).get("rpc", "jito")}
+
     logger.info(
         "Transaction broadcast complete",
-        extra={"details": {"signature": signature, "context": context}},
+        extra={"details": {"signature": signature, "context": context, "policy": policy}},
     )
     return signature
+
+
+async def rebroadcast(
+    rpc_client: AsyncClient,
+    tx_bytes: bytes,
+    *,
+    confirm_token: Optional[str] = None,
+    policy: str = SINGLE,
+) -> bool:
+    """Re-send an already broadcast transaction to its policy's endpoints; True if any accepted it."""
+    _check_guardrails(confirm_token)
+
+    if policy == SINGLE:
+        endpoints, on_result = [rpc_client._provider.endpoint_uri], None
+    else:
+        # The Jito leg of bundle_race is not repeated: its bundle already carries the tip
+        engine = get_race_engine(rpc_client)
+        endpoints, on_result = engine.get_fastest_rpcs(n=3), engine.on_send_result
+    outcome = await submit_signed_tx_fast(
+        tx_bytes,
+        endpoints,
+        timeout_ms_on_all=int(os.getenv("BROADCAST_RACE_TIMEOUT_MS", "1200")),
+        on_result=on_result,
+    )
+    return outcome.success
+
+
+def record_landing(policy: str, seconds: float, sends: int = 1) -> None:
+    """Broadcast -> confirmed time, and send rounds needed, of a transaction sent with `policy`."""
+    if policy in _landing:
+        _landing[policy].append((seconds, sends))
+
+
+def _percentile(ordered, pct: float):
+    return ordered[min(len(ordered) - 1, int(pct / 100 * len(ordered)))]
+
+
+def landing_stats() -> Dict[str, Dict[str, float]]:
+    """Rolling landing latency (seconds) and send rounds per policy."""
+    stats = {}
+    for policy, samples in _landing.items():
+        if not samples:
+            continue
+        seconds = sorted(sample[0] for sample in samples)
+        sends = sorted(sample[1] for sample in samples)
+        stats[policy] = {
+            "count": len(seconds),
+            "p50": _percentile(seconds, 50),
+            "p99": _percentile(seconds, 99),
+            "sends_p50": _percentile(sends, 50),
+            "sends_max": sends[-1],
+        }
+    return stats
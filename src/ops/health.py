@@ -12,6 +12,7 @@ from solana.rpc.async_api import AsyncClient
 
 from src.config import Config, get_config
 from src.modules.database import DatabaseManager
+from src.modules.http_pool import get_http_session
 
 HealthResult = Dict[str, Tuple[bool, str]]
 
@@ -68,12 +69,11 @@ async def _check_telegram(config: Config) -> Tuple[bool, str]:
     url = f"https://api.telegram.org/bot{token}/getMe"
     timeout = aiohttp.ClientTimeout(total=5)
     try:
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.get(url) as resp:
-                data = await resp.json()
-                if resp.status == 200 and data.get("ok"):
-                    return True, "telegram ok"
-                return False, "telegram rejected credentials"
+        async with get_http_session().get(url, timeout=timeout) as resp:
+            data = await resp.json()
+            if resp.status == 200 and data.get("ok"):
+                return True, "telegram ok"
+            return False, "telegram rejected credentials"
     except Exception as exc:  # pragma: no cover - protective
         return False, f"telegram error: {exc.__class__.__name__}"
 
@@ -0,0 +1,528 @@
+"""
+🧪 LOCAL EXECUTION STAND-IN
+Jupiter, Solana JSON-RPC and Jito on localhost, no network required
+
+FEATURES:
+- Jupiter /quote, /swap and /price with deterministic per-mint prices; /swap
+  transactions carry compute budget instructions like Jupiter's (1.4M limit,
+  price from prioritizationFeeLamports)
+- Solana JSON-RPC (single and batch) for the methods the bot uses:
+  getLatestBlockhash, sendTransaction, getSignatureStatuses, getBalance,
+  getHealth, getSlot, getBlockHeight, simulateTransaction, getRecentPrioritizationFees, ...
+- Jito sendBundle / getInflightBundleStatuses / getBundleStatuses and tip_floor
+- Per-endpoint latency (median + jitter) and error-rate profiles
+- Transactions land after a configurable delay, can be dropped, and expire with
+  their blockhash (150 blocks), like mainnet
+- Counters per endpoint for benchmarks and tests
+
+Usage:
+    python -m src.ops.standin --port 8899 --profile "quote=120:30,swap=150:40:0.01,rpc=40:10"
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import logging
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from aiohttp import web
+from solders.compute_budget import set_compute_unit_limit, set_compute_unit_price
+from solders.hash import Hash
+from solders.message import MessageV0
+from solders.pubkey import Pubkey
+from solders.signature import Signature
+from solders.system_program import TransferParams, transfer
+from solders.transaction import VersionedTransaction
+
+logger = logging.getLogger(__name__)
+
+SOL_MINT = "So11111111111111111111111111111111111111112"
+SOL_USD = 150.0
+TOKEN_DECIMALS = 6
+SLOT_SECONDS = 0.4
+BLOCKHASH_VALID_BLOCKS = 150
+SWAP_COMPUTE_UNIT_LIMIT = 1_400_000
+
+# Destination of the dummy instruction that makes every /swap transaction unique
+_SWAP_SINK = Pubkey.from_string("JUP6LkbZbjS1jKKwapdHNy74zcZ3tLUZoi5QNyVTaV4")
+
+
+@dataclass
+class EndpointProfile:
+    """Latency (normal around the median, floored at zero) and injected error rate."""
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+
+    def sample_latency(self, rng: random.Random) -> float:
+        if self.jitter_ms:
+            return max(0.0, rng.gauss(self.latency_ms, self.jitter_ms)) / 1000
+        return self.latency_ms / 1000
+
+
+ENDPOINTS = ("quote", "swap", "price", "rpc", "jito")
+
+
+@dataclass
+class StandinConfig:
+    profiles: Dict[str, EndpointProfile] = field(default_factory=dict)
+    land_ms: float = 400.0            # sendTransaction -> confirmed
+    drop_rate: float = 0.0            # share of sends that never land
+    bundle_land_rate: float = 1.0     # share of bundles that land (the rest fail)
+    balance_lamports: int = 100 * 10**9
+    compute_units: int = 120_000      # unitsConsumed reported by simulateTransaction
+    seed: Optional[int] = None
+
+    def profile(self, endpoint: str) -> EndpointProfile:
+        return self.profiles.get(endpoint) or EndpointProfile()
+
+
+def parse_profiles(spec: str) -> Dict[str, EndpointProfile]:
+    """"quote=120:30,swap=150:40:0.01" -> {endpoint: EndpointProfile(median, jitter, error_rate)}"""
+    profiles = {}
+    for entry in filter(None, (part.strip() for part in spec.split(','))):
+        name, _, values = entry.partition('=')
+        if name not in ENDPOINTS:
+            raise ValueError(f"unknown endpoint {name!r} (expected one of {', '.join(ENDPOINTS)})")
+        numbers = [float(value) for value in values.split(':') if value]
+        profiles[name] = EndpointProfile(*numbers)
+    return profiles
+
+
+@dataclass
+class _SentTransaction:
+    lands_at: Optional[float]          # None = dropped
+    slot: int = 0
+
+
+class StandinServer:
+    """aiohttp server standing in for Jupiter, a Solana RPC node and the Jito block engine."""
+
+    def __init__(self, config: Optional[StandinConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or StandinConfig()
+        self.host = host
+        self.port = port
+        self.rng = random.Random(self.config.seed)
+
+        self.requests: Counter = Counter()
+        self.errors: Counter = Counter()
+        self.rpc_methods: Counter = Counter()
+        self.sends = 0
+        self.dropped = 0
+        self.expired = 0
+
+        self._transactions: Dict[str, _SentTransaction] = {}
+        self._bundles: Dict[str, Dict[str, Any]] = {}
+        self._blockhashes: Dict[str, int] = {}          # blockhash -> block height issued at
+        self._swap_counter = 0
+        self._started = time.monotonic()
+        self._runner: Optional[web.AppRunner] = None
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def create_app(self) -> web.Application:
+        app = web.Application(middlewares=[self._profile_middleware])
+        app.router.add_get("/quote", self._quote)
+        app.router.add_post("/swap", self._swap)
+        app.router.add_get("/price", self._price)
+        app.router.add_post("/rpc", self._rpc)
+        app.router.add_post("/api/v1/bundles", self._jito)
+        app.router.add_get("/api/v1/bundles/tip_floor", self._tip_floor)
+        return app
+
+    async def start(self) -> "StandinServer":
+        self._runner = web.AppRunner(self.create_app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        logger.info(f"🧪 Stand-in listening on {self.base_url}")
+        return self
+
+    async def stop(self):
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc):
+        await self.stop()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def rpc_url(self) -> str:
+        return f"{self.base_url}/rpc"
+
+    @property
+    def jito_bundles_url(self) -> str:
+        return f"{self.base_url}/api/v1/bundles"
+
+    @property
+    def tip_floor_url(self) -> str:
+        return f"{self.base_url}/api/v1/bundles/tip_floor"
+
+    def env(self) -> Dict[str, str]:
+        """Environment that points JupiterClient and friends at this stand-in."""
+        return {
+            "SOLANA_RPC_URL": self.rpc_url,
+            "JUPITER_API_URL": self.base_url,
+            "JUPITER_PRICE_API_V4_URL": self.base_url,
+            "JITO_BUNDLES_URL": self.jito_bundles_url,
+            "JITO_TIP_FLOOR_URL": self.tip_floor_url,
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "requests": dict(self.requests),
+            "errors": dict(self.errors),
+            "rpc_methods": dict(self.rpc_methods),
+            "sends": self.sends,
+            "dropped": self.dropped,
+            "expired": self.expired,
+            "landed": sum(1 for tx in self._transactions.values() if tx.lands_at and tx.lands_at <= time.monotonic()),
+            "bundles": len(self._bundles),
+        }
+
+    # ------------------------------------------------------------------
+    # Chain clock
+    # ------------------------------------------------------------------
+
+    @property
+    def slot(self) -> int:
+        return 300_000_000 + int((time.monotonic() - self._started) / SLOT_SECONDS)
+
+    @property
+    def block_height(self) -> int:
+        return self.slot - 20_000_000
+
+    def _blockhash(self) -> str:
+        height = self.block_height
+        blockhash = str(Hash(hashlib.sha256(f"standin-{height}".encode()).digest()))
+        self._blockhashes.setdefault(blockhash, height)
+        return blockhash
+
+    # ------------------------------------------------------------------
+    # Profiles
+    # ------------------------------------------------------------------
+
+    @web.middleware
+    async def _profile_middleware(self, request: web.Request, handler):
+        endpoint = self._endpoint_for(request.path)
+        self.requests[endpoint] += 1
+        profile = self.config.profile(endpoint)
+        await asyncio.sleep(profile.sample_latency(self.rng))
+        if profile.error_rate and self.rng.random() < profile.error_rate:
+            self.errors[endpoint] += 1
+            if endpoint in ("rpc", "jito"):
+                # Shaped like an overloaded node so solana-py parses it into an error
+                error = {"code": -32005, "message": "Node is unhealthy", "data": {"numSlotsBehind": None}}
+                return web.json_response({"jsonrpc": "2.0", "id": None, "error": error}, status=503)
+            return web.json_response({"error": "injected failure"}, status=503)
+        return await handler(request)
+
+    @staticmethod
+    def _endpoint_for(path: str) -> str:
+        if path.startswith("/api/v1/bundles"):
+            return "jito"
+        return {"/quote": "quote", "/swap": "swap", "/price": "price"}.get(path, "rpc")
+
+    # ------------------------------------------------------------------
+    # Jupiter
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def token_price_sol(mint: str) -> float:
+        """Deterministic price per whole token in SOL."""
+        if mint == SOL_MINT:
+            return 1.0
+        bucket = int(hashlib.sha256(mint.encode()).hexdigest()[:8], 16) % 100
+        return 1e-5 * (1 + bucket)
+
+    async def _quote(self, request: web.Request) -> web.Response:
+        query = request.query
+        input_mint, output_mint = query["inputMint"], query["outputMint"]
+        amount = int(query["amount"])
+        slippage_bps = int(query.get("slippageBps", 50))
+
+        if input_mint == SOL_MINT:
+            out_amount = int(amount / 1e9 / self.token_price_sol(output_mint) * 10**TOKEN_DECIMALS)
+        else:
+            out_amount = int(amount / 10**TOKEN_DECIMALS * self.token_price_sol(input_mint) * 1e9)
+
+        return web.json_response({
+            "inputMint": input_mint,
+            "outputMint": output_mint,
+            "inAmount": str(amount),
+            "outAmount": str(out_amount),
+            "otherAmountThreshold": str(out_amount * (10_000 - slippage_bps) // 10_000),
+            "swapMode": query.get("swapMode", "ExactIn"),
+            "slippageBps": slippage_bps,
+            "priceImpactPct": "0.001",
+            "routePlan": [{
+                "swapInfo": {
+                    "ammKey": str(_SWAP_SINK),
+                    "label": "Stand-in",
+                    "inputMint": input_mint,
+                    "outputMint": output_mint,
+                    "inAmount": str(amount),
+                    "outAmount": str(out_amount),
+                },
+                "percent": 100,
+            }],
+            "contextSlot": self.slot,
+            "timeTaken": 0.001,
+        })
+
+    async def _swap(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        payer = Pubkey.from_string(body["userPublicKey"])
+        self._swap_counter += 1
+        # A unique transfer amount keeps every transaction's signature distinct
+        instruction = transfer(TransferParams(from_pubkey=payer, to_pubkey=_SWAP_SINK, lamports=self._swap_counter))
+        fee = int(body.get("prioritizationFeeLamports") or 0)
+        budget = [
+            set_compute_unit_limit(SWAP_COMPUTE_UNIT_LIMIT),
+            set_compute_unit_price(fee * 1_000_000 // SWAP_COMPUTE_UNIT_LIMIT),
+        ]
+        message = MessageV0.try_compile(payer, [*budget, instruction], [], Hash.from_string(self._blockhash()))
+        unsigned = VersionedTransaction.populate(message, [Signature.default()])
+        return web.json_response({
+            "swapTransaction": base64.b64encode(bytes(unsigned)).decode(),
+            "lastValidBlockHeight": self.block_height + BLOCKHASH_VALID_BLOCKS,
+            "prioritizationFeeLamports": body.get("prioritizationFeeLamports", 0),
+        })
+
+    async def _price(self, request: web.Request) -> web.Response:
+        ids = [mint for mint in request.query.get("ids", "").split(",") if mint]
+        return web.json_response({
+            "data": {mint: {"id": mint, "price": self.token_price_sol(mint) * SOL_USD} for mint in ids}
+        })
+
+    # ------------------------------------------------------------------
+    # Solana JSON-RPC
+    # ------------------------------------------------------------------
+
+    async def _rpc(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        if isinstance(body, list):
+            return web.json_response([self._rpc_call(call) for call in body])
+        return web.json_response(self._rpc_call(body))
+
+    def _rpc_call(self, call: Dict[str, Any]) -> Dict[str, Any]:
+        method = call.get("method", "")
+        params = call.get("params") or []
+        self.rpc_methods[method] += 1
+        handler = getattr(self, f"_rpc_{method}", None)
+        if handler is None:
+            return {"jsonrpc": "2.0", "id": call.get("id"), "error": {"code": -32601, "message": "Method not found"}}
+        try:
+            return {"jsonrpc": "2.0", "id": call.get("id"), "result": handler(params)}
+        except _RpcError as e:
+            return {"jsonrpc": "2.0", "id": call.get("id"), "error": e.as_error()}
+
+    def _context(self, value: Any) -> Dict[str, Any]:
+        return {"context": {"slot": self.slot}, "value": value}
+
+    def _rpc_getHealth(self, params):
+        return "ok"
+
+    def _rpc_getSlot(self, params):
+        return self.slot
+
+    def _rpc_getBlockHeight(self, params):
+        return self.block_height
+
+    def _rpc_getLatestBlockhash(self, params):
+        return self._context({
+            "blockhash": self._blockhash(),
+            "lastValidBlockHeight": self.block_height + BLOCKHASH_VALID_BLOCKS,
+        })
+
+    def _rpc_isBlockhashValid(self, params):
+        issued = self._blockhashes.get(params[0])
+        return self._context(issued is not None and self.block_height <= issued + BLOCKHASH_VALID_BLOCKS)
+
+    def _rpc_getBalance(self, params):
+        return self._context(self.config.balance_lamports)
+
+    def _rpc_getAccountInfo(self, params):
+        return self._context(None)
+
+    def _rpc_getRecentPrioritizationFees(self, params):
+        slot = self.slot
+        return [
+            {"slot": slot - offset, "prioritizationFee": 1_000 * (1 + (slot - offset) % 50)}
+            for offset in range(150)
+        ]
+
+    def _rpc_simulateTransaction(self, params):
+        return self._context({
+            "err": None,
+            "logs": [],
+            "accounts": None,
+            "unitsConsumed": self.config.compute_units,
+            "returnData": None,
+        })
+
+    def _rpc_sendTransaction(self, params):
+        encoding = (params[1] if len(params) > 1 and isinstance(params[1], dict) else {}).get("encoding", "base58")
+        if encoding != "base64":
+            raise _RpcError(-32602, "stand-in only accepts base64 transactions")
+        return self._accept(VersionedTransaction.from_bytes(base64.b64decode(params[0])))
+
+    def _accept(self, transaction: VersionedTransaction, *, lands: Optional[bool] = None) -> str:
+        signature = str(transaction.signatures[0])
+        self.sends += 1
+
+        issued = self._blockhashes.get(str(transaction.message.recent_blockhash))
+        if issued is not None and self.block_height > issued + BLOCKHASH_VALID_BLOCKS:
+            self.expired += 1
+            raise _RpcError(
+                -32002,
+                "Transaction simulation failed: Blockhash not found",
+                {"err": "BlockhashNotFound", "logs": [], "accounts": None, "unitsConsumed": 0, "returnData": None},
+            )
+
+        existing = self._transactions.get(signature)
+        if existing and existing.lands_at is not None:
+            return signature  # duplicate of a transaction that is landing anyway
+
+        if lands is None:
+            lands = self.rng.random() >= self.config.drop_rate
+        if not lands:
+            self.dropped += 1
+        self._transactions[signature] = _SentTransaction(
+            lands_at=time.monotonic() + self.config.land_ms / 1000 if lands else None,
+        )
+        return signature
+
+    def _rpc_getSignatureStatuses(self, params):
+        now = time.monotonic()
+        statuses: List[Optional[Dict[str, Any]]] = []
+        for signature in params[0]:
+            sent = self._transactions.get(signature)
+            if not sent or sent.lands_at is None or sent.lands_at > now:
+                statuses.append(None)
+                continue
+            if not sent.slot:
+                sent.slot = self.slot
+            statuses.append({
+                "slot": sent.slot,
+                "confirmations": None,
+                "err": None,
+                "status": {"Ok": None},
+                "confirmationStatus": "finalized" if self.slot - sent.slot > 32 else "confirmed",
+            })
+        return self._context(statuses)
+
+    # ------------------------------------------------------------------
+    # Jito
+    # ------------------------------------------------------------------
+
+    async def _jito(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        method, params = body.get("method"), body.get("params") or []
+        result: Any
+        if method == "sendBundle":
+            result = self._send_bundle(params[0])
+        elif method in ("getInflightBundleStatuses", "getBundleStatuses"):
+            result = self._context([self._bundle_status(bundle_id) for bundle_id in params[0]])
+        else:
+            return web.json_response({"jsonrpc": "2.0", "id": body.get("id"), "error": {"code": -32601, "message": "Method not found"}})
+        return web.json_response({"jsonrpc": "2.0", "id": body.get("id"), "result": result})
+
+    def _send_bundle(self, encoded: List[str]) -> str:
+        transactions = [VersionedTransaction.from_bytes(base64.b64decode(tx)) for tx in encoded]
+        bundle_id = hashlib.sha256("".join(str(tx.signatures[0]) for tx in transactions).encode()).hexdigest()
+        lands = self.rng.random() < self.config.bundle_land_rate
+        for transaction in transactions:
+            self._accept(transaction, lands=lands)
+        self._bundles[bundle_id] = {
+            "decided_at": time.monotonic() + self.config.land_ms / 1000,
+            "lands": lands,
+            "landed_slot": None,
+        }
+        return bundle_id
+
+    def _bundle_status(self, bundle_id: str) -> Dict[str, Any]:
+        bundle = self._bundles.get(bundle_id)
+        if bundle is None:
+            return {"bundle_id": bundle_id, "status": "Invalid", "landed_slot": None}
+        if time.monotonic() < bundle["decided_at"]:
+            return {"bundle_id": bundle_id, "status": "Pending", "landed_slot": None}
+        if not bundle["lands"]:
+            return {"bundle_id": bundle_id, "status": "Failed", "landed_slot": None}
+        bundle["landed_slot"] = bundle["landed_slot"] or self.slot
+        return {"bundle_id": bundle_id, "status": "Landed", "landed_slot": bundle["landed_slot"]}
+
+    async def _tip_floor(self, request: web.Request) -> web.Response:
+        return web.json_response([{
+            "time": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "landed_tips_25th_percentile": 0.00001,
+            "landed_tips_50th_percentile": 0.00002,
+            "landed_tips_75th_percentile": 0.0001,
+            "landed_tips_95th_percentile": 0.001,
+            "landed_tips_99th_percentile": 0.005,
+        }])
+
+
+class _RpcError(Exception):
+    def __init__(self, code: int, message: str, data: Optional[Dict[str, Any]] = None):
+        super().__init__(message)
+        self.code = code
+        self.data = data
+
+    def as_error(self) -> Dict[str, Any]:
+        error = {"code": self.code, "message": str(self)}
+        if self.data is not None:
+            error["data"] = self.data
+        return error
+
+
+async def _serve_forever(server: StandinServer):
+    async with server:
+        for name, value in server.env().items():
+            print(f"{name}={value}")
+        await asyncio.Event().wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Jupiter / Solana RPC / Jito stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8899)
+    parser.add_argument("--profile", default="", help='e.g. "quote=120:30,swap=150:40:0.01,rpc=40:10"')
+    parser.add_argument("--land-ms", type=float, default=400.0)
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    parser.add_argument("--bundle-land-rate", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    config = StandinConfig(
+        profiles=parse_profiles(args.profile),
+        land_ms=args.land_ms,
+        drop_rate=args.drop_rate,
+        bundle_land_rate=args.bundle_land_rate,
+        seed=args.seed,
+    )
+    try:
+        asyncio.run(_serve_forever(StandinServer(config, args.host, args.port)))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
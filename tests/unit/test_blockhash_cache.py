@@ -0,0 +1,137 @@
+import asyncio
+import base64
+import json
+
+import pytest
+from solders.hash import Hash
+from solders.keypair import Keypair
+from solders.message import MessageV0
+from solders.transaction import VersionedTransaction
+
+from src.modules.blockhash_cache import BlockhashCache, transaction_blockhash
+from src.modules.http_pool import close_http_sessions
+from src.modules.rebroadcaster import EXPIRED, Rebroadcaster
+from src.modules.rpc_batch import JsonRpcBatchClient
+from src.modules.swap_pool import SOL_MINT, PrebuiltSwapPool, SwapIntent
+from src.ops.standin import StandinConfig, StandinServer
+
+
+class FakeBatchRpc:
+    def __init__(self, height=1_000):
+        self.height = height
+        self.blockhashes = []
+
+    async def call_many(self, calls):
+        self.blockhashes.append(str(Hash.new_unique()))
+        results = {
+            "getLatestBlockhash": {
+                "context": {"slot": self.height + 50},
+                "value": {"blockhash": self.blockhashes[-1], "lastValidBlockHeight": self.height + 150},
+            },
+            "getBlockHeight": self.height,
+            "getSlot": self.height + 50,
+        }
+        return [results[method] for method, _ in calls]
+
+
+@pytest.mark.asyncio
+async def test_refresh_batches_blockhash_height_and_slot_against_the_standin():
+    standin = await StandinServer(StandinConfig()).start()
+    rpc = JsonRpcBatchClient(standin.rpc_url)
+    cache = BlockhashCache(rpc)
+    try:
+        assert cache.latest() is None and cache.block_height is None
+        await cache.refresh()
+
+        assert rpc.get_counters() == {"logical_calls": 3, "http_requests": 1}
+        latest = cache.latest()
+        # The stand-in's chain may tick one slot between the refresh and these checks
+        assert standin.block_height - cache.block_height in (0, 1)
+        assert standin.slot - cache.slot in (0, 1)
+        assert cache.last_valid_for(latest.blockhash) == latest.last_valid_block_height
+        assert cache.blocks_left(latest.last_valid_block_height) == 150
+    finally:
+        await close_http_sessions()
+        await standin.stop()
+
+
+@pytest.mark.asyncio
+async def test_slot_notifications_only_move_the_slot_forward():
+    cache = BlockhashCache(FakeBatchRpc(height=1_000))
+    await cache.refresh()
+    cache._handle_slot_message(json.dumps({"method": "slotNotification", "params": {"result": {"slot": 1_060}}}))
+    cache._handle_slot_message(json.dumps({"method": "slotNotification", "params": {"result": {"slot": 1_055}}}))
+    assert cache.slot == 1_060
+    assert cache.block_height == 1_000
+
+    cache.max_age = 0  # refreshes stalled: readers get nothing rather than stale values
+    assert cache.slot is None and cache.latest() is None and cache.blocks_left(1_150) is None
+
+
+@pytest.mark.asyncio
+async def test_rebroadcast_cutoff_reads_the_cache():
+    rpc = FakeBatchRpc(height=1_000)
+    cache = BlockhashCache(rpc)
+    await cache.refresh()
+    rpc.height = 1_200
+    await cache.refresh()
+
+    block_height_calls = []
+
+    class Client:
+        async def get_block_height(self, commitment=None):
+            block_height_calls.append(commitment)
+
+    async def never_confirms(signature, timeout):
+        await asyncio.sleep(timeout)
+        return False
+
+    rebroadcaster = Rebroadcaster(never_confirms, Client(), interval=0.01, grace=0.01, blockhash_cache=cache)
+    resends = []
+
+    async def resend():
+        resends.append(1)
+
+    outcome = await rebroadcaster.run("sig", resend, last_valid_block_height=1_150)
+    assert outcome.status == EXPIRED
+    assert resends == []
+    assert block_height_calls == []
+
+
+@pytest.mark.asyncio
+async def test_swap_pool_retires_entries_by_blocks_left():
+    keypair = Keypair()
+    rpc = FakeBatchRpc(height=1_000)
+    cache = BlockhashCache(rpc)
+    await cache.refresh()
+    swap_transaction = base64.b64encode(bytes(VersionedTransaction(
+        MessageV0.try_compile(keypair.pubkey(), [], [], Hash.from_string(rpc.blockhashes[0])), [keypair],
+    ))).decode()
+    assert transaction_blockhash(base64.b64decode(swap_transaction)) == rpc.blockhashes[0]
+
+    class Jupiter:
+        builds = 0
+
+        async def get_quote(self, *args, **kwargs):
+            return {"outAmount": "1"}
+
+        async def get_swap_transaction(self, quote, user_public_key, **kwargs):
+            Jupiter.builds += 1
+            return swap_transaction
+
+    intent = SwapIntent(str(keypair.pubkey()), SOL_MINT, "Token", 1_000, 100)
+    pool = PrebuiltSwapPool(Jupiter(), max_age=600, blockhash_cache=cache, min_blocks_left=50)
+    pool.add_source(lambda: [intent])
+
+    await pool.refresh()
+    assert pool._entries[intent].last_valid_block_height == 1_150
+
+    rpc.height = 1_060                # 90 blocks left: under 2x the minimum, rebuilt
+    await cache.refresh()
+    await pool.refresh()
+    assert Jupiter.builds == 2
+
+    rpc.height = 1_110                # 40 blocks left: too few to hand out
+    await cache.refresh()
+    assert pool.take(intent) is None
+    assert pool.stats()["stale"] == 1
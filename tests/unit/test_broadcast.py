@@ -0,0 +1,97 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from solders.hash import Hash
+from solders.keypair import Keypair
+from solders.message import MessageV0
+from solders.transaction import VersionedTransaction
+
+from src.modules.fast_execution import FastExecutionEngine
+from src.modules.http_pool import close_http_sessions
+from src.modules.trade_execution import TradeExecutionService
+from src.ops import broadcast
+from src.ops.standin import EndpointProfile, StandinConfig, StandinServer
+
+
+def _signed_tx() -> VersionedTransaction:
+    keypair = Keypair()
+    message = MessageV0.try_compile(keypair.pubkey(), [], [], Hash.default())
+    return VersionedTransaction(message, [keypair])
+
+
+@pytest.mark.asyncio
+async def test_guardrails_hold_for_every_policy(monkeypatch):
+    monkeypatch.setattr(broadcast, "IS_PROD", True)
+    monkeypatch.setenv("ALLOW_BROADCAST", "true")
+    monkeypatch.setenv("CONFIRM_TOKEN", "secret")
+    rpc = AsyncMock()
+    jito = AsyncMock()
+    for policy in broadcast.POLICIES:
+        with pytest.raises(RuntimeError, match="confirm_token"):
+            await broadcast.send(rpc, bytes(_signed_tx()), policy=policy, confirm_token="wrong", jito_submit_fn=jito)
+    rpc.send_raw_transaction.assert_not_awaited()
+    jito.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_race_and_bundle_race_policies():
+    slow = await StandinServer(StandinConfig(profiles={"rpc": EndpointProfile(60)})).start()
+    fast = await StandinServer(StandinConfig(profiles={"rpc": EndpointProfile(5)})).start()
+    engine = FastExecutionEngine(slow.rpc_url, [fast.rpc_url])
+    broadcast.set_race_engine(engine)
+    try:
+        tx = _signed_tx()
+        signature = await broadcast.send(AsyncMock(), bytes(tx), policy=broadcast.RACE)
+        assert signature == str(tx.signatures[0])
+        await asyncio.sleep(0.15)  # the losing send still completes and is scored
+        assert engine.stats()[slow.rpc_url]["samples"] == 1
+        assert slow.stats()["sends"] == fast.stats()["sends"] == 1
+
+        bundles = []
+
+        async def submit_bundle(tx_bytes):
+            bundles.append(tx_bytes)
+            return {"bundle_id": "b1"}
+
+        tx = _signed_tx()
+        assert await broadcast.send(AsyncMock(), bytes(tx), policy=broadcast.BUNDLE_RACE, jito_submit_fn=submit_bundle) == str(tx.signatures[0])
+        assert bundles == [bytes(tx)]
+        await asyncio.sleep(0.15)
+    finally:
+        broadcast.set_race_engine(None)
+        await close_http_sessions()
+        await slow.stop()
+        await fast.stop()
+
+
+@pytest.mark.asyncio
+async def test_execution_mode_picks_policy_per_context(monkeypatch):
+    monkeypatch.setenv("BROADCAST_POLICY_MANUAL", "single")
+    jupiter = AsyncMock()
+    jupiter.execute_swap.return_value = {"success": False, "error": "not confirmed"}
+    wallet = AsyncMock()
+    wallet.get_user_balance.return_value = 10.0
+    db = AsyncMock()
+    db.get_daily_pnl.return_value = 0.0
+    db.get_position_by_token.return_value = SimpleNamespace(
+        entry_amount_tokens=10.0, entry_amount_raw=10_000_000, position_id="p1", entry_amount_sol=1.0,
+    )
+    service = TradeExecutionService(db, wallet, jupiter)
+    service._get_user_settings = AsyncMock(return_value=SimpleNamespace(
+        max_trade_size_sol=5.0, daily_loss_limit_sol=1.0, check_honeypots=False,
+        min_liquidity_usd=0, slippage_percentage=1.0,
+    ))
+
+    async def policy(**kwargs):
+        await service.execute_buy(1, "Mint", 0.5, **kwargs)
+        return jupiter.execute_swap.await_args.kwargs["broadcast_policy"]
+
+    assert await policy(context="manual") == broadcast.SINGLE
+    assert await policy(context="copy_trade") == broadcast.RACE
+    assert await policy(context="sniper_manual") == broadcast.BUNDLE_RACE
+    assert await policy(context="copy_trade", execution_mode="single") == broadcast.SINGLE
+
+    await service.execute_sell(1, "Mint", context="manual")
+    assert jupiter.execute_swap.await_args.kwargs["broadcast_policy"] == broadcast.RACE  # exits race by default
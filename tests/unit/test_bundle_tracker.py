@@ -0,0 +1,165 @@
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.modules.bundle_tracker import EXPIRED, FAILED, LANDED, BundleTracker
+from src.modules.trade_execution import TradeExecutionService
+
+
+class FakeJito:
+    """Reports a bundle as landed after a given number of status checks."""
+
+    def __init__(self, land_after=None, failed=()):
+        self.land_after = land_after or {}
+        self.failed = set(failed)
+        self.calls = []
+        self.seen = {}
+
+    async def fetch(self, bundle_ids):
+        self.calls.append(len(bundle_ids))
+        statuses = {}
+        for bundle_id in bundle_ids:
+            self.seen[bundle_id] = self.seen.get(bundle_id, 0) + 1
+            if bundle_id in self.failed:
+                statuses[bundle_id] = {"bundle_id": bundle_id, "status": "Failed"}
+            elif self.seen[bundle_id] >= self.land_after.get(bundle_id, 1):
+                statuses[bundle_id] = {"bundle_id": bundle_id, "status": "Landed", "landed_slot": 42}
+            else:
+                statuses[bundle_id] = {"bundle_id": bundle_id, "status": "Pending"}
+        return statuses
+
+
+@pytest.mark.asyncio
+async def test_inflight_bundles_share_batched_status_calls():
+    bundle_ids = [f"bundle-{index}" for index in range(12)]
+    jito = FakeJito({bundle_id: 1 + index % 2 for index, bundle_id in enumerate(bundle_ids)})
+    tracker = BundleTracker(jito.fetch, poll_interval=0.01)
+    resolved = []
+
+    async def listener(bundle):
+        resolved.append(bundle.bundle_id)
+
+    tracker.add_listener(listener)
+    for bundle_id in bundle_ids:
+        tracker.track(bundle_id, signature=None)
+
+    results = await asyncio.gather(*(tracker.wait(bundle_id) for bundle_id in bundle_ids))
+
+    assert results == [LANDED] * 12
+    assert sorted(resolved) == sorted(bundle_ids)
+    # Two polls: all 12 bundles, then the 6 that had not landed yet
+    assert jito.calls == [5, 5, 2, 5, 1]
+    assert tracker.stats()["pending"] == 0
+
+
+@pytest.mark.asyncio
+async def test_unlanded_bundle_falls_back_to_rpc_once():
+    jito = FakeJito({"slow": 10_000, "dropped": 10_000}, failed=["dropped"])
+    sent = []
+
+    class Confirmations:
+        async def wait(self, signature, timeout=None):
+            return True
+
+    def sender(signature):
+        async def send():
+            sent.append(signature)
+            return signature
+        return send
+
+    tracker = BundleTracker(jito.fetch, confirmations=Confirmations(), poll_interval=0.01, fallback_after=0.03)
+    slow = tracker.track("slow", "sig-slow", fallback=sender("sig-slow"))
+    dropped = tracker.track("dropped", "sig-dropped", fallback=sender("sig-dropped"))
+
+    assert await tracker.wait("dropped") == LANDED  # Jito reported failure: fallback right away
+    assert await tracker.wait("slow") == LANDED     # pending past the fallback delay
+    assert sorted(sent) == ["sig-dropped", "sig-slow"]
+    assert slow.landed_via == dropped.landed_via == "rpc"
+    assert tracker.stats()["fallbacks"] == 2
+
+
+@pytest.mark.asyncio
+async def test_bundles_without_fallback_fail_or_expire():
+    jito = FakeJito({"stuck": 10_000}, failed=["rejected"])
+    tracker = BundleTracker(jito.fetch, poll_interval=0.01)
+    tracker.track("rejected")
+    tracker.track("stuck", timeout=0.05)
+
+    assert await tracker.wait("rejected") == FAILED
+    assert await tracker.wait("stuck") == EXPIRED
+    assert tracker.stats()["failed"] == 1 and tracker.stats()["expired"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_bundle_settles_trade_position_and_snipe():
+    db = AsyncMock()
+    db.get_trade_by_signature.return_value = SimpleNamespace(
+        user_id=1,
+        token_mint="Mint",
+        position_id="sig",
+        metadata_json=json.dumps({"snipe_id": "snipe-1", "bundle_id": "b1"}),
+    )
+    service = TradeExecutionService(db, AsyncMock(), AsyncMock())
+    tracker = BundleTracker(FakeJito(failed=["b1"]).fetch, poll_interval=0.01)
+    service.attach_bundle_tracker(tracker)
+
+    tracker.track("b1", "sig")
+    assert await tracker.wait("b1") == FAILED
+
+    signature, updates = db.update_trade.await_args.args
+    assert signature == "sig"
+    assert updates["success"] is False
+    assert json.loads(updates["metadata_json"])["bundle_status"] == FAILED
+    assert db.update_position_partial.await_args.args[1]["is_open"] is False
+    assert db.update_snipe_run.await_args.args[1]["status"] == "FAILED"
+
+
+@pytest.mark.asyncio
+async def test_failed_bundle_drops_the_engine_position():
+    from src.modules.automated_trading import AutomatedTradingEngine, TradingConfig
+
+    jito = FakeJito({"landed": 1}, failed=["dropped"])
+    tracker = BundleTracker(jito.fetch, poll_interval=0.01)
+
+    class Executor:
+        async def execute_buy(self, user_id, token_mint, amount, **kwargs):
+            bundle_id = "landed" if token_mint == "MintLanded" else "dropped"
+            tracker.track(bundle_id, f"sig-{bundle_id}")
+            return {"success": True, "price": 1.0, "bundle_id": bundle_id}
+
+    class Protection:
+        async def comprehensive_token_check(self, token_mint):
+            return {"is_safe": True}
+
+    class Jupiter:
+        bundle_tracker = tracker
+
+        async def get_token_price(self, token_mints):
+            return {mint: 1.0 for mint in token_mints}
+
+    intelligence = SimpleNamespace(tracked_wallets={}, client=None)
+    engine = AutomatedTradingEngine(
+        TradingConfig(), intelligence, Jupiter(), Protection(), trade_executor=Executor(),
+    )
+    engine.signal_core.streaming_enabled = False
+    await engine.start_automated_trading(1, None, None)
+    try:
+        for mint in ("MintLanded", "MintDropped"):
+            assert await engine._execute_automated_trade({"token_mint": mint, "amount": 0.1})
+        engine._sync_monitored_positions()
+        assert engine.position_monitor.get((1, "MintDropped")) is not None
+
+        assert await tracker.wait("dropped") == FAILED
+        await tracker.wait("landed")
+        assert list(engine.active_positions) == ["MintLanded"]
+        assert engine.position_monitor.get((1, "MintDropped")) is None
+
+        # Resolved before the engine recorded it: never recorded
+        await engine._execute_automated_trade({"token_mint": "MintDropped", "amount": 0.1})
+        assert "MintDropped" not in engine.active_positions
+    finally:
+        await engine.stop_automated_trading()
+        await tracker.close()
@@ -0,0 +1,110 @@
+import base64
+
+import pytest
+from solana.rpc.async_api import AsyncClient
+from solders.compute_budget import set_compute_unit_limit, set_compute_unit_price
+from solders.hash import Hash
+from solders.keypair import Keypair
+from solders.message import MessageV0
+from solders.pubkey import Pubkey
+from solders.signature import Signature
+from solders.system_program import TransferParams, transfer
+from solders.transaction import VersionedTransaction
+
+from src.modules.compute_budget import (
+    PRIORITY,
+    SAVINGS,
+    ComputeBudgetTuner,
+    read_compute_budget,
+    route_shape,
+)
+from src.modules.http_pool import close_http_sessions
+from src.modules.jupiter_client import JupiterClient
+from src.ops.standin import SOL_MINT, StandinConfig, StandinServer
+
+QUOTE = {
+    "inputMint": SOL_MINT,
+    "outputMint": "Token",
+    "routePlan": [{"swapInfo": {"label": "Raydium"}, "percent": 100}],
+}
+
+
+def _swap_tx(payer: Pubkey, units=1_400_000, micro_lamports=1_000) -> str:
+    instructions = [
+        set_compute_unit_limit(units),
+        set_compute_unit_price(micro_lamports),
+        transfer(TransferParams(from_pubkey=payer, to_pubkey=Pubkey.new_unique(), lamports=1)),
+    ]
+    message = MessageV0.try_compile(payer, instructions, [], Hash.default())
+    return base64.b64encode(bytes(VersionedTransaction.populate(message, [Signature.default()]))).decode()
+
+
+@pytest.mark.asyncio
+async def test_budget_is_tightened_from_simulation_then_from_the_route_profile():
+    standin = await StandinServer(StandinConfig(compute_units=200_000)).start()
+    payer = Keypair().pubkey()
+    try:
+        tuner = ComputeBudgetTuner(standin.rpc_url, margin=0.1, mode=PRIORITY, min_samples=2, resample_every=10)
+        original = _swap_tx(payer)
+        for expected_simulations in (1, 2, 2, 2):
+            tuned_b64, tuning = await tuner.tune(original, QUOTE)
+            assert standin.rpc_methods["simulateTransaction"] == expected_simulations
+
+        tuned = VersionedTransaction.from_bytes(base64.b64decode(tuned_b64))
+        assert read_compute_budget(tuned.message).units == 220_000
+        assert tuning.after.units == 220_000 and not tuning.simulated
+        # Same total priority fee (1.4 lamports) spread over 220k units
+        assert tuning.after.micro_lamports == 1_400_000 * 1_000 // 220_000
+        assert tuning.after.priority_fee_lamports <= tuning.before.priority_fee_lamports
+        untouched = VersionedTransaction.from_bytes(base64.b64decode(original)).message
+        assert tuned.message.instructions[2] == untouched.instructions[2]
+        assert tuned.message.account_keys == untouched.account_keys
+        assert len(tuned.signatures) == 1
+
+        savings = ComputeBudgetTuner(standin.rpc_url, margin=0.1, mode=SAVINGS)
+        _, tuning = await savings.tune(_swap_tx(payer, micro_lamports=50_000), QUOTE)
+        assert tuning.after == type(tuning.after)(220_000, 50_000)
+        assert tuning.after.priority_fee_lamports == 11_000
+
+        # A route shape with a different hop is profiled separately
+        other = {**QUOTE, "routePlan": QUOTE["routePlan"] * 2}
+        assert route_shape(other) != route_shape(QUOTE)
+        await tuner.tune(_swap_tx(payer), other)
+        assert standin.rpc_methods["simulateTransaction"] == 4
+
+        # So is another token on the same route (e.g. a Token-2022 mint with a transfer hook)
+        other_token = {**QUOTE, "outputMint": "Token2022"}
+        assert route_shape(other_token) != route_shape(QUOTE)
+        await tuner.tune(_swap_tx(payer), other_token)
+        assert standin.rpc_methods["simulateTransaction"] == 5
+        assert len(tuner.profiles()) == 3
+    finally:
+        await close_http_sessions()
+        await standin.stop()
+
+
+@pytest.mark.asyncio
+async def test_tuned_swap_lands_and_reports_fee_per_landed_trade(monkeypatch):
+    standin = await StandinServer(StandinConfig(land_ms=20, compute_units=100_000)).start()
+    for name, value in standin.env().items():
+        monkeypatch.setenv(name, value)
+    monkeypatch.setenv("CONFIRMATION_POLL_MS", "20")
+    client = AsyncClient(standin.rpc_url)
+    try:
+        async with JupiterClient(client) as jupiter:
+            jupiter.compute_budget = ComputeBudgetTuner(standin.rpc_url, mode=SAVINGS)
+            result = await jupiter.execute_swap(
+                SOL_MINT, str(Pubkey.new_unique()), 10**8, Keypair(), priority_fee_lamports=1_400_000,
+            )
+
+            assert result["success"]
+            assert result["compute_budget"]["units_before"] == 1_400_000
+            assert result["compute_budget"]["units_after"] == 115_000
+            stats = jupiter.compute_budget.stats()
+            assert stats["landed"] == 1
+            assert stats["priority_fee_per_landed_before"] == 1_400_000
+            assert stats["priority_fee_per_landed_after"] == 115_000
+    finally:
+        await client.close()
+        await close_http_sessions()
+        await standin.stop()
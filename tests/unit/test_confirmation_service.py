@@ -0,0 +1,82 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from solders.signature import Signature
+
+from src.modules.confirmation_service import ConfirmationMultiplexer
+
+
+class FakeRpc:
+    """Reports each signature as confirmed after a given number of status checks."""
+
+    def __init__(self, confirm_after, errors=()):
+        self.confirm_after = confirm_after
+        self.errors = set(errors)
+        self.calls = []
+        self.seen = {}
+
+    async def get_signature_statuses(self, signatures):
+        self.calls.append(len(signatures))
+        value = []
+        for signature in signatures:
+            key = str(signature)
+            self.seen[key] = self.seen.get(key, 0) + 1
+            if key in self.errors:
+                value.append(SimpleNamespace(err="InstructionError", confirmation_status="confirmed"))
+            elif self.seen[key] >= self.confirm_after.get(key, 1):
+                value.append(SimpleNamespace(err=None, confirmation_status="TransactionConfirmationStatus.Confirmed"))
+            else:
+                value.append(None)
+        return SimpleNamespace(value=value)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_confirmations_share_batched_status_calls():
+    signatures = [str(Signature.new_unique()) for _ in range(600)]
+    rpc = FakeRpc({signature: 1 + index % 3 for index, signature in enumerate(signatures)})
+    confirmations = ConfirmationMultiplexer(rpc, poll_interval=0.01)
+
+    results = await asyncio.gather(*(confirmations.wait(signature) for signature in signatures))
+
+    assert all(results)
+    # Three polls, each split into 256-signature calls: 600 + 400 + 200 signatures
+    assert rpc.calls == [256, 256, 88, 256, 144, 200]
+    assert confirmations.stats()["pending"] == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_and_unseen_transactions_resolve_false():
+    failed, unseen, ok = (str(Signature.new_unique()) for _ in range(3))
+    rpc = FakeRpc({unseen: 10_000, ok: 1}, errors=[failed])
+    confirmations = ConfirmationMultiplexer(rpc, poll_interval=0.01)
+
+    results = await asyncio.gather(
+        confirmations.wait(failed),
+        confirmations.wait(unseen, timeout=0.05),
+        confirmations.wait(ok),
+        confirmations.wait(ok),  # duplicate waiter shares the same poll
+    )
+
+    assert results == [False, False, True, True]
+    assert confirmations.stats()["failed"] == 1
+    assert confirmations.stats()["timeouts"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_stops_polling_its_signature():
+    signature = str(Signature.new_unique())
+    rpc = FakeRpc({signature: 10_000})
+    confirmations = ConfirmationMultiplexer(rpc, poll_interval=0.01)
+
+    waiter = asyncio.create_task(confirmations.wait(signature))
+    await asyncio.sleep(0.03)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert len(confirmations) == 0
+    await asyncio.sleep(0.03)
+    polled = len(rpc.calls)
+    await asyncio.sleep(0.03)
+    assert len(rpc.calls) == polled
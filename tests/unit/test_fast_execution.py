@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+from solders.hash import Hash
+from solders.keypair import Keypair
+from solders.message import MessageV0
+from solders.transaction import VersionedTransaction
+
+from src.modules.fast_execution import CLOSED, HALF_OPEN, OPEN, FastExecutionEngine
+from src.modules.http_pool import close_http_sessions
+from src.ops.standin import EndpointProfile, StandinConfig, StandinServer
+
+
+def _signed_tx() -> bytes:
+    keypair = Keypair()
+    message = MessageV0.try_compile(keypair.pubkey(), [], [], Hash.default())
+    return bytes(VersionedTransaction(message, [keypair]))
+
+
+def test_unsampled_endpoints_are_selectable_and_failures_demote():
+    engine = FastExecutionEngine("primary", ["backup-1", "backup-2"], failure_threshold=2)
+    assert engine.get_fastest_rpcs(3) == ["primary", "backup-1", "backup-2"]
+
+    engine.record_result("primary", 300, True)
+    engine.record_result("backup-1", 40, True)
+    assert engine.get_fastest_rpcs(2) == ["backup-1", "backup-2"]  # unsampled prior: 250ms
+
+    engine.record_result("backup-1", 900, False)
+    engine.record_result("backup-1", 900, False)
+    assert engine.health["backup-1"].state == OPEN
+    assert "backup-1" not in engine.get_fastest_rpcs(3)
+
+
+def test_open_circuit_half_opens_for_one_probe_and_backs_off():
+    engine = FastExecutionEngine("a", ["b"], failure_threshold=1, cooldown=0.0)
+    engine.record_result("a", 50, False)
+    assert engine.health["a"].state == OPEN
+
+    assert engine.get_fastest_rpcs(2) == ["b", "a"]  # cooldown over: one probe allowed
+    assert engine.health["a"].state == HALF_OPEN
+    assert engine.get_fastest_rpcs(2) == ["b"]       # probe still in flight
+
+    engine.record_result("a", 50, False)             # probe failed
+    assert engine.health["a"].state == OPEN
+    engine.base_cooldown = 5.0
+    engine.record_result("a", 50, True)              # e.g. a detached send reporting late
+    assert engine.health["a"].state == CLOSED
+
+
+@pytest.mark.asyncio
+async def test_sends_measure_each_endpoint_and_pings_probe_open_circuits():
+    fast = await StandinServer(StandinConfig(profiles={"rpc": EndpointProfile(5)})).start()
+    slow = await StandinServer(StandinConfig(profiles={"rpc": EndpointProfile(80)})).start()
+    broken = await StandinServer(StandinConfig(profiles={"rpc": EndpointProfile(1, 0, 1.0)})).start()
+    engine = FastExecutionEngine(slow.rpc_url, [fast.rpc_url, broken.rpc_url], failure_threshold=2, cooldown=0.05)
+    try:
+        for _ in range(2):
+            result = await engine.execute_fast(_signed_tx(), use_simulation=False)
+            assert result.success
+        await asyncio.sleep(0.2)  # losing sends finish in the background and report
+
+        stats = engine.stats()
+        assert stats[fast.rpc_url]["ewma_latency_ms"] < stats[slow.rpc_url]["ewma_latency_ms"]
+        assert stats[slow.rpc_url]["ewma_latency_ms"] >= 80
+        assert stats[broken.rpc_url]["state"] == OPEN
+        assert engine.get_fastest_rpcs(1) == [fast.rpc_url]
+
+        broken.config.profiles["rpc"] = EndpointProfile(1)  # endpoint recovers
+        await asyncio.sleep(0.1)
+        await engine.ping_all()
+        assert engine.stats()[broken.rpc_url]["state"] == CLOSED
+    finally:
+        await close_http_sessions()
+        for standin in (fast, slow, broken):
+            await standin.stop()
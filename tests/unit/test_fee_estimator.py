@@ -0,0 +1,166 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.modules.fee_estimator import CONTEXT_POLICIES, FeeEstimator, fee_context
+from src.modules.trade_execution import TradeExecutionService
+from src.ops import broadcast
+
+
+class FakeRpc:
+    def __init__(self, entries):
+        self.entries = entries
+        self.calls = []
+
+    async def call(self, method, params):
+        self.calls.append((method, params))
+        return self.entries
+
+
+@pytest.mark.asyncio
+async def test_quotes_follow_sampled_percentiles_per_context():
+    rpc = FakeRpc([{"slot": slot, "prioritizationFee": slot * 1000} for slot in range(1, 101)])
+    estimator = FeeEstimator(rpc, tip_floor_url=None, compute_units=1_000_000)
+    await estimator.sample()
+    await estimator.sample()  # same slots again: not double counted
+    estimator.add_tip_floor({
+        "landed_tips_25th_percentile": 0.00001,
+        "landed_tips_50th_percentile": 0.00002,
+        "landed_tips_75th_percentile": 0.0001,
+        "landed_tips_95th_percentile": 0.001,
+        "landed_tips_99th_percentile": 0.01,
+    })
+
+    assert rpc.calls[0] == ("getRecentPrioritizationFees", [])
+    assert estimator.stats()["fee_slots"] == 100
+
+    manual = estimator.quote("manual")   # p50 priority, p25 tip
+    sniper = estimator.quote("sniper")   # p90 priority, p75 tip
+    assert manual.micro_lamports_per_cu == 51_000
+    assert manual.priority_fee_lamports == 51_000  # 51k micro-lamports x 1M CU
+    assert manual.tip_lamports == 10_000
+    assert sniper.micro_lamports_per_cu == 91_000
+    assert sniper.priority_fee_lamports == 91_000
+    assert sniper.tip_lamports == 100_000
+
+
+def test_defaults_apply_before_any_sample():
+    quote = FeeEstimator().quote("sniper")
+    assert quote.priority_fee_lamports == CONTEXT_POLICIES["sniper"].default_priority_lamports
+    assert quote.tip_lamports == CONTEXT_POLICIES["sniper"].default_tip_lamports
+    assert fee_context("sniper_auto") == "sniper"
+    assert fee_context("copy_trade", "sell") == "exit"
+
+
+def test_wallet_copy_buys_use_the_copy_trade_policies(monkeypatch):
+    monkeypatch.delenv("BROADCAST_POLICY_COPY_TRADE", raising=False)
+    monkeypatch.delenv("BROADCAST_POLICY_MANUAL", raising=False)
+    assert fee_context("auto_trader") == "copy_trade"
+    assert fee_context("auto_trader", "sell") == "exit"
+    assert fee_context("manual_command") == "manual"
+    assert broadcast.policy_for(fee_context("auto_trader")) == broadcast.RACE
+    assert broadcast.policy_for(fee_context("web_dashboard")) == broadcast.SINGLE
+
+
+def test_landing_feedback_escalates_then_relaxes():
+    estimator = FeeEstimator(min_feedback=4, feedback_window=4)
+    base = estimator.quote("copy_trade").level
+
+    for landed in (True, False, False, True):
+        estimator.record_outcome("copy_trade", base, landed)
+    assert estimator.quote("copy_trade").level == base + 1
+
+    for _ in range(4):
+        estimator.record_outcome("copy_trade", base + 1, True)
+    # The rung below just underdelivered, so stay put
+    assert estimator.quote("copy_trade").level == base + 1
+
+    rates = estimator.landing_rates()["copy_trade"]
+    assert rates[base]["landing_rate"] == 0.5
+    assert rates[base + 1]["landing_rate"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_trade_results_feed_the_estimator():
+    estimator = FeeEstimator(tip_floor_url=None)
+    jupiter = AsyncMock()
+    jupiter.execute_swap.return_value = {"success": False, "error": "not confirmed", "sent": True}
+    wallet = AsyncMock()
+    wallet.get_user_balance.return_value = 10.0
+    db = AsyncMock()
+    db.get_daily_pnl.return_value = 0.0
+    service = TradeExecutionService(db, wallet, jupiter, fee_estimator=estimator)
+    service._get_user_settings = AsyncMock(return_value=SimpleNamespace(
+        max_trade_size_sol=5.0,
+        daily_loss_limit_sol=1.0,
+        check_honeypots=False,
+        min_liquidity_usd=0,
+        slippage_percentage=1.0,
+    ))
+
+    await service.execute_buy(1, "Mint", 0.5, context="copy_trade")
+
+    quote = estimator.quote("copy_trade")
+    assert jupiter.execute_swap.await_args.kwargs["priority_fee_lamports"] == quote.priority_fee_lamports
+    assert estimator.landing_rates()["copy_trade"][quote.level] == {"sent": 1, "landed": 0, "landing_rate": 0.0}
+
+
+@pytest.mark.asyncio
+async def test_expected_priority_fee_is_the_fee_the_swap_is_sent_with():
+    jupiter = AsyncMock()
+    jupiter.execute_swap.return_value = {"success": False, "error": "no route"}
+    jupiter.execute_swap_with_jito.return_value = {"success": False, "error": "no route"}
+    wallet = AsyncMock()
+    wallet.get_user_balance.return_value = 10.0
+    db = AsyncMock()
+    db.get_daily_pnl.return_value = 0.0
+    settings = SimpleNamespace(
+        max_trade_size_sol=5.0,
+        daily_loss_limit_sol=1.0,
+        check_honeypots=False,
+        min_liquidity_usd=0,
+        slippage_percentage=1.0,
+    )
+
+    for estimator in (None, FeeEstimator(tip_floor_url=None)):
+        service = TradeExecutionService(db, wallet, jupiter, fee_estimator=estimator)
+        service._get_user_settings = AsyncMock(return_value=settings)
+
+        await service.execute_buy(1, "Mint", 0.5, context="auto_trader", execution_mode="jito")
+        assert (jupiter.execute_swap_with_jito.await_args.kwargs["priority_fee_lamports"]
+                == service.expected_priority_fee("auto_trader", "buy", "jito"))
+
+        await service.execute_buy(1, "Mint", 0.5, context="manual")
+        assert (jupiter.execute_swap.await_args.kwargs["priority_fee_lamports"]
+                == service.expected_priority_fee("manual"))
+
+
+@pytest.mark.asyncio
+async def test_prebuilt_swap_only_feeds_back_the_fee_level_it_paid():
+    estimator = FeeEstimator(tip_floor_url=None)
+    quoted = estimator.quote("copy_trade")
+    jupiter = AsyncMock()
+    wallet = AsyncMock()
+    wallet.get_user_balance.return_value = 10.0
+    db = AsyncMock()
+    db.get_daily_pnl.return_value = 0.0
+    service = TradeExecutionService(db, wallet, jupiter, fee_estimator=estimator)
+    service._get_user_settings = AsyncMock(return_value=SimpleNamespace(
+        max_trade_size_sol=5.0,
+        daily_loss_limit_sol=1.0,
+        check_honeypots=False,
+        min_liquidity_usd=0,
+        slippage_percentage=1.0,
+    ))
+
+    jupiter.execute_swap.return_value = {
+        "success": False, "error": "expired", "sent": True,
+        "prebuilt": True, "priority_fee_lamports": quoted.priority_fee_lamports + 1,
+    }
+    await service.execute_buy(1, "Mint", 0.5, context="copy_trade")
+    assert quoted.level not in estimator.landing_rates().get("copy_trade", {})
+
+    jupiter.execute_swap.return_value["priority_fee_lamports"] = quoted.priority_fee_lamports
+    await service.execute_buy(1, "Mint", 0.5, context="copy_trade")
+    assert estimator.landing_rates()["copy_trade"][quoted.level]["sent"] == 1
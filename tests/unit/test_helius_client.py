@@ -0,0 +1,140 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+from aiohttp import web
+
+from src.modules.automated_trading import TradingConfig
+from src.modules.helius_client import HeliusEnhancedClient
+from src.modules.signal_core import WalletSignalCore
+from src.modules.wallet_intelligence import WalletMetrics
+
+
+WALLETS = [
+    "9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWWM",
+    "7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU",
+]
+TOKEN = "DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263"
+
+
+class StubHelius:
+    """Enhanced transactions endpoint that only knows signatures in `known` (swaps) and `transfers`."""
+
+    def __init__(self, known, transfers=()):
+        self.known = known
+        self.transfers = set(transfers)
+        self.posts = []
+        self.connections = set()
+        self._runner = None
+        self.url = None
+
+    async def __aenter__(self):
+        app = web.Application()
+        app.router.add_post("/v0/transactions", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+        return self
+
+    async def __aexit__(self, *exc):
+        await self._runner.cleanup()
+
+    async def _handle(self, request):
+        self.connections.add(id(request.transport))
+        body = await request.json()
+        self.posts.append(body["transactions"])
+        return web.json_response([
+            {
+                "signature": signature,
+                "type": "TRANSFER" if signature in self.transfers else "SWAP",
+                "source": "JUPITER",
+                "timestamp": int(time.time()),
+                "tokenTransfers": [{"mint": TOKEN, "tokenAmount": 10}],
+            }
+            for signature in body["transactions"]
+            if signature in self.known or signature in self.transfers
+        ])
+
+
+@pytest.mark.asyncio
+async def test_batches_lookups_over_one_pooled_connection():
+    async with StubHelius(known={"a", "c"}) as server:
+        client = HeliusEnhancedClient("key", base_url=server.url, batch_size=2)
+        first = await client.get_transactions(["a", "b", "c"])
+        second = await client.get_transactions(["c"])
+        await client.close()
+
+    assert set(first) == {"a", "c"}
+    assert set(second) == {"c"}
+    assert sorted(server.posts) == [["a", "b"], ["c"], ["c"]]
+    # Two chunks went out concurrently; the third POST reused a pooled connection
+    assert len(server.connections) == 2
+    assert client.get_counters() == {"logical_calls": 4, "http_requests": 3}
+
+
+@pytest.mark.asyncio
+async def test_scan_resolves_through_helius_and_falls_back_to_rpc(monkeypatch):
+    monkeypatch.setenv("HELIUS_API_KEY", "key")
+    monkeypatch.setenv("AUTO_TRADER_RPC_BATCH_SIZE", "0")
+
+    class StubRpc:
+        def __init__(self):
+            self.transactions = []
+
+        async def get_signatures_for_address(self, pubkey, limit=3):
+            return SimpleNamespace(value=[
+                SimpleNamespace(signature=f"{str(pubkey)[:4]}-tx", block_time=int(time.time()), err=None)
+            ])
+
+        async def get_transaction(self, signature, **kwargs):
+            self.transactions.append(signature)
+            return None
+
+    rpc = StubRpc()
+    tracked = {
+        address: WalletMetrics(address=address, win_rate=0.8, profit_factor=2.0, total_trades=50)
+        for address in WALLETS
+    }
+    intelligence = SimpleNamespace(tracked_wallets=tracked, client=rpc)
+
+    async with StubHelius(known={f"{WALLETS[0][:4]}-tx"}) as server:
+        monkeypatch.setenv("HELIUS_API_URL", server.url)
+        core = WalletSignalCore(TradingConfig(auto_trade_min_confidence=0.5), intelligence)
+        opportunities = await core._scan_for_opportunities()
+        await core.stop()
+
+    assert server.posts == [[f"{WALLETS[0][:4]}-tx", f"{WALLETS[1][:4]}-tx"]]
+    assert rpc.transactions == [f"{WALLETS[1][:4]}-tx"]
+    assert [opp["token_mint"] for opp in opportunities] == [TOKEN]
+
+
+@pytest.mark.asyncio
+async def test_non_swaps_answered_by_helius_skip_the_rpc_fallback(monkeypatch):
+    monkeypatch.setenv("HELIUS_API_KEY", "key")
+    monkeypatch.setenv("AUTO_TRADER_RPC_BATCH_SIZE", "0")
+
+    class StubRpc:
+        def __init__(self):
+            self.transactions = []
+
+        async def get_transaction(self, signature, **kwargs):
+            self.transactions.append(signature)
+            return None
+
+    rpc = StubRpc()
+    intelligence = SimpleNamespace(tracked_wallets={}, client=rpc)
+
+    async with StubHelius(known={"swap"}, transfers={"transfer"}) as server:
+        monkeypatch.setenv("HELIUS_API_URL", server.url)
+        core = WalletSignalCore(TradingConfig(), intelligence)
+        first, _ = await core._parse_swap_transactions(["swap", "transfer", "unknown"])
+        second, _ = await core._parse_swap_transactions(["swap", "transfer", "unknown"])
+        await core.stop()
+
+    assert first == second == {"swap": TOKEN, "transfer": None, "unknown": None}
+    # Only the signature Helius did not return falls back to getTransaction. Every
+    # Helius answer is cached; the transaction no one has yet is looked up again.
+    assert rpc.transactions == ["unknown", "unknown"]
+    assert server.posts == [["swap", "transfer", "unknown"], ["unknown"]]
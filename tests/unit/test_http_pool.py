@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from src.modules.http_pool import HttpClientRegistry
+
+
+async def _serve():
+    async def handler(request):
+        await asyncio.sleep(0.02)
+        return web.json_response({"ok": True})
+
+    app = web.Application()
+    app.router.add_get("/", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}/"
+
+
+@pytest.mark.asyncio
+async def test_requests_reuse_one_session_and_warm_connections():
+    runner, server_url = await _serve()
+    registry = HttpClientRegistry()
+    try:
+        for _ in range(3):
+            async with registry.session().get(server_url) as response:
+                assert (await response.json())["ok"]
+
+        assert registry.session() is registry.session()
+        stats = registry.host_stats()["127.0.0.1"]
+        assert stats["requests"] == 3
+        assert stats["in_flight"] == 0
+        assert stats["connections_created"] == 1
+        assert stats["connections_reused"] == 2
+        assert stats["latency_p50"] > 0
+    finally:
+        await registry.close()
+        await runner.cleanup()
+    assert registry._session is None
+
+
+@pytest.mark.asyncio
+async def test_per_host_limit_queues_requests_and_counts_pool_waits():
+    runner, server_url = await _serve()
+    registry = HttpClientRegistry(limit_per_host=2)
+    try:
+        async def fetch():
+            async with registry.session().get(server_url) as response:
+                return response.status
+
+        assert await asyncio.gather(*(fetch() for _ in range(6))) == [200] * 6
+
+        stats = registry.host_stats()["127.0.0.1"]
+        assert stats["connections_created"] == 2
+        assert stats["pool_waits"] == 4
+        assert stats["pool_wait_seconds"] > 0
+    finally:
+        await registry.close()
+        await runner.cleanup()
@@ -0,0 +1,168 @@
+import asyncio
+
+import pytest
+
+from src.modules.jupiter_client import JupiterClient
+
+SOL = "So11111111111111111111111111111111111111112"
+TOKEN = "DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263"
+
+
+class _Response:
+    status = 200
+
+    def __init__(self, params):
+        self.params = params
+
+    async def __aenter__(self):
+        await asyncio.sleep(0.01)
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def json(self):
+        return {"inAmount": self.params["amount"], "outAmount": str(int(self.params["amount"]) * 2)}
+
+
+class FakeSession:
+    def __init__(self):
+        self.calls = []
+
+    def get(self, url, params=None):
+        self.calls.append(params)
+        return _Response(params)
+
+
+def _client(ttl_ms=500, bucket_bps=100):
+    client = JupiterClient(rpc_client=None)
+    client.session = FakeSession()
+    client.quote_ttl_seconds = ttl_ms / 1000
+    client.quote_cache.ttl_seconds = client.quote_ttl_seconds
+    client.quote_bucket_bps = bucket_bps
+    return client
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_quotes_share_one_request():
+    client = _client()
+
+    quotes = await asyncio.gather(*(client.get_quote(SOL, TOKEN, 100_000_000) for _ in range(5)))
+
+    assert len(client.session.calls) == 1
+    assert all(quote is quotes[0] for quote in quotes)
+    assert client.get_quote_cache_stats()["coalesced"] == 4
+
+    # A follow-up inside the TTL is a cache hit
+    await client.get_quote(SOL, TOKEN, 100_000_000)
+    assert len(client.session.calls) == 1
+    assert client.get_quote_cache_stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_quotes_expire_after_ttl_and_failures_are_not_cached():
+    client = _client(ttl_ms=20)
+
+    await client.get_quote(SOL, TOKEN, 100_000_000)
+    await asyncio.sleep(0.03)
+    await client.get_quote(SOL, TOKEN, 100_000_000)
+    assert len(client.session.calls) == 2
+
+    async def failing_fetch(*args):
+        client.quote_http_requests += 1
+        return None
+
+    client._fetch_quote = failing_fetch
+    assert await client.get_quote(SOL, TOKEN, 5) is None
+    assert await client.get_quote(SOL, TOKEN, 5) is None
+    assert client.quote_http_requests == 4
+
+
+@pytest.mark.asyncio
+async def test_bucketing_only_applies_to_price_discovery_quotes():
+    client = _client(bucket_bps=100)
+
+    assert client._bucket_amount(123_456_789) == 123_000_000
+    assert client._bucket_amount(50) == 50
+
+    await client.estimate_price_impact(SOL, TOKEN, 123_456_789)
+    await client.estimate_price_impact(SOL, TOKEN, 123_100_000)
+    assert [call["amount"] for call in client.session.calls] == ["123000000"]
+
+    # Executable quotes always use the exact amount
+    quote = await client.get_quote(SOL, TOKEN, 123_456_789)
+    assert quote["inAmount"] == "123456789"
+
+
+class RouteSession:
+    """Quotes with a per-strategy delay and outAmount."""
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.calls = []
+
+    def get(self, url, params=None):
+        self.calls.append(params)
+        if params.get("onlyDirectRoutes") == "true":
+            name = "direct"
+        elif "maxAccounts" in params:
+            name = "compact"
+        else:
+            name = "best"
+        delay, out_amount = self.routes[name]
+        return _RouteResponse(delay, out_amount)
+
+
+class _RouteResponse(_Response):
+    def __init__(self, delay, out_amount):
+        self.delay = delay
+        self.out_amount = out_amount
+
+    async def __aenter__(self):
+        await asyncio.sleep(self.delay)
+        return self
+
+    async def json(self):
+        return {"outAmount": str(self.out_amount)}
+
+
+@pytest.mark.asyncio
+async def test_route_strategies_are_quoted_concurrently():
+    client = _client()
+    client.session = RouteSession({"best": (0.05, 1000), "direct": (0.05, 990), "compact": (0.05, 995)})
+
+    started = asyncio.get_running_loop().time()
+    quotes = await client.compare_multiple_routes(SOL, TOKEN, 100_000_000)
+    elapsed = asyncio.get_running_loop().time() - started
+
+    assert [quote["outAmount"] for quote in quotes] == ["1000", "995", "990"]
+    assert elapsed < 0.09
+
+
+@pytest.mark.asyncio
+async def test_hedged_comparison_proceeds_without_slow_strategies():
+    client = _client()
+    client.session = RouteSession({"best": (0.3, 1000), "direct": (0.01, 990), "compact": (0.02, 995)})
+
+    choices = await client.select_routes(SOL, TOKEN, 100_000_000, hedge_ms=50)
+
+    assert [choice.strategy.name for choice in choices] == ["compact", "direct"]
+
+    # Nothing within budget: take the first quote that arrives
+    client.session = RouteSession({"best": (0.08, 1000), "direct": (0.05, 990), "compact": (0.2, 995)})
+    choices = await client.select_routes(SOL, TOKEN, 200_000_000, hedge_ms=10)
+    assert [choice.strategy.name for choice in choices] == ["direct"]
+
+    # Abandoned strategies keep fetching in the background and still fill the cache
+    await asyncio.sleep(0.35)
+    assert len(client.quote_cache) == 6
+
+
+def test_route_score_trades_out_amount_against_latency():
+    client = _client()
+    client.route_latency_penalty_bps = 10  # 0.1% per 100ms
+
+    fast = client._route_score({"outAmount": "1000000"}, latency_ms=50)
+    slow = client._route_score({"outAmount": "1000500"}, latency_ms=900)
+
+    assert fast > slow
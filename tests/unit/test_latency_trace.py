@@ -0,0 +1,100 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from src.modules.automated_trading import AutomatedTradingEngine, TradingConfig
+from src.modules.latency_trace import StageLatencyTracker, get_latency_tracker, new_trace, stage_durations
+from src.modules.signal_core import WalletSignalCore
+from src.modules.wallet_intelligence import WalletMetrics
+from src.modules.web_api import WebAPIServer
+
+TOKEN = "DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263"
+WALLET = "9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWWM"
+
+
+class StubProtection:
+    async def comprehensive_token_check(self, token_mint):
+        return {"is_safe": True}
+
+
+def test_stage_durations_skip_missing_stages():
+    trace = new_trace(block_time=100, discovered=101.5, parsed=101.7, execute_buy=102.0, confirmed=104.0)
+
+    durations = stage_durations(trace)
+
+    assert durations == pytest.approx({
+        'discovered': 1.5,
+        'parsed': 0.2,
+        'execute_buy': 0.3,
+        'confirmed': 2.0,
+        'total': 4.0,
+    })
+
+
+def test_tracker_percentiles_and_monitor_export():
+    tracker = StageLatencyTracker()
+    recorded = []
+    monitor = SimpleNamespace(record_metric=lambda name, value, tags=None: recorded.append((name, value)))
+
+    for index in range(100):
+        tracker.observe(new_trace(block_time=0, discovered=(index + 1) / 100), monitor)
+
+    breakdown = tracker.breakdown()['discovered']
+    assert breakdown['count'] == 100
+    assert breakdown['p50'] == pytest.approx(0.5, abs=0.02)
+    assert breakdown['p99'] == pytest.approx(0.99, abs=0.01)
+    assert sum(breakdown['buckets'].values()) == 100
+    assert len([name for name, _ in recorded if name == 'latency.discovered_seconds']) == 100
+
+
+@pytest.mark.asyncio
+async def test_opportunity_trace_reaches_trade_metadata():
+    metrics = WalletMetrics(address=WALLET, win_rate=1.0, profit_factor=3.0, consistency_score=1.0, total_trades=100)
+    intelligence = SimpleNamespace(tracked_wallets={WALLET: metrics}, client=None)
+    core = WalletSignalCore(TradingConfig(auto_trade_min_confidence=0.6), intelligence)
+    buys = []
+
+    async def execute_buy(user_id, token_mint, amount, metadata=None, **kwargs):
+        # Stands in for TradeExecutionService: marks its own stages on the shared trace
+        metadata['latency']['execute_buy'] = time.time()
+        buys.append(metadata)
+        return {'success': True, 'price': 1.0}
+
+    engine = AutomatedTradingEngine(
+        TradingConfig(auto_trade_min_confidence=0.6), intelligence, None, StubProtection(),
+        trade_executor=SimpleNamespace(execute_buy=execute_buy), signal_core=core,
+    )
+    engine.is_running, engine.user_id, engine.db = True, 1, None
+    core.subscribe(engine)
+
+    now = time.time()
+    trace = new_trace(block_time=int(now) - 2, discovered=now - 0.5, parsed=now - 0.2)
+    core._record_token_signal(core._poll_signals, TOKEN, WALLET, metrics, trace)
+    await core._publish(core._build_opportunities(core._poll_signals), core._poll_signals)
+
+    latency = buys[0]['latency']
+    assert list(latency) == ['block_time', 'discovered', 'parsed', 'scored', 'execute_buy']
+    assert latency['parsed'] <= latency['scored'] <= latency['execute_buy']
+
+
+@pytest.mark.asyncio
+async def test_admin_latency_endpoint_reports_stage_percentiles():
+    tracker = get_latency_tracker()
+    tracker.reset()
+    tracker.observe(new_trace(block_time=10, discovered=11, parsed=11.1, scored=11.1, execute_buy=11.2,
+                              quote_received=11.4, broadcast=11.6, confirmed=12.6))
+
+    server = WebAPIServer(None)
+    async with TestClient(TestServer(server.app)) as client:
+        response = await client.get('/api/v1/admin/latency')
+        payload = await response.json()
+    tracker.reset()
+
+    assert response.status == 200
+    assert payload['traces'] == 1
+    stages = {entry['stage']: entry for entry in payload['stages']}
+    assert [entry['stage'] for entry in payload['stages']][0] == 'discovered'
+    assert stages['confirmed']['p50'] == pytest.approx(1.0)
+    assert stages['total']['p99'] == pytest.approx(2.6)
@@ -0,0 +1,137 @@
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from src.modules.automated_trading import AutomatedTradingEngine, TradingConfig
+from src.modules.position_monitor import MonitoredPosition, PositionMonitor
+
+
+async def _noop(position, reason, price):
+    return None
+
+
+def _position(key, entry=1.0, mint="MINT", stop=0.15, take=0.5, trail=0.10):
+    return MonitoredPosition(
+        key=key,
+        token_mint=mint,
+        entry_price=entry,
+        on_trigger=_noop,
+        stop_loss_pct=stop,
+        take_profit_pct=take,
+        trailing_stop_pct=trail,
+    )
+
+
+def _reference(position, price):
+    """The previous per-position loop, evaluated on every tick."""
+    pnl_pct = (price - position['entry']) / position['entry']
+    if pnl_pct <= -position['stop']:
+        return 'STOP_LOSS'
+    if pnl_pct >= position['take']:
+        return 'TAKE_PROFIT'
+    if pnl_pct > 0:
+        if position['high'] is None:
+            position['high'] = price
+        else:
+            position['high'] = max(position['high'], price)
+            if (position['high'] - price) / position['high'] >= position['trail']:
+                return 'TRAILING_STOP'
+    return None
+
+
+def test_sorted_books_fire_the_same_exits_as_checking_every_position():
+    rng = random.Random(7)
+    monitor = PositionMonitor(_noop)
+    reference = {}
+    for index in range(300):
+        entry = rng.uniform(0.5, 2.0)
+        stop, take, trail = rng.uniform(0.05, 0.3), rng.uniform(0.1, 1.0), rng.uniform(0.03, 0.2)
+        mint = f"MINT{index % 5}"
+        monitor.add(_position(index, entry=entry, mint=mint, stop=stop, take=take, trail=trail))
+        reference[index] = {'mint': mint, 'entry': entry, 'stop': stop, 'take': take, 'trail': trail, 'high': None}
+
+    prices = {f"MINT{index}": 1.0 for index in range(5)}
+    for _ in range(200):
+        prices = {mint: price * rng.uniform(0.93, 1.08) for mint, price in prices.items()}
+
+        fired = {position.key: reason for position, reason, _ in monitor.apply_prices(prices)}
+        expected = {}
+        for key, position in list(reference.items()):
+            reason = _reference(position, prices[position['mint']])
+            if reason:
+                expected[key] = reason
+                del reference[key]
+
+        assert fired == expected
+
+    assert len(monitor) == len(reference)
+    # Only crossed levels are evaluated, not every position on every tick
+    assert monitor.positions_touched < 300 * 200 / 2
+
+
+def test_missing_or_zero_price_does_not_trigger_stop_loss():
+    monitor = PositionMonitor(_noop)
+    monitor.add(_position("a"))
+
+    assert monitor.apply_prices({"MINT": 0}) == []
+    assert monitor.apply_prices({}) == []
+    assert "a" in monitor
+
+    fired = monitor.apply_prices({"MINT": 0.8})
+    assert [(position.key, reason) for position, reason, _ in fired] == [("a", "STOP_LOSS")]
+    assert "a" not in monitor
+
+
+@pytest.mark.asyncio
+async def test_tick_batches_price_requests_for_all_tokens():
+    requests = []
+
+    async def fetch(mints):
+        requests.append(list(mints))
+        return {mint: 1.0 for mint in mints}
+
+    monitor = PositionMonitor(fetch, price_batch_size=100)
+    for index in range(250):
+        monitor.add(_position((index % 2, f"MINT{index}"), mint=f"MINT{index}"))
+
+    await monitor.tick()
+
+    assert sorted(len(chunk) for chunk in requests) == [50, 100, 100]
+    assert monitor.price_requests == 3
+
+
+@pytest.mark.asyncio
+async def test_engine_tracks_sniper_positions_and_closes_on_trigger():
+    prices = {"BONK": 1.0, "WIF": 2.0}
+    jupiter = SimpleNamespace(get_token_price=None)
+
+    async def get_token_price(mints):
+        return {mint: prices[mint] for mint in mints}
+
+    jupiter.get_token_price = get_token_price
+    sells = []
+
+    async def execute_sell(user_id, token_mint, **kwargs):
+        sells.append((token_mint, kwargs['metadata']['exit_reason']))
+        return {'success': True}
+
+    executor = SimpleNamespace(execute_sell=execute_sell)
+    engine = AutomatedTradingEngine(TradingConfig(), SimpleNamespace(tracked_wallets={}), jupiter, None, trade_executor=executor)
+    engine.user_id = 1
+    engine.db = None
+
+    # Written straight into active_positions, the way the sniper registers positions
+    engine.active_positions["BONK"] = {'entry_price': 1.0, 'amount': 0.5}
+    engine.active_positions["WIF"] = {'entry_price': 2.0, 'amount': 0.5, 'take_profit_pct': 0.25}
+
+    await engine._manage_positions()
+    assert len(engine.position_monitor) == 2
+    assert sells == []
+
+    prices.update(BONK=0.85, WIF=2.6)
+    await engine._manage_positions()
+
+    assert sorted(sells) == [("BONK", "STOP_LOSS"), ("WIF", "TAKE_PROFIT")]
+    assert engine.active_positions == {}
+    assert len(engine.position_monitor) == 0
@@ -0,0 +1,79 @@
+import asyncio
+import json
+
+import pytest
+
+from src.modules.price_service import PriceService, parse_feed_map
+
+SOL = "So11111111111111111111111111111111111111112"
+TOKEN = "DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263"
+SOL_FEED = "ef0d8b6fda2ceba41da15d4095d1da392a0d2f8ed0c6c7bc0f4cfac8c280b56d"
+
+
+class FakeJupiter:
+    def __init__(self, prices):
+        self.prices = prices
+        self.calls = []
+
+    async def fetch(self, mints):
+        self.calls.append(list(mints))
+        await asyncio.sleep(0.01)
+        return {mint: self.prices[mint] for mint in mints if mint in self.prices}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reads_share_one_batched_fetch_then_hit_the_store():
+    jupiter = FakeJupiter({TOKEN: 2.5, SOL: 150.0})
+    service = PriceService(jupiter.fetch, max_age=5)
+
+    results = await asyncio.gather(
+        service.get_prices([TOKEN, SOL]),
+        service.get_prices([TOKEN]),
+        service.get_prices([SOL, "unknown"]),
+    )
+
+    assert results[0] == {TOKEN: 2.5, SOL: 150.0}
+    assert results[1] == {TOKEN: 2.5}
+    assert results[2] == {SOL: 150.0}
+    assert jupiter.calls == [[TOKEN, SOL], ["unknown"]]
+
+    assert await service.get_prices([TOKEN, SOL]) == {TOKEN: 2.5, SOL: 150.0}
+    assert len(jupiter.calls) == 2
+    assert service.get_price(TOKEN) == 2.5
+
+
+@pytest.mark.asyncio
+async def test_poll_refreshes_watched_mints_keeps_history_and_notifies():
+    jupiter = FakeJupiter({TOKEN: 1.0})
+    service = PriceService(jupiter.fetch, poll_interval=0, idle_seconds=60, history_size=3)
+    ticks = []
+    service.subscribe(ticks.append)
+
+    service.watch([TOKEN])
+    for price in (1.0, 1.1, 1.2, 1.3):
+        jupiter.prices[TOKEN] = price
+        await service.poll()
+
+    assert [tick.price for tick in ticks] == [1.0, 1.1, 1.2, 1.3]
+    assert [price for _, price in service.history(TOKEN)] == [1.1, 1.2, 1.3]
+
+    service._watched[TOKEN] -= 120  # nobody asked for it in a while
+    await service.poll()
+    assert service.stats()["watched"] == 0
+    assert len(jupiter.calls) == 4
+
+
+@pytest.mark.asyncio
+async def test_pyth_stream_ticks_keep_major_feeds_off_the_poll():
+    jupiter = FakeJupiter({SOL: 1.0, TOKEN: 2.0})
+    service = PriceService(jupiter.fetch, pyth_feeds=parse_feed_map(f"{SOL}:0x{SOL_FEED}"), poll_interval=2)
+
+    line = "data:" + json.dumps({
+        "parsed": [{"id": SOL_FEED, "price": {"price": "15012345678", "expo": -8, "publish_time": 1}}]
+    })
+    assert service.handle_stream_line(line.encode()) == 1
+    assert service.get_tick(SOL).source == "pyth"
+
+    assert await service.get_prices([SOL, TOKEN]) == {SOL: pytest.approx(150.12345678), TOKEN: 2.0}
+    await service.poll()
+    assert jupiter.calls == [[TOKEN]]
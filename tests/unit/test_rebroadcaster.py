@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+from solana.rpc.async_api import AsyncClient
+from solders.keypair import Keypair
+from solders.message import MessageV0
+from solders.transaction import VersionedTransaction
+
+from src.modules.confirmation_service import ConfirmationMultiplexer
+from src.modules.http_pool import close_http_sessions
+from src.modules.rebroadcaster import CONFIRMED, EXPIRED, Rebroadcaster
+from src.ops import broadcast
+from src.ops.standin import StandinConfig, StandinServer
+
+
+async def _signed_tx(client: AsyncClient) -> bytes:
+    blockhash = (await client.get_latest_blockhash()).value.blockhash
+    keypair = Keypair()
+    return bytes(VersionedTransaction(MessageV0.try_compile(keypair.pubkey(), [], [], blockhash), [keypair]))
+
+
+def _rebroadcaster(confirmations, client, **kwargs) -> Rebroadcaster:
+    return Rebroadcaster(lambda signature, timeout: confirmations.wait(signature, timeout=timeout), client, **kwargs)
+
+
+async def _send_and_rebroadcast(client, rebroadcaster, tx_bytes, **kwargs):
+    signature = await broadcast.send(client, tx_bytes)
+    return await rebroadcaster.run(
+        signature,
+        lambda: broadcast.rebroadcast(client, tx_bytes),
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_dropped_transactions_land_through_rebroadcast():
+    standin = await StandinServer(StandinConfig(land_ms=30, drop_rate=0.6, seed=3)).start()
+    client = AsyncClient(standin.rpc_url)
+    confirmations = ConfirmationMultiplexer(client, poll_interval=0.02)
+    rebroadcaster = _rebroadcaster(confirmations, client, interval=0.08)
+    try:
+        transactions = [await _signed_tx(client) for _ in range(10)]
+        outcomes = await asyncio.gather(*(
+            _send_and_rebroadcast(client, rebroadcaster, tx_bytes) for tx_bytes in transactions
+        ))
+
+        assert all(outcome.status == CONFIRMED for outcome in outcomes)
+        assert sum(outcome.sends for outcome in outcomes) > len(outcomes)  # drops were re-sent
+        assert standin.stats()["sends"] == rebroadcaster.total_sends
+        stats = rebroadcaster.stats()
+        assert stats["outcomes"] == {CONFIRMED: 10}
+        assert stats["landed_sends_max"] >= 2
+        assert 0 < stats["time_to_land_p50"] <= stats["time_to_land_p99"]
+    finally:
+        await confirmations.close()
+        await client.close()
+        await close_http_sessions()
+        await standin.stop()
+
+
+@pytest.mark.asyncio
+async def test_rebroadcast_stops_once_the_blockhash_expires():
+    standin = await StandinServer(StandinConfig(drop_rate=1.0, seed=3)).start()
+    client = AsyncClient(standin.rpc_url)
+    confirmations = ConfirmationMultiplexer(client, poll_interval=0.02)
+    rebroadcaster = _rebroadcaster(confirmations, client, interval=0.1, grace=0.1)
+    try:
+        tx_bytes = await _signed_tx(client)
+        height = (await client.get_block_height()).value
+        outcome = await _send_and_rebroadcast(
+            client, rebroadcaster, tx_bytes, last_valid_block_height=height + 2,
+        )
+
+        assert outcome.status == EXPIRED
+        assert not outcome.landed
+        assert outcome.sends > 2
+        sends = standin.stats()["sends"]
+        await asyncio.sleep(0.3)
+        assert standin.stats()["sends"] == sends == outcome.sends
+        assert len(confirmations) == 0
+    finally:
+        await confirmations.close()
+        await client.close()
+        await close_http_sessions()
+        await standin.stop()
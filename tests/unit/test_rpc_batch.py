@@ -0,0 +1,161 @@
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+from aiohttp import web
+
+from src.modules.automated_trading import TradingConfig
+from src.modules.rpc_batch import JsonRpcBatchClient, RpcBatchError
+from src.modules.signal_core import WalletSignalCore
+from src.modules.wallet_intelligence import WalletMetrics
+
+
+WALLETS = [
+    "9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWWM",
+    "7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU",
+    "5Q544fKrFoe6tsEbD7S8EmxGTJYAKtTVhAW5Q5pge4j1",
+]
+TOKEN = "DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263"
+
+
+def _transaction(block_time, mint, owner=WALLETS[0]):
+    return {
+        "slot": 1,
+        "blockTime": block_time,
+        "meta": {
+            "err": None,
+            "fee": 5000,
+            "preBalances": [1],
+            "postBalances": [1],
+            "innerInstructions": [],
+            "logMessages": [],
+            "preTokenBalances": [],
+            "postTokenBalances": [
+                {
+                    "accountIndex": 1,
+                    "mint": mint,
+                    "owner": owner,
+                    "uiTokenAmount": {"amount": "1000", "decimals": 3, "uiAmount": 1.0, "uiAmountString": "1"},
+                }
+            ],
+            "rewards": [],
+            "status": {"Ok": None},
+            "loadedAddresses": {"writable": [], "readonly": []},
+        },
+        "transaction": {
+            "signatures": ["1" * 64],
+            "message": {
+                "accountKeys": [
+                    {"pubkey": owner, "signer": True, "writable": True, "source": "transaction"}
+                ],
+                "recentBlockhash": "11111111111111111111111111111111",
+                "instructions": [
+                    {
+                        "program": "spl-token",
+                        "programId": "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA",
+                        "parsed": {"type": "transferChecked", "info": {"mint": mint}},
+                        "stackHeight": None,
+                    }
+                ],
+            },
+        },
+        "version": 0,
+    }
+
+
+class StubBatchRpc:
+    """JSON-RPC endpoint that answers batches in reverse order."""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.http_requests = 0
+        self.batch_sizes = []
+        self._runner = None
+        self.url = None
+
+    async def __aenter__(self):
+        app = web.Application()
+        app.router.add_post("/", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}/"
+        return self
+
+    async def __aexit__(self, *exc):
+        await self._runner.cleanup()
+
+    async def _handle(self, request):
+        self.http_requests += 1
+        payload = await request.json()
+        self.batch_sizes.append(len(payload))
+        responses = [self.handler(call) for call in payload]
+        return web.Response(text=json.dumps(list(reversed(responses))), content_type="application/json")
+
+
+@pytest.mark.asyncio
+async def test_call_many_demultiplexes_out_of_order_responses():
+    def handler(call):
+        if call["params"][0] == "bad":
+            return {"jsonrpc": "2.0", "id": call["id"], "error": {"code": -32602, "message": "invalid"}}
+        return {"jsonrpc": "2.0", "id": call["id"], "result": call["params"][0].upper()}
+
+    requests_seen = []
+    async with StubBatchRpc(handler) as server:
+        client = JsonRpcBatchClient(server.url, batch_size=2, on_request=lambda: requests_seen.append(1))
+        results = await client.call_many([("echo", [value]) for value in ["a", "b", "bad", "d", "e"]])
+        await client.close()
+
+    assert results[:2] == ["A", "B"]
+    assert isinstance(results[2], RpcBatchError)
+    assert results[3:] == ["D", "E"]
+    assert server.batch_sizes == [2, 2, 1]
+    assert client.get_counters() == {"logical_calls": 5, "http_requests": 3}
+    assert len(requests_seen) == 3
+
+
+@pytest.mark.asyncio
+async def test_scan_batches_signatures_and_transactions(monkeypatch):
+    monkeypatch.delenv("HELIUS_API_KEY", raising=False)
+    now = int(time.time())
+
+    def handler(call):
+        if call["method"] == "getSignaturesForAddress":
+            address = call["params"][0]
+            result = [{"signature": f"sig-{address[:4]}", "blockTime": now - 5, "err": None}]
+        else:
+            # Each wallet's signature is that wallet buying the token
+            owner = next(address for address in WALLETS if call["params"][0] == f"sig-{address[:4]}")
+            result = _transaction(now - 5, TOKEN, owner)
+        return {"jsonrpc": "2.0", "id": call["id"], "result": result}
+
+    async with StubBatchRpc(handler) as server:
+        tracked = {
+            address: WalletMetrics(address=address, win_rate=0.8, profit_factor=2.0, total_trades=50)
+            for address in WALLETS
+        }
+        client = SimpleNamespace(_provider=SimpleNamespace(endpoint_uri=server.url))
+        intelligence = SimpleNamespace(tracked_wallets=tracked, client=client)
+        recorded = []
+        monitor = SimpleNamespace(
+            record_request=lambda: None,
+            record_metric=lambda name, value, tags=None: recorded.append((name, value, tags)),
+        )
+        core = WalletSignalCore(TradingConfig(), intelligence, monitor=monitor)
+
+        opportunities = await core._scan_for_opportunities()
+        await core.stop()
+
+    assert server.http_requests == 2
+    assert server.batch_sizes == [3, 3]
+    assert core._wallet_last_signature == {address: f"sig-{address[:4]}" for address in WALLETS}
+    assert [opp["token_mint"] for opp in opportunities] == [TOKEN]
+    assert opportunities[0]["signal_count"] == 3
+
+    rpc_metric = [entry for entry in recorded if entry[0] == "automated_trader.rpc_requests"][0]
+    assert rpc_metric[1] == 6
+    assert rpc_metric[2]["logical_calls"] == 6
+    assert rpc_metric[2]["http_requests"] == 2
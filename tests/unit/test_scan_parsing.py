@@ -0,0 +1,66 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.modules.automated_trading import TradingConfig
+from src.modules.signal_core import WalletSignalCore
+from src.modules.wallet_intelligence import WalletMetrics
+
+
+WALLETS = [
+    "9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWWM",
+    "7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU",
+    "5Q544fKrFoe6tsEbD7S8EmxGTJYAKtTVhAW5Q5pge4j1",
+]
+
+
+class StubSignatureClient:
+    async def get_signatures_for_address(self, pubkey, limit=3):
+        now = int(time.time())
+        return SimpleNamespace(value=[
+            SimpleNamespace(signature=f"{str(pubkey)[:4]}-{index}", block_time=now, err=None)
+            for index in range(limit)
+        ])
+
+
+@pytest.mark.asyncio
+async def test_scan_parses_new_signatures_concurrently(monkeypatch):
+    monkeypatch.setenv("AUTO_TRADER_RPC_BATCH_SIZE", "0")
+    monkeypatch.setenv("AUTO_TRADER_PARSE_CONCURRENCY", "4")
+    monkeypatch.delenv("HELIUS_API_KEY", raising=False)
+
+    tracked = {
+        address: WalletMetrics(address=address, win_rate=0.8, profit_factor=2.0, total_trades=50)
+        for address in WALLETS
+    }
+    intelligence = SimpleNamespace(tracked_wallets=tracked, client=StubSignatureClient())
+    core = WalletSignalCore(TradingConfig(), intelligence)
+
+    # Second wallet already processed its newest signature last scan
+    core._wallet_last_signature[WALLETS[1]] = f"{WALLETS[1][:4]}-1"
+
+    parsed = []
+    in_flight = 0
+    peak = 0
+
+    async def fake_parse(signature, owner=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.02)
+        in_flight -= 1
+        parsed.append(signature)
+        return None, 1
+
+    core._parse_rpc_transaction = fake_parse
+    await core._scan_for_opportunities()
+
+    assert sorted(parsed) == sorted([
+        f"{WALLETS[0][:4]}-0", f"{WALLETS[0][:4]}-1", f"{WALLETS[0][:4]}-2",
+        f"{WALLETS[1][:4]}-0",
+        f"{WALLETS[2][:4]}-0", f"{WALLETS[2][:4]}-1", f"{WALLETS[2][:4]}-2",
+    ])
+    assert peak == 4
+    assert core._wallet_last_signature[WALLETS[1]] == f"{WALLETS[1][:4]}-0"
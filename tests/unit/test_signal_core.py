@@ -0,0 +1,177 @@
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from src.modules.automated_trading import AutomatedTradingEngine, TradingConfig
+from src.modules.signal_core import WalletSignalCore
+from src.modules.wallet_intelligence import WalletMetrics
+
+TOKEN = "DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263"
+OTHER_TOKEN = "EKpQGSJtjMFqKZ9KQanSqYXRcF8fBopzLHYxdM65zcjm"
+WALLET = "9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWWM"
+
+
+class StubProtection:
+    async def comprehensive_token_check(self, token_mint):
+        return {"is_safe": True}
+
+
+class StubTradeExecutor:
+    def __init__(self):
+        self.buys = []
+
+    async def execute_buy(self, user_id, token_mint, amount, **kwargs):
+        self.buys.append((user_id, token_mint, amount))
+        return {"success": True, "price": 1.0}
+
+
+def _engine(core, executor, user_id, **config):
+    engine = AutomatedTradingEngine(
+        TradingConfig(**config),
+        core.wallet_intelligence,
+        jupiter_client=None,
+        protection_system=StubProtection(),
+        trade_executor=executor,
+        signal_core=core,
+    )
+    engine.is_running = True
+    engine.user_id = user_id
+    engine.db = None
+    core.subscribe(engine)
+    return engine
+
+
+def _core():
+    metrics = WalletMetrics(address=WALLET, win_rate=1.0, profit_factor=3.0, consistency_score=1.0, total_trades=100)
+    intelligence = SimpleNamespace(tracked_wallets={WALLET: metrics}, client=None)
+    return WalletSignalCore(TradingConfig(auto_trade_min_confidence=0.6), intelligence)
+
+
+@pytest.mark.asyncio
+async def test_one_signal_fans_out_to_every_user_with_their_own_gates():
+    core = _core()
+    executor = StubTradeExecutor()
+    _engine(core, executor, 1, auto_trade_min_confidence=0.6, default_buy_amount=0.2)
+    _engine(core, executor, 2, auto_trade_min_confidence=0.6, default_buy_amount=0.5)
+    _engine(core, executor, 3, auto_trade_min_confidence=0.95)  # stricter user skips it
+
+    core._record_token_signal(core._poll_signals, TOKEN, WALLET, core.wallet_intelligence.tracked_wallets[WALLET])
+    opportunities = core._build_opportunities(core._poll_signals)
+    await core._publish(opportunities, core._poll_signals)
+
+    assert sorted(executor.buys) == [(1, TOKEN, 0.2), (2, TOKEN, 0.5)]
+
+    # Each user trades a windowed signal at most once
+    await core._publish(core._build_opportunities(core._poll_signals), core._poll_signals)
+    assert len(executor.buys) == 2
+
+
+@pytest.mark.asyncio
+async def test_declined_signal_is_offered_again_to_that_user_only():
+    core = _core()
+    executor = StubTradeExecutor()
+    holder = _engine(core, executor, 1)
+    _engine(core, executor, 2)
+    holder.active_positions[TOKEN] = {'entry_price': 1.0, 'amount': 0.1, 'timestamp': datetime.now()}
+
+    core._record_token_signal(core._poll_signals, TOKEN, WALLET, core.wallet_intelligence.tracked_wallets[WALLET])
+    await core._publish(core._build_opportunities(core._poll_signals), core._poll_signals)
+    assert [user for user, _, _ in executor.buys] == [2]
+
+    del holder.active_positions[TOKEN]
+    await core._publish(core._build_opportunities(core._poll_signals), core._poll_signals)
+    assert [user for user, _, _ in executor.buys] == [2, 1]
+
+
+@pytest.mark.asyncio
+async def test_attempted_or_rejected_signal_is_used_up_but_a_declined_one_is_offered_again():
+    core = _core()
+
+    class FailingTradeExecutor(StubTradeExecutor):
+        async def execute_buy(self, user_id, token_mint, amount, **kwargs):
+            self.buys.append((user_id, token_mint, amount))
+            if user_id == 1:
+                return {"success": False, "error": "slippage"}
+            return {"success": True, "price": 1.0}
+
+    class RejectingProtection:
+        async def comprehensive_token_check(self, token_mint):
+            return {"is_safe": False}
+
+    executor = FailingTradeExecutor()
+    failed = _engine(core, executor, 1)
+    rejected = _engine(core, executor, 2)
+    rejected.protection = RejectingProtection()
+    limited = _engine(core, executor, 3)
+    limited.daily_stats['trades'] = limited.config.auto_trade_max_daily_trades
+
+    core._record_token_signal(core._poll_signals, TOKEN, WALLET, core.wallet_intelligence.tracked_wallets[WALLET])
+    await core._publish(core._build_opportunities(core._poll_signals), core._poll_signals)
+    assert executor.buys == [(1, TOKEN, 0.1)]
+    taken_by = core._poll_signals[TOKEN]['taken_by']
+    assert id(failed) in taken_by and id(rejected) in taken_by and id(limited) not in taken_by
+
+    # The failed swap is not retried; the user held back by its daily limit gets it once the limit resets
+    limited.daily_stats['trades'] = 0
+    await core._publish(core._build_opportunities(core._poll_signals), core._poll_signals)
+    await core._publish(core._build_opportunities(core._poll_signals), core._poll_signals)
+    assert executor.buys == [(1, TOKEN, 0.1), (3, TOKEN, 0.1)]
+    assert TOKEN in limited.active_positions and TOKEN not in failed.active_positions
+
+
+@pytest.mark.asyncio
+async def test_streamed_signatures_are_not_held_up_by_a_trade_in_progress():
+    core = _core()
+    core.running = True
+    release = asyncio.Event()
+
+    class SlowTradeExecutor(StubTradeExecutor):
+        async def execute_buy(self, user_id, token_mint, amount, **kwargs):
+            self.buys.append((user_id, token_mint, amount))
+            if token_mint == TOKEN:
+                await release.wait()
+            return {"success": True, "price": 1.0}
+
+    executor = SlowTradeExecutor()
+    _engine(core, executor, 1)
+    mints = {"first": TOKEN, "second": OTHER_TOKEN, "repeat": TOKEN}
+
+    async def fake_parse(signature, owner=None):
+        return mints[signature], 1
+
+    core._parse_swap_transaction = fake_parse
+
+    first = asyncio.create_task(core._handle_streamed_signature(WALLET, "first"))
+    await asyncio.sleep(0.01)
+    assert [mint for _, mint, _ in executor.buys] == [TOKEN]
+
+    # Handled while the first trade is still waiting; the same signal is not offered twice
+    await asyncio.wait_for(core._handle_streamed_signature(WALLET, "second"), 1)
+    await asyncio.wait_for(core._handle_streamed_signature(WALLET, "repeat"), 1)
+    assert [mint for _, mint, _ in executor.buys] == [TOKEN, OTHER_TOKEN]
+
+    release.set()
+    await first
+    assert [mint for _, mint, _ in executor.buys] == [TOKEN, OTHER_TOKEN]
+    assert not core._stream_signals[TOKEN]['pending_by']
+
+
+@pytest.mark.asyncio
+async def test_core_stops_when_last_user_leaves():
+    core = _core()
+    core.streaming_enabled = False
+    executor = StubTradeExecutor()
+    first = AutomatedTradingEngine(TradingConfig(), core.wallet_intelligence, None, StubProtection(), trade_executor=executor, signal_core=core)
+    second = AutomatedTradingEngine(TradingConfig(), core.wallet_intelligence, None, StubProtection(), trade_executor=executor, signal_core=core)
+
+    await first.start_automated_trading(1, None, None)
+    await second.start_automated_trading(2, None, None)
+    assert core.running and core.subscriber_count == 2
+
+    await first.stop_automated_trading()
+    assert core.running
+
+    await second.stop_automated_trading()
+    assert not core.running and core.subscriber_count == 0
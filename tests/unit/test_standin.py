@@ -0,0 +1,63 @@
+import pytest
+from cryptography.fernet import Fernet
+from solana.rpc.async_api import AsyncClient
+from solders.pubkey import Pubkey
+
+from src.modules.database import DatabaseManager
+from src.modules.http_pool import close_http_sessions
+from src.modules.jupiter_client import JupiterClient
+from src.modules.trade_execution import TradeExecutionService
+from src.modules.wallet_manager import UserWalletManager
+from src.ops.standin import EndpointProfile, StandinConfig, StandinServer, parse_profiles
+
+SETTINGS = {
+    "max_trade_size_sol": 10.0,
+    "daily_loss_limit_sol": 100.0,
+    "slippage_percentage": 1.0,
+    "check_honeypots": False,
+    "min_liquidity_usd": 0.0,
+}
+
+
+def test_parse_profiles():
+    assert parse_profiles("quote=120:30,rpc=40:10:0.05") == {
+        "quote": EndpointProfile(120, 30),
+        "rpc": EndpointProfile(40, 10, 0.05),
+    }
+    with pytest.raises(ValueError):
+        parse_profiles("bogus=1")
+
+
+@pytest.mark.asyncio
+async def test_buy_and_sell_through_the_real_service(monkeypatch, tmp_path):
+    standin = await StandinServer(StandinConfig(land_ms=20, seed=1)).start()
+    for name, value in standin.env().items():
+        monkeypatch.setenv(name, value)
+    monkeypatch.setenv("WALLET_ENCRYPTION_KEY", Fernet.generate_key().decode())
+    monkeypatch.setenv("PYTH_PRICE_FEED_ENABLED", "false")
+    monkeypatch.setenv("CONFIRMATION_POLL_MS", "20")
+
+    db = DatabaseManager(f"sqlite+aiosqlite:///{tmp_path}/standin.db")
+    client = AsyncClient(standin.rpc_url)
+    try:
+        await db.init_db()
+        wallets = UserWalletManager(db, client, default_user_settings=SETTINGS)
+        await wallets.get_or_create_user_wallet(1)
+        mint = str(Pubkey.new_unique())
+
+        async with JupiterClient(client) as jupiter:
+            service = TradeExecutionService(db, wallets, jupiter)
+            bought = await service.execute_buy(1, mint, 0.5, context="standin")
+            assert bought["success"], bought
+            sold = await service.execute_sell(1, mint, context="standin")
+            assert sold["success"], sold
+
+        assert (await db.get_position_by_token(1, mint)) is None
+        stats = standin.stats()
+        assert stats["sends"] == stats["landed"] == 2
+        assert stats["rpc_methods"]["sendTransaction"] == 2
+    finally:
+        await client.close()
+        await close_http_sessions()
+        await db.engine.dispose()
+        await standin.stop()
@@ -0,0 +1,62 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from src.modules.swap_decoder import decode_swap, load_result, token_deltas
+
+
+FIXTURES = Path(__file__).resolve().parent.parent / "fixtures" / "swaps"
+
+
+def _load(name):
+    return (FIXTURES / name).read_bytes()
+
+
+@pytest.mark.parametrize(
+    "fixture, mint, amount, decimals, sol_change",
+    [
+        # Jupiter route, SOL wrapped into a temporary wSOL account
+        ("jupiter_buy_bonk.json", "DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263", 2718281828459, 5, -500_000_000),
+        # Raydium AMM v4, json (not jsonParsed) encoding, pre-funded wSOL account
+        ("raydium_buy_wif.json", "EKpQGSJtjMFqKZ9KQanSqYXRcF8fBopzLHYxdM65zcjm", 498765432, 6, -1_200_000_000),
+        # pump.fun bonding curve paid in native SOL (includes ATA rent + protocol fee)
+        ("pumpfun_buy.json", "2qEHjDLDLbuBgRYvsxhc5D6uDWAivNFZGan56P1tpump", 10713941250000, 6, -305_039_280),
+    ],
+)
+def test_decodes_buys_from_recorded_transactions(fixture, mint, amount, decimals, sol_change):
+    raw = _load(fixture)
+    result = json.loads(raw)["result"]
+    fee_payer = result["transaction"]["message"]["accountKeys"][0]
+    swap = decode_swap(raw)
+
+    assert swap is not None
+    assert swap.mint == mint
+    assert swap.amount == amount
+    assert swap.decimals == decimals
+    assert swap.sol_change_lamports == sol_change
+    assert swap.owner == (fee_payer["pubkey"] if isinstance(fee_payer, dict) else fee_payer)
+    assert swap.block_time == result["blockTime"]
+
+
+@pytest.mark.parametrize("fixture", ["orca_sell_jup.json", "jupiter_failed_slippage.json"])
+def test_sells_and_failed_transactions_are_not_buys(fixture):
+    assert decode_swap(_load(fixture)) is None
+
+
+def test_accepts_str_result_object_and_other_owner():
+    response = json.loads(_load("jupiter_buy_bonk.json"))
+    result = response["result"]
+
+    assert decode_swap(json.dumps(result)).mint == "DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263"
+    assert load_result(_load("jupiter_buy_bonk.json")) == result
+    # The pool authority only lost BONK, so it bought nothing
+    assert decode_swap(result, owner="HcoJqG325TTifs8wDkvpR9ZN3KUgNkiQ8EWLfHWHybRj") is None
+
+
+def test_token_deltas_net_out_per_owner_and_mint():
+    meta = json.loads(_load("orca_sell_jup.json"))["result"]["meta"]
+    deltas = token_deltas(meta)
+
+    assert deltas[("5tzFkiKscXHK5ZXCGbXZxdw7gTjjD1mBwuoFbhUvuAi9", "JUPyiwrYJFskUPiHa7hkeR8VUtAeFoSYbKedZNsDvCN")] == (-250000000, 6)
+    assert deltas[("C1MgLojNLWBKADvu9BHdtgzz1oZX4dZ5zGdGcgvvW8Wz", "JUPyiwrYJFskUPiHa7hkeR8VUtAeFoSYbKedZNsDvCN")] == (250000000, 6)
@@ -0,0 +1,190 @@
+import base64
+from types import SimpleNamespace
+
+import pytest
+from solders.hash import Hash
+from solders.keypair import Keypair
+from solders.message import MessageV0
+from solders.transaction import VersionedTransaction
+
+from src.modules.jupiter_client import JupiterClient
+from src.modules.swap_pool import SOL_MINT, PrebuiltSwapPool, SwapIntent
+
+TOKEN = "DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263"
+
+
+def _swap_transaction(keypair):
+    message = MessageV0.try_compile(keypair.pubkey(), [], [], Hash.default())
+    return base64.b64encode(bytes(VersionedTransaction(message, [keypair]))).decode()
+
+
+class StubJupiter:
+    def __init__(self, keypair):
+        self.keypair = keypair
+        self.quotes = 0
+        self.swaps = 0
+
+    async def get_quote(self, input_mint, output_mint, amount, slippage_bps=50, **kwargs):
+        self.quotes += 1
+        return {"inAmount": str(amount), "outAmount": str(amount * 2)}
+
+    async def get_swap_transaction(self, quote, user_public_key, **kwargs):
+        self.swaps += 1
+        return _swap_transaction(self.keypair)
+
+
+def _intent(keypair, amount=100_000_000):
+    return SwapIntent(str(keypair.pubkey()), SOL_MINT, TOKEN, amount, 500)
+
+
+@pytest.mark.asyncio
+async def test_pool_builds_wanted_swaps_and_hands_them_out_once():
+    keypair = Keypair()
+    jupiter = StubJupiter(keypair)
+    wanted = [_intent(keypair)]
+    pool = PrebuiltSwapPool(jupiter, max_age=20)
+    pool.add_source(lambda: wanted)
+
+    assert await pool.refresh() == 1
+    assert await pool.refresh() == 0  # still fresh, nothing rebuilt
+    assert jupiter.swaps == 1
+
+    prebuilt = pool.take(_intent(keypair))
+    assert prebuilt.quote["inAmount"] == "100000000"
+    assert pool.take(_intent(keypair)) is None  # single use
+
+    await pool.refresh()
+    wanted.clear()
+    await pool.refresh()
+    assert len(pool) == 0
+    assert pool.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_rebuilds_on_age_and_price_move():
+    keypair = Keypair()
+    jupiter = StubJupiter(keypair)
+    prices = {TOKEN: 1.0}
+
+    async def price_fetcher(mints):
+        return {mint: prices[mint] for mint in mints}
+
+    pool = PrebuiltSwapPool(jupiter, price_fetcher=price_fetcher, max_age=20, price_tolerance_bps=100)
+    pool.add_source(lambda: [_intent(keypair)])
+    await pool.refresh()
+
+    prices[TOKEN] = 1.005  # inside tolerance
+    assert await pool.refresh() == 0
+
+    prices[TOKEN] = 1.02
+    assert await pool.refresh() == 1
+
+    pool._entries[_intent(keypair)].built_at -= 11  # past half of max_age
+    assert await pool.refresh() == 1
+
+    pool._entries[_intent(keypair)].built_at -= 25
+    assert pool.take(_intent(keypair)) is None
+    assert pool.stats()["stale"] == 1
+
+
+class CountingSession:
+    def __init__(self, keypair):
+        self.keypair = keypair
+        self.requests = []
+        self.swap_payloads = []
+
+    def get(self, url, params=None):
+        self.requests.append(url)
+        return _Response({"inAmount": params["amount"], "outAmount": "5"})
+
+    def post(self, url, json=None):
+        self.requests.append(url)
+        self.swap_payloads.append(json)
+        return _Response({"swapTransaction": _swap_transaction(self.keypair)})
+
+
+class _Response:
+    status = 200
+
+    def __init__(self, payload):
+        self.payload = payload
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def json(self):
+        return self.payload
+
+
+@pytest.mark.asyncio
+async def test_execute_swap_with_prebuilt_swap_only_signs_and_sends():
+    keypair = Keypair()
+    sent = []
+
+    async def send_raw_transaction(tx_bytes, opts=None):
+        sent.append(tx_bytes)
+        return SimpleNamespace(value="sig")
+
+    client = JupiterClient(rpc_client=SimpleNamespace(send_raw_transaction=send_raw_transaction))
+    client.session = CountingSession(keypair)
+
+    async def confirmed(signature, max_wait=None):
+        return True
+
+    client._confirm_transaction = confirmed
+    client.swap_pool = PrebuiltSwapPool(client)
+    client.swap_pool.add_source(lambda: [_intent(keypair)])
+    await client.swap_pool.refresh()
+    client.quote_cache.clear()
+    client.session.requests.clear()
+
+    trace = {}
+    result = await client.execute_swap(SOL_MINT, TOKEN, 100_000_000, keypair, slippage_bps=500, latency_trace=trace)
+
+    assert result["success"] and result["prebuilt"]
+    assert client.session.requests == []  # no quote, no /swap on the critical path
+    assert len(sent) == 1
+    assert list(trace) == ["quote_received", "broadcast", "confirmed"]
+
+    # Without a prebuilt entry the quote and /swap round trips are back
+    result = await client.execute_swap(SOL_MINT, TOKEN, 100_000_000, keypair, slippage_bps=500)
+    assert result["success"] and not result["prebuilt"]
+    assert len(client.session.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_prebuilt_swap_carries_its_priority_fee_and_only_matches_that_fee():
+    keypair = Keypair()
+
+    async def send_raw_transaction(tx_bytes, opts=None):
+        return SimpleNamespace(value="sig")
+
+    client = JupiterClient(rpc_client=SimpleNamespace(send_raw_transaction=send_raw_transaction))
+    client.session = CountingSession(keypair)
+
+    async def confirmed(signature, max_wait=None):
+        return True
+
+    client._confirm_transaction = confirmed
+    client.swap_pool = PrebuiltSwapPool(client)
+    intent = SwapIntent(str(keypair.pubkey()), SOL_MINT, TOKEN, 100_000_000, 500, 250_000)
+    client.swap_pool.add_source(lambda: [intent])
+    await client.swap_pool.refresh()
+    assert client.session.swap_payloads[-1]["prioritizationFeeLamports"] == 250_000
+
+    # A caller paying another fee does not get the entry built with 250k
+    result = await client.execute_swap(
+        SOL_MINT, TOKEN, 100_000_000, keypair, slippage_bps=500, priority_fee_lamports=400_000
+    )
+    assert result["success"] and not result["prebuilt"]
+    assert client.session.swap_payloads[-1]["prioritizationFeeLamports"] == 400_000
+    assert intent in client.swap_pool
+
+    result = await client.execute_swap(
+        SOL_MINT, TOKEN, 100_000_000, keypair, slippage_bps=500, priority_fee_lamports=250_000
+    )
+    assert result["success"] and result["prebuilt"]
+    assert intent not in client.swap_pool
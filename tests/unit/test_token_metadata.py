@@ -0,0 +1,70 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from src.modules.jupiter_client import JupiterClient
+from src.modules.token_metadata import TokenMetadataStore
+
+TOKENS = [
+    {"address": f"MINT{index}", "symbol": f"T{index}", "decimals": 6}
+    for index in range(2000)
+]
+
+
+def test_lookups_and_batches_after_reopen(tmp_path):
+    path = tmp_path / "tokens.sqlite"
+    TokenMetadataStore(path).load_raw(json.dumps(TOKENS))
+
+    # A fresh process opens the persisted index without downloading
+    store = TokenMetadataStore(path)
+    assert store.open()
+    assert store.get("MINT42") == {"address": "MINT42", "symbol": "T42", "decimals": 6}
+    assert store.get("UNKNOWN") is None
+
+    mints = [f"MINT{index}" for index in range(0, 2000, 2)] + ["UNKNOWN"]
+    found = store.get_many(mints)
+    assert len(found) == 1000
+    assert found["MINT1998"]["symbol"] == "T1998"
+
+
+@pytest.mark.asyncio
+async def test_stale_index_keeps_serving_while_refreshing(tmp_path):
+    store = TokenMetadataStore(tmp_path / "tokens.sqlite", refresh_seconds=3600)
+    downloads = []
+
+    async def fetch_raw():
+        downloads.append(time.time())
+        await asyncio.sleep(0.01)
+        return json.dumps(TOKENS[:10] if len(downloads) == 1 else TOKENS).encode()
+
+    # No index yet: the first call waits for the download
+    assert await store.ensure_fresh(fetch_raw)
+    assert store.get("MINT500") is None
+
+    store._updated_at -= 7200
+    store._next_attempt = 0.0
+    assert await store.ensure_fresh(fetch_raw)
+    assert store.get("MINT500") is None  # old index still answers
+    await store._refresh_task
+    assert store.get("MINT500")["symbol"] == "T500"
+    assert len(downloads) == 2
+
+
+@pytest.mark.asyncio
+async def test_jupiter_get_token_info_uses_local_index(tmp_path):
+    client = JupiterClient(rpc_client=None)
+    client.token_metadata = TokenMetadataStore(tmp_path / "tokens.sqlite")
+    downloads = []
+
+    async def download():
+        downloads.append(1)
+        return json.dumps(TOKENS).encode()
+
+    client._download_token_list = download
+
+    assert (await client.get_token_info("MINT7"))["symbol"] == "T7"
+    assert (await client.get_token_info("MINT8"))["symbol"] == "T8"
+    assert set(await client.get_token_infos(["MINT1", "MINT2", "NOPE"])) == {"MINT1", "MINT2"}
+    assert len(downloads) == 1
@@ -0,0 +1,69 @@
+from types import SimpleNamespace
+
+import pytest
+
+from src.modules import ttl_cache
+from src.modules.ttl_cache import TTLCache, export_cache_metrics
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(ttl_cache.time, "monotonic", lambda: now.value)
+    return now
+
+
+def test_lru_eviction_and_counters(clock):
+    cache = TTLCache("test.lru", max_size=2, ttl_seconds=None)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache.get("a") == 1  # "b" is now least recently used
+
+    cache["c"] = 3
+
+    assert "b" not in cache
+    assert cache.get("b") is None
+    assert cache["a"] == 1 and cache["c"] == 3
+    assert cache.stats() == {
+        "size": 2,
+        "max_size": 2,
+        "hits": 3,
+        "misses": 1,
+        "evictions": 1,
+        "expirations": 0,
+        "hit_rate": 0.75,
+    }
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = TTLCache("test.ttl", max_size=10, ttl_seconds=60)
+    cache["sig"] = {"mint": None}
+    cache["other"] = 1
+
+    clock.value += 59
+    assert cache.get("sig") == {"mint": None}
+
+    clock.value += 1
+    assert cache.get("sig") is None
+    with pytest.raises(KeyError):
+        cache["sig"]
+    assert cache.purge_expired() == 1
+    assert len(cache) == 0
+    assert cache.expirations == 2
+
+
+def test_export_metrics_through_monitor(clock):
+    recorded = []
+    monitor = SimpleNamespace(record_metric=lambda name, value, tags=None: recorded.append((name, value, tags)))
+
+    cache = TTLCache("test.export", max_size=10)
+    cache["a"] = 1
+    cache.get("a")
+    cache.get("missing")
+    export_cache_metrics(monitor)
+
+    exported = {name: value for name, value, tags in recorded if tags == {"cache": "test.export"}}
+    assert exported["cache.test.export.hits"] == 1
+    assert exported["cache.test.export.misses"] == 1
+    assert exported["cache.test.export.size"] == 1
+    assert exported["cache.test.export.hit_rate"] == 0.5
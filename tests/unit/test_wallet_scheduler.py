@@ -0,0 +1,79 @@
+from types import SimpleNamespace
+
+from src.modules.wallet_scheduler import AdaptiveWalletScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _metrics(score):
+    return SimpleNamespace(calculate_score=lambda: score)
+
+
+def test_hot_wallets_poll_fast_and_dormant_wallets_back_off():
+    clock = FakeClock()
+    scheduler = AdaptiveWalletScheduler(min_interval=5, max_interval=600, initial_interval=30, clock=clock)
+    scheduler.sync({"hot": _metrics(0), "dormant": _metrics(0), "elite": _metrics(100)})
+
+    assert sorted(scheduler.take_due()) == ["dormant", "elite", "hot"]
+    assert scheduler.take_due() == []
+
+    polls = {"hot": 0, "dormant": 0, "elite": 0}
+    for _ in range(3600):
+        clock.now += 1
+        for address in scheduler.take_due():
+            polls[address] += 1
+            scheduler.record_poll(address, new_signatures=1 if address == "hot" else 0, swaps=1 if address == "hot" else 0)
+
+    # Hot wallet every 5s; dormant backs off to 600s; score 100 caps the back-off at 150s
+    assert polls["hot"] >= 700
+    assert polls["dormant"] <= 10
+    assert 20 <= polls["elite"] <= 30
+    assert scheduler._wallets["dormant"].interval == 600
+    assert scheduler._wallets["elite"].interval == 150
+
+
+def test_budget_caps_each_scan_and_unpolled_wallets_stay_due():
+    clock = FakeClock()
+    scheduler = AdaptiveWalletScheduler(budget_per_minute=60, clock=clock)
+    scheduler.sync({f"w{index}": _metrics(50) for index in range(100)})
+
+    first = scheduler.take_due()
+    assert len(first) == 60
+    assert scheduler.take_due() == []
+
+    clock.now += 10  # refills 10 tokens
+    second = scheduler.take_due()
+    assert len(second) == 10
+    assert not set(first) & set(second)
+
+    scheduler.charge(20)
+    clock.now += 10
+    assert scheduler.take_due() == []
+
+
+def test_thousands_of_wallets_fit_todays_quota():
+    clock = FakeClock()
+    budget = 1200  # ~560 wallets x (signatures + a transaction lookup) every 30s today
+    scheduler = AdaptiveWalletScheduler(budget_per_minute=budget, clock=clock)
+    wallets = {f"w{index}": _metrics(index % 100) for index in range(5000)}
+    scheduler.sync(wallets)
+    active = {f"w{index}" for index in range(0, 5000, 50)}  # 2% trade regularly
+
+    requests = 0
+    for second in range(1800):
+        clock.now += 1
+        for address in scheduler.take_due():
+            requests += 1
+            scheduler.record_poll(address, new_signatures=int(address in active), swaps=int(address in active))
+
+    polled = {address for address, schedule in scheduler._wallets.items() if schedule.polls}
+    assert polled == set(wallets)
+    assert requests <= budget * 31
+    # Active wallets end up on the minimum interval
+    assert all(scheduler._wallets[address].interval == scheduler.min_interval for address in active)
@@ -0,0 +1,248 @@
+import asyncio
+import json
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+import websockets
+from solana.rpc.commitment import Confirmed
+
+from src.modules.automated_trading import AutomatedTradingEngine, TradingConfig
+from src.modules.wallet_intelligence import WalletMetrics
+from src.modules.wallet_stream import WalletActivityStream
+
+
+WALLET = "9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWWM"
+POLL_WALLET = "7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU"
+TOKEN = "DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263"
+POLL_TOKEN = "EKpQGSJtjMFqKZ9KQanSqYXRcF8fBopzLHYxdM65zcjm"
+# WALLET buys TOKEN (BONK) as fee payer; MENTIONED_WALLET is only one of its account keys
+MENTIONED_WALLET = "3Hn4QdNwz2r5kYj1xHmQhQfs4sJQJj1VZDkQfJjRYjgk"
+BUY_FIXTURE = Path(__file__).resolve().parent.parent / "fixtures" / "swaps" / "jupiter_buy_bonk.json"
+
+
+class StubRpcWebsocket:
+    """Minimal logsSubscribe server that pushes queued signatures to subscribers."""
+
+    def __init__(self):
+        self.subscribed = asyncio.Event()
+        self.subscriptions = {}
+        self._clients = []
+        self._server = None
+
+    async def __aenter__(self):
+        self._server = await websockets.serve(self._handler, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *exc):
+        self._server.close()
+        await self._server.wait_closed()
+
+    @property
+    def url(self):
+        port = next(iter(self._server.sockets)).getsockname()[1]
+        return f"ws://127.0.0.1:{port}"
+
+    async def _handler(self, websocket, path=None):
+        self._clients.append(websocket)
+        async for raw in websocket:
+            request = json.loads(raw)
+            if request["method"] == "logsSubscribe":
+                subscription_id = len(self.subscriptions) + 100
+                self.subscriptions[request["params"][0]["mentions"][0]] = subscription_id
+                await websocket.send(json.dumps({"jsonrpc": "2.0", "id": request["id"], "result": subscription_id}))
+                self.subscribed.set()
+
+    async def push(self, address, signature, err=None):
+        message = {
+            "jsonrpc": "2.0",
+            "method": "logsNotification",
+            "params": {
+                "subscription": self.subscriptions[address],
+                "result": {
+                    "context": {"slot": 1234},
+                    "value": {"signature": signature, "err": err, "logs": []},
+                },
+            },
+        }
+        for client in self._clients:
+            await client.send(json.dumps(message))
+
+
+class StubTradeExecutor:
+    def __init__(self):
+        self.buys = []
+
+    async def execute_buy(self, user_id, token_mint, amount, **kwargs):
+        self.buys.append((token_mint, kwargs.get("metadata")))
+        return {"success": True, "price": 1.0}
+
+
+class StubProtection:
+    async def comprehensive_token_check(self, token_mint):
+        return {"is_safe": True}
+
+
+class StubTransactionClient:
+    """getTransaction that only finds the transaction at 'confirmed', once `visible` is set."""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.visible = False
+        self.lookups = []
+
+    async def get_transaction(self, signature, encoding=None, max_supported_transaction_version=None, commitment=None):
+        self.lookups.append(commitment)
+        if not self.visible or commitment != Confirmed:
+            return SimpleNamespace(value=None)
+        return SimpleNamespace(value=True, to_json=lambda: self.raw)
+
+
+def _build_engine(executor, wallets=(WALLET,)):
+    tracked_wallets = {
+        address: WalletMetrics(address=address, win_rate=1.0, profit_factor=3.0, consistency_score=1.0, total_trades=100)
+        for address in wallets
+    }
+    intelligence = SimpleNamespace(tracked_wallets=tracked_wallets, client=None)
+    engine = AutomatedTradingEngine(
+        TradingConfig(auto_trade_min_confidence=0.6),
+        intelligence,
+        jupiter_client=None,
+        protection_system=StubProtection(),
+        trade_executor=executor,
+    )
+    engine.is_running = True
+    engine.user_id = 1
+    engine.db = None
+    engine.signal_core.running = True
+    engine.signal_core.subscribe(engine)
+    return engine
+
+
+@pytest.mark.asyncio
+async def test_stream_forwards_successful_signatures_only():
+    received = asyncio.Queue()
+
+    async def on_signature(address, signature, slot):
+        await received.put((address, signature, slot))
+
+    async with StubRpcWebsocket() as server:
+        stream = WalletActivityStream(server.url, on_signature, reconnect_delay=0.1)
+        await stream.start([WALLET])
+        await asyncio.wait_for(server.subscribed.wait(), 2)
+        await asyncio.sleep(0.05)
+
+        await server.push(WALLET, "failedSig", err={"InstructionError": [0, "Custom"]})
+        await server.push(WALLET, "goodSig")
+
+        address, signature, slot = await asyncio.wait_for(received.get(), 2)
+        await stream.stop()
+
+    assert (address, signature, slot) == (WALLET, "goodSig", 1234)
+    assert received.empty()
+
+
+@pytest.mark.asyncio
+async def test_streamed_buy_triggers_trade_and_skips_poll_reprocessing():
+    executor = StubTradeExecutor()
+    engine = _build_engine(executor, wallets=(WALLET, POLL_WALLET))
+    core = engine.signal_core
+    # Both wallets buy in the same block: WALLET is streamed, POLL_WALLET is only seen by the poll scan
+    block_time = int(datetime.now().timestamp()) - 2
+
+    async def fake_parse(signature, owner=None):
+        core._cache_transaction(signature, TOKEN, block_time)
+        return TOKEN, 1
+
+    async def fake_recent_signatures(address, limit=3):
+        signature = "streamSig" if address == WALLET else "pollSig"
+        return {"signatures": [SimpleNamespace(signature=signature, block_time=block_time)], "rpc_calls": 1}
+
+    parsed_by_poll = []
+
+    async def fake_parse_many(signatures, owners=None):
+        parsed_by_poll.extend(signatures)
+        return {signature: POLL_TOKEN for signature in signatures}, len(signatures)
+
+    core._parse_swap_transaction = fake_parse
+    core._fetch_recent_signatures = fake_recent_signatures
+    core._parse_swap_transactions = fake_parse_many
+
+    async with StubRpcWebsocket() as server:
+        core.wallet_stream = WalletActivityStream(server.url, core._handle_streamed_signature, reconnect_delay=0.1)
+        await core.wallet_stream.start([WALLET])
+        await asyncio.wait_for(server.subscribed.wait(), 2)
+        await asyncio.sleep(0.05)
+
+        await server.push(WALLET, "streamSig")
+        for _ in range(100):
+            if executor.buys:
+                break
+            await asyncio.sleep(0.01)
+
+        # The next poll pass sees both signatures; the streamed one is not parsed or traded again
+        await asyncio.sleep(0.1)
+        opportunities = await core._scan_for_opportunities()
+        await core._publish(opportunities, core._poll_signals if core.scheduler else None)
+        await engine.stop_automated_trading()
+
+    assert [mint for mint, _ in executor.buys] == [TOKEN, POLL_TOKEN]
+    assert executor.buys[0][1]["opportunity"] == "wallet_stream"
+    assert parsed_by_poll == ["pollSig"]
+    assert TOKEN not in core._poll_signals
+    assert "streamSig" in core._streamed_signatures
+    assert core.subscriber_count == 0 and not core.running
+
+    # Same block time, detected by push vs by the following poll pass
+    stats = core.get_detection_latency_stats()
+    assert stats["stream"]["samples"] == 1 and stats["poll"]["samples"] == 1
+    assert 2 <= stats["stream"]["median_seconds"] < stats["poll"]["median_seconds"]
+
+
+@pytest.mark.asyncio
+async def test_streamed_signature_is_retried_until_the_node_has_it(monkeypatch):
+    monkeypatch.delenv("HELIUS_API_KEY", raising=False)
+    executor = StubTradeExecutor()
+    engine = _build_engine(executor)
+    core = engine.signal_core
+    rpc = StubTransactionClient(BUY_FIXTURE.read_text())
+    core.wallet_intelligence.client = rpc
+
+    # Notified before the node serves the transaction: nothing cached, nothing traded
+    await core._handle_streamed_signature(WALLET, "streamSig", 1234)
+    assert executor.buys == []
+    assert core._get_cached_transaction("streamSig") is None
+    assert "streamSig" not in core._streamed_signatures
+
+    rpc.visible = True
+    await core._handle_streamed_signature(WALLET, "streamSig", 1234)
+    await engine.stop_automated_trading()
+
+    assert [mint for mint, _ in executor.buys] == [TOKEN]
+    assert rpc.lookups == [Confirmed, Confirmed]
+    assert "streamSig" in core._streamed_signatures
+
+
+@pytest.mark.asyncio
+async def test_buy_is_credited_to_the_wallet_that_bought_not_every_wallet_mentioned(monkeypatch):
+    monkeypatch.delenv("HELIUS_API_KEY", raising=False)
+    monkeypatch.setenv("AUTO_TRADER_RPC_BATCH_SIZE", "0")
+    executor = StubTradeExecutor()
+    engine = _build_engine(executor, wallets=(WALLET, MENTIONED_WALLET))
+    core = engine.signal_core
+    rpc = StubTransactionClient(BUY_FIXTURE.read_text())
+    rpc.visible = True
+    core.wallet_intelligence.client = rpc
+
+    # The mentioned wallet's logsSubscribe notification: someone else's buy
+    await core._handle_streamed_signature(MENTIONED_WALLET, "buySig", 1234)
+    assert executor.buys == []
+    assert core._get_cached_transaction("buySig", MENTIONED_WALLET)["mint"] is None
+
+    # Listed under both wallets by the poll scan: only the fee payer bought
+    mints, _ = await core._parse_swap_transactions(["buySig"], {"buySig": WALLET})
+    assert mints == {"buySig": TOKEN}
+    mints, _ = await core._parse_swap_transactions(["buySig"], {"buySig": MENTIONED_WALLET})
+    assert mints == {"buySig": None}
+    await engine.stop_automated_trading()